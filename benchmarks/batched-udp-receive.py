@@ -0,0 +1,90 @@
+"""
+Receive datagrams in batches
+++++++++++++++++++++++++++++
+
+Measure how many SNMP notifications per second the asyncore UDP
+transport hands over to the transport dispatcher, with and without
+`enableBatching()` (Linux recvmmsg()).
+
+Each round fills the receiving socket buffer over loopback first, then
+times draining it, so the sender does not compete for CPU.
+
+Usage: batched-udp-receive.py [rounds] [datagrams-per-round]
+
+| $ python batched-udp-receive.py 20 2000
+
+"""#
+import asyncore
+import socket
+import sys
+import time
+
+from pyasn1.codec.ber import encoder
+
+from pysnmp.carrier.asyncore.dgram import udp
+from pysnmp.carrier.asyncore.dispatch import AsyncoreDispatcher
+from pysnmp.proto.api import v2c
+
+rounds = len(sys.argv) > 1 and int(sys.argv[1]) or 20
+count = len(sys.argv) > 2 and int(sys.argv[2]) or 2000
+
+trapMsg = v2c.Message()
+v2c.apiMessage.setDefaults(trapMsg)
+v2c.apiMessage.setCommunity(trapMsg, 'public')
+
+trapPDU = v2c.TrapPDU()
+v2c.apiTrapPDU.setDefaults(trapPDU)
+v2c.apiMessage.setPDU(trapMsg, trapPDU)
+
+wholeMsg = encoder.encode(trapMsg)
+
+
+def measure(batching, port):
+    transportDispatcher = AsyncoreDispatcher()
+
+    received = [0]
+
+    def cbFun(transportDispatcher, transportDomain, transportAddress,
+              wholeMsg):
+        received[0] += 1
+
+    transportDispatcher.registerRecvCbFun(cbFun)
+
+    transport = udp.UdpTransport()
+    transport.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+
+    if batching:
+        transport.enableBatching()
+
+    transportDispatcher.registerTransport(
+        udp.DOMAIN_NAME, transport.openServerMode(('127.0.0.1', port)))
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    elapsed = 0
+
+    for x in range(rounds):
+        expected = received[0] + count
+
+        for y in range(count):
+            sock.sendto(wholeMsg, ('127.0.0.1', port))
+
+        startTime = time.time()
+
+        while received[0] < expected:
+            asyncore.poll(0.5, transportDispatcher.getSocketMap())
+
+        elapsed += time.time() - startTime
+
+    sock.close()
+
+    transportDispatcher.closeDispatcher()
+
+    return received[0] / elapsed
+
+
+plainRate = measure(False, 17000)
+batchedRate = measure(True, 17001)
+
+print('%d rounds of %d datagrams: plain %.0f pps, batched %.0f pps' % (
+    rounds, count, plainRate, batchedRate))
@@ -0,0 +1,89 @@
+"""
+Configure many SNMP targets
++++++++++++++++++++++++++++
+
+Measure how long it takes to configure SNMP targets along with 100
+target parameters entries, and how long the first target tag lookup
+takes once they are configured:
+
+* by calling addTargetParams()/addTargetAddr() for each entry
+* by a single bulkLoad() call
+* by bulkLoadFromCsv() reading the same entries from CSV text
+
+Usage: bulk-load-targets.py [add|bulk|csv] [number-of-targets]
+
+| $ python bulk-load-targets.py bulk 100000
+
+"""#
+import io
+import sys
+import time
+
+from pyasn1.compat.octets import str2octs
+
+from pysnmp.entity import engine, config
+from pysnmp.entity.rfc3413 import config as lcd
+
+mode = len(sys.argv) > 1 and sys.argv[1] or 'bulk'
+count = len(sys.argv) > 2 and int(sys.argv[2]) or 100000
+
+targetParams = [('params-%d' % i, 'public', 'noAuthNoPriv', 1)
+                for i in range(100)]
+
+targets = [dict(addrName='target-%d' % i,
+                transportDomain=config.SNMP_UDP_DOMAIN,
+                transportAddress=('10.%d.%d.%d' % (
+                    i >> 16 & 255, i >> 8 & 255, i & 255), 161),
+                params='params-%d' % (i % 100),
+                tagList='tag-%d all' % (i % 1000))
+           for i in range(count)]
+
+snmpEngine = engine.SnmpEngine()
+
+if mode == 'add':
+    startTime = time.time()
+
+    for entry in targetParams:
+        config.addTargetParams(snmpEngine, *entry)
+
+    for entry in targets:
+        config.addTargetAddr(snmpEngine, **entry)
+
+elif mode == 'bulk':
+    startTime = time.time()
+
+    config.bulkLoad(snmpEngine, targetParams=targetParams, targets=targets)
+
+elif mode == 'csv':
+    csvFile = io.StringIO()
+
+    csvFile.write(u'addrName,transportDomain,transportAddress,params,tagList\n')
+
+    for entry in targets:
+        csvFile.write(u'%s,SNMP_UDP_DOMAIN,%s:%d,%s,%s\n' % (
+            entry['addrName'], entry['transportAddress'][0],
+            entry['transportAddress'][1], entry['params'], entry['tagList']))
+
+    csvFile.seek(0)
+
+    startTime = time.time()
+
+    config.bulkLoad(snmpEngine, targetParams=targetParams)
+    config.bulkLoadFromCsv(snmpEngine, csvFile, 'targets')
+
+else:
+    sys.stderr.write('Unknown mode %s\n' % mode)
+    sys.exit(1)
+
+loadTime = time.time() - startTime
+
+startTime = time.time()
+
+targetNames = lcd.getTargetNames(snmpEngine, str2octs('tag-7'))
+
+lookupTime = time.time() - startTime
+
+print('%s: %d targets loaded in %.2f sec (%.1f usec per target), '
+      'first tag lookup %.2f sec, %d targets tagged' % (
+          mode, count, loadTime, loadTime / count * 1000000,
+          lookupTime, len(targetNames)))
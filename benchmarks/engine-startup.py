@@ -0,0 +1,93 @@
+"""
+Start up SNMP engines
++++++++++++++++++++++
+
+Measure how long it takes to create SNMP engines in a fresh Python
+process, first one and subsequent ones, with core MIB modules loaded:
+
+* from MIB sources, as usual
+* from a MIB bundle file made by `MibBuilder.bundleModules()` and
+  given in the `PYSNMP_MIB_BUNDLES` environment variable
+
+Each measurement runs in a new process, so that nothing is shared
+with the previous ones.
+
+Usage: engine-startup.py [number-of-processes] [engines-per-process]
+
+| $ python engine-startup.py 5 20
+
+"""#
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def measure(count):
+    from pysnmp.entity import engine
+
+    startTime = time.time()
+
+    engine.SnmpEngine()
+
+    firstTime = time.time() - startTime
+
+    startTime = time.time()
+
+    for x in range(count):
+        engine.SnmpEngine()
+
+    nextTime = (time.time() - startTime) / count
+
+    print('%f %f' % (firstTime, nextTime))
+
+
+def run(env):
+    firstTimes = []
+    nextTimes = []
+
+    for x in range(processes):
+        output = subprocess.Popen(
+            [sys.executable, __file__, 'measure', str(count)],
+            stdout=subprocess.PIPE, env=env).communicate()[0]
+
+        firstTime, nextTime = [float(x) for x in output.split()]
+
+        firstTimes.append(firstTime * 1000)
+        nextTimes.append(nextTime * 1000)
+
+    return min(firstTimes), max(firstTimes), min(nextTimes), max(nextTimes)
+
+
+if len(sys.argv) > 2 and sys.argv[1] == 'measure':
+    measure(int(sys.argv[2]))
+    sys.exit(0)
+
+processes = len(sys.argv) > 1 and int(sys.argv[1]) or 5
+count = len(sys.argv) > 2 and int(sys.argv[2]) or 20
+
+from pysnmp.entity import engine
+
+env = dict(os.environ)
+env.pop('PYSNMP_MIB_BUNDLES', None)
+
+print('without bundle: first %.1f-%.1f msec, subsequent %.1f-%.1f msec '
+      'each' % run(env))
+
+bundleFd, bundleFile = tempfile.mkstemp(suffix='.bundle')
+
+os.close(bundleFd)
+
+try:
+    mibBuilder = engine.SnmpEngine().msgAndPduDsp.mibInstrumController.mibBuilder
+
+    mibBuilder.bundleModules(bundleFile)
+
+    env['PYSNMP_MIB_BUNDLES'] = bundleFile
+
+    print('with bundle: first %.1f-%.1f msec, subsequent %.1f-%.1f msec '
+          'each' % run(env))
+
+finally:
+    os.remove(bundleFile)
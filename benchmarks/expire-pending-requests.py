@@ -0,0 +1,54 @@
+"""
+Expire pending requests
++++++++++++++++++++++++
+
+Measure the cost of a single timer tick checking in-flight requests
+for expiration, none of them being due yet:
+
+* with `timeNow` given, only requests whose deadline has come are
+  looked at
+* without `timeNow`, every cached request is offered to the callback
+
+Usage: expire-pending-requests.py [number-of-requests ...]
+
+| $ python expire-pending-requests.py 1000 10000 50000 200000
+
+"""#
+import sys
+import time
+
+from pysnmp.proto.cache import Cache
+
+counts = [int(x) for x in sys.argv[1:]] or [1000, 10000, 50000, 200000]
+
+
+def cbFun(index, cachedParams, cbCtx):
+    if cbCtx[0] >= cachedParams['timeout']:
+        return True
+
+
+for count in counts:
+    cache = Cache()
+
+    for index in range(count):
+        cache.add(index, timeout=1000 + index % 50, sendPduHandle=index)
+
+    timeNow = [10]
+
+    startTime = time.time()
+
+    for tick in range(100):
+        cache.expire(cbFun, timeNow, timeNow[0])
+
+    deadlineTick = (time.time() - startTime) / 100
+
+    startTime = time.time()
+
+    for tick in range(3):
+        cache.expire(cbFun, timeNow)
+
+    fullScanTick = (time.time() - startTime) / 3
+
+    print('%7d in-flight: tick by deadline %.1f usec, full scan tick '
+          '%.1f usec' % (count, deadlineTick * 1000000,
+                         fullScanTick * 1000000))
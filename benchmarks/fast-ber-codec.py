@@ -0,0 +1,156 @@
+"""
+Decode and encode SNMP messages
++++++++++++++++++++++++++++++++
+
+Measure how many SNMP messages per second are decoded and encoded:
+
+* by pyasn1 BER codec working from SNMP message ASN.1 schema
+* by `pysnmp.proto.api.fastcodec` working with plain tuples
+
+Then time peeking at SNMP message version the way
+`verdec.decodeMessageVersion()` does through the fast codec against two
+partial pyasn1 decodes.
+
+Usage: fast-ber-codec.py [number-of-pyasn1-runs]
+
+| $ python fast-ber-codec.py 300
+
+"""#
+import sys
+import timeit
+
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.type import univ
+
+from pysnmp.proto import api
+from pysnmp.proto.api import fastcodec
+from pysnmp.proto.api import verdec
+from pysnmp.proto.mpmod.rfc3412 import SNMPv3Message, ScopedPDU
+
+count = len(sys.argv) > 1 and int(sys.argv[1]) or 300
+
+v1 = api.PROTOCOL_MODULES[api.SNMP_VERSION_1]
+v2c = api.PROTOCOL_MODULES[api.SNMP_VERSION_2C]
+
+
+def makePdu(pMod, pduType, varBinds):
+    pdu = pduType()
+    pMod.apiPDU.setDefaults(pdu)
+    pMod.apiPDU.setVarBinds(pdu, varBinds)
+    return pdu
+
+
+def makeMessage(pMod, pdu):
+    msg = pMod.Message()
+    pMod.apiMessage.setDefaults(msg)
+    pMod.apiMessage.setCommunity(msg, 'public')
+    pMod.apiMessage.setPDU(msg, pdu)
+    return encoder.encode(msg)
+
+
+def makeV3Message(pdu):
+    scopedPdu = ScopedPDU()
+    scopedPdu['contextEngineId'] = univ.OctetString(
+        hexValue='80004fb805').asOctets()
+    scopedPdu['contextName'] = ''
+    scopedPdu['data'].setComponentByType(pdu.tagSet, pdu)
+
+    msg = SNMPv3Message()
+    msg['msgVersion'] = 3
+
+    msgGlobalData = msg['msgGlobalData']
+    msgGlobalData['msgID'] = 12345
+    msgGlobalData['msgMaxSize'] = 65507
+    msgGlobalData['msgFlags'] = univ.OctetString(hexValue='04').asOctets()
+    msgGlobalData['msgSecurityModel'] = 3
+
+    msg['msgSecurityParameters'] = univ.OctetString(
+        hexValue='300e0400020100020100040004000400').asOctets()
+    msg['msgData']['plaintext'] = scopedPdu
+
+    return encoder.encode(msg)
+
+
+getVarBinds = [('1.3.6.1.2.1.1.1.0', v2c.Null(''))]
+
+rowVarBinds = []
+
+for idx in range(1, 6):
+    rowVarBinds.extend([
+        ('1.3.6.1.2.1.2.2.1.2.%d' % idx, v2c.OctetString('eth0')),
+        ('1.3.6.1.2.1.2.2.1.10.%d' % idx, v2c.Counter32(123456789)),
+        ('1.3.6.1.2.1.2.2.1.16.%d' % idx, v2c.Counter32(987654)),
+        ('1.3.6.1.2.1.2.2.1.5.%d' % idx, v2c.Gauge32(1000000000)),
+        ('1.3.6.1.2.1.2.2.1.8.%d' % idx, v2c.Integer(1))
+    ])
+
+v1Trap = v1.TrapPDU()
+v1.apiTrapPDU.setDefaults(v1Trap)
+v1.apiTrapPDU.setEnterprise(v1Trap, (1, 3, 6, 1, 4, 1, 20408, 4, 1, 1, 2))
+v1.apiTrapPDU.setVarBinds(
+    v1Trap, [('1.3.6.1.2.1.1.1.0', v1.OctetString('my system')),
+             ('1.3.6.1.2.1.1.3.0', v1.TimeTicks(12345))])
+
+v2cTrap = makePdu(
+    v2c, v2c.SNMPv2TrapPDU,
+    [('1.3.6.1.2.1.1.3.0', v2c.TimeTicks(12345)),
+     ('1.3.6.1.6.3.1.1.4.1.0', v2c.ObjectIdentifier('1.3.6.1.6.3.1.1.5.1'))])
+
+MESSAGES = [
+    ('v1 GET', makeMessage(v1, makePdu(v1, v1.GetRequestPDU, getVarBinds)),
+     v1.Message),
+    ('v2c GET', makeMessage(v2c, makePdu(v2c, v2c.GetRequestPDU, getVarBinds)),
+     v2c.Message),
+    ('v3 GET', makeV3Message(makePdu(v2c, v2c.GetRequestPDU, getVarBinds)),
+     SNMPv3Message),
+    ('v2c GETBULK response (25)',
+     makeMessage(v2c, makePdu(v2c, v2c.ResponsePDU, rowVarBinds)),
+     v2c.Message),
+    ('v3 GETBULK response (25)',
+     makeV3Message(makePdu(v2c, v2c.ResponsePDU, rowVarBinds)),
+     SNMPv3Message),
+    ('v1 TRAP', makeMessage(v1, v1Trap), v1.Message),
+    ('v2c TRAP', makeMessage(v2c, v2cTrap), v2c.Message)
+]
+
+
+def rate(fun, number):
+    return number / min(timeit.repeat(fun, number=number, repeat=3))
+
+
+print('%-26s %12s %12s %12s %12s' % (
+    'messages/sec', 'pyasn1 dec', 'fast dec', 'pyasn1 enc', 'fast enc'))
+
+for label, wholeMsg, asn1Spec in MESSAGES:
+    asn1Msg, rest = decoder.decode(wholeMsg, asn1Spec=asn1Spec())
+
+    msg, rest = fastcodec.decodeMessage(wholeMsg)
+
+    if fastcodec.encodeMessage(msg) != wholeMsg:
+        raise Exception('%s re-encoded differently' % label)
+
+    print('%-26s %12.0f %12.0f %12.0f %12.0f' % (
+        label,
+        rate(lambda: decoder.decode(wholeMsg, asn1Spec=asn1Spec()), count),
+        rate(lambda: fastcodec.decodeMessage(wholeMsg), count * 20),
+        rate(lambda: encoder.encode(asn1Msg), count),
+        rate(lambda: fastcodec.encodeMessage(msg), count * 20)))
+
+
+def decodeMessageVersion(wholeMsg):
+    seq, wholeMsg = decoder.decode(
+        wholeMsg, asn1Spec=univ.Sequence(), recursiveFlag=False,
+        substrateFun=lambda a, b, c: (a, b[:c]))
+
+    ver, wholeMsg = decoder.decode(
+        wholeMsg, asn1Spec=univ.Integer(), recursiveFlag=False,
+        substrateFun=lambda a, b, c: (a, b[:c]))
+
+    return ver
+
+
+wholeMsg = MESSAGES[3][1]
+
+print('decodeMessageVersion(): pyasn1 %.1f usec, fast codec %.1f usec' % (
+    1000000 / rate(lambda: decodeMessageVersion(wholeMsg), count * 10),
+    1000000 / rate(lambda: verdec.decodeMessageVersion(wholeMsg), count * 100)))
@@ -0,0 +1,69 @@
+"""
+Index MIB instances one by one
+++++++++++++++++++++++++++++++
+
+Measure the cost of exporting a Managed Object Instance into a MIB
+table column and bringing MIB instrumentation up to date, one instance
+at a time, the way agents add table rows in between SNMP requests:
+
+* incrementally, as `MibInstrumController.indexMib()` does
+* by rebuilding the whole tree of MIB objects after each export
+
+Usage: index-mib-instances.py [incremental-instances] [rebuilt-instances]
+
+| $ python index-mib-instances.py 10000 2000
+
+"""#
+import sys
+import time
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder
+from pysnmp.smi import instrum
+
+incrementalCount = len(sys.argv) > 1 and int(sys.argv[1]) or 10000
+rebuiltCount = len(sys.argv) > 2 and int(sys.argv[2]) or 2000
+
+
+def measure(count, rebuild):
+    mibBuilder = builder.MibBuilder()
+    mibBuilder.loadModules('SNMPv2-MIB')
+
+    mibInstrumController = instrum.MibInstrumController(mibBuilder)
+
+    (MibScalarInstance, MibTableColumn,
+     MibTableRow, MibTable) = mibBuilder.importSymbols(
+        'SNMPv2-SMI', 'MibScalarInstance', 'MibTableColumn',
+        'MibTableRow', 'MibTable')
+
+    table = MibTable((1, 3, 6, 1, 4, 1, 20408, 999, 1))
+    row = MibTableRow(table.name + (1,)).setIndexNames(
+        (0, 'BENCHMARK-MIB', 'column'))
+    column = MibTableColumn(row.name + (1,), rfc1902.Integer32())
+
+    mibBuilder.exportSymbols(
+        'BENCHMARK-MIB', table=table, row=row, column=column)
+
+    mibInstrumController.indexMib()
+
+    startTime = time.time()
+
+    for idx in range(count):
+        mibBuilder.exportSymbols(
+            'BENCHMARK-MIB', **{'instance%d' % idx: MibScalarInstance(
+                column.name, (idx,), rfc1902.Integer32(idx))})
+
+        if rebuild:
+            mibInstrumController._rebuildMib()
+
+        else:
+            mibInstrumController.indexMib()
+
+    return (time.time() - startTime) / count
+
+
+print('incremental: %d instances, %.2f msec per export' % (
+    incrementalCount, measure(incrementalCount, False) * 1000))
+
+print('full rebuild: %d instances, %.2f msec per export' % (
+    rebuiltCount, measure(rebuiltCount, True) * 1000))
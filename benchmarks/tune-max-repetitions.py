@@ -0,0 +1,156 @@
+"""
+Tune GETBULK max-repetitions
+++++++++++++++++++++++++++++
+
+Measure how many GETBULK requests it takes to walk a 3000-row table
+with fixed max-repetitions values and with max-repetitions adjusted by
+`MaxRepetitionsTuner`.
+
+The table is served by a local responder which caps its responses at
+a given size either by truncating them, by responding with tooBig
+error or by dropping them.
+
+Usage: tune-max-repetitions.py
+
+| $ python tune-max-repetitions.py
+
+"""#
+import bisect
+import multiprocessing
+import socket
+import time
+
+from pysnmp.entity.rfc3413.cmdgen import configureMaxRepetitionsTuner
+from pysnmp.hlapi.v3arch.asyncore import *
+from pysnmp.proto import rfc1905
+from pysnmp.proto.api import fastcodec
+
+PREFIX = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+
+ROWS = 3000
+
+TABLE = [(PREFIX + (idx,),
+          (fastcodec.TAG_OCTET_STRING, ('row-%06d' % idx).encode().ljust(40, b'.')))
+         for idx in range(1, ROWS + 1)]
+
+NAMES = [name for name, value in TABLE]
+
+
+def serve(port, limit, mode, requests, ready):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', port))
+
+    ready.set()
+
+    while True:
+        wholeMsg, address = sock.recvfrom(65535)
+
+        requests.value += 1
+
+        (version, community, pdu), rest = fastcodec.decodeMessage(wholeMsg)
+
+        pduType, requestId, nonRepeaters, maxRepetitions, varBinds = pdu
+
+        idx = bisect.bisect_right(NAMES, varBinds[0][0])
+
+        rows = TABLE[idx:idx + maxRepetitions]
+
+        if len(rows) < maxRepetitions:
+            rows.append((rows and rows[-1][0] or varBinds[0][0],
+                         (fastcodec.TAG_END_OF_MIB_VIEW, None)))
+
+        wholeMsg = fastcodec.encodeMessage(
+            (version, community, (fastcodec.TAG_RESPONSE, requestId, 0, 0, rows)))
+
+        if len(wholeMsg) > limit:
+            if mode == 'drop':
+                continue
+
+            elif mode == 'tooBig':
+                wholeMsg = fastcodec.encodeMessage(
+                    (version, community,
+                     (fastcodec.TAG_RESPONSE, requestId, 1, 0, varBinds)))
+
+            else:
+                while len(wholeMsg) > limit:
+                    rows = rows[:len(rows) * limit // len(wholeMsg)]
+
+                    wholeMsg = fastcodec.encodeMessage(
+                        (version, community,
+                         (fastcodec.TAG_RESPONSE, requestId, 0, 0, rows)))
+
+        sock.sendto(wholeMsg, address)
+
+
+def walk(port, maxRepetitions, adaptive):
+    snmpEngine = SnmpEngine()
+
+    if adaptive:
+        configureMaxRepetitionsTuner(snmpEngine, maxRepetitions=1000)
+
+    result = {'rows': 0, 'error': ''}
+
+    def cbFun(snmpEngine, sendRequestHandle, errorIndication,
+              errorStatus, errorIndex, varBindTable, cbCtx):
+        if errorIndication or errorStatus:
+            result['error'] = str(errorIndication or errorStatus.prettyPrint())
+            return False
+
+        for varBinds in varBindTable:
+            name, value = varBinds[0]
+
+            if (name[:len(PREFIX)] != PREFIX or
+                    rfc1905.endOfMibView.isSameTypeWith(value)):
+                return False
+
+            result['rows'] += 1
+
+        return True
+
+    bulkCmd(snmpEngine,
+            CommunityData('public'),
+            UdpTransportTarget(('127.0.0.1', port), timeout=0.5, retries=1),
+            ContextData(),
+            0, maxRepetitions,
+            ObjectType(ObjectIdentity(PREFIX)),
+            cbFun=cbFun, lookupMib=False)
+
+    startTime = time.time()
+
+    snmpEngine.transportDispatcher.runDispatcher()
+
+    snmpEngine.transportDispatcher.closeDispatcher()
+
+    return result['rows'], result['error'], time.time() - startTime
+
+
+port = 16300
+
+for limit, mode in ((1472, 'truncate'), (1472, 'tooBig'), (1472, 'drop'),
+                    (8192, 'truncate'), (8192, 'tooBig'), (65507, 'truncate')):
+    requests = multiprocessing.Value('i', 0)
+    ready = multiprocessing.Event()
+
+    port += 1
+
+    responder = multiprocessing.Process(
+        target=serve, args=(port, limit, mode, requests, ready))
+    responder.daemon = True
+    responder.start()
+
+    ready.wait()
+
+    for maxRepetitions, adaptive in ((10, False), (50, False),
+                                     (200, False), (10, True)):
+        requests.value = 0
+
+        rows, error, elapsed = walk(port, maxRepetitions, adaptive)
+
+        print('limit %5d %-8s max-repetitions %3d %-8s: %4d rows, '
+              '%3d requests, %.2f sec %s' % (
+                  limit, mode, maxRepetitions,
+                  adaptive and 'adaptive' or 'fixed', rows, requests.value,
+                  elapsed, error))
+
+    responder.terminate()
+    responder.join()
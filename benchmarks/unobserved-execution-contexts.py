@@ -0,0 +1,118 @@
+"""
+Skip unobserved execution contexts
+++++++++++++++++++++++++++++++++++
+
+Measure how long SNMP engine takes to answer an SNMPv2c GET request
+fed right into its message dispatcher, and how many execution contexts
+it stores per request:
+
+* with no observers registered
+* with an observer registered at every execution point of SNMPv1/v2c
+  message processing and security models, which makes the engine build
+  all of their contexts as it used to do
+
+Responses are not sent out, UDP transport is only used to look up
+local endpoint.
+
+Usage: unobserved-execution-contexts.py [number-of-requests]
+
+| $ python unobserved-execution-contexts.py 5000
+
+"""#
+import sys
+import time
+
+from pyasn1.codec.ber import encoder
+
+from pysnmp.carrier.asyncore.dgram import udp
+from pysnmp.entity import engine, config
+from pysnmp.entity.rfc3413 import cmdrsp, context
+from pysnmp.proto.api import v2c
+
+count = len(sys.argv) > 1 and int(sys.argv[1]) or 5000
+
+EXECUTION_POINTS = (
+    'rfc2576.prepareDataElements:confirmed',
+    'rfc2576.prepareDataElements:response',
+    'rfc2576.prepareDataElements:sm-failure',
+    'rfc2576.prepareDataElements:unconfirmed',
+    'rfc2576.prepareOutgoingMessage',
+    'rfc2576.prepareResponseMessage',
+    'rfc2576.processIncomingMsg',
+    'rfc2576.processIncomingMsg:writable'
+)
+
+reqPDU = v2c.GetRequestPDU()
+v2c.apiPDU.setDefaults(reqPDU)
+v2c.apiPDU.setVarBinds(reqPDU, [('1.3.6.1.2.1.1.1.0', v2c.Null(''))])
+
+reqMsg = v2c.Message()
+v2c.apiMessage.setDefaults(reqMsg)
+v2c.apiMessage.setCommunity(reqMsg, 'public')
+v2c.apiMessage.setPDU(reqMsg, reqPDU)
+
+wholeMsg = encoder.encode(reqMsg)
+
+
+def measure(observed):
+    snmpEngine = engine.SnmpEngine()
+
+    config.addTransport(
+        snmpEngine, udp.DOMAIN_NAME,
+        udp.UdpTransport().openServerMode(('127.0.0.1', 16181)))
+
+    config.addV1System(snmpEngine, 'my-area', 'public')
+    config.addVacmUser(snmpEngine, 2, 'my-area', 'noAuthNoPriv', (1, 3, 6))
+
+    cmdrsp.GetCommandResponder(snmpEngine, context.SnmpContext(snmpEngine))
+
+    responses = []
+
+    def sendMessage(outgoingMessage, transportDomain, transportAddress):
+        responses.append(outgoingMessage)
+
+    snmpEngine.transportDispatcher.sendMessage = sendMessage
+
+    if observed:
+        def cbFun(snmpEngine, execpoint, variables, cbCtx):
+            pass
+
+        snmpEngine.observer.registerObserver(cbFun, *EXECUTION_POINTS)
+
+    stores = [0]
+
+    storeExecutionContext = snmpEngine.observer.storeExecutionContext
+
+    def countingStoreExecutionContext(*args):
+        stores[0] += 1
+        return storeExecutionContext(*args)
+
+    snmpEngine.observer.storeExecutionContext = countingStoreExecutionContext
+
+    msgAndPduDsp = snmpEngine.msgAndPduDsp
+
+    for x in range(count):
+        msgAndPduDsp.receiveMessage(
+            snmpEngine, udp.DOMAIN_NAME, ('127.0.0.1', 1024), wholeMsg)
+
+    startTime = time.time()
+
+    for x in range(count):
+        msgAndPduDsp.receiveMessage(
+            snmpEngine, udp.DOMAIN_NAME, ('127.0.0.1', 1024), wholeMsg)
+
+    elapsed = time.time() - startTime
+
+    snmpEngine.transportDispatcher.closeDispatcher()
+
+    if len(responses) != count * 2:
+        raise Exception('%d responses out of %d' % (len(responses), count * 2))
+
+    return float(stores[0]) / count / 2, elapsed / count
+
+
+for observed in (False, True):
+    contexts, elapsed = measure(observed)
+
+    print('%s: %.1f contexts stored, %.1f usec per request' % (
+        observed and 'observed' or 'unobserved', contexts, elapsed * 1000000))
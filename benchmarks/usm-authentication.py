@@ -0,0 +1,153 @@
+"""
+Authenticate SNMPv3 messages
+++++++++++++++++++++++++++++
+
+Measure how many ~360 byte messages per second USM services process,
+with the same localized keys every time:
+
+* authNoPriv: signed by `authenticateOutgoingMsg()` and verified by
+  `authenticateIncomingMsg()` of authentication services
+* authPriv: scoped PDU encrypted by `encryptData()` of DES or AES
+  privacy service then signed, and verified then decrypted by
+  `decryptData()` on the way in
+
+For comparison, authNoPriv digest is also computed the way RFC 3414
+(6.3.1) spells it out, building both HMAC pads from the key for each
+message.
+
+Usage: usm-authentication.py [number-of-messages]
+
+| $ python usm-authentication.py 100000
+
+"""#
+import hashlib
+import os
+import sys
+import time
+
+from pyasn1.type import univ
+
+from pysnmp.proto.secmod.rfc3414.auth import hmacmd5
+from pysnmp.proto.secmod.rfc3414.auth import hmacsha
+from pysnmp.proto.secmod.rfc3414.priv import des
+from pysnmp.proto.secmod.rfc3826.priv import aes
+from pysnmp.proto.secmod.rfc7860.auth import hmacsha2
+
+count = len(sys.argv) > 1 and int(sys.argv[1]) or 100000
+
+snmpEngineId = univ.OctetString(hexValue='80000102')
+
+msgHeader = univ.OctetString((0x30, 0x82)).asOctets() + os.urandom(30)
+
+services = [(hmacmd5.HmacMd5(), hashlib.md5),
+            (hmacsha.HmacSha(), hashlib.sha1)]
+
+for oid, hashFun in sorted(hmacsha2.HmacSha2.HASH_ALGORITHM.items()):
+    services.append((hmacsha2.HmacSha2(oid), hashFun))
+
+
+def authenticateOutgoingMsg(hashFun, authKey, digestLength, wholeMsg):
+    blockSize = hashFun().block_size
+
+    extendedAuthKey = authKey.asNumbers() + (0,) * (blockSize - len(authKey))
+
+    k1 = univ.OctetString([x ^ 0x36 for x in extendedAuthKey]).asOctets()
+    k2 = univ.OctetString([x ^ 0x5C for x in extendedAuthKey]).asOctets()
+
+    ln = wholeMsg.find(univ.OctetString((0,) * digestLength).asOctets())
+
+    d1 = hashFun(k1 + wholeMsg).digest()
+    d2 = hashFun(k2 + d1).digest()
+
+    return wholeMsg[:ln] + d2[:digestLength] + wholeMsg[ln + digestLength:]
+
+
+def rate(fun, *args):
+    startTime = time.time()
+
+    for x in range(count):
+        fun(*args)
+
+    return count / (time.time() - startTime)
+
+
+def makeMessage(service, data):
+    return (msgHeader + univ.OctetString(
+        (0,) * service.digestLength).asOctets() + data)
+
+
+def getDigest(service, wholeMsg):
+    return univ.OctetString(
+        wholeMsg[len(msgHeader):len(msgHeader) + service.digestLength])
+
+
+for service, hashFun in services:
+    authKey = service.localizeKey(
+        service.hashPassphrase('authkey1'), snmpEngineId)
+
+    wholeMsg = makeMessage(service, os.urandom(300))
+
+    authenticatedWholeMsg = service.authenticateOutgoingMsg(authKey, wholeMsg)
+
+    if (authenticatedWholeMsg !=
+            authenticateOutgoingMsg(
+                hashFun, authKey, service.digestLength, wholeMsg)):
+        raise Exception('%s digest mismatch' % service.__class__.__name__)
+
+    authParameters = getDigest(service, authenticatedWholeMsg)
+
+    service.authenticateIncomingMsg(
+        authKey, authParameters, authenticatedWholeMsg)
+
+    print('authNoPriv %s (%s): outgoing %.0f msgs/sec, pads built per '
+          'message %.0f msgs/sec, incoming %.0f msgs/sec' % (
+              service.__class__.__name__, hashFun().name,
+              rate(service.authenticateOutgoingMsg, authKey, wholeMsg),
+              rate(authenticateOutgoingMsg,
+                   hashFun, authKey, service.digestLength, wholeMsg),
+              rate(service.authenticateIncomingMsg,
+                   authKey, authParameters, authenticatedWholeMsg)))
+
+scopedPdu = os.urandom(300)
+
+# privacy keys are commonly derived with MD5 or SHA-1
+for service, hashFun in services[:2]:
+    authKey = service.localizeKey(
+        service.hashPassphrase('authkey1'), snmpEngineId)
+
+    for privService in (des.Des(), aes.Aes()):
+        privKey = privService.localizeKey(
+            service.SERVICE_ID,
+            privService.hashPassphrase(service.SERVICE_ID, 'privkey1'),
+            snmpEngineId)
+
+        def sendMessage():
+            encryptedData, privParameters = privService.encryptData(
+                privKey, (1, 2, None), scopedPdu)
+
+            return service.authenticateOutgoingMsg(
+                authKey, makeMessage(service, encryptedData.asOctets()))
+
+        authenticatedWholeMsg = sendMessage()
+
+        encryptedData, privParameters = privService.encryptData(
+            privKey, (1, 2, None), scopedPdu)
+
+        authParameters = getDigest(service, authenticatedWholeMsg)
+
+        def receiveMessage():
+            service.authenticateIncomingMsg(
+                authKey, authParameters, authenticatedWholeMsg)
+
+            return privService.decryptData(
+                privKey, (1, 2, privParameters), encryptedData)
+
+        if receiveMessage()[:len(scopedPdu)] != scopedPdu:
+            raise Exception('%s decryption mismatch' % (
+                privService.__class__.__name__))
+
+        print('authPriv %s (%s) + %s: outgoing %.0f msgs/sec, incoming '
+              '%.0f msgs/sec' % (
+                  service.__class__.__name__, hashFun().name,
+                  privService.__class__.__name__,
+                  rate(sendMessage), rate(receiveMessage)))
@@ -0,0 +1,126 @@
+"""
+Check access to many variable-bindings
+++++++++++++++++++++++++++++++++++++++
+
+Measure how long VACM takes to check read access to 10000 OIDs, the
+size of a large GETBULK response, against a view made of 40 families,
+13 of them masked:
+
+* all OIDs distinct
+* 1000 distinct OIDs repeated, mostly served from the decision cache
+* 1000 distinct OIDs repeated, with decision cache cut down to a
+  single entry
+
+Usage: vacm-access-checks.py [runs]
+
+| $ python vacm-access-checks.py 15
+
+"""#
+import random
+import sys
+import time
+
+from pysnmp.entity import engine, config
+from pysnmp.proto import rfc1902
+from pysnmp.proto.acmod import rfc3415
+from pysnmp.proto.error import StatusInformation
+
+runs = len(sys.argv) > 1 and int(sys.argv[1]) or 15
+
+
+def measure(distinct, decisionCacheSize):
+    random.seed(1)
+
+    rfc3415.Vacm.DECISION_CACHE_SIZE = decisionCacheSize
+
+    snmpEngine = engine.SnmpEngine()
+
+    config.addV1System(snmpEngine, 'my-area', 'public')
+    config.addVacmGroup(snmpEngine, 'my-group', 2, 'my-area')
+    config.addVacmAccess(snmpEngine, 'my-group', '', 2, 'noAuthNoPriv',
+                         'exact', 'my-view', 'my-view', 'my-view')
+    config.addContext(snmpEngine, '')
+
+    config.addVacmView(snmpEngine, 'my-view', 'included', (1, 3, 6, 1), '')
+
+    for idx in range(1, 40):
+        subTree = (1, 3, 6, 1, 2, 1, 2, 2, 1, idx % 22 + 1)
+
+        if idx % 3 == 0:
+            config.addVacmView(
+                snmpEngine, 'my-view', 'excluded', subTree + (idx,), '')
+
+        elif idx % 3 == 1:
+            config.addVacmView(
+                snmpEngine, 'my-view', 'excluded',
+                (1, 3, 6, 1, 4, 1, idx, 1, 5), '\xef\x80')
+
+        else:
+            config.addVacmView(
+                snmpEngine, 'my-view', 'included', subTree + (idx, 7), '')
+
+    count = distinct and 5000 or 1000
+
+    varNames = [
+        rfc1902.ObjectName((1, 3, 6, 1, 2, 1, 2, 2, 1, random.randint(1, 22),
+                            random.randint(1, 40), 7))
+        for x in range(count)]
+
+    varNames.extend([
+        rfc1902.ObjectName((1, 3, 6, 1, 4, 1, random.randint(1, 40),
+                            random.randint(0, 3), 5, random.randint(1, 100)))
+        for x in range(count)])
+
+    if not distinct:
+        varNames *= 5
+
+    accessControlModel = snmpEngine.accessControlModel[3]
+
+    securityModel = rfc1902.Integer(2)
+    securityName = rfc1902.OctetString('my-area')
+    securityLevel = rfc1902.Integer(1)
+    contextName = rfc1902.OctetString('')
+
+    def checkAccess():
+        allowed = 0
+
+        for varName in varNames:
+            try:
+                accessControlModel.isAccessAllowed(
+                    snmpEngine, securityModel, securityName, securityLevel,
+                    'read', contextName, varName)
+
+            except StatusInformation:
+                continue
+
+            allowed += 1
+
+        return allowed
+
+    checkAccess()
+
+    best = None
+
+    for x in range(runs):
+        startTime = time.time()
+
+        allowed = checkAccess()
+
+        elapsed = time.time() - startTime
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return allowed, len(varNames), best
+
+
+decisionCacheSize = rfc3415.Vacm.DECISION_CACHE_SIZE
+
+for label, distinct, cacheSize in (
+        ('distinct OIDs', True, decisionCacheSize),
+        ('repeated OIDs', False, decisionCacheSize),
+        ('repeated OIDs, no decision cache', False, 1)):
+    allowed, count, elapsed = measure(distinct, cacheSize)
+
+    print('%s: %d of %d allowed, %.1f msec (%.2f usec per OID)' % (
+        label, allowed, count, elapsed * 1000, elapsed / count * 1000000))
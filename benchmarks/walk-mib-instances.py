@@ -0,0 +1,127 @@
+"""
+Walk many MIB instances
++++++++++++++++++++++++
+
+Measure how long it takes to look up Managed Object Instances next to
+given ones in a MIB tree holding a 10-column table of 1M instances:
+
+* next instance look up by `MibInstrumController._getNextInstance()`
+* reading next instance by `MibInstrumController.readNextMibObjects()`,
+  one var-bind at a time, the way GETNEXT walks the table
+* reading next instances of all table columns at once, repeated the way
+  GETBULK request with max-repetitions is served
+
+Usage: walk-mib-instances.py [number-of-instances] [max-repetitions]
+
+| $ python walk-mib-instances.py 1000000 25
+
+"""#
+import sys
+import time
+
+from pysnmp.proto import rfc1902
+from pysnmp.smi import builder
+from pysnmp.smi import instrum
+
+count = len(sys.argv) > 1 and int(sys.argv[1]) or 1000000
+maxRepetitions = len(sys.argv) > 2 and int(sys.argv[2]) or 25
+
+COLUMNS = 10
+
+PREFIX = (1, 3, 6, 1, 4, 1, 20408, 999, 1)
+
+mibBuilder = builder.MibBuilder()
+mibBuilder.loadModules('SNMPv2-MIB')
+
+mibInstrumController = instrum.MibInstrumController(mibBuilder)
+
+(MibScalarInstance, MibTableColumn,
+ MibTableRow, MibTable) = mibBuilder.importSymbols(
+    'SNMPv2-SMI', 'MibScalarInstance', 'MibTableColumn',
+    'MibTableRow', 'MibTable')
+
+table = MibTable(PREFIX)
+row = MibTableRow(table.name + (1,)).setIndexNames(
+    (0, 'BENCHMARK-MIB', 'column1'))
+
+columns = [MibTableColumn(row.name + (idx,), rfc1902.Integer32()).setMaxAccess(
+           'read-only') for idx in range(1, COLUMNS + 1)]
+
+symbols = dict([('column%d' % (idx + 1), column)
+                for idx, column in enumerate(columns)])
+
+mibBuilder.exportSymbols('BENCHMARK-MIB', table=table, row=row, **symbols)
+
+value = rfc1902.Integer32(1)
+
+startTime = time.time()
+
+mibBuilder.exportSymbols(
+    'BENCHMARK-MIB', *[MibScalarInstance(column.name, (idx,), value)
+                       for column in columns
+                       for idx in range(1, count // COLUMNS + 1)])
+
+mibInstrumController.indexMib()
+
+print('%d instances exported and indexed in %.1f sec' % (
+    count, time.time() - startTime))
+
+name = PREFIX
+instances = 0
+
+startTime = time.time()
+
+while True:
+    node = mibInstrumController._getNextInstance(name)
+
+    if node is None or node.name[:len(PREFIX)] != PREFIX:
+        break
+
+    name = node.name
+    instances += 1
+
+elapsed = time.time() - startTime
+
+print('_getNextInstance(): %d instances in %.1f sec (%.2f usec per '
+      'instance)' % (instances, elapsed, elapsed / instances * 1000000))
+
+rspVarBinds = []
+
+
+def cbFun(varBinds, **context):
+    rspVarBinds[:] = varBinds
+
+
+name = PREFIX
+reads = min(instances, 100000)
+
+startTime = time.time()
+
+for x in range(reads):
+    mibInstrumController.readNextMibObjects((name, None), cbFun=cbFun)
+
+    name = rspVarBinds[0][0]
+
+elapsed = time.time() - startTime
+
+print('readNextMibObjects(): %d instances in %.1f sec (%.2f usec per '
+      'instance)' % (reads, elapsed, elapsed / reads * 1000000))
+
+varBinds = [(column.name, None) for column in columns]
+requests = min(count // COLUMNS // maxRepetitions, 1000)
+
+startTime = time.time()
+
+for x in range(requests):
+    for repetition in range(maxRepetitions):
+        mibInstrumController.readNextMibObjects(*varBinds, cbFun=cbFun)
+
+        varBinds = [(name, None) for name, val in rspVarBinds]
+
+elapsed = time.time() - startTime
+
+print('GETBULK, %d columns by %d repetitions: %d requests in %.1f sec '
+      '(%.2f msec per request, %.2f usec per instance)' % (
+          COLUMNS, maxRepetitions, requests, elapsed,
+          elapsed / requests * 1000,
+          elapsed / (requests * maxRepetitions * COLUMNS) * 1000000))
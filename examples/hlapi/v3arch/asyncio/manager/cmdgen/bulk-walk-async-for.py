@@ -0,0 +1,54 @@
+"""
+Bulk walk MIB with async for
+++++++++++++++++++++++++++++
+
+Walk MIB by a series of SNMP GETBULK requests iterating over
+MIB variables in `async for` loop (Python 3.5+):
+
+* with SNMPv3, user 'usr-none-none', no authentication, no privacy
+* over IPv4/UDP
+* to an Agent at demo.snmplabs.com:161
+* for all OIDs within SNMPv2-MIB::system
+* fetching next 25 MIB variables while current ones are processed
+* stop after 100 MIB variables
+* based on asyncio I/O framework
+
+Functionally similar to:
+
+| $ snmpbulkwalk -v3 -lnoAuthNoPriv -u usr-none-none -Cn0 -Cr25 \
+|                demo.snmplabs.com  SNMPv2-MIB::system
+
+"""#
+import asyncio
+from pysnmp.hlapi.v3arch.asyncio import *
+
+
+async def run():
+    snmpEngine = SnmpEngine()
+
+    async for (errorIndication, errorStatus,
+               errorIndex, varBinds) in bulkWalkCmd(
+            snmpEngine,
+            UsmUserData('usr-none-none'),
+            UdpTransportTarget(('demo.snmplabs.com', 161)),
+            ContextData(),
+            0, 25,
+            ObjectType(ObjectIdentity('SNMPv2-MIB', 'system')),
+            lexicographicMode=False, maxRows=100):
+
+        if errorIndication:
+            print(errorIndication)
+
+        elif errorStatus:
+            print('%s at %s' % (errorStatus.prettyPrint(),
+                                errorIndex and varBinds[int(errorIndex) - 1][0] or '?'))
+
+        else:
+            for varBind in varBinds:
+                print(' = '.join([x.prettyPrint() for x in varBind]))
+
+    snmpEngine.transportDispatcher.closeDispatcher()
+
+
+loop = asyncio.get_event_loop()
+loop.run_until_complete(run())
@@ -0,0 +1,67 @@
+"""
+Periodic polling
+++++++++++++++++
+
+Poll multiple SNMP Agents periodically with SNMP GET requests
+using the following options:
+
+* with SNMPv2c, community 'public'
+* over IPv4/UDP
+* to multiple Agents at demo.snmplabs.com
+* for instances of SNMPv2-MIB::sysUpTime.0 and IF-MIB::ifNumber.0
+  MIB objects
+* every 10 seconds, polls spread across the interval
+* report scheduled and achieved polling rates after a minute
+* based on asyncio I/O framework
+
+Functionally similar to:
+
+| $ watch -n 10 snmpget -v2c -c public demo.snmplabs.com:1161 SNMPv2-MIB::sysUpTime.0 IF-MIB::ifNumber.0
+| $ watch -n 10 snmpget -v2c -c public demo.snmplabs.com:2161 SNMPv2-MIB::sysUpTime.0 IF-MIB::ifNumber.0
+| $ watch -n 10 snmpget -v2c -c public demo.snmplabs.com:3161 SNMPv2-MIB::sysUpTime.0 IF-MIB::ifNumber.0
+
+"""#
+import asyncio
+from pysnmp.hlapi.v3arch.asyncio import *
+from pysnmp.entity.rfc3413.poller import configurePollScheduler
+
+
+# noinspection PyUnusedLocal
+def cbFun(snmpEngine, jobId, errorIndication, errorStatus, errorIndex,
+          varBinds, cbCtx):
+    if errorIndication:
+        print('%s: %s' % (cbCtx, errorIndication))
+
+    elif errorStatus:
+        print('%s: %s at %s' % (cbCtx, errorStatus.prettyPrint(),
+                                errorIndex and varBinds[int(errorIndex) - 1][0] or '?'))
+
+    else:
+        print('%s: %s' % (cbCtx, ', '.join(
+            [' = '.join([x.prettyPrint() for x in varBind])
+             for varBind in varBinds])))
+
+
+snmpEngine = SnmpEngine()
+
+scheduler = configurePollScheduler(snmpEngine, maxMessageSize=1472)
+
+for hostname in (('demo.snmplabs.com', 1161),
+                 ('demo.snmplabs.com', 2161),
+                 ('demo.snmplabs.com', 3161)):
+    pollCmd(snmpEngine,
+            CommunityData('public'),
+            UdpTransportTarget(hostname),
+            ContextData(),
+            ObjectType(ObjectIdentity('SNMPv2-MIB', 'sysUpTime', 0)),
+            ObjectType(ObjectIdentity('IF-MIB', 'ifNumber', 0)),
+            interval=10, cbFun=cbFun, cbCtx=hostname)
+
+loop = asyncio.get_event_loop()
+loop.run_until_complete(asyncio.sleep(60))
+
+stats = scheduler.getStats()
+
+print('%d jobs, polls per second scheduled %.2f, achieved %.2f, average '
+      'lateness %.3f sec' % (stats['jobs'], stats['scheduledRate'],
+                             stats['achievedRate'], stats['lateness']))
@@ -0,0 +1,65 @@
+"""
+Adaptive GETBULK max-repetitions
+++++++++++++++++++++++++++++++++
+
+Send a series of SNMP GETBULK requests having SNMP engine adjust
+max-repetitions to Agent responses:
+
+* with SNMPv2c, community 'public'
+* over IPv4/UDP
+* to an Agent at demo.snmplabs.com:161
+* starting with max-repetitions of 10, then growing it while
+  responses come back complete but keeping responses under
+  1472 octets (to avoid IP fragmentation on Ethernet)
+* for all OIDs past SNMPv2-MIB::system
+* report max-repetitions estimates at the end
+
+Functionally similar to:
+
+| $ snmpbulkwalk -v2c -c public -Cr10 demo.snmplabs.com SNMPv2-MIB::system
+
+"""#
+from pysnmp.hlapi.v3arch.asyncore import *
+from pysnmp.entity.rfc3413.cmdgen import configureMaxRepetitionsTuner
+
+
+# noinspection PyUnusedLocal,PyUnusedLocal,PyUnusedLocal
+def cbFun(snmpEngine, sendRequestHandle, errorIndication,
+          errorStatus, errorIndex, varBindTable, cbCtx):
+
+    if errorIndication:
+        print(errorIndication)
+        return
+
+    elif errorStatus:
+        print('%s at %s' % (errorStatus.prettyPrint(),
+                            errorIndex and varBindTable[-1][int(errorIndex) - 1][0] or '?'))
+        return
+
+    else:
+        for varBindRow in varBindTable:
+            for varBind in varBindRow:
+                print(' = '.join([x.prettyPrint() for x in varBind]))
+
+    return True  # request lower layers to do GETBULK and call us back
+
+
+snmpEngine = SnmpEngine()
+
+tuner = configureMaxRepetitionsTuner(snmpEngine, maxMessageSize=1472)
+
+bulkCmd(snmpEngine,
+        CommunityData('public'),
+        UdpTransportTarget(('demo.snmplabs.com', 161)),
+        ContextData(),
+        0, 10,
+        ObjectType(ObjectIdentity('SNMPv2-MIB', 'system')),
+        cbFun=cbFun)
+
+snmpEngine.transportDispatcher.runDispatcher()
+
+for (transportDomain, transportAddress), estimate in tuner.getEstimates().items():
+    print('%s: max-repetitions %d, %d responses, %d truncated, '
+          '%d tooBig' % (transportAddress[0], estimate['maxRepetitions'],
+                         estimate['responses'], estimate['truncated'],
+                         estimate['tooBig']))
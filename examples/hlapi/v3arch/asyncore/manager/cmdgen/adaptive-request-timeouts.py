@@ -0,0 +1,72 @@
+"""
+Adaptive request timeouts
++++++++++++++++++++++++++
+
+Send a series of SNMP GET requests to a few Agents having SNMP engine
+pick request timeout for each Agent from measured round-trip times:
+
+* with SNMPv2c, community 'public'
+* over IPv4/UDP
+* to Agents at demo.snmplabs.com:161 and 127.0.0.1:161
+* with request timeouts between 0.5 and 10 seconds, the timeout
+  configured for the target is used until the Agent responds
+* for 10 instances of SNMPv2-MIB::sysORDescr MIB object at each Agent
+* report round-trip time estimates at the end
+
+"""#
+from pysnmp.hlapi.v3arch.asyncore import *
+from pysnmp.entity.rfc3413.cmdgen import configureRttEstimator
+
+AGENTS = (
+    ('demo.snmplabs.com', 161),
+    ('127.0.0.1', 161)
+)
+
+
+# noinspection PyUnusedLocal
+def cbFun(snmpEngine, sendRequestHandle, errorIndication,
+          errorStatus, errorIndex, varBinds, cbCtx):
+    agent, sysORIndex = cbCtx
+
+    if errorIndication:
+        print('%s: %s' % (agent, errorIndication))
+        return
+
+    elif errorStatus:
+        print('%s: %s at %s' % (agent, errorStatus.prettyPrint(),
+                                errorIndex and varBinds[int(errorIndex) - 1][0] or '?'))
+
+    else:
+        for varBind in varBinds:
+            print('%s: %s' % (agent, ' = '.join([x.prettyPrint() for x in varBind])))
+
+    # query next instance once the previous one is in
+    if sysORIndex < 10:
+        getSysORDescr(snmpEngine, agent, sysORIndex + 1)
+
+
+def getSysORDescr(snmpEngine, agent, sysORIndex):
+    getCmd(snmpEngine,
+           CommunityData('public'),
+           UdpTransportTarget(agent, timeout=3, retries=3),
+           ContextData(),
+           ObjectType(ObjectIdentity('SNMPv2-MIB', 'sysORDescr', sysORIndex)),
+           cbFun=cbFun, cbCtx=(agent, sysORIndex))
+
+
+snmpEngine = SnmpEngine()
+
+estimator = configureRttEstimator(snmpEngine, minTimeout=0.5, maxTimeout=10)
+
+for agent in AGENTS:
+    getSysORDescr(snmpEngine, agent, 1)
+
+snmpEngine.transportDispatcher.runDispatcher()
+
+for (transportDomain, transportAddress), estimate in estimator.getEstimates().items():
+    if estimate['srtt'] is None:
+        print('%s: no response, %d timeouts' % (transportAddress[0], estimate['timeouts']))
+
+    else:
+        print('%s: srtt %.3f sec, rttvar %.3f sec, timeout %.2f sec' % (
+            transportAddress[0], estimate['srtt'], estimate['rttvar'], estimate['timeout']))
@@ -0,0 +1,62 @@
+"""
+Limit outstanding requests per agent
+++++++++++++++++++++++++++++++++++++
+
+Submit many SNMP GET requests all at once and have SNMP engine
+send them to each agent no more than a few at a time:
+
+* with SNMPv2c, community 'public'
+* over IPv4/UDP
+* to Agents at demo.snmplabs.com:161 and 127.0.0.1:161
+* keeping at most 4 requests in flight per Agent and at most 16
+  requests in flight in total
+* for 10 instances of SNMPv2-MIB::sysORDescr MIB object at each Agent
+* report request pipeline statistics at the end
+
+"""#
+from pysnmp.hlapi.v3arch.asyncore import *
+from pysnmp.entity.rfc3413.cmdgen import configureRequestPipeline
+
+AGENTS = (
+    ('demo.snmplabs.com', 161),
+    ('127.0.0.1', 161)
+)
+
+
+# noinspection PyUnusedLocal
+def cbFun(snmpEngine, sendRequestHandle, errorIndication,
+          errorStatus, errorIndex, varBinds, cbCtx):
+
+    if errorIndication:
+        print('%s: %s' % (cbCtx, errorIndication))
+
+    elif errorStatus:
+        print('%s: %s at %s' % (cbCtx, errorStatus.prettyPrint(),
+                                errorIndex and varBinds[int(errorIndex) - 1][0] or '?'))
+
+    else:
+        for varBind in varBinds:
+            print('%s: %s' % (cbCtx, ' = '.join([x.prettyPrint() for x in varBind])))
+
+
+snmpEngine = SnmpEngine()
+
+pipeline = configureRequestPipeline(
+    snmpEngine, maxInFlight=16, maxInFlightPerTarget=4)
+
+for agent in AGENTS:
+    for sysORIndex in range(1, 11):
+        getCmd(snmpEngine,
+               CommunityData('public'),
+               UdpTransportTarget(agent),
+               ContextData(),
+               ObjectType(ObjectIdentity('SNMPv2-MIB', 'sysORDescr', sysORIndex)),
+               cbFun=cbFun, cbCtx=agent)
+
+snmpEngine.transportDispatcher.runDispatcher()
+
+stats = pipeline.getStats()
+
+print('%d requests submitted, %d queued for %.2f sec on '
+      'average' % (stats['submitted'], stats['delayed'],
+                   stats['waitTime'] / (stats['delayed'] or 1)))
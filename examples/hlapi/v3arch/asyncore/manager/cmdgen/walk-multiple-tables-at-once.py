@@ -0,0 +1,63 @@
+"""
+Walk multiple MIB tables at once
+++++++++++++++++++++++++++++++++
+
+Walk columns of two MIB tables sharing the same index (IF-MIB::ifTable
+and IF-MIB::ifXTable, augmenting it) by concurrent SNMP GETBULK requests,
+having table rows merged by index:
+
+* with SNMPv2c, community 'public'
+* over IPv4/UDP
+* to an Agent at demo.snmplabs.com:161
+* for IF-MIB::ifDescr, IF-MIB::ifType, IF-MIB::ifName and
+  IF-MIB::ifHCInOctets columns
+* up to two columns per GETBULK request
+* stop once all columns have been walked
+
+Functionally similar to:
+
+| $ snmptable -v2c -c public -Ci demo.snmplabs.com IF-MIB::ifTable
+| $ snmptable -v2c -c public -Ci demo.snmplabs.com IF-MIB::ifXTable
+
+"""#
+from pysnmp.hlapi.v3arch.asyncore import *
+
+
+# noinspection PyUnusedLocal,PyUnusedLocal,PyUnusedLocal
+def cbFun(snmpEngine, sendRequestHandle, errorIndication,
+          errorStatus, errorIndex, varBindTable, cbCtx):
+
+    if errorIndication:
+        print(errorIndication)
+        return
+
+    elif errorStatus:
+        print('%s at column %s' % (errorStatus.prettyPrint(),
+                                   errorIndex or '?'))
+        return
+
+    elif not varBindTable:
+        print('all columns walked')
+        return
+
+    else:
+        for varBindRow in varBindTable:
+            print(', '.join([varBind[1].prettyPrint()
+                             for varBind in varBindRow]))
+
+    return True  # keep walking the tables
+
+
+snmpEngine = SnmpEngine()
+
+tableCmd(snmpEngine,
+         CommunityData('public'),
+         UdpTransportTarget(('demo.snmplabs.com', 161)),
+         ContextData(),
+         ObjectType(ObjectIdentity('IF-MIB', 'ifDescr')),
+         ObjectType(ObjectIdentity('IF-MIB', 'ifType')),
+         ObjectType(ObjectIdentity('IF-MIB', 'ifName')),
+         ObjectType(ObjectIdentity('IF-MIB', 'ifHCInOctets')),
+         maxColumns=2, cbFun=cbFun)
+
+snmpEngine.transportDispatcher.runDispatcher()
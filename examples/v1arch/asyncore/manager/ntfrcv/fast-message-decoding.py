@@ -0,0 +1,90 @@
+"""
+Fast notifications decoding
++++++++++++++++++++++++++++
+
+Receive SNMP TRAP messages with the following options:
+
+* SNMPv1/SNMPv2c
+* with any SNMP community
+* over IPv4/UDP, listening at 127.0.0.1:162
+* decode messages into plain Python tuples by the specialised
+  SNMP message codec rather than pyasn1
+* print received data on stdout
+
+Either of the following Net-SNMP commands will send notifications to this
+receiver:
+
+| $ snmptrap -v1 -c public 127.0.0.1 1.3.6.1.4.1.20408.4.1.1.2 127.0.0.1 1 1 123 1.3.6.1.2.1.1.1.0 s test
+| $ snmptrap -v2c -c public 127.0.0.1 123 1.3.6.1.6.3.1.1.5.1 1.3.6.1.2.1.1.5.0 s test
+
+"""#
+from pysnmp.carrier.asyncore.dispatch import AsyncoreDispatcher
+from pysnmp.carrier.asyncore.dgram import udp
+from pysnmp.proto import api
+from pysnmp.proto import error
+from pysnmp.proto.api import fastcodec
+
+
+# noinspection PyUnusedLocal
+def cbFun(transportDispatcher, transportDomain, transportAddress, wholeMsg):
+
+    while wholeMsg:
+        try:
+            msg, wholeMsg = fastcodec.decodeMessage(wholeMsg)
+
+        except error.ProtocolError as exc:
+            print('Broken message from %s: %s' % (transportAddress, exc))
+            return
+
+        msgVer, community, pdu = msg[0], msg[1], msg[-1]
+
+        if msgVer not in api.PROTOCOL_MODULES:
+            print('Unsupported SNMP version %s' % msgVer)
+            return
+
+        print('Notification message from %s:%s, community '
+              '%r: ' % (transportDomain, transportAddress, community))
+
+        if pdu[0] == fastcodec.TAG_V1_TRAP:
+            (pduType, enterprise, agentAddr, genericTrap,
+             specificTrap, timeStamp, varBinds) = pdu
+
+            print('Enterprise: %s' % '.'.join([str(x) for x in enterprise]))
+            print('Agent Address: %s' % '.'.join([str(x) for x in bytearray(agentAddr)]))
+            print('Generic Trap: %s' % genericTrap)
+            print('Specific Trap: %s' % specificTrap)
+            print('Uptime: %s' % timeStamp)
+
+        elif pdu[0] in (fastcodec.TAG_SNMPV2_TRAP,
+                        fastcodec.TAG_INFORM_REQUEST):
+            varBinds = pdu[-1]
+
+        else:
+            continue
+
+        print('Var-binds:')
+
+        for oid, value in varBinds:
+            print('%s = %s' % ('.'.join([str(x) for x in oid]),
+                               fastcodec.toAsn1Value(value).prettyPrint()))
+
+    return wholeMsg
+
+
+transportDispatcher = AsyncoreDispatcher()
+
+transportDispatcher.registerRecvCbFun(cbFun)
+
+# UDP/IPv4
+transportDispatcher.registerTransport(
+    udp.DOMAIN_NAME, udp.UdpSocketTransport().openServerMode(('localhost', 162))
+)
+
+transportDispatcher.jobStarted(1)
+
+try:
+    # Dispatcher will never finish as job#1 never reaches zero
+    transportDispatcher.runDispatcher()
+
+finally:
+    transportDispatcher.closeDispatcher()
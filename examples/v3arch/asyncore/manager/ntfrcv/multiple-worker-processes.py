@@ -0,0 +1,62 @@
+"""
+Receive notifications in many processes
++++++++++++++++++++++++++++++++++++++++
+
+Receive SNMP TRAP/INFORM messages with the following options:
+
+* SNMPv1/SNMPv2c
+* with SNMP community "public"
+* over IPv4/UDP, listening at 127.0.0.1:162
+* by four worker processes sharing the same UDP port (SO_REUSEPORT)
+* print received data and aggregated SNMP engine counters on stdout
+
+Either of the following Net-SNMP commands will send notifications to this
+receiver:
+
+| $ snmptrap -v2c -c public 127.0.0.1:162 123 1.3.6.1.6.3.1.1.5.1 1.3.6.1.2.1.1.5.0 s test
+
+"""#
+from pysnmp.entity import engine, config, workers
+from pysnmp.carrier.asyncore.dgram import udp
+from pysnmp.entity.rfc3413 import ntfrcv
+
+# Create SNMP engine with autogenernated engineID
+snmpEngine = engine.SnmpEngine()
+
+# SNMPv1/2c setup is done just once, workers inherit it
+
+# SecurityName <-> CommunityName mapping
+config.addV1System(snmpEngine, 'my-area', 'public')
+
+pool = workers.WorkerPool(snmpEngine, workers=4)
+
+# Transport setup
+
+# UDP over IPv4, each worker binds its own socket
+pool.addTransport(udp.DOMAIN_NAME, udp.UdpTransport, ('127.0.0.1', 162))
+
+
+# Callback function for receiving notifications
+# noinspection PyUnusedLocal,PyUnusedLocal,PyUnusedLocal
+def cbFun(snmpEngine, stateReference, contextEngineId, contextName,
+          varBinds, cbCtx):
+    print('Worker #%s: notification from ContextEngineId "%s", '
+          'ContextName "%s"' % (cbCtx, contextEngineId.prettyPrint(),
+                                contextName.prettyPrint()))
+
+    for name, val in varBinds:
+        print('%s = %s' % (name.prettyPrint(), val.prettyPrint()))
+
+
+# Register SNMP Application at the SNMP engine of each worker
+def initFun(snmpEngine, workerId, cbCtx):
+    ntfrcv.NotificationReceiver(snmpEngine, cbFun, workerId)
+
+
+# Report SNMP engine counters summed over workers
+def reportFun(counters, cbCtx):
+    print('Total snmpInPkts %s' % counters['snmpInPkts'])
+
+
+# Run workers till interrupted
+print(pool.run(initFun, reportFun))
@@ -6,45 +6,173 @@
 #
 # Limited-size dictionary-like class to use for caches
 #
+import time
+
+try:
+    from collections import OrderedDict
+
+except ImportError:
+    from ordereddict import OrderedDict
+
+from pysnmp import error
 
 
 class Cache(object):
-    def __init__(self, maxSize=256):
-        self._maxSize = maxSize
-        self._size = 0
-        self._chopSize = maxSize // 10
-        self._chopSize = self._chopSize or 1
+    """Limited-size dictionary-like cache.
+
+    Once `maxSize` entries are stored, each new entry evicts either the
+    least recently used (`LRU` policy) or, approximately, the least
+    frequently used (`LFU` policy) entry. Both policies evict in O(1).
+
+    If `ttl` (in seconds) is given, entries older than that are treated
+    as missing.
+
+    Hit, miss, eviction and expiration counters can be read with the
+    `getStats()` method.
+    """
+    LRU = 'lru'
+    LFU = 'lfu'
+
+    # access counts saturate here, that makes LFU approximate
+    MAX_FREQUENCY = 255
+
+    def __init__(self, maxSize=256, policy=LRU, ttl=None):
+        if policy not in (self.LRU, self.LFU):
+            raise error.PySnmpError('Unknown cache policy %r' % (policy,))
+
+        self._maxSize = max(maxSize, 1)
+        self._policy = policy
+        self._ttl = ttl
+
+        # key -> [value, expireAt, frequency]
         self._cache = {}
-        self._usage = {}
+
+        # frequency -> keys in the order of last access
+        self._buckets = {}
+        self._minFrequency = 0
+
+        self._hits = self._misses = 0
+        self._evictions = self._expirations = 0
 
     def __contains__(self, k):
-        return k in self._cache
+        if k in self._cache and not self._expired(k):
+            return True
+
+        self._misses += 1
+        return False
 
     def __getitem__(self, k):
-        self._usage[k] += 1
-        return self._cache[k]
+        if k not in self._cache or self._expired(k):
+            self._misses += 1
+            raise KeyError(k)
+
+        self._hits += 1
+
+        entry = self._cache[k]
+
+        self._touch(k, entry)
+
+        return entry[0]
 
     def __len__(self):
-        return self._size
+        return len(self._cache)
 
     def __setitem__(self, k, v):
-        if self._size >= self._maxSize:
-            usageKeys = sorted(
-                self._usage, key=lambda x, d=self._usage: d[x])
+        if self._ttl is None:
+            expireAt = None
+
+        else:
+            expireAt = time.time() + self._ttl
+
+        if k in self._cache:
+            entry = self._cache[k]
+            entry[0] = v
+            entry[1] = expireAt
 
-            for _k in usageKeys[:self._chopSize]:
-                del self._cache[_k]
-                del self._usage[_k]
+            self._touch(k, entry)
 
-            self._size -= self._chopSize
+            return
 
-        if k not in self._cache:
-            self._size += 1
-            self._usage[k] = 0
+        if len(self._cache) >= self._maxSize:
+            self._evict()
 
-        self._cache[k] = v
+        self._cache[k] = [v, expireAt, 0]
+
+        self._buckets.setdefault(0, OrderedDict())[k] = None
+        self._minFrequency = 0
 
     def __delitem__(self, k):
+        entry = self._cache.pop(k)
+        self._unlink(k, entry[2])
+
+    def get(self, k, default=None):
+        try:
+            return self[k]
+
+        except KeyError:
+            return default
+
+    def clear(self):
+        self._cache.clear()
+        self._buckets.clear()
+        self._minFrequency = 0
+
+    def getStats(self):
+        """Return cache performance counters as a dict"""
+        return {
+            'size': len(self._cache),
+            'maxSize': self._maxSize,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'expirations': self._expirations
+        }
+
+    def _expired(self, k):
+        entry = self._cache[k]
+
+        if entry[1] is None or entry[1] > time.time():
+            return False
+
+        del self[k]
+
+        self._expirations += 1
+
+        return True
+
+    def _unlink(self, k, frequency):
+        bucket = self._buckets[frequency]
+
+        del bucket[k]
+
+        if not bucket:
+            del self._buckets[frequency]
+
+    def _touch(self, k, entry):
+        frequency = entry[2]
+
+        if self._policy == self.LRU:
+            bucket = self._buckets[frequency]
+            bucket[k] = bucket.pop(k)
+            return
+
+        self._unlink(k, frequency)
+
+        if frequency < self.MAX_FREQUENCY:
+            entry[2] = frequency = frequency + 1
+
+        self._buckets.setdefault(frequency, OrderedDict())[k] = None
+
+    def _evict(self):
+        # the search is bound by MAX_FREQUENCY
+        while self._minFrequency not in self._buckets:
+            self._minFrequency += 1
+
+        k, _ = self._buckets[self._minFrequency].popitem(last=False)
+
+        if not self._buckets[self._minFrequency]:
+            del self._buckets[self._minFrequency]
+
         del self._cache[k]
-        del self._usage[k]
-        self._size -= 1
+
+        self._evictions += 1
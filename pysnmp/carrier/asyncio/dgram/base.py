@@ -31,6 +31,7 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 #
 import platform
+import socket
 import sys
 import traceback
 
@@ -42,6 +43,7 @@ except ImportError:
 
 from pysnmp import debug
 from pysnmp.carrier import error
+from pysnmp.carrier import sockmmsg
 from pysnmp.carrier.asyncio.base import AbstractAsyncioTransport
 
 IS_PYTHON_344_PLUS = platform.python_version_tuple() >= ('3', '4', '4')
@@ -57,6 +59,10 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
     def __init__(self, sock=None, sockMap=None, loop=None):
         self._writeQ = []
         self._lport = None
+        self._recvmmsg = self._sendmmsg = None
+        self._sock = None
+        self._flushing = self._writing = False
+        self._reusePort = False
 
         if loop is None:
             loop = asyncio.get_event_loop()
@@ -93,9 +99,130 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
     def connection_lost(self, exc):
         debug.logger & debug.FLAG_IO and debug.logger('connection_lost: invoked')
 
+    # Batched I/O bypasses asyncio datagram transport
+
+    def _openBatchedEndpoint(self, iface):
+        try:
+            sock = socket.socket(self.SOCK_FAMILY, socket.SOCK_DGRAM)
+
+            if self._reusePort:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+            if iface is not None:
+                sock.bind(iface)
+
+            sock.setblocking(False)
+
+        except socket.error as exc:
+            raise error.CarrierError('bind() for %s failed: %s' % (iface, exc))
+
+        self._sock = sock
+
+        self.loop.add_reader(sock.fileno(), self._readReady)
+
+        debug.logger & debug.FLAG_IO and debug.logger(
+            '_openBatchedEndpoint: socket %s open' % sock.fileno())
+
+        self._scheduleFlush()
+
+    def _readReady(self):
+        try:
+            incomingMessages = self._recvmmsg(self._sock)
+
+        except socket.error as exc:
+            debug.logger & debug.FLAG_IO and debug.logger(
+                '_readReady: ignoring socket error %s' % exc)
+            return
+
+        if not incomingMessages:
+            return
+
+        if self._cbFun is None:
+            raise error.CarrierError('Unable to call cbFun')
+
+        self.loop.call_soon(self._datagramsReceived, incomingMessages)
+
+    def _datagramsReceived(self, incomingMessages):
+        for datagram, transportAddress in incomingMessages:
+            self._cbFun(self, transportAddress, datagram)
+
+    def _scheduleFlush(self):
+        if self._writeQ and self._sock is not None and not self._flushing:
+            self._flushing = True
+            self.loop.call_soon(self._flushWriteQ)
+
+    def _flushWriteQ(self):
+        while self._writeQ:
+            try:
+                count = self._sendmmsg(self._sock, self._writeQ)
+
+            except (BlockingIOError, InterruptedError):
+                if not self._writing:
+                    self.loop.add_writer(self._sock.fileno(), self._flushWriteQ)
+                    self._writing = True
+
+                return
+
+            except socket.error as exc:
+                outgoingMessage, transportAddress = self._writeQ.pop(0)
+
+                debug.logger & debug.FLAG_IO and debug.logger(
+                    '_flushWriteQ: dropping message to %r on socket '
+                    'error %s' % (transportAddress, exc))
+
+                continue
+
+            del self._writeQ[:count]
+
+        if self._writing:
+            self.loop.remove_writer(self._sock.fileno())
+            self._writing = False
+
+        self._flushing = False
+
     # AbstractAsyncioTransport API
 
+    def enableBatching(self, flag=1, batchSize=sockmmsg.BATCH_SIZE):
+        """Receive and send up to `batchSize` datagrams per system call.
+
+        Relies on Linux recvmmsg()/sendmmsg() calls. Must be called
+        before the transport is open.
+        """
+        if self._lport is not None or self._sock is not None:
+            raise error.CarrierError(
+                'Batching can not be changed on open transport')
+
+        if flag:
+            self._recvmmsg = sockmmsg.getRecvMmsg(batchSize)
+            self._sendmmsg = sockmmsg.getSendMmsg(batchSize)
+
+        else:
+            self._recvmmsg = self._sendmmsg = None
+
+        return self
+
+    def enableReusePort(self, flag=1):
+        """Let many sockets (processes) bind the same address and port.
+
+        Must be called before the transport is open.
+        """
+        if not hasattr(socket, 'SO_REUSEPORT'):
+            raise error.CarrierError(
+                'SO_REUSEPORT socket option is not supported by this OS')
+
+        if self._lport is not None or self._sock is not None:
+            raise error.CarrierError(
+                'SO_REUSEPORT can not be changed on open transport')
+
+        self._reusePort = bool(flag)
+
+        return self
+
     def openClientMode(self, iface=None):
+        if self._recvmmsg is not None:
+            self._openBatchedEndpoint(iface)
+            return self
+
         try:
             c = self.loop.create_datagram_endpoint(
                 lambda: self, local_addr=iface, family=self.SOCK_FAMILY
@@ -114,9 +241,14 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
         return self
 
     def openServerMode(self, iface):
+        if self._recvmmsg is not None:
+            self._openBatchedEndpoint(iface)
+            return self
+
         try:
             c = self.loop.create_datagram_endpoint(
-                lambda: self, local_addr=iface, family=self.SOCK_FAMILY
+                lambda: self, local_addr=iface, family=self.SOCK_FAMILY,
+                reuse_port=self._reusePort or None
             )
 
             # Avoid deprecation warning for asyncio.async()
@@ -138,6 +270,16 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
         if self.transport is not None:
             self.transport.close()
 
+        if self._sock is not None:
+            self.loop.remove_reader(self._sock.fileno())
+
+            if self._writing:
+                self.loop.remove_writer(self._sock.fileno())
+                self._writing = False
+
+            self._sock.close()
+            self._sock = None
+
         AbstractAsyncioTransport.closeTransport(self)
 
     def sendMessage(self, outgoingMessage, transportAddress):
@@ -146,7 +288,12 @@ class DgramAsyncioProtocol(asyncio.DatagramProtocol, AbstractAsyncioTransport):
             '%s' % (self.transport is None and "queuing" or "sending",
                     transportAddress, debug.hexdump(outgoingMessage)))
 
-        if self.transport is None:
+        if self._sendmmsg is not None:
+            self._writeQ.append(
+                (outgoingMessage, self.normalizeAddress(transportAddress)))
+            self._scheduleFlush()
+
+        elif self.transport is None:
             self._writeQ.append((outgoingMessage, transportAddress))
 
         else:
@@ -8,7 +8,7 @@ import errno
 import socket
 
 from pysnmp import debug
-from pysnmp.carrier import sockmsg, error
+from pysnmp.carrier import sockmmsg, sockmsg, error
 from pysnmp.carrier.asyncore.base import AbstractSocketTransport
 
 # Ignore these socket errors
@@ -41,6 +41,7 @@ class DgramSocketTransport(AbstractSocketTransport):
             return d, self.ADDRESS_TYPE(a)
 
         self._recvfrom = __recvfrom
+        self._recvmmsg = self._sendmmsg = None
         AbstractSocketTransport.__init__(self, sock, sockMap)
 
     def openClientMode(self, iface=None):
@@ -79,6 +80,30 @@ class DgramSocketTransport(AbstractSocketTransport):
 
         return self
 
+    def enableReusePort(self, flag=1):
+        """Let many sockets (processes) bind the same address and port.
+
+        Must be called before `openServerMode()`.
+        """
+        if not hasattr(socket, 'SO_REUSEPORT'):
+            raise error.CarrierError(
+                'SO_REUSEPORT socket option is not supported by this OS')
+
+        try:
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_REUSEPORT, flag
+            )
+
+        except socket.error as exc:
+            raise error.CarrierError('setsockopt() for SO_REUSEPORT '
+                                     'failed: %s' % exc)
+
+        debug.logger & debug.FLAG_IO and debug.logger(
+            'enableReusePort: %s option SO_REUSEPORT on '
+            'socket %s' % (flag and "enabled" or "disabled", self.socket.fileno()))
+
+        return self
+
     def enablePktInfo(self, flag=1):
         if (not hasattr(self.socket, 'sendmsg') or
                 not hasattr(self.socket, 'recvmsg')):
@@ -111,6 +136,42 @@ class DgramSocketTransport(AbstractSocketTransport):
 
         return self
 
+    def enableBatching(self, flag=1, batchSize=sockmmsg.BATCH_SIZE):
+        """Receive and send up to `batchSize` datagrams per system call.
+
+        Relies on Linux recvmmsg()/sendmmsg() calls. Can not be used
+        along with `enablePktInfo()`.
+        """
+        if not flag:
+            self._recvmmsg = self._sendmmsg = None
+            return self
+
+        try:
+            if self.socket.family == socket.AF_INET:
+                pktInfo = self.socket.getsockopt(
+                    socket.SOL_IP, socket.IP_PKTINFO)
+
+            else:
+                pktInfo = self.socket.getsockopt(
+                    socket.SOL_IPV6, socket.IPV6_RECVPKTINFO)
+
+        except socket.error:
+            pktInfo = 0
+
+        if pktInfo:
+            raise error.CarrierError(
+                'recvmmsg()/sendmmsg() interface does not support '
+                'IP_PKTINFO')
+
+        self._recvmmsg = sockmmsg.getRecvMmsg(batchSize)
+        self._sendmmsg = sockmmsg.getSendMmsg(batchSize)
+
+        debug.logger & debug.FLAG_IO and debug.logger(
+            'enableBatching: up to %d datagrams per system call on socket '
+            '%s' % (batchSize, self.socket.fileno()))
+
+        return self
+
     def enableTransparent(self, flag=1):
         try:
             if self.socket.family == socket.AF_INET:
@@ -172,6 +233,10 @@ class DgramSocketTransport(AbstractSocketTransport):
         return self.__outQueue
 
     def handle_write(self):
+        if self._sendmmsg is not None:
+            self._handleBatchedWrite()
+            return
+
         outgoingMessage, transportAddress = self.__outQueue.pop(0)
 
         debug.logger & debug.FLAG_IO and debug.logger(
@@ -196,10 +261,63 @@ class DgramSocketTransport(AbstractSocketTransport):
                 raise error.CarrierError(
                     'sendto() failed for %s: %s' % (transportAddress, exc))
 
+    def _handleBatchedWrite(self):
+        try:
+            count = self._sendmmsg(self.socket, self.__outQueue)
+
+        except socket.error as exc:
+            # the first message in the queue has failed
+            outgoingMessage, transportAddress = self.__outQueue.pop(0)
+
+            if exc.args[0] in SOCK_ERRORS:
+                debug.logger & debug.FLAG_IO and debug.logger(
+                    'handle_write: ignoring socket error %s' % exc)
+
+            else:
+                raise error.CarrierError(
+                    'sendmmsg() failed for %s: %s' % (transportAddress, exc))
+
+        else:
+            debug.logger & debug.FLAG_IO and debug.logger(
+                'handle_write: sent %d outgoing messages' % count)
+
+            del self.__outQueue[:count]
+
     def readable(self):
         return True
 
+    def _handleBatchedRead(self):
+        try:
+            incomingMessages = self._recvmmsg(self.socket)
+
+        except socket.error as exc:
+            if exc.args[0] in SOCK_ERRORS:
+                debug.logger & debug.FLAG_IO and debug.logger(
+                    'handle_read: known socket error %s' % exc)
+                SOCK_ERRORS[exc.args[0]] and self.handle_close()
+                return
+
+            else:
+                raise error.CarrierError('recvmmsg() failed: %s' % exc)
+
+        localAddress = self.getLocalAddress()
+
+        for incomingMessage, transportAddress in incomingMessages:
+            transportAddress = self.ADDRESS_TYPE(
+                transportAddress).setLocalAddress(localAddress)
+
+            debug.logger & debug.FLAG_IO and debug.logger(
+                'handle_read: transportAddress %r -> %r incomingMessage (%d '
+                'octets) %s' % (transportAddress, localAddress,
+                                len(incomingMessage), debug.hexdump(incomingMessage)))
+
+            self._cbFun(self, transportAddress, incomingMessage)
+
     def handle_read(self):
+        if self._recvmmsg is not None:
+            self._handleBatchedRead()
+            return
+
         try:
             incomingMessage, transportAddress = self._recvfrom(self.socket, 65535)
 
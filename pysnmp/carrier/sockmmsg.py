@@ -0,0 +1,271 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysnmp/license.html
+#
+# The following routines receive and send many datagrams per system call
+# by means of Linux-specific recvmmsg()/sendmmsg() calls.
+#
+# These calls are not exposed by the socket module so we go through
+# ctypes. Only IPv4 and IPv6 datagram sockets are supported.
+#
+import ctypes
+import errno
+import os
+import socket
+import struct
+
+from pysnmp import debug
+from pysnmp.carrier import error
+
+BATCH_SIZE = 32
+
+BUFFER_SIZE = 65535
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+
+    _recvmmsg = _libc.recvmmsg
+    _sendmmsg = _libc.sendmmsg
+
+except (OSError, AttributeError):
+    _recvmmsg = _sendmmsg = None
+
+# sizeof(struct sockaddr_storage)
+SOCKADDR_SIZE = 128
+
+MSG_TRUNC = int(getattr(socket, 'MSG_TRUNC', 0x20))
+
+
+class iovec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(iovec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', msghdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+
+if _recvmmsg is not None:
+    _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(mmsghdr),
+                          ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    _recvmmsg.restype = ctypes.c_int
+
+    _sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(mmsghdr),
+                          ctypes.c_uint, ctypes.c_int]
+    _sendmmsg.restype = ctypes.c_int
+
+
+def isSupported():
+    return _recvmmsg is not None and _sendmmsg is not None
+
+
+def _raiseSocketError():
+    err = ctypes.get_errno()
+    raise socket.error(err, os.strerror(err))
+
+
+def _unpackAddress(buf, offset):
+    family, = struct.unpack_from('=H', buf, offset)
+
+    if family == socket.AF_INET:
+        port, = struct.unpack_from('!H', buf, offset + 2)
+        host = socket.inet_ntop(
+            socket.AF_INET, bytes(buf[offset + 4:offset + 8]))
+        return host, port
+
+    elif family == socket.AF_INET6:
+        port, flowinfo = struct.unpack_from('!HI', buf, offset + 2)
+        scopeId, = struct.unpack_from('=I', buf, offset + 24)
+        host = socket.inet_ntop(
+            socket.AF_INET6, bytes(buf[offset + 8:offset + 24]))
+        return host, port, flowinfo, scopeId
+
+    raise error.CarrierError('Unsupported address family %s' % family)
+
+
+def _packAddress(buf, offset, transportAddress):
+    """Pack address into `buf`, return its length or 0 if not numeric"""
+    host, port = transportAddress[:2]
+
+    try:
+        packed = socket.inet_pton(socket.AF_INET, host)
+
+    except (socket.error, ValueError):
+        pass
+
+    else:
+        struct.pack_into('=H', buf, offset, socket.AF_INET)
+        struct.pack_into('!H4s8x', buf, offset + 2, port, packed)
+        return 16
+
+    try:
+        packed = socket.inet_pton(socket.AF_INET6, host)
+
+    except (socket.error, ValueError):
+        return 0
+
+    flowinfo = scopeId = 0
+
+    if len(transportAddress) > 3:
+        flowinfo, scopeId = transportAddress[2:4]
+
+    struct.pack_into('=H', buf, offset, socket.AF_INET6)
+    struct.pack_into('!HI16s', buf, offset + 2, port, flowinfo, packed)
+    struct.pack_into('=I', buf, offset + 24, scopeId)
+    return 28
+
+
+def getRecvMmsg(batchSize=BATCH_SIZE, bufferSize=BUFFER_SIZE):
+    """Return `recvmmsg(sock)` callable returning a list of datagrams.
+
+    Each datagram is reported as (data, transportAddress) tuple. Empty
+    list is returned if nothing is pending at the socket.
+    """
+    if not isSupported():
+        raise error.CarrierError(
+            'recvmmsg()/sendmmsg() interface is not supported by this OS')
+
+    dataBuf = bytearray(batchSize * bufferSize)
+    nameBuf = bytearray(batchSize * SOCKADDR_SIZE)
+
+    dataPtr = ctypes.addressof(ctypes.c_char.from_buffer(dataBuf))
+    namePtr = ctypes.addressof(ctypes.c_char.from_buffer(nameBuf))
+
+    iovecs = (iovec * batchSize)()
+    msgs = (mmsghdr * batchSize)()
+
+    for idx in range(batchSize):
+        iovecs[idx].iov_base = dataPtr + idx * bufferSize
+        iovecs[idx].iov_len = bufferSize
+
+        hdr = msgs[idx].msg_hdr
+        hdr.msg_name = namePtr + idx * SOCKADDR_SIZE
+        hdr.msg_iov = ctypes.pointer(iovecs[idx])
+        hdr.msg_iovlen = 1
+
+    data = memoryview(dataBuf)
+
+    hdrs = [msg.msg_hdr for msg in msgs]
+
+    # number of headers filled in by the previous call
+    used = [batchSize]
+
+    def recvmmsg(s):
+        for idx in range(used[0]):
+            hdrs[idx].msg_namelen = SOCKADDR_SIZE
+
+        count = _recvmmsg(s.fileno(), msgs, batchSize, 0, None)
+
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+
+            _raiseSocketError()
+
+        used[0] = count
+
+        incomingMessages = []
+
+        for idx in range(count):
+            msg = msgs[idx]
+
+            if hdrs[idx].msg_flags & MSG_TRUNC:
+                debug.logger & debug.FLAG_IO and debug.logger(
+                    'recvmmsg: dropping truncated datagram')
+                continue
+
+            offset = idx * bufferSize
+
+            incomingMessages.append(
+                (data[offset:offset + msg.msg_len].tobytes(),
+                 _unpackAddress(nameBuf, idx * SOCKADDR_SIZE)))
+
+        debug.logger & debug.FLAG_IO and debug.logger(
+            'recvmmsg: received %d datagrams' % count)
+
+        return incomingMessages
+
+    return recvmmsg
+
+
+def getSendMmsg(batchSize=BATCH_SIZE):
+    """Return `sendmmsg(sock, outgoingMessages)` callable.
+
+    The `outgoingMessages` is a sequence of (data, transportAddress)
+    tuples, up to `batchSize` of them are sent at once. Returns the
+    number of datagrams sent from the head of the sequence.
+    """
+    if not isSupported():
+        raise error.CarrierError(
+            'recvmmsg()/sendmmsg() interface is not supported by this OS')
+
+    nameBuf = bytearray(batchSize * SOCKADDR_SIZE)
+
+    namePtr = ctypes.addressof(ctypes.c_char.from_buffer(nameBuf))
+
+    iovecs = (iovec * batchSize)()
+    msgs = (mmsghdr * batchSize)()
+
+    for idx in range(batchSize):
+        hdr = msgs[idx].msg_hdr
+        hdr.msg_name = namePtr + idx * SOCKADDR_SIZE
+        hdr.msg_iov = ctypes.pointer(iovecs[idx])
+        hdr.msg_iovlen = 1
+
+    def sendmmsg(s, outgoingMessages):
+        # keep outgoing data referenced till the call is complete
+        buffers = []
+
+        for idx, (outgoingMessage, transportAddress) in enumerate(
+                outgoingMessages[:batchSize]):
+
+            namelen = _packAddress(
+                nameBuf, idx * SOCKADDR_SIZE, transportAddress)
+
+            if not namelen:
+                # non-numeric address would need a resolver
+                if not idx:
+                    s.sendto(outgoingMessage, transportAddress)
+                    return 1
+
+                break
+
+            buf = ctypes.c_char_p(outgoingMessage)
+            buffers.append(buf)
+
+            iovecs[idx].iov_base = ctypes.cast(buf, ctypes.c_void_p).value
+            iovecs[idx].iov_len = len(outgoingMessage)
+
+            msgs[idx].msg_hdr.msg_namelen = namelen
+
+        count = _sendmmsg(s.fileno(), msgs, len(buffers), 0)
+
+        if count < 0:
+            _raiseSocketError()
+
+        debug.logger & debug.FLAG_IO and debug.logger(
+            'sendmmsg: sent %d of %d datagrams' % (count, len(buffers)))
+
+        return count
+
+    return sendmmsg
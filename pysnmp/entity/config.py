@@ -4,11 +4,17 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import csv
+import json
+import multiprocessing
+
 from pyasn1.compat.octets import null
+from pyasn1.error import PyAsn1Error
 
 from pysnmp import error
 from pysnmp.carrier.asyncore.dgram import udp
 from pysnmp.carrier.asyncore.dgram import udp6
+from pysnmp.proto.secmod.rfc3414 import localkey
 from pysnmp.proto.secmod.rfc3414.auth import hmacmd5
 from pysnmp.proto.secmod.rfc3414.auth import hmacsha
 from pysnmp.proto.secmod.rfc3414.auth import noauth
@@ -96,12 +102,8 @@ def __cookV1SystemInfo(snmpEngine, communityIndex):
     return snmpCommunityEntry, tblIdx, snmpEngineID
 
 
-def addV1System(snmpEngine, communityIndex, communityName,
-                contextEngineId=None, contextName=None,
-                transportTag=None, securityName=None):
-    (snmpCommunityEntry, tblIdx,
-     snmpEngineID) = __cookV1SystemInfo(snmpEngine, communityIndex)
-
+def __cookV1SystemParams(snmpEngineID, communityIndex, contextEngineId,
+                         contextName, securityName):
     if contextEngineId is None:
         contextEngineId = snmpEngineID.syntax
 
@@ -113,6 +115,19 @@ def addV1System(snmpEngine, communityIndex, communityName,
 
     securityName = securityName is not None and securityName or communityIndex
 
+    return contextEngineId, contextName, securityName
+
+
+def addV1System(snmpEngine, communityIndex, communityName,
+                contextEngineId=None, contextName=None,
+                transportTag=None, securityName=None):
+    (snmpCommunityEntry, tblIdx,
+     snmpEngineID) = __cookV1SystemInfo(snmpEngine, communityIndex)
+
+    contextEngineId, contextName, securityName = __cookV1SystemParams(
+        snmpEngineID, communityIndex, contextEngineId, contextName,
+        securityName)
+
     snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
         (snmpCommunityEntry.name + (8,) + tblIdx, 'destroy'),
         snmpEngine=snmpEngine
@@ -177,46 +192,8 @@ def __cookV3UserInfo(snmpEngine, securityName, securityEngineId):
     return securityEngineId, usmUserEntry, tblIdx1, pysnmpUsmSecretEntry, tblIdx2
 
 
-def addV3User(snmpEngine, userName,
-              authProtocol=USM_AUTH_NONE, authKey=None,
-              privProtocol=USM_PRIV_NONE, privKey=None,
-              securityEngineId=None,
-              securityName=None,
-              authKeyType=USM_KEY_TYPE_PASSPHRASE,
-              privKeyType=USM_KEY_TYPE_PASSPHRASE):
-
-    mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
-
-    if securityName is None:
-        securityName = userName
-
-    (securityEngineId, usmUserEntry, tblIdx1,
-     pysnmpUsmSecretEntry, tblIdx2) = __cookV3UserInfo(
-        snmpEngine, securityName, securityEngineId)
-
-    # Load augmenting table before creating new row in base one
-    pysnmpUsmKeyEntry, = mibBuilder.importSymbols(
-        'PYSNMP-USM-MIB', 'pysnmpUsmKeyEntry')
-
-    # Load clone-from (may not be needed)
-    zeroDotZero, = mibBuilder.importSymbols(
-        'SNMPv2-SMI', 'zeroDotZero')
-
-    snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
-        (usmUserEntry.name + (13,) + tblIdx1, 'destroy'),
-        snmpEngine=snmpEngine
-    )
-
-    snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
-        (usmUserEntry.name + (2,) + tblIdx1, userName),
-        (usmUserEntry.name + (3,) + tblIdx1, securityName),
-        (usmUserEntry.name + (4,) + tblIdx1, zeroDotZero.name),
-        (usmUserEntry.name + (5,) + tblIdx1, authProtocol),
-        (usmUserEntry.name + (8,) + tblIdx1, privProtocol),
-        (usmUserEntry.name + (13,) + tblIdx1, 'createAndGo'),
-        snmpEngine=snmpEngine
-    )
-
+def __cookV3UserKeys(mibBuilder, authProtocol, authKey, privProtocol,
+                     privKey, securityEngineId, authKeyType, privKeyType):
     if authProtocol not in AUTH_SERVICES:
         raise error.PySnmpError('Unknown auth protocol %s' % (authProtocol,))
 
@@ -262,6 +239,55 @@ def addV3User(snmpEngine, userName,
             authProtocol, masterPrivKey, securityEngineId
         )
 
+    return (authKey, masterAuthKey, localAuthKey,
+            privKey, masterPrivKey, localPrivKey)
+
+
+def addV3User(snmpEngine, userName,
+              authProtocol=USM_AUTH_NONE, authKey=None,
+              privProtocol=USM_PRIV_NONE, privKey=None,
+              securityEngineId=None,
+              securityName=None,
+              authKeyType=USM_KEY_TYPE_PASSPHRASE,
+              privKeyType=USM_KEY_TYPE_PASSPHRASE):
+
+    mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+    if securityName is None:
+        securityName = userName
+
+    (securityEngineId, usmUserEntry, tblIdx1,
+     pysnmpUsmSecretEntry, tblIdx2) = __cookV3UserInfo(
+        snmpEngine, securityName, securityEngineId)
+
+    # Load augmenting table before creating new row in base one
+    pysnmpUsmKeyEntry, = mibBuilder.importSymbols(
+        'PYSNMP-USM-MIB', 'pysnmpUsmKeyEntry')
+
+    # Load clone-from (may not be needed)
+    zeroDotZero, = mibBuilder.importSymbols(
+        'SNMPv2-SMI', 'zeroDotZero')
+
+    snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
+        (usmUserEntry.name + (13,) + tblIdx1, 'destroy'),
+        snmpEngine=snmpEngine
+    )
+
+    snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
+        (usmUserEntry.name + (2,) + tblIdx1, userName),
+        (usmUserEntry.name + (3,) + tblIdx1, securityName),
+        (usmUserEntry.name + (4,) + tblIdx1, zeroDotZero.name),
+        (usmUserEntry.name + (5,) + tblIdx1, authProtocol),
+        (usmUserEntry.name + (8,) + tblIdx1, privProtocol),
+        (usmUserEntry.name + (13,) + tblIdx1, 'createAndGo'),
+        snmpEngine=snmpEngine
+    )
+
+    (authKey, masterAuthKey, localAuthKey,
+     privKey, masterPrivKey, localPrivKey) = __cookV3UserKeys(
+        mibBuilder, authProtocol, authKey, privProtocol, privKey,
+        securityEngineId, authKeyType, privKeyType)
+
     # Commit only the keys we have
 
     snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
@@ -386,6 +412,84 @@ def delV3User(snmpEngine,
         )
 
 
+def _hashPassphrases(userKeys):
+    for authProtocol, authKey, privProtocol, privKey in userKeys:
+        if authKey:
+            AUTH_SERVICES[authProtocol].hashPassphrase(authKey)
+
+        if privKey:
+            PRIV_SERVICES[privProtocol].hashPassphrase(authProtocol, privKey)
+
+
+def _precomputeKeys(userKeys):
+    # runs in a worker process
+    keyCache = localkey.KeyCache()
+
+    localkey.setKeyCache(keyCache)
+
+    _hashPassphrases(userKeys)
+
+    return keyCache.items()
+
+
+def precomputeKeys(userKeys, processes=None):
+    """Turn many USM pass-phrases into master keys at once.
+
+    Master keys derivation is spread over a pool of `processes` worker
+    processes (defaults to the number of CPUs). Derived keys end up in
+    the master keys cache so that subsequent :py:func:`addV3User` calls
+    with the same pass-phrases complete quickly.
+
+    Parameters
+    ----------
+    userKeys: iterable of
+        (`authProtocol`, `authKey`, `privProtocol`, `privKey`) tuples
+        carrying the same values as passed to :py:func:`addV3User`.
+
+    processes: int
+        Number of worker processes to use. Keys are derived in the
+        calling process if `processes` is 1.
+
+    Returns
+    -------
+    int
+        Number of keys in the master keys cache.
+    """
+    userKeys = list(set(userKeys))
+
+    for authProtocol, authKey, privProtocol, privKey in userKeys:
+        if authProtocol not in AUTH_SERVICES:
+            raise error.PySnmpError('Unknown auth protocol %s' % (authProtocol,))
+
+        if privProtocol not in PRIV_SERVICES:
+            raise error.PySnmpError('Unknown privacy protocol %s' % (privProtocol,))
+
+    keyCache = localkey.getKeyCache()
+
+    if processes == 1:
+        _hashPassphrases(userKeys)
+
+    else:
+        if not processes:
+            processes = multiprocessing.cpu_count()
+
+        chunks = [userKeys[idx::processes] for idx in range(processes)]
+
+        pool = multiprocessing.Pool(processes)
+
+        try:
+            for items in pool.map(_precomputeKeys, chunks):
+                keyCache.update(items)
+
+        finally:
+            pool.terminate()
+
+    debug.logger & debug.FLAG_SM and debug.logger(
+        'precomputeKeys: %d master keys cached' % len(keyCache))
+
+    return len(keyCache)
+
+
 def __cookTargetParamsInfo(snmpEngine, name):
     mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
 
@@ -395,20 +499,24 @@ def __cookTargetParamsInfo(snmpEngine, name):
     return snmpTargetParamsEntry, tblIdx
 
 
-# mpModel: 0 == SNMPv1, 1 == SNMPv2c, 3 == SNMPv3
-def addTargetParams(snmpEngine, name, securityName, securityLevel, mpModel=3):
+def __cookSecurityModel(mpModel):
     if mpModel == 0:
-        securityModel = 1
+        return 1
 
     elif mpModel in (1, 2):
-        securityModel = 2
+        return 2
 
     elif mpModel == 3:
-        securityModel = 3
+        return 3
 
     else:
         raise error.PySnmpError('Unknown MP model %s' % mpModel)
 
+
+# mpModel: 0 == SNMPv1, 1 == SNMPv2c, 3 == SNMPv3
+def addTargetParams(snmpEngine, name, securityName, securityLevel, mpModel=3):
+    securityModel = __cookSecurityModel(mpModel)
+
     snmpTargetParamsEntry, tblIdx = __cookTargetParamsInfo(snmpEngine, name)
 
     snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
@@ -444,16 +552,8 @@ def __cookTargetAddrInfo(snmpEngine, addrName):
     return snmpTargetAddrEntry, snmpSourceAddrEntry, tblIdx
 
 
-def addTargetAddr(snmpEngine, addrName, transportDomain, transportAddress,
-                  params, timeout=None, retryCount=None, tagList=null,
-                  sourceAddress=None):
-
-    mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
-
-    (snmpTargetAddrEntry,
-     snmpSourceAddrEntry,
-     tblIdx) = __cookTargetAddrInfo(snmpEngine, addrName)
-
+def __cookTargetAddresses(mibBuilder, transportDomain, transportAddress,
+                          sourceAddress):
     if transportDomain[:len(SNMP_UDP_DOMAIN)] == SNMP_UDP_DOMAIN:
         SnmpUDPAddress, = mibBuilder.importSymbols('SNMPv2-TM', 'SnmpUDPAddress')
         transportAddress = SnmpUDPAddress(transportAddress)
@@ -472,6 +572,22 @@ def addTargetAddr(snmpEngine, addrName, transportDomain, transportAddress,
 
         sourceAddress = TransportAddressIPv6(sourceAddress)
 
+    return transportAddress, sourceAddress
+
+
+def addTargetAddr(snmpEngine, addrName, transportDomain, transportAddress,
+                  params, timeout=None, retryCount=None, tagList=null,
+                  sourceAddress=None):
+
+    mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+    (snmpTargetAddrEntry,
+     snmpSourceAddrEntry,
+     tblIdx) = __cookTargetAddrInfo(snmpEngine, addrName)
+
+    transportAddress, sourceAddress = __cookTargetAddresses(
+        mibBuilder, transportDomain, transportAddress, sourceAddress)
+
     snmpEngine.msgAndPduDsp.mibInstrumController.writeMibObjects(
         (snmpTargetAddrEntry.name + (9,) + tblIdx, 'destroy'),
         snmpEngine=snmpEngine
@@ -950,3 +1066,335 @@ def setInitialVacmParameters(snmpEngine):
                 "included", (1, 3, 6, 1, 6, 3, 11, 2, 1), "")
     addVacmView(snmpEngine, "restricted",
                 "included", (1, 3, 6, 1, 6, 3, 15, 1, 1), "")
+
+
+# Bulk configuration
+
+def __bulkV1SystemRows(snmpEngine, communityIndex, communityName,
+                       contextEngineId=None, contextName=None,
+                       transportTag=None, securityName=None):
+    (snmpCommunityEntry, tblIdx,
+     snmpEngineID) = __cookV1SystemInfo(snmpEngine, communityIndex)
+
+    contextEngineId, contextName, securityName = __cookV1SystemParams(
+        snmpEngineID, communityIndex, contextEngineId, contextName,
+        securityName)
+
+    return [
+        (snmpCommunityEntry, tblIdx,
+         {1: communityIndex, 2: communityName, 3: securityName,
+          4: contextEngineId, 5: contextName, 6: transportTag,
+          7: 'nonVolatile', 8: 'active'})
+    ]
+
+
+def __bulkV3UserRows(snmpEngine, userName,
+                     authProtocol=USM_AUTH_NONE, authKey=None,
+                     privProtocol=USM_PRIV_NONE, privKey=None,
+                     securityEngineId=None,
+                     securityName=None,
+                     authKeyType=USM_KEY_TYPE_PASSPHRASE,
+                     privKeyType=USM_KEY_TYPE_PASSPHRASE):
+
+    mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+    if securityName is None:
+        securityName = userName
+
+    (securityEngineId, usmUserEntry, tblIdx1,
+     pysnmpUsmSecretEntry, tblIdx2) = __cookV3UserInfo(
+        snmpEngine, securityName, securityEngineId)
+
+    pysnmpUsmKeyEntry, = mibBuilder.importSymbols(
+        'PYSNMP-USM-MIB', 'pysnmpUsmKeyEntry')
+
+    zeroDotZero, = mibBuilder.importSymbols(
+        'SNMPv2-SMI', 'zeroDotZero')
+
+    (authKey, masterAuthKey, localAuthKey,
+     privKey, masterPrivKey, localPrivKey) = __cookV3UserKeys(
+        mibBuilder, authProtocol, authKey, privProtocol, privKey,
+        securityEngineId, authKeyType, privKeyType)
+
+    keys = {1: localAuthKey, 2: localPrivKey}
+
+    if authKeyType < USM_KEY_TYPE_LOCALIZED:
+        keys[3] = masterAuthKey
+
+    if privKeyType < USM_KEY_TYPE_LOCALIZED:
+        keys[4] = masterPrivKey
+
+    secrets = {4: 'active'}
+
+    if authKeyType < USM_KEY_TYPE_MASTER:
+        secrets.update({1: userName, 2: authKey})
+
+    if privKeyType < USM_KEY_TYPE_MASTER:
+        secrets.update({1: userName, 3: privKey})
+
+    return [
+        (usmUserEntry, tblIdx1,
+         {2: userName, 3: securityName, 4: zeroDotZero.name,
+          5: authProtocol, 8: privProtocol, 13: 'active'}),
+        (pysnmpUsmKeyEntry, tblIdx1, keys),
+        (pysnmpUsmSecretEntry, tblIdx2, secrets)
+    ]
+
+
+def __bulkTargetParamsRows(snmpEngine, name, securityName, securityLevel,
+                           mpModel=3):
+    securityModel = __cookSecurityModel(mpModel)
+
+    snmpTargetParamsEntry, tblIdx = __cookTargetParamsInfo(snmpEngine, name)
+
+    return [
+        (snmpTargetParamsEntry, tblIdx,
+         {1: name, 2: mpModel, 3: securityModel, 4: securityName,
+          5: securityLevel, 7: 'active'})
+    ]
+
+
+def __bulkTargetAddrRows(snmpEngine, addrName, transportDomain,
+                         transportAddress, params, timeout=None,
+                         retryCount=None, tagList=null, sourceAddress=None):
+
+    mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+    (snmpTargetAddrEntry,
+     snmpSourceAddrEntry,
+     tblIdx) = __cookTargetAddrInfo(snmpEngine, addrName)
+
+    transportAddress, sourceAddress = __cookTargetAddresses(
+        mibBuilder, transportDomain, transportAddress, sourceAddress)
+
+    return [
+        (snmpTargetAddrEntry, tblIdx,
+         {1: addrName, 2: transportDomain, 3: transportAddress,
+          4: timeout, 5: retryCount, 6: tagList, 7: params, 9: 'active'}),
+        (snmpSourceAddrEntry, tblIdx, {1: sourceAddress})
+    ]
+
+
+def bulkLoad(snmpEngine, users=(), targetParams=(), targets=(),
+             communities=()):
+    """Configure many SNMP users, targets and communities at once.
+
+    Parameters
+    ----------
+    users: iterable
+        :py:func:`addV3User` parameters, but `snmpEngine`, per USM user
+
+    targetParams: iterable
+        :py:func:`addTargetParams` parameters, but `snmpEngine`, per
+        target parameters entry
+
+    targets: iterable
+        :py:func:`addTargetAddr` parameters, but `snmpEngine`, per target
+
+    communities: iterable
+        :py:func:`addV1System` parameters, but `snmpEngine`, per
+        SNMP community
+
+    Parameters of each entry are given either as a `dict` of keyword
+    arguments or as a `tuple` of positional arguments.
+
+    Unlike calling :py:func:`addV3User` and others one entry at a time,
+    rows are put into LCD tables directly, each table is changed just
+    once. Entries replace already configured ones of the same names.
+    LCD lookup maps catch up with the loaded entries on first use.
+
+    All entries are validated before any of them is loaded, so if some
+    of them turn out to be malformed, no LCD table is changed.
+
+    USM pass-phrases are turned into keys here as well, consider
+    calling :py:func:`precomputeKeys` ahead of configuring many
+    USM users.
+    """
+    tables = []
+    tableRows = {}
+
+    for rowsFun, entries in ((__bulkV3UserRows, users),
+                             (__bulkTargetParamsRows, targetParams),
+                             (__bulkTargetAddrRows, targets),
+                             (__bulkV1SystemRows, communities)):
+        for entry in entries:
+            if isinstance(entry, dict):
+                rows = rowsFun(snmpEngine, **entry)
+
+            else:
+                rows = rowsFun(snmpEngine, *entry)
+
+            # augmenting tables come after the augmented ones
+            for mibObj, instId, values in rows:
+                if mibObj.name not in tableRows:
+                    tables.append(mibObj)
+                    tableRows[mibObj.name] = []
+
+                tableRows[mibObj.name].append((instId, values))
+
+    # columns get attached to table rows as MIB tree is built
+    snmpEngine.msgAndPduDsp.mibInstrumController.indexMib()
+
+    # all rows are checked before any table is changed
+    preparedRows = [mibObj.prepareRows(tableRows[mibObj.name])
+                    for mibObj in tables]
+
+    for mibObj, rows in zip(tables, preparedRows):
+        mibObj.commitRows(rows)
+
+        debug.logger & debug.FLAG_SM and debug.logger(
+            'bulkLoad: %d rows loaded into %s' % (
+                len(tableRows[mibObj.name]), mibObj.name))
+
+
+def _textToOid(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+
+    if value in _BULK_LOAD_OIDS:
+        return _BULK_LOAD_OIDS[value]
+
+    try:
+        return tuple(rfc1902.ObjectName(value))
+
+    except PyAsn1Error:
+        raise error.PySnmpError('Bad OID %s' % (value,))
+
+
+def _textToAddress(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+
+    host, sep, port = value.rpartition(':')
+
+    if not sep or not port.isdigit():
+        raise error.PySnmpError('Bad host:port address %s' % (value,))
+
+    if host.startswith('[') and host.endswith(']'):
+        host = host[1:-1]
+
+    return host, int(port)
+
+
+def _textToOctets(value):
+    if value[:2].lower() == '0x':
+        value = value[2:]
+
+    try:
+        return rfc1902.OctetString(hexValue=value)
+
+    except PyAsn1Error:
+        raise error.PySnmpError('Bad hex string %s' % (value,))
+
+
+# named OIDs accepted by bulk loading from text
+_BULK_LOAD_OIDS = dict(
+    [(name, value) for name, value in globals().items()
+     if name.startswith(('SNMP_UDP', 'USM_AUTH_', 'USM_PRIV_'))]
+)
+
+# bulk loaded parameters to convert from text
+_BULK_LOAD_PARAMS = {
+    'users': {
+        'authProtocol': _textToOid,
+        'privProtocol': _textToOid,
+        'securityEngineId': _textToOctets,
+        'authKeyType': int,
+        'privKeyType': int
+    },
+    'targetParams': {
+        'mpModel': int
+    },
+    'targets': {
+        'transportDomain': _textToOid,
+        'transportAddress': _textToAddress,
+        'sourceAddress': _textToAddress,
+        'timeout': int,
+        'retryCount': int
+    },
+    'communities': {
+        'contextEngineId': _textToOctets
+    }
+}
+
+
+def _textToParams(kind, entry):
+    converters = _BULK_LOAD_PARAMS[kind]
+
+    params = {}
+
+    for name, value in entry.items():
+        # missing CSV cells and JSON nulls stand for defaults
+        if value is None or value == '':
+            continue
+
+        if name in converters:
+            try:
+                value = converters[name](value)
+
+            except ValueError:
+                raise error.PySnmpError(
+                    'Bad %s value %s of %s' % (name, value, kind))
+
+        params[str(name)] = value
+
+    return params
+
+
+def bulkLoadFromJson(snmpEngine, fileObj):
+    """Configure many SNMP users, targets and communities from JSON.
+
+    JSON document is read from file-like `fileObj`. The document is an
+    object with any of `users`, `targetParams`, `targets` and
+    `communities` keys, each holding a list of objects carrying keyword
+    arguments to the respective :py:func:`bulkLoad` entries, e.g.:
+
+    .. code-block:: json
+
+        {"targetParams": [{"name": "v2c-public", "securityName": "public",
+                           "securityLevel": "noAuthNoPriv", "mpModel": 1}],
+         "targets": [{"addrName": "router-1",
+                      "transportDomain": "SNMP_UDP_DOMAIN",
+                      "transportAddress": "192.168.1.1:161",
+                      "params": "v2c-public"}]}
+
+    OIDs (e.g. `transportDomain`, `authProtocol`) are given by their
+    names in this module (e.g. `SNMP_UDP_DOMAIN`, `USM_AUTH_HMAC96_SHA`)
+    or in dotted notation, addresses as `host:port` or `[host]:port`
+    strings or [`host`, `port`] lists, SNMP engine IDs as hex strings.
+    """
+    document = json.load(fileObj)
+
+    kwargs = {}
+
+    for kind, entries in document.items():
+        if kind not in _BULK_LOAD_PARAMS:
+            raise error.PySnmpError('Unknown bulk load entries kind %s' % kind)
+
+        kwargs[str(kind)] = [_textToParams(kind, entry) for entry in entries]
+
+    bulkLoad(snmpEngine, **kwargs)
+
+
+def bulkLoadFromCsv(snmpEngine, fileObj, kind):
+    """Configure many SNMP users, targets or communities from CSV.
+
+    CSV table is read from file-like `fileObj`. The first line names
+    :py:func:`bulkLoad` entry parameters of `kind` (one of `users`,
+    `targetParams`, `targets` or `communities`), each following line
+    is one entry, e.g.:
+
+    .. code-block:: text
+
+        addrName,transportDomain,transportAddress,params,tagList
+        router-1,SNMP_UDP_DOMAIN,192.168.1.1:161,v2c-public,core
+        router-2,SNMP_UDP_DOMAIN,192.168.1.2:161,v2c-public,core edge
+
+    Empty cells stand for default values. Values are converted the
+    same way as by :py:func:`bulkLoadFromJson`.
+    """
+    if kind not in _BULK_LOAD_PARAMS:
+        raise error.PySnmpError('Unknown bulk load entries kind %s' % kind)
+
+    bulkLoad(snmpEngine, **{kind: [_textToParams(kind, entry)
+                                   for entry in csv.DictReader(fileObj)]})
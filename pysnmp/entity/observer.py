@@ -21,6 +21,10 @@ class MetaObserver(object):
        It's important to realize that execution context is only guaranteed
        to exist to functions that are at the same or deeper level of invocation
        relative to execution point specified.
+
+       Execution points which do not enclose any further processing
+       (e.g. those of message processing and security models) are
+       only stored if some callback is registered for them.
     """
 
     def __init__(self):
@@ -54,6 +58,14 @@ class MetaObserver(object):
                 if not self.__observers[execpoint]:
                     del self.__observers[execpoint]
 
+    def isObserved(self, execpoint):
+        """Tell if any callback is registered for `execpoint`.
+
+        Lets SNMP engine skip building execution context on hot paths
+        when nobody is going to look at it.
+        """
+        return execpoint in self.__observers
+
     def storeExecutionContext(self, snmpEngine, execpoint, variables):
         self.__execpoints[execpoint] = variables
         if execpoint in self.__observers:
@@ -4,6 +4,9 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import collections
+import time
+
 from pyasn1.type import univ
 
 from pysnmp import debug
@@ -19,6 +22,707 @@ getNextHandle = nextid.Integer(0x7fffffff)
 
 __null = univ.Null('')
 
+PIPELINE_CONTEXT_ID = 'cmdgenRequestPipeline'
+
+RTT_ESTIMATOR_CONTEXT_ID = 'cmdgenRttEstimator'
+
+TUNER_CONTEXT_ID = 'cmdgenMaxRepetitionsTuner'
+
+# SNMP message size short of variable-bindings (SNMPv3 with authPriv)
+MESSAGE_OVERHEAD = 160
+
+# assumed size of a value in response
+VALUE_SIZE = 24
+
+# message size any SNMP engine must accept (RFC 3417)
+MIN_MESSAGE_SIZE = 484
+
+
+def estimateVarBindSize(name, valueSize=VALUE_SIZE):
+    """Estimate encoded size of variable-binding in SNMP response"""
+    # tag and length of varbind SEQUENCE, OID
+    size = 4 + 1
+
+    for arc in tuple(name)[2:]:
+        size += 1
+        while arc > 0x7f:
+            arc >>= 7
+            size += 1
+
+    # tag and length of value
+    return size + 2 + valueSize
+
+
+class RequestPipeline(object):
+    """Limit the number of outstanding SNMP requests.
+
+    Requests over `maxInFlightPerTarget` outstanding requests to the
+    same SNMP agent (transport address) or over `maxInFlight`
+    outstanding requests in total are queued and sent out in the order
+    of submission as earlier requests complete. Targets take turns
+    once the total limit is reached. Zero means no limit.
+
+    Request timeout starts once the request is actually sent, retries
+    of the outstanding request do not go through the queue.
+    """
+    def __init__(self, maxInFlight=0, maxInFlightPerTarget=0):
+        self._maxInFlight = maxInFlight
+        self._maxInFlightPerTarget = maxInFlightPerTarget
+        self._targetLimits = {}
+
+        # sendRequestHandle -> target
+        self._requests = {}
+
+        # target -> number of outstanding requests
+        self._inFlight = {}
+        self._totalInFlight = 0
+
+        # target -> queued (sendRequestHandle, queuedAt, sendFun, errorFun)
+        self._queues = {}
+        self._queued = 0
+
+        # targets with queued requests held by the total limit only
+        self._ready = collections.deque()
+        self._readySet = set()
+
+        self._draining = False
+
+        self._submitted = self._delayed = self._maxQueued = 0
+        self._waitTime = self._maxWaitTime = 0
+
+    def setLimits(self, maxInFlight=0, maxInFlightPerTarget=0):
+        """Change total and default per-target outstanding requests limits"""
+        self._maxInFlight = maxInFlight
+        self._maxInFlightPerTarget = maxInFlightPerTarget
+
+        for target in list(self._queues):
+            self._markReady(target)
+
+        self._drain()
+
+    def setTargetLimit(self, transportDomain, transportAddress, maxInFlight):
+        """Set outstanding requests limit for one SNMP agent"""
+        target = transportDomain, transportAddress
+
+        self._targetLimits[target] = maxInFlight
+
+        self._markReady(target)
+        self._drain()
+
+    def getQueueDepth(self, transportDomain, transportAddress):
+        """Return the number of requests queued for SNMP agent"""
+        return len(self._queues.get((transportDomain, transportAddress), ()))
+
+    def getStats(self):
+        """Return request pipeline counters as a dict.
+
+        The `waitTime` and `maxWaitTime` (in seconds) are the total
+        and the longest time queued requests spent waiting.
+        """
+        return {
+            'inFlight': self._totalInFlight,
+            'queued': self._queued,
+            'maxQueued': self._maxQueued,
+            'submitted': self._submitted,
+            'delayed': self._delayed,
+            'waitTime': self._waitTime,
+            'maxWaitTime': self._maxWaitTime
+        }
+
+    def submit(self, sendRequestHandle, target, sendFun, errorFun):
+        """Call `sendFun()` now or once outstanding requests limits permit.
+
+        Exception raised by `sendFun` is propagated to the caller unless
+        the request has been queued. In the latter case it is passed to
+        `errorFun(exc)`.
+        """
+        self._submitted += 1
+
+        if (target not in self._queues and self._canSend(target) and
+                (not self._maxInFlight or
+                 self._totalInFlight < self._maxInFlight)):
+            self._send(sendRequestHandle, target, sendFun)
+            return
+
+        if target not in self._queues:
+            self._queues[target] = collections.deque()
+
+        self._queues[target].append(
+            (sendRequestHandle, time.time(), sendFun, errorFun))
+
+        self._queued += 1
+        self._delayed += 1
+
+        if self._queued > self._maxQueued:
+            self._maxQueued = self._queued
+
+        self._markReady(target)
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            'submit: sendRequestHandle %s queued for %s, %d request(s) '
+            'in flight, %d queued' % (sendRequestHandle, target,
+                                      self._totalInFlight, self._queued))
+
+    def release(self, sendRequestHandle):
+        """Mark request complete, send out queued requests if possible"""
+        target = self._requests.pop(sendRequestHandle, None)
+        if target is None:
+            return
+
+        count = self._inFlight[target] - 1
+
+        if count:
+            self._inFlight[target] = count
+
+        else:
+            del self._inFlight[target]
+
+        self._totalInFlight -= 1
+
+        self._markReady(target)
+        self._drain()
+
+    def _canSend(self, target):
+        limit = self._targetLimits.get(target, self._maxInFlightPerTarget)
+        return not limit or self._inFlight.get(target, 0) < limit
+
+    def _markReady(self, target):
+        if (target in self._queues and target not in self._readySet and
+                self._canSend(target)):
+            self._ready.append(target)
+            self._readySet.add(target)
+
+    def _send(self, sendRequestHandle, target, sendFun):
+        self._requests[sendRequestHandle] = target
+        self._inFlight[target] = self._inFlight.get(target, 0) + 1
+        self._totalInFlight += 1
+
+        try:
+            sendFun()
+
+        except Exception:
+            self.release(sendRequestHandle)
+            raise
+
+    def _drain(self):
+        if self._draining:
+            return
+
+        self._draining = True
+
+        try:
+            while self._ready and (not self._maxInFlight or
+                                   self._totalInFlight < self._maxInFlight):
+                target = self._ready.popleft()
+                self._readySet.remove(target)
+
+                queue = self._queues[target]
+
+                sendRequestHandle, queuedAt, sendFun, errorFun = queue.popleft()
+
+                if not queue:
+                    del self._queues[target]
+
+                self._queued -= 1
+
+                waitTime = time.time() - queuedAt
+
+                self._waitTime += waitTime
+
+                if waitTime > self._maxWaitTime:
+                    self._maxWaitTime = waitTime
+
+                try:
+                    self._send(sendRequestHandle, target, sendFun)
+
+                except error.PySnmpError as exc:
+                    errorFun(exc)
+
+                self._markReady(target)
+
+        finally:
+            self._draining = False
+
+
+def configureRequestPipeline(snmpEngine, maxInFlight=0,
+                             maxInFlightPerTarget=0):
+    """Limit outstanding command generator requests at SNMP engine.
+
+    Returns `RequestPipeline` object serving all command generators
+    working through `snmpEngine`.
+    """
+    pipeline = snmpEngine.getUserContext(PIPELINE_CONTEXT_ID)
+
+    if pipeline is None:
+        pipeline = RequestPipeline(maxInFlight, maxInFlightPerTarget)
+        snmpEngine.setUserContext(**{PIPELINE_CONTEXT_ID: pipeline})
+
+    else:
+        pipeline.setLimits(maxInFlight, maxInFlightPerTarget)
+
+    return pipeline
+
+
+def getRequestPipeline(snmpEngine):
+    """Return `RequestPipeline` of SNMP engine or `None` if not configured"""
+    return snmpEngine.getUserContext(PIPELINE_CONTEXT_ID)
+
+
+class RttEstimator(object):
+    """Derive request timeouts from measured round-trip times.
+
+    Smoothed round-trip time (SRTT) and its variation (RTTVAR) are
+    maintained per SNMP agent (transport address) the way TCP does it
+    (RFC 6298). Request timeout is then SRTT + 4 * RTTVAR kept within
+    `minTimeout` and `maxTimeout` (in seconds). Until the first response
+    arrives, timeout configured for the target is used.
+
+    Each request timeout doubles agent timeout (exponential backoff),
+    up to `maxTimeout`, till the next round-trip time measurement.
+    Requests that have been retransmitted are not measured (Karn's
+    algorithm).
+    """
+    ALPHA = 0.125
+    BETA = 0.25
+    K = 4
+
+    # backoff limit for zero timeouts never reaching `maxTimeout`
+    MAX_BACKOFF = 1024
+
+    def __init__(self, minTimeout=0.5, maxTimeout=60.0):
+        self._minTimeout = minTimeout
+        self._maxTimeout = maxTimeout
+
+        # target -> [srtt, rttvar, backoff, samples, timeouts]
+        self._estimates = {}
+
+        # sendPduHandle -> (target, sentAt, backoff)
+        self._requests = {}
+
+    def setLimits(self, minTimeout=0.5, maxTimeout=60.0):
+        """Change request timeout bounds (in seconds)"""
+        self._minTimeout = minTimeout
+        self._maxTimeout = maxTimeout
+
+    def getTimeout(self, transportDomain, transportAddress, defaultTimeout):
+        """Return request timeout (in seconds) for SNMP agent"""
+        estimate = self._estimates.get((transportDomain, transportAddress))
+
+        if estimate is None:
+            return defaultTimeout
+
+        srtt, rttvar, backoff = estimate[:3]
+
+        if srtt is None:
+            timeout = defaultTimeout
+
+        else:
+            timeout = self._getBaseTimeout(srtt, rttvar)
+
+        return min(timeout * min(backoff, self.MAX_BACKOFF),
+                   max(self._maxTimeout, defaultTimeout))
+
+    def _getBaseTimeout(self, srtt, rttvar):
+        return min(max(srtt + self.K * rttvar, self._minTimeout),
+                   self._maxTimeout)
+
+    def getEstimate(self, transportDomain, transportAddress):
+        """Return round-trip time estimates for SNMP agent as a dict.
+
+        The `srtt`, `rttvar` and `timeout` are in seconds, `srtt` and
+        `rttvar` are `None` until the first measurement. Returns `None`
+        if nothing is known of the agent.
+        """
+        estimate = self._estimates.get((transportDomain, transportAddress))
+
+        if estimate is None:
+            return
+
+        srtt, rttvar, backoff, samples, timeouts = estimate
+
+        if srtt is None:
+            timeout = None
+
+        else:
+            timeout = self.getTimeout(transportDomain, transportAddress, srtt)
+
+        return {
+            'srtt': srtt,
+            'rttvar': rttvar,
+            'timeout': timeout,
+            'backoff': backoff,
+            'samples': samples,
+            'timeouts': timeouts
+        }
+
+    def getEstimates(self):
+        """Return round-trip time estimates of all known SNMP agents.
+
+        Returns a dict of `getEstimate()` results keyed by
+        (transportDomain, transportAddress).
+        """
+        estimates = {}
+
+        for transportDomain, transportAddress in self._estimates:
+            estimates[(transportDomain, transportAddress)] = self.getEstimate(
+                transportDomain, transportAddress)
+
+        return estimates
+
+    def requestSent(self, sendPduHandle, transportDomain, transportAddress):
+        """Start timing request to SNMP agent"""
+        target = transportDomain, transportAddress
+
+        estimate = self._estimates.get(target)
+
+        self._requests[sendPduHandle] = (
+            target, time.time(), estimate and estimate[2] or 1)
+
+    def responseReceived(self, sendPduHandle, retransmitted=False):
+        """Update agent estimates with request round-trip time"""
+        request = self._requests.pop(sendPduHandle, None)
+        if request is None or retransmitted:
+            return
+
+        target, sentAt, backoff = request
+
+        rtt = time.time() - sentAt
+
+        estimate = self._estimates.get(target)
+
+        if estimate is None or estimate[0] is None:
+            self._estimates[target] = [
+                rtt, rtt / 2, 1, 1, estimate and estimate[4] or 0]
+
+        else:
+            srtt, rttvar = estimate[:2]
+
+            estimate[1] = ((1 - self.BETA) * rttvar +
+                           self.BETA * abs(srtt - rtt))
+            estimate[0] = (1 - self.ALPHA) * srtt + self.ALPHA * rtt
+            estimate[2] = 1
+            estimate[3] += 1
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            'responseReceived: sendPduHandle %s, target %s, rtt %.3f, '
+            'srtt %.3f, rttvar %.3f' % ((sendPduHandle, target, rtt) +
+                                        tuple(self._estimates[target][:2])))
+
+    def requestTimedOut(self, sendPduHandle):
+        """Back off agent timeout"""
+        request = self._requests.pop(sendPduHandle, None)
+        if request is None:
+            return
+
+        target, sentAt, backoff = request
+
+        estimate = self._estimates.get(target)
+
+        if estimate is None:
+            estimate = self._estimates[target] = [None, None, 1, 0, 0]
+
+        estimate[4] += 1
+
+        if estimate[0] is None:
+            timeout = self._minTimeout
+
+        else:
+            timeout = self._getBaseTimeout(*estimate[:2])
+
+        # concurrent requests timing out back off once, backoff stops
+        # once timeout gets to its limit
+        if (estimate[2] == backoff and backoff < self.MAX_BACKOFF and
+                timeout * backoff < self._maxTimeout):
+            estimate[2] = backoff * 2
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            'requestTimedOut: sendPduHandle %s, target %s, backoff '
+            '%s' % (sendPduHandle, target, estimate[2]))
+
+
+def configureRttEstimator(snmpEngine, minTimeout=0.5, maxTimeout=60.0):
+    """Derive command generator request timeouts from round-trip times.
+
+    Returns `RttEstimator` object serving all command generators
+    working through `snmpEngine`.
+    """
+    estimator = snmpEngine.getUserContext(RTT_ESTIMATOR_CONTEXT_ID)
+
+    if estimator is None:
+        estimator = RttEstimator(minTimeout, maxTimeout)
+        snmpEngine.setUserContext(**{RTT_ESTIMATOR_CONTEXT_ID: estimator})
+
+    else:
+        estimator.setLimits(minTimeout, maxTimeout)
+
+    return estimator
+
+
+def getRttEstimator(snmpEngine):
+    """Return `RttEstimator` of SNMP engine or `None` if not configured"""
+    return snmpEngine.getUserContext(RTT_ESTIMATOR_CONTEXT_ID)
+
+
+class MaxRepetitionsTuner(object):
+    """Adapt GETBULK max-repetitions to SNMP agent responses.
+
+    Max-repetitions value is maintained per SNMP agent (transport
+    address). It doubles while responses come back complete, but never
+    exceeds `maxRepetitions` or the number of rows expected to fit
+    `maxMessageSize` octets judging by the size of earlier responses.
+    Agent truncating the response to fit its own message size limit
+    sets max-repetitions to the number of rows received.
+
+    Response refused by the agent with `tooBig` error or lost (timed out)
+    while being larger than any response received from the agent so far
+    lowers agent message size estimate. Such request is repeated asking
+    for as many rows as the largest response held. Responses arriving
+    later than `maxResponseTime` seconds (if set) halve max-repetitions.
+    """
+    ALPHA = 0.25
+
+    def __init__(self, minRepetitions=1, maxRepetitions=256,
+                 maxMessageSize=65507, maxResponseTime=None):
+        self._minRepetitions = minRepetitions
+        self._maxRepetitions = maxRepetitions
+        self._maxMessageSize = maxMessageSize
+        self._maxResponseTime = maxResponseTime
+
+        # target -> estimate dict
+        self._estimates = {}
+
+        # sendRequestHandle -> (target, maxRepetitions, sentAt)
+        self._requests = {}
+
+    def setLimits(self, minRepetitions=1, maxRepetitions=256,
+                  maxMessageSize=65507, maxResponseTime=None):
+        """Change max-repetitions, response size and time bounds"""
+        self._minRepetitions = minRepetitions
+        self._maxRepetitions = maxRepetitions
+        self._maxMessageSize = maxMessageSize
+        self._maxResponseTime = maxResponseTime
+
+    def getMaxRepetitions(self, transportDomain, transportAddress,
+                          defaultRepetitions):
+        """Return max-repetitions value to use with SNMP agent"""
+        estimate = self._estimates.get((transportDomain, transportAddress))
+
+        if estimate is None:
+            return defaultRepetitions
+
+        return estimate['maxRepetitions']
+
+    def getEstimate(self, transportDomain, transportAddress):
+        """Return max-repetitions estimates for SNMP agent as a dict.
+
+        Besides current `maxRepetitions` value, reports average
+        `rowSize` and the largest response `maxSize` received (in
+        octets), agent message size limit estimate `sizeLimit` (`None`
+        if unknown) along with `responses`, `truncated`, `tooBig` and
+        `timeouts` counters. Returns `None` if nothing is known of the
+        agent.
+        """
+        estimate = self._estimates.get((transportDomain, transportAddress))
+
+        if estimate is not None:
+            return dict(estimate)
+
+    def getEstimates(self):
+        """Return max-repetitions estimates of all known SNMP agents.
+
+        Returns a dict of `getEstimate()` results keyed by
+        (transportDomain, transportAddress).
+        """
+        estimates = {}
+
+        for target, estimate in self._estimates.items():
+            estimates[target] = dict(estimate)
+
+        return estimates
+
+    def requestSent(self, sendRequestHandle, transportDomain,
+                    transportAddress, maxRepetitions):
+        """Start tracking GETBULK request to SNMP agent"""
+        target = transportDomain, transportAddress
+
+        if target not in self._estimates:
+            self._estimates[target] = {
+                'maxRepetitions': maxRepetitions,
+                'rowSize': 0,
+                'maxSize': 0,
+                'sizeLimit': None,
+                'responses': 0,
+                'truncated': 0,
+                'tooBig': 0,
+                'timeouts': 0
+            }
+
+        self._requests[sendRequestHandle] = (
+            target, maxRepetitions, time.time())
+
+    def responseReceived(self, sendRequestHandle, rows, truncated,
+                         messageSize=0):
+        """Adjust agent max-repetitions by GETBULK response.
+
+        The `rows` is the number of rows in the response of
+        `messageSize` octets, `truncated` is true if the agent returned
+        less rows than requested yet not reaching the end of MIB.
+        """
+        request = self._requests.pop(sendRequestHandle, None)
+        if request is None:
+            return
+
+        target, maxRepetitions, sentAt = request
+
+        estimate = self._estimates[target]
+
+        estimate['responses'] += 1
+
+        if rows and messageSize:
+            rowSize = float(messageSize) / rows
+
+            if estimate['rowSize']:
+                rowSize = ((1 - self.ALPHA) * estimate['rowSize'] +
+                           self.ALPHA * rowSize)
+
+            estimate['rowSize'] = rowSize
+
+            if messageSize > estimate['maxSize']:
+                estimate['maxSize'] = messageSize
+
+                if (estimate['sizeLimit'] and
+                        estimate['sizeLimit'] <= messageSize):
+                    estimate['sizeLimit'] = None
+
+        if truncated:
+            estimate['truncated'] += 1
+            value = rows
+
+        elif (self._maxResponseTime and
+                time.time() - sentAt > self._maxResponseTime):
+            value = maxRepetitions // 2
+
+        elif rows < maxRepetitions:
+            # end of MIB reached, nothing learned
+            value = estimate['maxRepetitions']
+
+        else:
+            value = maxRepetitions * 2
+
+            if estimate['rowSize']:
+                sizeLimit = self._maxMessageSize
+
+                # probe half way towards the size agent could not handle
+                if estimate['sizeLimit']:
+                    sizeLimit = min(
+                        sizeLimit,
+                        (estimate['maxSize'] + estimate['sizeLimit']) // 2)
+
+                value = min(value, int(sizeLimit / estimate['rowSize']))
+
+        estimate['maxRepetitions'] = self._clamp(value)
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            'responseReceived: sendRequestHandle %s, target %s, %d of %d '
+            'rows, %d octets, max-repetitions now '
+            '%d' % (sendRequestHandle, target, rows, maxRepetitions,
+                    messageSize, estimate['maxRepetitions']))
+
+    def responseTooBig(self, sendRequestHandle):
+        """Lower agent max-repetitions on `tooBig` error.
+
+        Returns max-repetitions value to repeat the request with or
+        zero if it can not be reduced any further.
+        """
+        request = self._requests.pop(sendRequestHandle, None)
+        if request is None:
+            return 0
+
+        target, maxRepetitions, sentAt = request
+
+        estimate = self._estimates[target]
+
+        estimate['tooBig'] += 1
+
+        if maxRepetitions <= self._minRepetitions:
+            return 0
+
+        return self._shrink(estimate, maxRepetitions) or self._clamp(
+            maxRepetitions // 2)
+
+    def requestTimedOut(self, sendRequestHandle):
+        """Lower agent max-repetitions if the response was likely too big.
+
+        Returns max-repetitions value to repeat the request with or
+        zero if the timeout is not attributed to response size.
+        """
+        request = self._requests.pop(sendRequestHandle, None)
+        if request is None:
+            return 0
+
+        target, maxRepetitions, sentAt = request
+
+        estimate = self._estimates[target]
+
+        estimate['timeouts'] += 1
+
+        return self._shrink(estimate, maxRepetitions)
+
+    def requestFailed(self, sendRequestHandle):
+        """Stop tracking GETBULK request"""
+        self._requests.pop(sendRequestHandle, None)
+
+    def _shrink(self, estimate, maxRepetitions):
+        if not estimate['rowSize']:
+            return 0
+
+        size = maxRepetitions * estimate['rowSize']
+
+        if size <= estimate['maxSize']:
+            return 0
+
+        if not estimate['sizeLimit'] or size < estimate['sizeLimit']:
+            estimate['sizeLimit'] = int(size)
+
+        estimate['maxRepetitions'] = self._clamp(
+            int(estimate['maxSize'] / estimate['rowSize']))
+
+        if estimate['maxRepetitions'] >= maxRepetitions:
+            return 0
+
+        return estimate['maxRepetitions']
+
+    def _clamp(self, maxRepetitions):
+        return min(max(maxRepetitions, self._minRepetitions),
+                   self._maxRepetitions)
+
+
+def configureMaxRepetitionsTuner(snmpEngine, minRepetitions=1,
+                                 maxRepetitions=256, maxMessageSize=65507,
+                                 maxResponseTime=None):
+    """Adapt GETBULK max-repetitions of table walks at SNMP engine.
+
+    Returns `MaxRepetitionsTuner` object serving all bulk command
+    generators working through `snmpEngine`.
+    """
+    tuner = snmpEngine.getUserContext(TUNER_CONTEXT_ID)
+
+    if tuner is None:
+        tuner = MaxRepetitionsTuner(minRepetitions, maxRepetitions,
+                                    maxMessageSize, maxResponseTime)
+        snmpEngine.setUserContext(**{TUNER_CONTEXT_ID: tuner})
+
+    else:
+        tuner.setLimits(minRepetitions, maxRepetitions,
+                        maxMessageSize, maxResponseTime)
+
+    return tuner
+
+
+def getMaxRepetitionsTuner(snmpEngine):
+    """Return `MaxRepetitionsTuner` of SNMP engine or `None` if not configured"""
+    return snmpEngine.getUserContext(TUNER_CONTEXT_ID)
+
 
 class CommandGenerator(object):
     _null = univ.Null('')
@@ -31,6 +735,25 @@ class CommandGenerator(object):
                            securityModel, securityName, securityLevel,
                            contextEngineId, contextName, pduVersion,
                            PDU, statusInformation, sendPduHandle, cbCtx):
+        retried = False
+
+        try:
+            retried = self.__processResponsePdu(
+                snmpEngine, messageProcessingModel, securityModel,
+                securityName, securityLevel, contextEngineId, contextName,
+                pduVersion, PDU, statusInformation, sendPduHandle, cbCtx)
+
+        finally:
+            # retried request holds on to its pipeline slot
+            if not retried:
+                pipeline = getRequestPipeline(snmpEngine)
+                if pipeline is not None:
+                    pipeline.release(cbCtx[0])
+
+    def __processResponsePdu(self, snmpEngine, messageProcessingModel,
+                             securityModel, securityName, securityLevel,
+                             contextEngineId, contextName, pduVersion,
+                             PDU, statusInformation, sendPduHandle, cbCtx):
         origSendRequestHandle, cbFun, cbCtx = cbCtx
 
         # 3.1.1
@@ -46,6 +769,16 @@ class CommandGenerator(object):
 
         snmpEngine.transportDispatcher.jobFinished(id(self))
 
+        estimator = getRttEstimator(snmpEngine)
+
+        if estimator is not None:
+            if (statusInformation and
+                    statusInformation['errorIndication'] == errind.requestTimedOut):
+                estimator.requestTimedOut(sendPduHandle)
+
+            else:
+                estimator.responseReceived(sendPduHandle, origRetries > 0)
+
         # 3.1.3
         if statusInformation:
             debug.logger & debug.FLAG_APP and debug.logger(
@@ -81,15 +814,30 @@ class CommandGenerator(object):
                 reqPDU = origPdu
                 pduVersion = 1
 
+            timeoutInTicks = origTimeout
+
+            if estimator is not None:
+                timerResolution = (
+                    snmpEngine.transportDispatcher.getTimerResolution())
+
+                timeoutInTicks = estimator.getTimeout(
+                    origTransportDomain, origTransportAddress,
+                    origTimeout * timerResolution) / timerResolution
+
             try:
                 sendPduHandle = snmpEngine.msgAndPduDsp.sendPdu(
                     snmpEngine, origTransportDomain, origTransportAddress,
                     origMessageProcessingModel, origSecurityModel,
                     origSecurityName, origSecurityLevel, origContextEngineId,
                     origContextName, pduVersion, reqPDU,
-                    True, origTimeout, self.processResponsePdu,
+                    True, timeoutInTicks, self.processResponsePdu,
                     (origSendRequestHandle, cbFun, cbCtx))
 
+                if estimator is not None:
+                    estimator.requestSent(
+                        sendPduHandle, origTransportDomain,
+                        origTransportAddress)
+
                 snmpEngine.transportDispatcher.jobStarted(id(self))
 
                 self.__pendingReqs[sendPduHandle] = (
@@ -100,7 +848,7 @@ class CommandGenerator(object):
                     origRetryCount, origRetries, origDiscoveryRetries
                 )
 
-                return
+                return True
 
             except StatusInformation as exc:
                 statusInformation = exc
@@ -155,9 +903,10 @@ class CommandGenerator(object):
          securityName,
          securityLevel) = config.getTargetInfo(snmpEngine, targetName)
 
+        timerResolution = snmpEngine.transportDispatcher.getTimerResolution()
+
         # Convert timeout in seconds into timeout in timer ticks
-        timeoutInTicks = (float(timeout) / 100 /
-                          snmpEngine.transportDispatcher.getTimerResolution())
+        timeoutInTicks = float(timeout) / 100 / timerResolution
 
         mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
 
@@ -182,32 +931,114 @@ class CommandGenerator(object):
 
         sendRequestHandle = getNextHandle()
 
-        # 3.1
-        sendPduHandle = snmpEngine.msgAndPduDsp.sendPdu(
-            snmpEngine, transportDomain, transportAddress,
-            messageProcessingModel, securityModel, securityName,
-            securityLevel, contextEngineId, contextName,
-            pduVersion, PDU, True, timeoutInTicks, self.processResponsePdu,
-            (sendRequestHandle, cbFun, cbCtx)
-        )
+        estimator = getRttEstimator(snmpEngine)
 
-        snmpEngine.transportDispatcher.jobStarted(id(self))
+        def sendFun():
+            sendTimeout = timeoutInTicks
 
-        self.__pendingReqs[sendPduHandle] = (
-            transportDomain, transportAddress, messageProcessingModel,
-            securityModel, securityName, securityLevel, contextEngineId,
-            contextName, pduVersion, origPDU, timeoutInTicks,
-            retryCount, 0, 0
-        )
+            if estimator is not None:
+                sendTimeout = estimator.getTimeout(
+                    transportDomain, transportAddress,
+                    float(timeout) / 100) / timerResolution
 
-        debug.logger & debug.FLAG_APP and debug.logger(
-            'sendPdu: sendPduHandle %s, timeout %d*10 ms/%d ticks, retry '
-            '0 of %d' % (sendPduHandle, timeout, timeoutInTicks, retryCount))
+            # 3.1
+            sendPduHandle = snmpEngine.msgAndPduDsp.sendPdu(
+                snmpEngine, transportDomain, transportAddress,
+                messageProcessingModel, securityModel, securityName,
+                securityLevel, contextEngineId, contextName,
+                pduVersion, PDU, True, sendTimeout,
+                self.processResponsePdu, (sendRequestHandle, cbFun, cbCtx)
+            )
+
+            if estimator is not None:
+                estimator.requestSent(
+                    sendPduHandle, transportDomain, transportAddress)
+
+            snmpEngine.transportDispatcher.jobStarted(id(self))
+
+            self.__pendingReqs[sendPduHandle] = (
+                transportDomain, transportAddress, messageProcessingModel,
+                securityModel, securityName, securityLevel, contextEngineId,
+                contextName, pduVersion, origPDU, timeoutInTicks,
+                retryCount, 0, 0
+            )
+
+            debug.logger & debug.FLAG_APP and debug.logger(
+                'sendPdu: sendPduHandle %s, timeout %d*10 ms/%d ticks, retry '
+                '0 of %d' % (sendPduHandle, sendTimeout * timerResolution * 100,
+                             sendTimeout, retryCount))
+
+        def errorFun(exc):
+            if isinstance(exc, StatusInformation):
+                errorIndication = exc['errorIndication']
+
+            else:
+                errorIndication = str(exc)
+
+            debug.logger & debug.FLAG_APP and debug.logger(
+                'sendPdu: sendRequestHandle %s, queued request failed with '
+                '%r' % (sendRequestHandle, errorIndication))
+
+            cbFun(snmpEngine, sendRequestHandle, errorIndication, None, cbCtx)
+
+        pipeline = getRequestPipeline(snmpEngine)
+
+        if pipeline is None:
+            sendFun()
+
+        else:
+            pipeline.submit(sendRequestHandle,
+                            (transportDomain, transportAddress),
+                            sendFun, errorFun)
 
         return sendRequestHandle
 
 
+class _GetRequest(object):
+
+    def __init__(self, sendRequestHandle, varBinds, cbFun, cbCtx):
+        self.sendRequestHandle = sendRequestHandle
+        self.varBinds = varBinds
+        self.cbFun = cbFun
+        self.cbCtx = cbCtx
+
+        # outstanding PDUs carrying request's var-binds
+        self.pending = 0
+
+        self.rspVarBinds = [None] * len(varBinds)
+        self.errorIndication = None
+        self.errorStatus = self.errorIndex = 0
+
+
 class GetCommandGenerator(CommandGenerator):
+    """Read MIB variables by SNMP GET requests.
+
+    With `splitTooBig` option set, requests answered with `tooBig` error
+    are split in halves and sent again, responses get put back together
+    before being reported. The number of var-binds that got through to
+    SNMP agent is remembered and used to split requests up front.
+
+    With `coalesce` option set (implies `splitTooBig`), requests to the
+    same SNMP agent and context made while earlier ones are outstanding
+    are queued and sent together once the outstanding ones complete
+    or the queue fills up an SNMP message. Message size is limited by
+    both local SNMP engine and SNMP agent's maximum message sizes, the
+    latter is learned by SNMPv3 discovery or is assumed to be
+    `maxMessageSize` option (484 octets by default).
+    """
+    def __init__(self, **options):
+        CommandGenerator.__init__(self, **options)
+
+        self._coalesce = options.get('coalesce', False)
+        self._splitTooBig = self._coalesce or options.get('splitTooBig', False)
+        self._maxMessageSize = options.get('maxMessageSize', MIN_MESSAGE_SIZE)
+
+        # (targetName, contextEngineId, contextName) ->
+        #     [outstanding PDUs, queued requests, queued size]
+        self._batches = {}
+
+        # targetName -> var-binds per PDU not answered with tooBig
+        self._maxVarBinds = {}
 
     def processResponseVarBinds(self, snmpEngine, sendRequestHandle,
                                 errorIndication, PDU, cbCtx):
@@ -220,14 +1051,260 @@ class GetCommandGenerator(CommandGenerator):
 
     def sendVarBinds(self, snmpEngine, targetName, contextEngineId,
                      contextName, varBinds, cbFun, cbCtx=None):
+        if not self._splitTooBig:
+            reqPDU = v2c.GetRequestPDU()
+            v2c.apiPDU.setDefaults(reqPDU)
+
+            v2c.apiPDU.setVarBinds(reqPDU, varBinds)
+
+            return self.sendPdu(snmpEngine, targetName, contextEngineId,
+                                contextName, reqPDU,
+                                self.processResponseVarBinds, (cbFun, cbCtx))
+
+        target = targetName, contextEngineId, contextName
+
+        request = _GetRequest(getNextHandle(), list(varBinds), cbFun, cbCtx)
+
+        if not self._coalesce:
+            self._sendParts(snmpEngine, target,
+                            [(request, 0, len(request.varBinds))])
+
+            return request.sendRequestHandle
+
+        batch = self._batches.get(target)
+
+        if batch is None:
+            batch = self._batches[target] = [0, [], 0]
+
+        batch[1].append((request, 0))
+        batch[2] += sum([estimateVarBindSize(x[0]) for x in varBinds])
+
+        # Nagle-like: send right away only if nothing is outstanding
+        if not batch[0] or batch[2] >= self._getBudget(snmpEngine, targetName):
+            self._flush(snmpEngine, target, not batch[0])
+
+        return request.sendRequestHandle
+
+    def _getBudget(self, snmpEngine, targetName):
+        mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+        snmpEngineMaxMessageSize, = mibBuilder.importSymbols(
+            '__SNMP-FRAMEWORK-MIB', 'snmpEngineMaxMessageSize')
+
+        maxMessageSize = self._maxMessageSize
+
+        transportDomain, transportAddress = config.getTargetAddr(
+            snmpEngine, targetName)[:2]
+
+        mpHandler = snmpEngine.messageProcessingSubsystems.get(3)
+
+        if mpHandler is not None:
+            maxMessageSize = mpHandler.getPeerMaxMessageSize(
+                transportDomain, transportAddress) or maxMessageSize
+
+        return min(int(snmpEngineMaxMessageSize.syntax),
+                   maxMessageSize) - MESSAGE_OVERHEAD
+
+    def _flush(self, snmpEngine, target, force=False):
+        """Send queued requests packed into as few PDUs as budget permits.
+
+        The last, not full PDU is kept queued unless `force` is set.
+        """
+        batch = self._batches[target]
+
+        budget = self._getBudget(snmpEngine, target[0])
+
+        maxVarBinds = self._maxVarBinds.get(target[0])
+
+        queue = batch[1]
+
+        batch[1] = []
+        batch[2] = 0
+
+        parts = []
+        size = count = 0
+
+        for request, start in queue:
+            for idx in range(start, len(request.varBinds)):
+                varBindSize = estimateVarBindSize(request.varBinds[idx][0])
+
+                if count and (size + varBindSize > budget or
+                              maxVarBinds and count >= maxVarBinds):
+                    if idx > start:
+                        parts.append((request, start, idx))
+                        start = idx
+
+                    self._sendParts(snmpEngine, target, parts)
+
+                    parts = []
+                    size = count = 0
+
+                size += varBindSize
+                count += 1
+
+            parts.append((request, start, len(request.varBinds)))
+
+        if force and parts:
+            self._sendParts(snmpEngine, target, parts)
+
+            parts = []
+            size = 0
+
+        batch[1][:0] = [(request, start) for request, start, stop in parts]
+        batch[2] += size
+
+    def _sendParts(self, snmpEngine, target, parts):
+        targetName, contextEngineId, contextName = target
+
+        varBinds = []
+
+        for request, start, stop in parts:
+            varBinds.extend(request.varBinds[start:stop])
+            request.pending += 1
+
         reqPDU = v2c.GetRequestPDU()
         v2c.apiPDU.setDefaults(reqPDU)
 
         v2c.apiPDU.setVarBinds(reqPDU, varBinds)
 
-        return self.sendPdu(snmpEngine, targetName, contextEngineId,
-                            contextName, reqPDU, self.processResponseVarBinds,
-                            (cbFun, cbCtx))
+        batch = self._batches.get(target)
+
+        if batch is not None:
+            batch[0] += 1
+
+        try:
+            self.sendPdu(snmpEngine, targetName, contextEngineId,
+                         contextName, reqPDU, self._processPartsResponse,
+                         (target, parts, len(varBinds)))
+
+        except StatusInformation as exc:
+            debug.logger & debug.FLAG_APP and debug.logger(
+                '_sendParts: target %s, sendPdu() failed with '
+                '%r' % (targetName, exc))
+
+            self._processPartsResponse(
+                snmpEngine, None, exc['errorIndication'], None,
+                (target, parts, len(varBinds)))
+
+    def _processPartsResponse(self, snmpEngine, sendRequestHandle,
+                              errorIndication, PDU, cbCtx):
+        target, parts, count = cbCtx
+
+        batch = self._batches.get(target)
+
+        if batch is not None:
+            batch[0] -= 1
+
+        if errorIndication:
+            errorStatus = errorIndex = 0
+            varBinds = ()
+
+        else:
+            errorStatus = v2c.apiPDU.getErrorStatus(PDU)
+            errorIndex = v2c.apiPDU.getErrorIndex(PDU, muteErrors=True)
+            varBinds = v2c.apiPDU.getVarBinds(PDU)
+
+        # PDU parts to send again, parts held till then
+        retryParts = []
+        heldParts = []
+
+        if errorStatus == 1 and count > 1:
+            maxVarBinds = (count + 1) // 2
+
+            if maxVarBinds < self._maxVarBinds.get(target[0], count + 1):
+                self._maxVarBinds[target[0]] = maxVarBinds
+
+            debug.logger & debug.FLAG_APP and debug.logger(
+                '_processPartsResponse: target %s, tooBig with %d '
+                'var-binds, splitting' % (target[0], count))
+
+            retryParts = self._splitParts(parts, maxVarBinds)
+
+            heldParts = parts
+            parts = []
+
+        elif errorStatus:
+            offset = 0
+
+            for request, start, stop in parts:
+                if offset < errorIndex <= offset + stop - start:
+                    # the rest of requests did nothing wrong
+                    heldParts = [x for x in parts if x[0] is not request]
+                    retryParts = [heldParts]
+
+                    errorIndex = errorIndex.clone(
+                        errorIndex - offset + start)
+
+                    parts = [x for x in parts if x[0] is request]
+                    break
+
+                offset += stop - start
+
+        for retry in retryParts:
+            if retry:
+                self._sendParts(snmpEngine, target, retry)
+
+        offset = 0
+
+        for request, start, stop in parts:
+            if errorIndication:
+                request.errorIndication = errorIndication
+
+            elif errorStatus:
+                if not request.errorStatus:
+                    request.errorStatus = errorStatus
+                    request.errorIndex = errorIndex
+
+            else:
+                request.rspVarBinds[start:stop] = varBinds[offset:offset + stop - start]
+
+            offset += stop - start
+
+        for request, start, stop in heldParts + parts:
+            request.pending -= 1
+
+            if not request.pending:
+                self._completeRequest(snmpEngine, request)
+
+        if batch is not None and not batch[0]:
+            if batch[1]:
+                self._flush(snmpEngine, target, True)
+
+            else:
+                del self._batches[target]
+
+    @staticmethod
+    def _splitParts(parts, maxVarBinds):
+        """Split PDU parts into chunks of up to `maxVarBinds` var-binds"""
+        chunks = [[]]
+        count = 0
+
+        for request, start, stop in parts:
+            while start < stop:
+                if count == maxVarBinds:
+                    chunks.append([])
+                    count = 0
+
+                end = min(stop, start + maxVarBinds - count)
+
+                chunks[-1].append((request, start, end))
+
+                count += end - start
+                start = end
+
+        return chunks
+
+    def _completeRequest(self, snmpEngine, request):
+        if request.errorIndication:
+            varBinds = ()
+
+        else:
+            varBinds = [rspVarBind or varBind for rspVarBind, varBind
+                        in zip(request.rspVarBinds, request.varBinds)]
+
+        request.cbFun(snmpEngine, request.sendRequestHandle,
+                      request.errorIndication, request.errorStatus,
+                      request.errorIndex, varBinds, request.cbCtx)
 
 
 class SetCommandGenerator(CommandGenerator):
@@ -372,13 +1449,39 @@ class BulkCommandGenerator(BulkCommandGeneratorSingleRun):
         (targetName, nonRepeaters, maxRepetitions,
          contextEngineId, contextName, reqPDU, cbFun, cbCtx) = cbCtx
 
+        if errorIndication:
+            varBindTable = ()
+
+        else:
+            varBindTable = v2c.apiBulkPDU.getVarBindTable(reqPDU, PDU)
+
+        tuner = getMaxRepetitionsTuner(snmpEngine)
+
+        if tuner is not None:
+            retryRepetitions = self._tuneMaxRepetitions(
+                snmpEngine, tuner, sendRequestHandle, errorIndication,
+                reqPDU, PDU, varBindTable)
+
+            if retryRepetitions:
+                debug.logger & debug.FLAG_APP and debug.logger(
+                    'processResponseVarBinds: sendRequestHandle %s, repeating '
+                    'request with max-repetitions %d' % (sendRequestHandle,
+                                                         retryRepetitions))
+
+                v2c.apiBulkPDU.setMaxRepetitions(reqPDU, retryRepetitions)
+
+                self._sendNextRequest(
+                    snmpEngine, sendRequestHandle, targetName, nonRepeaters,
+                    maxRepetitions, contextEngineId, contextName, reqPDU,
+                    cbFun, cbCtx)
+
+                return
+
         if errorIndication:
             cbFun(snmpEngine, sendRequestHandle, errorIndication,
                   0, 0, (), cbCtx)
             return
 
-        varBindTable = v2c.apiBulkPDU.getVarBindTable(reqPDU, PDU)
-
         if v2c.apiBulkPDU.getErrorStatus(PDU):
             errorIndication, varBinds = None, ()
 
@@ -406,11 +1509,29 @@ class BulkCommandGenerator(BulkCommandGeneratorSingleRun):
         if not varBinds:
             return  # no more objects available
 
-        v2c.apiBulkPDU.setRequestID(reqPDU, v2c.getNextRequestID())
         v2c.apiBulkPDU.setVarBinds(reqPDU, varBinds)
 
+        if tuner is not None:
+            transportDomain, transportAddress = config.getTargetAddr(
+                snmpEngine, targetName)[:2]
+
+            v2c.apiBulkPDU.setMaxRepetitions(
+                reqPDU, tuner.getMaxRepetitions(
+                    transportDomain, transportAddress,
+                    v2c.apiBulkPDU.getMaxRepetitions(reqPDU)))
+
+        self._sendNextRequest(
+            snmpEngine, sendRequestHandle, targetName, nonRepeaters,
+            maxRepetitions, contextEngineId, contextName, reqPDU,
+            cbFun, cbCtx)
+
+    def _sendNextRequest(self, snmpEngine, sendRequestHandle, targetName,
+                         nonRepeaters, maxRepetitions, contextEngineId,
+                         contextName, reqPDU, cbFun, cbCtx):
+        v2c.apiBulkPDU.setRequestID(reqPDU, v2c.getNextRequestID())
+
         try:
-            self.sendPdu(
+            nextRequestHandle = self.sendPdu(
                 snmpEngine, targetName, contextEngineId, contextName, reqPDU,
                 self.processResponseVarBinds,
                 (targetName, nonRepeaters, maxRepetitions,
@@ -425,3 +1546,81 @@ class BulkCommandGenerator(BulkCommandGeneratorSingleRun):
 
             cbFun(snmpEngine, sendRequestHandle,
                   statusInformation['errorIndication'], 0, 0, (), cbCtx)
+
+            return
+
+        self._trackRequest(snmpEngine, nextRequestHandle, targetName,
+                           v2c.apiBulkPDU.getMaxRepetitions(reqPDU))
+
+    @staticmethod
+    def _trackRequest(snmpEngine, sendRequestHandle, targetName,
+                      maxRepetitions):
+        tuner = getMaxRepetitionsTuner(snmpEngine)
+
+        if tuner is not None:
+            transportDomain, transportAddress = config.getTargetAddr(
+                snmpEngine, targetName)[:2]
+
+            tuner.requestSent(sendRequestHandle, transportDomain,
+                              transportAddress, int(maxRepetitions))
+
+    @staticmethod
+    def _tuneMaxRepetitions(snmpEngine, tuner, sendRequestHandle,
+                            errorIndication, reqPDU, PDU, varBindTable):
+        """Report GETBULK outcome to tuner, return max-repetitions to retry"""
+        if errorIndication:
+            if errorIndication == errind.requestTimedOut:
+                return tuner.requestTimedOut(sendRequestHandle)
+
+            tuner.requestFailed(sendRequestHandle)
+            return 0
+
+        errorStatus = v2c.apiBulkPDU.getErrorStatus(PDU)
+
+        if errorStatus == 1:  # tooBig
+            return tuner.responseTooBig(sendRequestHandle)
+
+        reqVarBinds = v2c.apiBulkPDU.getVarBinds(reqPDU)
+
+        if (errorStatus or
+                len(reqVarBinds) <= v2c.apiBulkPDU.getNonRepeaters(reqPDU)):
+            tuner.requestFailed(sendRequestHandle)
+            return 0
+
+        truncated = (
+            len(varBindTable) < v2c.apiBulkPDU.getMaxRepetitions(reqPDU) and
+            not [x for x in varBindTable and varBindTable[-1] or ()
+                 if x[1].tagSet == v2c.EndOfMibView.tagSet])
+
+        try:
+            messageSize = len(snmpEngine.observer.getExecutionContext(
+                'rfc3412.receiveMessage:response')['wholeMsg'])
+
+        except KeyError:
+            messageSize = 0
+
+        tuner.responseReceived(
+            sendRequestHandle, len(varBindTable), truncated, messageSize)
+
+        return 0
+
+    def sendVarBinds(self, snmpEngine, targetName, contextEngineId,
+                     contextName, nonRepeaters, maxRepetitions,
+                     varBinds, cbFun, cbCtx=None):
+        tuner = getMaxRepetitionsTuner(snmpEngine)
+
+        if tuner is not None:
+            transportDomain, transportAddress = config.getTargetAddr(
+                snmpEngine, targetName)[:2]
+
+            maxRepetitions = tuner.getMaxRepetitions(
+                transportDomain, transportAddress, maxRepetitions)
+
+        sendRequestHandle = BulkCommandGeneratorSingleRun.sendVarBinds(
+            self, snmpEngine, targetName, contextEngineId, contextName,
+            nonRepeaters, maxRepetitions, varBinds, cbFun, cbCtx)
+
+        self._trackRequest(snmpEngine, sendRequestHandle, targetName,
+                           maxRepetitions)
+
+        return sendRequestHandle
@@ -441,22 +441,36 @@ class BulkCommandResponder(NextCommandResponder):
             eom = all(exval.endOfMibView.isSameTypeWith(value) for name, value in rspVarBinds)
 
             if not eom and context['counters']['M'] and context['counters']['R']:
-                snmpEngine = context['snmpEngine']
+                repetition = context['repetition']
 
-                # Need to unwind stack, can't recurse any more
-                def callLater(*args):
-                    snmpEngine.transportDispatcher.unregisterTimerCbFun(callLater)
-                    mgmtFun = context['mgmtFun']
-                    reqVarBinds = varBinds[-context['counters']['R']:]
-                    mgmtFun(*reqVarBinds,
-                            **dict(context, cbFun=self.completeMgmtOperation,
-                                   varBindsMap={}, rspVarBinds=reqVarBinds[:]))
+                repetition['varBinds'] = varBinds[-context['counters']['R']:]
 
-                snmpEngine.transportDispatcher.registerTimerCbFun(callLater, 0.01)
+                # Repetitions completing right away are run by the loop
+                if not repetition['running']:
+                    self._runRepetitions(**context)
 
             else:
                 CommandResponderBase.completeMgmtOperation(self, context['allVarBinds'], **context)
 
+    def _runRepetitions(self, **context):
+        """Read next GETBULK repetitions in a loop rather than recursively"""
+        repetition = context['repetition']
+        mgmtFun = context['mgmtFun']
+
+        repetition['running'] = True
+
+        try:
+            while repetition['varBinds']:
+                reqVarBinds = repetition['varBinds']
+                repetition['varBinds'] = None
+
+                mgmtFun(*reqVarBinds,
+                        **dict(context, cbFun=self.completeMgmtOperation,
+                               varBindsMap={}, rspVarBinds=reqVarBinds[:]))
+
+        finally:
+            repetition['running'] = False
+
     # rfc1905: 4.2.3
     def initiateMgmtOperation(self, snmpEngine, stateReference, contextName, PDU):
         nonRepeaters = v2c.apiBulkPDU.getNonRepeaters(PDU)
@@ -489,6 +503,7 @@ class BulkCommandResponder(NextCommandResponder):
                        cbCtx=self.cbCtx,
                        reqVarBinds=varBinds[N:],
                        counters={'M': M, 'R': R},
+                       repetition={'varBinds': None, 'running': False},
                        rspVarBinds=varBinds[N:],
                        allVarBinds=[],
                        varBindsMap={},
@@ -228,53 +228,102 @@ def getNotificationInfo(snmpEngine, notificationTarget):
 def getTargetNames(snmpEngine, tag):
     mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
 
-    snmpTargetAddrEntry, = mibBuilder.importSymbols(
-        'SNMP-TARGET-MIB', 'snmpTargetAddrEntry')
+    (SnmpTagValue, snmpTargetAddrName,
+     snmpTargetAddrTagList) = mibBuilder.importSymbols(
+        'SNMP-TARGET-MIB', 'SnmpTagValue', 'snmpTargetAddrName',
+        'snmpTargetAddrTagList'
+    )
 
     cache = snmpEngine.getUserContext('getTargetNames')
     if cache is None:
         cache = {'id': -1}
         snmpEngine.setUserContext(getTargetNames=cache)
 
-    if cache['id'] == snmpTargetAddrEntry.branchVersionId:
-        tagToTargetsMap = cache['tagToTargetsMap']
+    if cache['id'] != snmpTargetAddrTagList.branchVersionId:
+        changes = snmpTargetAddrTagList.getInstancesChanges(cache['id'])
+
+        if changes is None:
+            # tag -> {instId: snmpTargetAddrName}
+            cache['tagToRowsMap'] = {}
+            # instId -> tags
+            cache['rowToTagsMap'] = {}
+            # tag -> snmpTargetAddrName's in table order
+            cache['tagToTargetsMap'] = {}
+
+            instIds = []
 
-    else:
-        cache['tagToTargetsMap'] = {}
+            mibNode = snmpTargetAddrTagList
 
+            while True:
+                try:
+                    mibNode = snmpTargetAddrTagList.getNextNode(mibNode.name)
+
+                except NoSuchInstanceError:
+                    break
+
+                instIds.append(mibNode.name[len(snmpTargetAddrTagList.name):])
+
+        else:
+            instIds = set(changes)
+
+        tagToRowsMap = cache['tagToRowsMap']
+        rowToTagsMap = cache['rowToTagsMap']
         tagToTargetsMap = cache['tagToTargetsMap']
 
-        (SnmpTagValue, snmpTargetAddrName,
-         snmpTargetAddrTagList) = mibBuilder.importSymbols(
-            'SNMP-TARGET-MIB', 'SnmpTagValue', 'snmpTargetAddrName',
-            'snmpTargetAddrTagList'
-        )
+        # many rows share the same tag lists
+        tagLists = {}
 
-        mibNode = snmpTargetAddrTagList
+        for idx in instIds:
+            for _tag in rowToTagsMap.pop(idx, ()):
+                del tagToRowsMap[_tag][idx]
+
+                if not tagToRowsMap[_tag]:
+                    del tagToRowsMap[_tag]
+
+                tagToTargetsMap.pop(_tag, None)
 
-        while True:
             try:
-                mibNode = snmpTargetAddrTagList.getNextNode(mibNode.name)
+                _snmpTargetAddrTagList = snmpTargetAddrTagList.getNode(
+                    snmpTargetAddrTagList.name + idx).syntax
+
+                _snmpTargetAddrName = snmpTargetAddrName.getNode(
+                    snmpTargetAddrName.name + idx).syntax
 
             except NoSuchInstanceError:
-                break
+                continue
 
-            idx = mibNode.name[len(snmpTargetAddrTagList.name):]
+            tagList = _snmpTargetAddrTagList.asOctets()
 
-            _snmpTargetAddrName = snmpTargetAddrName.getNode(snmpTargetAddrName.name + idx).syntax
+            if tagList in tagLists:
+                tags = tagLists[tagList]
 
-            for _tag in mibNode.syntax.asOctets().split():
-                _tag = SnmpTagValue(_tag)
+            else:
+                tags = tagLists[tagList] = frozenset(
+                    [SnmpTagValue(x) for x in tagList.split()])
 
-                if _tag not in tagToTargetsMap:
-                    tagToTargetsMap[_tag] = []
+            for _tag in tags:
+                if _tag not in tagToRowsMap:
+                    tagToRowsMap[_tag] = {}
 
-                tagToTargetsMap[_tag].append(_snmpTargetAddrName)
+                tagToRowsMap[_tag][idx] = _snmpTargetAddrName
 
-        cache['id'] = snmpTargetAddrEntry.branchVersionId
+                tagToTargetsMap.pop(_tag, None)
+
+            rowToTagsMap[idx] = tags
+
+        cache['id'] = snmpTargetAddrTagList.branchVersionId
+
+    tagToTargetsMap = cache['tagToTargetsMap']
 
     if tag not in tagToTargetsMap:
-        raise SmiError('Transport tag %s not configured at LCD' % tag)
+        tagToRowsMap = cache['tagToRowsMap']
+
+        if tag not in tagToRowsMap:
+            raise SmiError('Transport tag %s not configured at LCD' % tag)
+
+        rows = tagToRowsMap[tag]
+
+        tagToTargetsMap[tag] = [rows[idx] for idx in sorted(rows)]
 
     return tagToTargetsMap[tag]
 
@@ -0,0 +1,220 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysnmp/license.html
+#
+# Bulk SNMP engine discovery (RFC 3414 section 4) and persistence of
+# the discovered peer SNMP engines information.
+#
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from pyasn1.type import univ
+
+from pysnmp import debug
+from pysnmp import error
+from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.entity.rfc3413 import config
+from pysnmp.proto.error import StatusInformation
+from pysnmp.proto.mpmod.rfc3412 import SnmpV3MessageProcessingModel
+from pysnmp.proto.secmod.rfc3414 import SnmpUSMSecurityModel
+
+__all__ = ['discoverEngines', 'exportEngineInfo', 'importEngineInfo']
+
+DEFAULT_CONCURRENCY = 64
+
+# RFC 3414, snmpEngineTime upper bound
+MAX_ENGINE_TIME = 2147483647
+
+
+def _getMpHandler(snmpEngine):
+    return snmpEngine.messageProcessingSubsystems[
+        SnmpV3MessageProcessingModel.MESSAGE_PROCESSING_MODEL_ID]
+
+
+def _getSmHandler(snmpEngine):
+    return snmpEngine.securityModels[
+        SnmpUSMSecurityModel.SECURITY_MODEL_ID]
+
+
+def _toHex(value):
+    return ''.join(['%.2x' % x for x in univ.OctetString(value).asNumbers()])
+
+
+def _fromHex(value):
+    return univ.OctetString(hexValue=value)
+
+
+def discoverEngines(snmpEngine, targetNames, cbFun, cbCtx=None,
+                    concurrency=DEFAULT_CONCURRENCY):
+    """Discover SNMP engines behind many LCD targets.
+
+    Sends an empty SNMP GET request to each of `targetNames` keeping at
+    most `concurrency` of them in flight. Command generator's own engine
+    ID and time window discovery does the work, the responses end up
+    populating peer engine ID cache of SNMPv3 message processing model
+    and USM timeline. Subsequent requests to these targets go out
+    authenticated right away.
+
+    User `cbFun` is called once per target:
+
+        cbFun(snmpEngine, targetName, errorIndication,
+              securityEngineId, cbCtx)
+
+    Where `securityEngineId` is `None` unless discovery succeeded.
+    Targets the request could not be sent to (e.g. not configured) are
+    reported with `errorIndication` right away.
+    """
+    targetNames = iter(targetNames)
+
+    cmdGen = cmdgen.GetCommandGenerator()
+
+    def __cbFun(snmpEngine, sendRequestHandle, errorIndication,
+                errorStatus, errorIndex, varBinds, targetName):
+
+        securityEngineId = None
+
+        if not errorIndication:
+            transportDomain, transportAddress = config.getTargetAddr(
+                snmpEngine, targetName)[:2]
+
+            securityEngineId = _getMpHandler(snmpEngine).getPeerEngineInfo(
+                transportDomain, transportAddress)[0]
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            'discoverEngines: target %s, errorIndication %s, '
+            'securityEngineId %r' % (targetName, errorIndication,
+                                     securityEngineId))
+
+        try:
+            cbFun(snmpEngine, targetName, errorIndication,
+                  securityEngineId, cbCtx)
+
+        finally:
+            __sendNext()
+
+    def __sendNext():
+        for targetName in targetNames:
+            try:
+                cmdGen.sendVarBinds(
+                    snmpEngine, targetName, None, '', (), __cbFun, targetName)
+                return
+
+            except StatusInformation as exc:
+                errorIndication = exc['errorIndication']
+
+            except error.PySnmpError as exc:
+                errorIndication = exc
+
+            debug.logger & debug.FLAG_APP and debug.logger(
+                'discoverEngines: target %s, sendVarBinds() failed with '
+                '%s' % (targetName, errorIndication))
+
+            # move on to the next target anyway
+            cbFun(snmpEngine, targetName, errorIndication, None, cbCtx)
+
+    for _ in range(max(concurrency, 1)):
+        __sendNext()
+
+
+def exportEngineInfo(snmpEngine, filename):
+    """Save discovered peer SNMP engines information into a file.
+
+    Stores securityEngineId, contextEngineId and contextName of each
+    known peer along with its snmpEngineBoots and snmpEngineTime
+    (if known). Returns the number of peers saved.
+    """
+    mpHandler = _getMpHandler(snmpEngine)
+    smHandler = _getSmHandler(snmpEngine)
+
+    engines = []
+
+    for transportDomain, transportAddress in mpHandler.getPeerEngines():
+        (securityEngineId,
+         contextEngineId,
+         contextName) = mpHandler.getPeerEngineInfo(
+            transportDomain, transportAddress)
+
+        if securityEngineId is None:
+            continue
+
+        engine = {
+            'transportDomain': [int(x) for x in transportDomain],
+            'transportAddress': list(transportAddress),
+            'securityEngineId': _toHex(securityEngineId),
+            'contextEngineId': _toHex(contextEngineId),
+            'contextName': _toHex(contextName)
+        }
+
+        timeline = smHandler.getTimelineInfo(securityEngineId)
+        if timeline:
+            engine['snmpEngineBoots'], engine['snmpEngineTime'] = timeline
+
+        engines.append(engine)
+
+    contents = {
+        'timestamp': int(time.time()),
+        'engines': engines
+    }
+
+    try:
+        fd, fn = tempfile.mkstemp(dir=os.path.dirname(filename) or '.')
+
+        os.write(fd, json.dumps(contents).encode())
+        os.close(fd)
+
+        shutil.move(fn, filename)
+
+    except (OSError, IOError) as exc:
+        raise error.PySnmpError(
+            'Failed to save SNMP engines info to %s: %s' % (filename, exc))
+
+    debug.logger & debug.FLAG_APP and debug.logger(
+        'exportEngineInfo: saved %d SNMP engines to '
+        '%s' % (len(engines), filename))
+
+    return len(engines)
+
+
+def importEngineInfo(snmpEngine, filename):
+    """Load peer SNMP engines information saved by `exportEngineInfo`.
+
+    Peer snmpEngineTime is advanced by the time passed since the
+    export. Returns the number of peers loaded.
+    """
+    try:
+        with open(filename) as f:
+            contents = json.load(f)
+
+    except (OSError, IOError, ValueError) as exc:
+        raise error.PySnmpError(
+            'Failed to load SNMP engines info from %s: %s' % (filename, exc))
+
+    mpHandler = _getMpHandler(snmpEngine)
+    smHandler = _getSmHandler(snmpEngine)
+
+    idleTime = max(int(time.time()) - contents.get('timestamp', 0), 0)
+
+    for engine in contents.get('engines', ()):
+        securityEngineId = _fromHex(engine['securityEngineId'])
+
+        mpHandler.setPeerEngineInfo(
+            snmpEngine, tuple(engine['transportDomain']),
+            tuple(engine['transportAddress']), securityEngineId,
+            _fromHex(engine['contextEngineId']),
+            _fromHex(engine['contextName']))
+
+        if 'snmpEngineBoots' in engine:
+            smHandler.setTimelineInfo(
+                snmpEngine, securityEngineId, engine['snmpEngineBoots'],
+                min(engine['snmpEngineTime'] + idleTime, MAX_ENGINE_TIME))
+
+    debug.logger & debug.FLAG_APP and debug.logger(
+        'importEngineInfo: loaded %d SNMP engines from '
+        '%s' % (len(contents.get('engines', ())), filename))
+
+    return len(contents.get('engines', ()))
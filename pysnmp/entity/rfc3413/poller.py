@@ -0,0 +1,433 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysnmp/license.html
+#
+# Periodic polling of many SNMP agents by SNMP GET requests
+#
+import heapq
+import math
+import random
+
+from pysnmp import debug
+from pysnmp import error
+from pysnmp import nextid
+from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.proto.error import StatusInformation
+
+__all__ = ['PollScheduler', 'configurePollScheduler', 'getPollScheduler']
+
+getNextHandle = nextid.Integer(0x7fffffff)
+
+POLLER_CONTEXT_ID = 'cmdgenPollScheduler'
+
+# golden ratio conjugate, spreads any number of jobs evenly
+SPREAD_FACTOR = 0.6180339887498949
+
+# time constant (in seconds) of achieved poll rate smoothing
+RATE_SMOOTHING = 60.0
+
+
+class _PollJob(object):
+
+    def __init__(self, jobId, target, varBinds, interval, cbFun, cbCtx):
+        self.jobId = jobId
+        self.target = target
+        self.varBinds = varBinds
+        self.interval = interval
+        self.cbFun = cbFun
+        self.cbCtx = cbCtx
+
+        self.varBindSize = max(
+            [cmdgen.estimateVarBindSize(x[0]) for x in varBinds])
+
+        # scheduling grid: phase + k * interval
+        self.nominalTime = None
+        self.dueTime = None
+
+        # outstanding poll: [requests, varBinds, errorIndication,
+        #                    errorStatus, errorIndex]
+        self.poll = None
+
+
+class PollScheduler(object):
+    """Poll SNMP agents periodically by SNMP GET requests.
+
+    Each job is polled every `interval` seconds. First polls of jobs are
+    spread across their intervals, each poll is additionally delayed at
+    random by up to `jitter` fraction of job's interval. Jobs due at the
+    same time at the same SNMP agent and context are polled together, by
+    as few GET requests as `maxMessageSize` permits. Sizes of responses
+    are learned as polls complete.
+
+    Job that is still being polled when it gets due again skips the
+    cycle. Cycles the scheduler was late for by more than the interval
+    are skipped as well.
+
+    Polls are driven by the timer of SNMP engine's transport dispatcher,
+    so scheduling is as precise as dispatcher's timer resolution.
+    """
+    def __init__(self, snmpEngine, maxMessageSize=1472, jitter=0.1):
+        self._snmpEngine = snmpEngine
+        self._maxMessageSize = maxMessageSize
+        self._jitter = jitter
+
+        self._cmdGen = cmdgen.GetCommandGenerator(splitTooBig=True)
+
+        # jobId -> _PollJob
+        self._jobs = {}
+
+        # jobs yet to be put on schedule
+        self._newJobs = []
+
+        # (dueTime, jobId) of scheduled jobs
+        self._schedule = []
+
+        self._jobsAdded = 0
+        self._running = False
+
+        self._scheduledRate = 0.0
+        self._achievedRate = self._rateWeight = 0.0
+        self._lastTick = None
+
+        self._polls = self._completed = self._failed = 0
+        self._skipped = self._missed = 0
+        self._requests = 0
+
+        self._lateness = self._maxLateness = 0.0
+
+    def setLimits(self, maxMessageSize=1472, jitter=0.1):
+        """Change request size limit and polls jitter"""
+        self._maxMessageSize = maxMessageSize
+        self._jitter = jitter
+
+    def addJob(self, targetName, contextEngineId, contextName, varBinds,
+               interval, cbFun, cbCtx=None):
+        """Poll MIB variables at SNMP agent every `interval` seconds.
+
+        Once all MIB variables are read `cbFun` is called:
+
+            cbFun(snmpEngine, jobId, errorIndication, errorStatus,
+                  errorIndex, varBinds, cbCtx)
+
+        Returns job ID to remove the job by.
+        """
+        if not varBinds:
+            raise error.PySnmpError('No MIB variables to poll')
+
+        if interval <= 0:
+            raise error.PySnmpError('Bad polling interval %s' % interval)
+
+        jobId = getNextHandle()
+
+        job = _PollJob(jobId, (targetName, contextEngineId, contextName),
+                       list(varBinds), interval, cbFun, cbCtx)
+
+        self._jobs[jobId] = job
+        self._newJobs.append(job)
+
+        self._scheduledRate += 1.0 / interval
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            'addJob: jobId %s, target %s, %d var-binds every '
+            '%s sec' % (jobId, targetName, len(varBinds), interval))
+
+        if not self._running:
+            self._start()
+
+        return jobId
+
+    def removeJob(self, jobId):
+        """Stop polling, outstanding poll of the job gets dropped"""
+        try:
+            job = self._jobs.pop(jobId)
+
+        except KeyError:
+            raise error.PySnmpError('Unknown polling job %s' % jobId)
+
+        job.poll = None
+
+        self._scheduledRate -= 1.0 / job.interval
+
+        if job in self._newJobs:
+            self._newJobs.remove(job)
+
+        if not self._jobs:
+            self._stop()
+
+    def getStats(self):
+        """Return polling counters as a dict.
+
+        The `scheduledRate` and `achievedRate` are in polls per second,
+        the latter being the rate of polls actually sent out smoothed
+        over about a minute. The `lateness` and `maxLateness` (in
+        seconds) are the average and the longest delay of a poll past
+        its due time.
+        """
+        return {
+            'jobs': len(self._jobs),
+            'scheduledRate': self._scheduledRate,
+            'achievedRate': (self._rateWeight and
+                             self._achievedRate / self._rateWeight or 0.0),
+            'polls': self._polls,
+            'completed': self._completed,
+            'failed': self._failed,
+            'skipped': self._skipped,
+            'missed': self._missed,
+            'requests': self._requests,
+            'lateness': self._polls and self._lateness / self._polls or 0.0,
+            'maxLateness': self._maxLateness
+        }
+
+    def _start(self):
+        transportDispatcher = self._snmpEngine.transportDispatcher
+
+        if transportDispatcher is None:
+            raise error.PySnmpError('No transport dispatcher configured')
+
+        transportDispatcher.registerTimerCbFun(self._tick)
+        transportDispatcher.jobStarted(id(self))
+
+        self._running = True
+        self._lastTick = None
+
+    def _stop(self):
+        transportDispatcher = self._snmpEngine.transportDispatcher
+
+        if transportDispatcher is not None:
+            transportDispatcher.unregisterTimerCbFun(self._tick)
+            transportDispatcher.jobFinished(id(self))
+
+        self._running = False
+        self._schedule = []
+
+    def _tick(self, timeNow):
+        self._putOnSchedule(timeNow)
+
+        dueJobs = {}
+
+        polls = 0
+
+        while self._schedule and self._schedule[0][0] <= timeNow:
+            dueTime, jobId = heapq.heappop(self._schedule)
+
+            job = self._jobs.get(jobId)
+
+            # removed or rescheduled job
+            if job is None or job.dueTime != dueTime:
+                continue
+
+            self._reschedule(job, timeNow)
+
+            if job.poll is not None:
+                self._skipped += 1
+                continue
+
+            lateness = timeNow - dueTime
+
+            self._lateness += lateness
+
+            if lateness > self._maxLateness:
+                self._maxLateness = lateness
+
+            polls += 1
+
+            if job.target in dueJobs:
+                dueJobs[job.target].append(job)
+
+            else:
+                dueJobs[job.target] = [job]
+
+        self._polls += polls
+
+        if self._lastTick is not None and timeNow > self._lastTick:
+            interval = timeNow - self._lastTick
+
+            weight = 1 - math.exp(-interval / RATE_SMOOTHING)
+
+            # bias-corrected moving average
+            self._achievedRate += weight * (
+                polls / interval - self._achievedRate)
+            self._rateWeight += weight * (1 - self._rateWeight)
+
+        self._lastTick = timeNow
+
+        for target, jobs in dueJobs.items():
+            self._pollTarget(target, jobs)
+
+    def _putOnSchedule(self, timeNow):
+        for job in self._newJobs:
+            self._jobsAdded += 1
+
+            phase = (self._jobsAdded * SPREAD_FACTOR) % 1 * job.interval
+
+            job.nominalTime = timeNow + phase
+            job.dueTime = job.nominalTime + self._getJitter(job)
+
+            heapq.heappush(self._schedule, (job.dueTime, job.jobId))
+
+        self._newJobs = []
+
+    def _reschedule(self, job, timeNow):
+        job.nominalTime += job.interval
+
+        # late beyond next cycle
+        if job.nominalTime <= timeNow:
+            missed = int((timeNow - job.nominalTime) // job.interval) + 1
+
+            job.nominalTime += missed * job.interval
+
+            self._missed += missed
+
+        job.dueTime = job.nominalTime + self._getJitter(job)
+
+        heapq.heappush(self._schedule, (job.dueTime, job.jobId))
+
+    def _getJitter(self, job):
+        return self._jitter and random.uniform(
+            0, self._jitter * job.interval) or 0
+
+    def _pollTarget(self, target, jobs):
+        budget = self._maxMessageSize - cmdgen.MESSAGE_OVERHEAD
+
+        varBinds = []
+        parts = []
+        size = 0
+
+        for job in jobs:
+            job.poll = [0, [None] * len(job.varBinds), None, 0, 0]
+
+            start = 0
+
+            for stop in range(1, len(job.varBinds) + 1):
+                if varBinds and size + job.varBindSize > budget:
+                    if stop - 1 > start:
+                        parts.append((job, start, stop - 1))
+                        start = stop - 1
+
+                    self._sendRequest(target, varBinds, parts)
+
+                    varBinds = []
+                    parts = []
+                    size = 0
+
+                varBinds.append(job.varBinds[stop - 1])
+                size += job.varBindSize
+
+            parts.append((job, start, len(job.varBinds)))
+
+        if varBinds:
+            self._sendRequest(target, varBinds, parts)
+
+    def _sendRequest(self, target, varBinds, parts):
+        targetName, contextEngineId, contextName = target
+
+        for job, start, stop in parts:
+            job.poll[0] += 1
+
+        self._requests += 1
+
+        try:
+            self._cmdGen.sendVarBinds(
+                self._snmpEngine, targetName, contextEngineId, contextName,
+                varBinds, self._processResponse, parts)
+
+        except StatusInformation as exc:
+            debug.logger & debug.FLAG_APP and debug.logger(
+                '_sendRequest: target %s, sendVarBinds() failed with '
+                '%r' % (targetName, exc))
+
+            self._processResponse(self._snmpEngine, None,
+                                  exc['errorIndication'], 0, 0, (), parts)
+
+    def _processResponse(self, snmpEngine, sendRequestHandle,
+                         errorIndication, errorStatus, errorIndex, varBinds,
+                         parts):
+        messageSize = 0
+
+        if not errorIndication and not errorStatus:
+            try:
+                messageSize = len(snmpEngine.observer.getExecutionContext(
+                    'rfc3412.receiveMessage:response')['wholeMsg'])
+
+            except KeyError:
+                messageSize = 0
+
+        offset = 0
+
+        for job, start, stop in parts:
+            poll = job.poll
+
+            # job removed meanwhile
+            if poll is None:
+                offset += stop - start
+                continue
+
+            if errorIndication:
+                poll[2] = errorIndication
+
+            elif errorStatus:
+                if 0 < errorIndex - offset <= stop - start:
+                    poll[3] = errorStatus
+                    poll[4] = errorIndex.clone(errorIndex - offset + start)
+
+                elif not poll[3]:
+                    poll[3] = errorStatus
+
+                # response will not fit, pack less next time
+                if errorStatus == 1:
+                    job.varBindSize *= 2
+
+            else:
+                poll[1][start:stop] = varBinds[offset:offset + stop - start]
+
+                if messageSize:
+                    varBindSize = (messageSize - cmdgen.MESSAGE_OVERHEAD) // len(varBinds) + 1
+
+                    if varBindSize > job.varBindSize:
+                        job.varBindSize = varBindSize
+
+            offset += stop - start
+
+            poll[0] -= 1
+
+            if not poll[0]:
+                self._completePoll(job)
+
+    def _completePoll(self, job):
+        requests, varBinds, errorIndication, errorStatus, errorIndex = job.poll
+
+        job.poll = None
+
+        if errorIndication or errorStatus:
+            self._failed += 1
+            varBinds = ()
+
+        else:
+            self._completed += 1
+
+        job.cbFun(self._snmpEngine, job.jobId, errorIndication, errorStatus,
+                  errorIndex, varBinds, job.cbCtx)
+
+
+def configurePollScheduler(snmpEngine, maxMessageSize=1472, jitter=0.1):
+    """Poll SNMP agents periodically at SNMP engine.
+
+    Returns `PollScheduler` object running polling jobs of `snmpEngine`.
+    """
+    scheduler = snmpEngine.getUserContext(POLLER_CONTEXT_ID)
+
+    if scheduler is None:
+        scheduler = PollScheduler(snmpEngine, maxMessageSize, jitter)
+        snmpEngine.setUserContext(**{POLLER_CONTEXT_ID: scheduler})
+
+    else:
+        scheduler.setLimits(maxMessageSize, jitter)
+
+    return scheduler
+
+
+def getPollScheduler(snmpEngine):
+    """Return `PollScheduler` of SNMP engine or `None` if not configured"""
+    return snmpEngine.getUserContext(POLLER_CONTEXT_ID)
@@ -0,0 +1,276 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysnmp/license.html
+#
+# Concurrent walk over many MIB table columns assembling table rows
+#
+from pysnmp import debug
+from pysnmp import error
+from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.proto import errind
+from pysnmp.proto.api import v2c
+from pysnmp.proto.error import StatusInformation
+
+__all__ = ['walkTables']
+
+DEFAULT_MAX_REPETITIONS = 25
+
+# table columns walked by a single request chain
+DEFAULT_MAX_COLUMNS = 16
+
+EXCEPTION_TAGS = (v2c.NoSuchObject.tagSet, v2c.NoSuchInstance.tagSet,
+                  v2c.EndOfMibView.tagSet)
+
+
+class _TableWalk(object):
+
+    def __init__(self, snmpEngine, targetName, contextEngineId, contextName,
+                 columns, maxRepetitions, cbFun, cbCtx):
+        self._snmpEngine = snmpEngine
+        self._targetName = targetName
+        self._contextEngineId = contextEngineId
+        self._contextName = contextName
+        self._maxRepetitions = maxRepetitions
+        self._cbFun = cbFun
+        self._cbCtx = cbCtx
+
+        self._columns = [tuple(v2c.ObjectIdentifier(x)) for x in columns]
+
+        # the last OID received in each column
+        self._lastNames = [None] * len(self._columns)
+
+        self._done = [False] * len(self._columns)
+
+        # row index -> [varBind or None per column]
+        self._rows = {}
+
+        self._stopped = False
+
+        # request chains still running
+        self._chains = 0
+
+        self._cmdGen = cmdgen.BulkCommandGeneratorSingleRun()
+
+    def start(self, maxColumns):
+        for idx in range(0, len(self._columns), maxColumns):
+            self._chains += 1
+
+            try:
+                self._sendRequest(
+                    list(range(idx, min(idx + maxColumns, len(self._columns)))))
+
+            except StatusInformation as exc:
+                debug.logger & debug.FLAG_APP and debug.logger(
+                    'start: sendVarBinds() failed with %r' % (exc,))
+
+                self._stop(None, exc['errorIndication'], 0, 0)
+                return
+
+    def _sendRequest(self, columnIdxs):
+        varBinds = [(v2c.ObjectIdentifier(self._lastNames[idx] or
+                                          self._columns[idx]), v2c.null)
+                    for idx in columnIdxs]
+
+        return self._cmdGen.sendVarBinds(
+            self._snmpEngine, self._targetName, self._contextEngineId,
+            self._contextName, 0, self._maxRepetitions, varBinds,
+            self._processResponse, columnIdxs)
+
+    def _processResponse(self, snmpEngine, sendRequestHandle,
+                         errorIndication, errorStatus, errorIndex, varBinds,
+                         columnIdxs):
+        if self._stopped:
+            return
+
+        if errorIndication:
+            self._stop(sendRequestHandle, errorIndication, 0, 0)
+            return
+
+        if errorStatus:
+            # SNMPv1 agent reports end of MIB this way
+            if errorStatus == 2 and 0 < errorIndex <= len(columnIdxs):
+                self._done[columnIdxs[errorIndex - 1]] = True
+
+            else:
+                if 0 < errorIndex <= len(columnIdxs):
+                    errorIndex = errorIndex.clone(
+                        columnIdxs[errorIndex - 1] + 1)
+
+                self._stop(sendRequestHandle, None, errorStatus, errorIndex)
+                return
+
+        else:
+            errorIndication = self._collectColumns(varBinds, columnIdxs)
+
+            if errorIndication:
+                self._stop(sendRequestHandle, errorIndication, 0, 0)
+                return
+
+        columnIdxs = [idx for idx in columnIdxs if not self._done[idx]]
+
+        if not columnIdxs:
+            self._chains -= 1
+
+        self._reportRows(sendRequestHandle)
+
+        if self._stopped:
+            return
+
+        if not columnIdxs:
+            if not self._chains:
+                self._finish(sendRequestHandle)
+
+            return
+
+        try:
+            self._sendRequest(columnIdxs)
+
+        except StatusInformation as exc:
+            debug.logger & debug.FLAG_APP and debug.logger(
+                '_processResponse: sendRequestHandle %s, sendVarBinds() '
+                'failed with %r' % (sendRequestHandle, exc))
+
+            self._stop(sendRequestHandle, exc['errorIndication'], 0, 0)
+
+    def _collectColumns(self, varBinds, columnIdxs):
+        """Sort out column instances, returns error indication if any"""
+        width = len(columnIdxs)
+
+        # ignore incomplete trailing row
+        varBinds = varBinds[:len(varBinds) // width * width]
+
+        if not varBinds:
+            for idx in columnIdxs:
+                self._done[idx] = True
+
+        for pos, (name, value) in enumerate(varBinds):
+            idx = columnIdxs[pos % width]
+
+            if self._done[idx]:
+                continue
+
+            column = self._columns[idx]
+
+            oid = name.asTuple()
+
+            if (value.tagSet in EXCEPTION_TAGS or
+                    oid[:len(column)] != column):
+                self._done[idx] = True
+                continue
+
+            if self._lastNames[idx] and oid <= self._lastNames[idx]:
+                debug.logger & debug.FLAG_APP and debug.logger(
+                    '_collectColumns: OID %s not increasing after '
+                    '%s' % (name, v2c.ObjectIdentifier(self._lastNames[idx])))
+
+                return errind.oidNotIncreasing
+
+            self._lastNames[idx] = oid
+
+            index = oid[len(column):]
+
+            row = self._rows.get(index)
+            if row is None:
+                row = self._rows[index] = [None] * len(self._columns)
+
+            row[idx] = name, value
+
+    def _reportRows(self, sendRequestHandle):
+        lastIndex = None
+
+        for idx, column in enumerate(self._columns):
+            if self._done[idx]:
+                continue
+
+            lastName = self._lastNames[idx]
+
+            # nothing is known of column's rows yet
+            if lastName is None:
+                return
+
+            index = lastName[len(column):]
+
+            if lastIndex is None or index < lastIndex:
+                lastIndex = index
+
+        if lastIndex is None:
+            indices = sorted(self._rows)
+
+        else:
+            indices = sorted([x for x in self._rows if x <= lastIndex])
+
+        if not indices:
+            return
+
+        varBindTable = []
+
+        for index in indices:
+            row = self._rows.pop(index)
+
+            for idx, varBind in enumerate(row):
+                if varBind is None:
+                    row[idx] = (v2c.ObjectIdentifier(self._columns[idx] + index),
+                                v2c.NoSuchInstance(''))
+
+            varBindTable.append(row)
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            '_reportRows: sendRequestHandle %s, %d row(s) complete, %d '
+            'pending' % (sendRequestHandle, len(varBindTable),
+                         len(self._rows)))
+
+        if not self._cbFun(self._snmpEngine, sendRequestHandle, None, 0, 0,
+                           varBindTable, self._cbCtx):
+            self._stopped = True
+
+    def _finish(self, sendRequestHandle):
+        self._stopped = True
+
+        debug.logger & debug.FLAG_APP and debug.logger(
+            '_finish: sendRequestHandle %s, walk is over' % sendRequestHandle)
+
+        self._cbFun(self._snmpEngine, sendRequestHandle, None, 0, 0, (),
+                    self._cbCtx)
+
+    def _stop(self, sendRequestHandle, errorIndication, errorStatus,
+              errorIndex):
+        self._stopped = True
+
+        self._cbFun(self._snmpEngine, sendRequestHandle, errorIndication,
+                    errorStatus, errorIndex, (), self._cbCtx)
+
+
+def walkTables(snmpEngine, targetName, contextEngineId, contextName,
+               columns, cbFun, cbCtx=None,
+               maxRepetitions=DEFAULT_MAX_REPETITIONS,
+               maxColumns=DEFAULT_MAX_COLUMNS):
+    """Walk many MIB table columns at once reporting complete table rows.
+
+    Columns are walked by concurrent chains of GETBULK requests, each
+    carrying up to `maxColumns` columns. Columns leaving their subtree
+    or reaching the end of MIB are dropped from subsequent requests.
+
+    Instances of all `columns` sharing the same index form a table row
+    (that is how columns of tables augmenting each other get merged).
+    Rows are reported in the order of their indices as soon as all
+    columns have gone past them:
+
+        cbFun(snmpEngine, sendRequestHandle, errorIndication,
+              errorStatus, errorIndex, varBindTable, cbCtx)
+
+    Each row holds a (name, value) pair per column, missing column
+    instances are reported as `noSuchInstance` values. Once all columns
+    are walked, `cbFun` is called one last time with empty
+    `varBindTable` (that is the only call for empty tables). On error,
+    including column OIDs not increasing (`errind.oidNotIncreasing`),
+    the walk stops with the last `cbFun` call carrying error indication
+    or `errorIndex` pointing to the failed column. Walk also stops once
+    `cbFun` returns false value, no more calls are made then.
+    """
+    if not columns:
+        raise error.PySnmpError('No table columns to walk')
+
+    _TableWalk(snmpEngine, targetName, contextEngineId, contextName,
+               columns, maxRepetitions, cbFun, cbCtx).start(max(maxColumns, 1))
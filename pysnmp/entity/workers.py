@@ -0,0 +1,228 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysnmp/license.html
+#
+# Multi-process serving on top of SO_REUSEPORT sockets
+#
+import multiprocessing
+import os
+import signal
+
+try:
+    from multiprocessing.connection import wait
+
+except ImportError:  # Python < 3.3
+    import select
+
+    def wait(connections, timeout=None):
+        return select.select(connections, [], [], timeout)[0]
+
+from pysnmp import debug
+from pysnmp import error
+from pysnmp import nextid
+from pysnmp.entity import config
+
+__all__ = ['WorkerPool']
+
+
+class WorkerPool(object):
+    """Serve SNMP engine from many processes sharing UDP ports.
+
+    SNMP engine is configured once (USM users, VACM, communities) in
+    the parent process, then `run()` forks the workers. Each worker
+    binds its own socket to every transport endpoint added with
+    `addTransport()` with SO_REUSEPORT option so that the kernel
+    balances incoming datagrams among the workers.
+
+    SNMP applications (e.g. `NotificationReceiver`, command responders)
+    should be registered at the engine by `initFun` which is invoked
+    in each worker process.
+
+    Worker processes periodically report their SNMP engine counters
+    to the parent where they are aggregated (see `getCounters()`).
+    """
+    COUNTERS = (
+        ('__SNMPv2-MIB', ('snmpInPkts', 'snmpInBadVersions',
+                          'snmpInBadCommunityNames', 'snmpInASNParseErrs',
+                          'snmpInGenErrs', 'snmpSilentDrops')),
+        ('__SNMP-MPD-MIB', ('snmpUnknownSecurityModels', 'snmpInvalidMsgs',
+                            'snmpUnknownPDUHandlers')),
+        ('__SNMP-TARGET-MIB', ('snmpUnknownContexts',)),
+        ('__SNMP-USER-BASED-SM-MIB', ('usmStatsUnsupportedSecLevels',
+                                      'usmStatsNotInTimeWindows',
+                                      'usmStatsUnknownUserNames',
+                                      'usmStatsUnknownEngineIDs',
+                                      'usmStatsWrongDigests',
+                                      'usmStatsDecryptionErrors'))
+    )
+
+    def __init__(self, snmpEngine, workers=None, statsInterval=1.0):
+        self._snmpEngine = snmpEngine
+        self._workers = workers or multiprocessing.cpu_count()
+        self._statsInterval = statsInterval
+        self._transports = []
+        self._counters = {}
+
+    def addTransport(self, transportDomain, transportClass, iface):
+        """Have each worker serve `iface` with `transportClass` instance"""
+        self._transports.append((transportDomain, transportClass, iface))
+
+    def getCounters(self):
+        """Return SNMP engine counters summed over all workers"""
+        counters = {}
+
+        for workerCounters in self._counters.values():
+            for name, value in workerCounters.items():
+                counters[name] = counters.get(name, 0) + value
+
+        return counters
+
+    def _readCounters(self, snmpEngine):
+        mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+        counters = {}
+
+        for modName, names in self.COUNTERS:
+            for name, mibNode in zip(
+                    names, mibBuilder.importSymbols(modName, *names)):
+                counters[name] = int(mibNode.syntax)
+
+        return counters
+
+    def _runWorker(self, workerId, conn, initFun, cbCtx):
+        snmpEngine = self._snmpEngine
+
+        def __stop(signum, frame):
+            # nothing should interrupt shutdown once it begins
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            raise KeyboardInterrupt()
+
+        signal.signal(signal.SIGINT, __stop)
+
+        # do not share request and message IDs sequences with other workers
+        nextid.reseed()
+
+        for transportDomain, transportClass, iface in self._transports:
+            config.addTransport(
+                snmpEngine, transportDomain,
+                transportClass().enableReusePort().openServerMode(iface))
+
+        if initFun:
+            initFun(snmpEngine, workerId, cbCtx)
+
+        def __reportCounters(timeNow):
+            conn.send(self._readCounters(snmpEngine))
+
+        transportDispatcher = snmpEngine.transportDispatcher
+
+        transportDispatcher.registerTimerCbFun(
+            __reportCounters, self._statsInterval)
+
+        transportDispatcher.jobStarted(id(self))
+
+        try:
+            transportDispatcher.runDispatcher()
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            conn.send(self._readCounters(snmpEngine))
+            transportDispatcher.closeDispatcher()
+
+    def run(self, initFun=None, cbFun=None, cbCtx=None):
+        """Fork worker processes and wait for them to finish.
+
+        Worker calls `initFun(snmpEngine, workerId, cbCtx)` prior to
+        serving requests. Parent calls `cbFun(counters, cbCtx)` on
+        counters update. Returns aggregated counters.
+        """
+        if self._snmpEngine.transportDispatcher is not None:
+            raise error.PySnmpError(
+                'SNMP engine transports must be added through worker pool')
+
+        if not self._transports:
+            raise error.PySnmpError('No transports configured')
+
+        if hasattr(multiprocessing, 'get_context'):
+            context = multiprocessing.get_context('fork')
+
+        else:
+            context = multiprocessing
+
+        workers = {}
+
+        for workerId in range(self._workers):
+            parentConn, childConn = context.Pipe(duplex=False)
+
+            process = context.Process(
+                target=self._runWorker,
+                args=(workerId, childConn, initFun, cbCtx))
+
+            process.start()
+
+            childConn.close()
+
+            workers[workerId] = process, parentConn
+
+            debug.logger & debug.FLAG_APP and debug.logger(
+                'run: started worker %s, pid %s' % (workerId, process.pid))
+
+        sigintHandler = signal.getsignal(signal.SIGINT)
+
+        try:
+            self._collectCounters(workers, cbFun, cbCtx)
+
+        except KeyboardInterrupt:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+            # let workers shut down and report their final counters
+            for process, conn in workers.values():
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGINT)
+
+            self._collectCounters(workers, cbFun, cbCtx)
+
+        finally:
+            for process, conn in workers.values():
+                process.terminate()
+                process.join()
+
+            signal.signal(signal.SIGINT, sigintHandler)
+
+        return self.getCounters()
+
+    def _collectCounters(self, workers, cbFun, cbCtx):
+        while workers:
+            updated = False
+
+            connToWorker = dict(
+                [(conn, workerId)
+                 for workerId, (process, conn) in workers.items()])
+
+            for conn in wait(list(connToWorker)):
+                workerId = connToWorker[conn]
+                process = workers[workerId][0]
+
+                try:
+                    while conn.poll():
+                        counters = conn.recv()
+
+                        if self._counters.get(workerId) != counters:
+                            self._counters[workerId] = counters
+                            updated = True
+
+                except EOFError:
+                    process.join()
+
+                    del workers[workerId]
+
+                    debug.logger & debug.FLAG_APP and debug.logger(
+                        '_collectCounters: worker %s exited with code '
+                        '%s' % (workerId, process.exitcode))
+
+            if updated and cbFun:
+                cbFun(self.getCounters(), cbCtx)
@@ -31,22 +31,29 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 #
+import collections
+
 try:
     import asyncio
 
 except ImportError:
     import trollius as asyncio
 
+from pysnmp import error
 from pysnmp.hlapi.v3arch.auth import *
 from pysnmp.hlapi.v3arch.context import *
 from pysnmp.hlapi.v3arch.lcd import *
 from pysnmp.hlapi.varbinds import *
 from pysnmp.hlapi.v3arch.asyncio.transport import *
 from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.entity.rfc3413 import poller
+from pysnmp.proto import errind
 from pysnmp.proto.api import v2c
+from pysnmp.proto.rfc1905 import endOfMibView
 from pysnmp.smi.rfc1902 import *
 
-__all__ = ['getCmd', 'nextCmd', 'setCmd', 'bulkCmd', 'isEndOfMib']
+__all__ = ['getCmd', 'nextCmd', 'setCmd', 'bulkCmd', 'walkCmd',
+           'bulkWalkCmd', 'pollCmd', 'isEndOfMib']
 
 VB_PROCESSOR = CommandGeneratorVarBinds()
 LCD = CommandGeneratorLcdConfigurator()
@@ -535,3 +542,589 @@ def bulkCmd(snmpEngine, authData, transportTarget, contextData,
     )
 
     return future
+
+
+class _WalkIterator(object):
+    """Asynchronous iterator over MIB variables being walked.
+
+    At most one SNMP request is outstanding at any moment. Next request
+    is sent as soon as less than `prefetchRows` rows are buffered, so
+    the consumer is processing one response while the next one is being
+    fetched. Once consumer falls behind, no more requests are sent.
+    """
+
+    def __init__(self, snmpEngine, sendRequest, varBinds, nonRepeaters,
+                 prefetchRows, **options):
+        self._snmpEngine = snmpEngine
+        self._sendRequest = sendRequest
+        self._nonRepeaters = nonRepeaters
+        self._prefetchRows = prefetchRows
+
+        self._lookupMib = options.get('lookupMib', True)
+        self._lexicographicMode = options.get('lexicographicMode', True)
+        self._ignoreNonIncreasingOid = options.get(
+            'ignoreNonIncreasingOid', False)
+        self._maxRows = options.get('maxRows', 0)
+        self._maxCalls = options.get('maxCalls', 0)
+
+        self._initialVarBinds = varBinds
+        self._varBinds = varBinds
+        self._endOfMib = [False] * len(varBinds)
+
+        # (errorIndication, errorStatus, errorIndex, varBinds) to yield
+        self._rows = collections.deque()
+
+        self._waiter = None
+        self._exception = None
+
+        self._totalRows = self._totalCalls = 0
+
+        # nothing to walk beyond non-repeaters
+        if nonRepeaters >= len(varBinds):
+            self._maxCalls = 1
+
+        self._inFlight = False
+        self._done = False
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        if self._waiter is not None and not self._waiter.done():
+            raise error.PySnmpError('Walk is being iterated already')
+
+        self._waiter = asyncio.Future()
+
+        self._wakeup()
+        self._prefetch()
+
+        return self._waiter
+
+    def aclose(self):
+        """Stop walking, responses to outstanding request get dropped."""
+        self._closed = self._done = True
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.cancel()
+
+        self._rows.clear()
+
+        future = asyncio.Future()
+        future.set_result(None)
+
+        return future
+
+    def _prefetch(self):
+        if (self._closed or self._done or self._inFlight or
+                len(self._rows) >= self._prefetchRows):
+            return
+
+        maxRows = self._maxRows and self._maxRows - self._totalRows or 0
+
+        varBinds = list(self._initialVarBinds[:self._nonRepeaters])
+
+        varBinds.extend(
+            [(x[0], v2c.null) for x in self._varBinds[self._nonRepeaters:]])
+
+        self._inFlight = True
+
+        try:
+            self._sendRequest(varBinds, maxRows, self._processResponse)
+
+        except Exception as exc:
+            self._inFlight = False
+            self._exception = exc
+            self._done = True
+
+            self._wakeup()
+
+    def _processResponse(self, snmpEngine, sendRequestHandle,
+                         errorIndication, errorStatus, errorIndex,
+                         varBindTable, cbCtx):
+        self._inFlight = False
+
+        if self._closed:
+            return
+
+        if self._waiter is not None and self._waiter.cancelled():
+            # consumer has been cancelled while awaiting
+            self._closed = self._done = True
+            self._rows.clear()
+            return
+
+        if errorIndication:
+            self._finish(errorIndication, 0, 0,
+                         varBindTable and varBindTable[0] or [])
+
+        elif errorStatus:
+            # SNMPv1 agent reports end of MIB by noSuchName
+            if errorStatus == 2:
+                self._finish()
+
+            else:
+                self._finish(None, errorStatus, errorIndex,
+                             varBindTable and varBindTable[0] or [])
+
+        else:
+            self._totalCalls += 1
+
+            self._collectRows(varBindTable)
+
+            if self._maxCalls and self._totalCalls >= self._maxCalls:
+                self._done = True
+
+        self._wakeup()
+        self._prefetch()
+
+    def _collectRows(self, varBindTable):
+        if not varBindTable:
+            self._finish(errind.emptyResponse)
+            return
+
+        for varBindRow in varBindTable:
+            # incomplete trailing row
+            if len(varBindRow) != len(self._varBinds):
+                break
+
+            stopFlag = True
+
+            nextVarBinds = []
+
+            for col, (name, value) in enumerate(varBindRow):
+                if col < self._nonRepeaters:
+                    nextVarBinds.append((name, value))
+                    continue
+
+                prevName = self._varBinds[col][0]
+
+                if self._endOfMib[col]:
+                    nextVarBinds.append((prevName, endOfMibView))
+                    continue
+
+                if (isinstance(value, v2c.Null) or
+                        not self._lexicographicMode and
+                        not self._initialVarBinds[col][0].isPrefixOf(name)):
+                    self._endOfMib[col] = True
+                    nextVarBinds.append((prevName, endOfMibView))
+                    continue
+
+                if name <= prevName and not self._ignoreNonIncreasingOid:
+                    self._finish(errind.oidNotIncreasing, 0, 0, varBindRow)
+                    return
+
+                stopFlag = False
+
+                nextVarBinds.append((name, value))
+
+            if stopFlag and self._nonRepeaters < len(varBindRow):
+                self._done = True
+                return
+
+            self._varBinds = nextVarBinds
+
+            self._rows.append((None, 0, 0, nextVarBinds))
+
+            self._totalRows += 1
+
+            if self._maxRows and self._totalRows >= self._maxRows:
+                self._done = True
+                return
+
+    def _finish(self, *row):
+        if row:
+            self._rows.append(row)
+
+        self._done = True
+
+    def _wakeup(self):
+        waiter = self._waiter
+
+        if waiter is None or waiter.done():
+            return
+
+        if self._rows:
+            errorIndication, errorStatus, errorIndex, varBinds = self._rows.popleft()
+
+            try:
+                varBinds = VB_PROCESSOR.unmakeVarBinds(
+                    self._snmpEngine.cache, varBinds, self._lookupMib)
+
+            except Exception as exc:
+                waiter.set_exception(exc)
+
+            else:
+                waiter.set_result(
+                    (errorIndication, errorStatus, errorIndex, varBinds))
+
+        elif self._exception is not None:
+            waiter.set_exception(self._exception)
+            self._exception = None
+
+        elif self._done:
+            waiter.set_exception(StopAsyncIteration())
+
+
+def walkCmd(snmpEngine, authData, transportTarget, contextData,
+            *varBinds, **options):
+    """Creates an asynchronous iterator walking MIB by SNMP GETNEXT queries.
+
+    While the iterator is being advanced by `async for` loop (Python
+    3.5+), a series of SNMP GETNEXT requests is send (:RFC:`1905#section-4.2.2`)
+    each carrying the MIB variables last seen in response. Next request
+    is sent while the consumer is processing current response. Requests
+    are suspended while consumer is lagging behind so memory consumption
+    does not depend on the size of MIB being walked.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials.
+
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget`
+        Class instance representing transport type along with SNMP peer address.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName values.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing MIB variables to place
+        into SNMP request.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `lookupMib` - load MIB and resolve response MIB variables at
+              the cost of slightly reduced performance. Default is `True`.
+            * `lexicographicMode` - walk SNMP agent's MIB till the end (if `True`),
+              otherwise (if `False`) stop iteration when all response MIB
+              variables leave the scope of initial MIB variables in
+              `varBinds`. Default is `True`.
+            * `ignoreNonIncreasingOid` - continue iteration even if response
+              MIB variables (OIDs) are not greater then request MIB variables.
+              Be aware that setting it to `True` may cause infinite loop between
+              SNMP management and agent applications. Default is `False`.
+            * `maxRows` - stop iteration once this generator instance processed
+              `maxRows` of SNMP conceptual table. Default is `0` (no limit).
+            * `maxCalls` - stop iteration once this generator instance processed
+              `maxCalls` responses. Default is 0 (no limit).
+
+    Yields
+    ------
+    errorIndication : str
+        True value indicates SNMP engine error.
+    errorStatus : str
+        True value indicates SNMP PDU error.
+    errorIndex : int
+        Non-zero value refers to `varBinds[errorIndex-1]`
+    varBinds : tuple
+        A sequence of :py:class:`~pysnmp.smi.rfc1902.ObjectType` class
+        instances representing MIB variables returned in SNMP response.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Notes
+    -----
+    The iteration stops on any of the following conditions:
+
+    * SNMP engine error occurs thus `errorIndication` is `True`
+    * SNMP PDU `errorStatus` is reported as `True`
+    * SNMP :py:class:`~pysnmp.proto.rfc1905.EndOfMibView` values
+      (also known as *SNMP exception values*) are reported for all
+      MIB variables in `varBinds`
+    * *lexicographicMode* option is `True` and SNMP agent reports
+      end-of-mib or *lexicographicMode* is `False` and all
+      response MIB variables leave the scope of `varBinds`
+
+    Leaving the loop early stops the walk. Awaiting `aclose()` method of
+    the iterator or cancelling the consuming task does the same,
+    response to a request in progress is then ignored.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from pysnmp.hlapi.asyncio import *
+    >>>
+    >>> async def run():
+    ...     async for errorIndication, errorStatus, errorIndex, varBinds in walkCmd(
+    ...             SnmpEngine(),
+    ...             CommunityData('public'),
+    ...             UdpTransportTarget(('demo.snmplabs.com', 161)),
+    ...             ContextData(),
+    ...             ObjectType(ObjectIdentity('SNMPv2-MIB', 'system')),
+    ...             lexicographicMode=False):
+    ...         print(errorIndication, errorStatus, errorIndex, varBinds)
+    >>>
+    >>> asyncio.get_event_loop().run_until_complete(run())
+    None 0 0 [ObjectType(ObjectIdentity(ObjectName('1.3.6.1.2.1.1.1.0')), DisplayString('SunOS zeus.snmplabs.com 4.1.3_U1 1 sun4m'))]
+    None 0 0 [ObjectType(ObjectIdentity(ObjectName('1.3.6.1.2.1.1.2.0')), ObjectIdentifier('1.3.6.1.4.1.424242.1.1'))]
+    ...
+    >>>
+
+    """
+
+    def __sendRequest(varBinds, maxRows, cbFun):
+        cmdgen.NextCommandGenerator().sendVarBinds(
+            snmpEngine, addrName, contextData.contextEngineId,
+            contextData.contextName, varBinds, cbFun)
+
+    addrName, paramsName = LCD.configure(
+        snmpEngine, authData, transportTarget, contextData.contextName)
+
+    return _WalkIterator(
+        snmpEngine, __sendRequest,
+        VB_PROCESSOR.makeVarBinds(snmpEngine.cache, varBinds), 0, 1,
+        **options)
+
+
+def bulkWalkCmd(snmpEngine, authData, transportTarget, contextData,
+                nonRepeaters, maxRepetitions, *varBinds, **options):
+    """Creates an asynchronous iterator walking MIB by SNMP GETBULK queries.
+
+    While the iterator is being advanced by `async for` loop (Python
+    3.5+), a series of SNMP GETBULK requests is send (:RFC:`1905#section-4.2.3`)
+    each carrying the MIB variables last seen in response. Next request
+    is sent while the consumer is processing current response. Requests
+    are suspended while consumer is lagging behind so no more than
+    about `2 * maxRepetitions` rows are kept in memory however large
+    the MIB being walked is.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials.
+
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget`
+        Class instance representing transport type along with SNMP peer address.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName values.
+
+    nonRepeaters : int
+        One MIB variable is requested in response for the first
+        `nonRepeaters` MIB variables in request.
+
+    maxRepetitions : int
+        `maxRepetitions` MIB variables are requested in response for each
+        of the remaining MIB variables in the request (e.g. excluding
+        `nonRepeaters`). Remote SNMP engine may choose lesser value than
+        requested.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing MIB variables to place
+        into SNMP request.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `lookupMib` - load MIB and resolve response MIB variables at
+              the cost of slightly reduced performance. Default is `True`.
+            * `lexicographicMode` - walk SNMP agent's MIB till the end (if `True`),
+              otherwise (if `False`) stop iteration when all response MIB
+              variables leave the scope of initial MIB variables in
+              `varBinds`. Default is `True`.
+            * `ignoreNonIncreasingOid` - continue iteration even if response
+              MIB variables (OIDs) are not greater then request MIB variables.
+              Be aware that setting it to `True` may cause infinite loop between
+              SNMP management and agent applications. Default is `False`.
+            * `maxRows` - stop iteration once this generator instance processed
+              `maxRows` of SNMP conceptual table. Default is `0` (no limit).
+            * `maxCalls` - stop iteration once this generator instance processed
+              `maxCalls` responses. Default is 0 (no limit).
+
+    Yields
+    ------
+    errorIndication : str
+        True value indicates SNMP engine error.
+    errorStatus : str
+        True value indicates SNMP PDU error.
+    errorIndex : int
+        Non-zero value refers to `varBinds[errorIndex-1]`
+    varBinds : tuple
+        A sequence of :py:class:`~pysnmp.smi.rfc1902.ObjectType` class
+        instances representing MIB variables returned in SNMP response.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Notes
+    -----
+    The iteration stops on the same conditions as :py:func:`walkCmd`'s
+    does. Leaving the loop early, awaiting `aclose()` method of the
+    iterator or cancelling the consuming task stops the walk.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from pysnmp.hlapi.asyncio import *
+    >>>
+    >>> async def run():
+    ...     async for errorIndication, errorStatus, errorIndex, varBinds in bulkWalkCmd(
+    ...             SnmpEngine(),
+    ...             CommunityData('public'),
+    ...             UdpTransportTarget(('demo.snmplabs.com', 161)),
+    ...             ContextData(),
+    ...             0, 25,
+    ...             ObjectType(ObjectIdentity('SNMPv2-MIB', 'system')),
+    ...             lexicographicMode=False):
+    ...         print(errorIndication, errorStatus, errorIndex, varBinds)
+    >>>
+    >>> asyncio.get_event_loop().run_until_complete(run())
+    None 0 0 [ObjectType(ObjectIdentity(ObjectName('1.3.6.1.2.1.1.1.0')), DisplayString('SunOS zeus.snmplabs.com 4.1.3_U1 1 sun4m'))]
+    None 0 0 [ObjectType(ObjectIdentity(ObjectName('1.3.6.1.2.1.1.2.0')), ObjectIdentifier('1.3.6.1.4.1.424242.1.1'))]
+    ...
+    >>>
+
+    """
+
+    def __sendRequest(varBinds, maxRows, cbFun):
+        cmdgen.BulkCommandGenerator().sendVarBinds(
+            snmpEngine, addrName, contextData.contextEngineId,
+            contextData.contextName, nonRepeaters,
+            maxRows and min(maxRows, maxRepetitions) or maxRepetitions,
+            varBinds, cbFun)
+
+    addrName, paramsName = LCD.configure(
+        snmpEngine, authData, transportTarget, contextData.contextName)
+
+    return _WalkIterator(
+        snmpEngine, __sendRequest,
+        VB_PROCESSOR.makeVarBinds(snmpEngine.cache, varBinds),
+        nonRepeaters, max(maxRepetitions, 1), **options)
+
+
+def pollCmd(snmpEngine, authData, transportTarget, contextData,
+            *varBinds, **options):
+    """Polls MIB variables periodically by SNMP GET queries.
+
+    Based on passed parameters, schedules SNMP GET requests
+    (:RFC:`1905#section-4.2.1`) to be sent every `interval` seconds by
+    SNMP engine's :py:class:`~pysnmp.entity.rfc3413.poller.PollScheduler`.
+    Polls of many jobs get spread across the interval, MIB variables
+    of jobs polled at the same time at the same SNMP agent are packed
+    into as few SNMP messages as possible.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials.
+
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncio.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncio.Udp6TransportTarget`
+        Class instance representing transport type along with SNMP peer address.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName values.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing MIB variables to place
+        into SNMP request.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `interval` - polling interval in seconds. Default is 60.
+            * `lookupMib` - load MIB and resolve response MIB variables at
+              the cost of slightly reduced performance. Default is `True`.
+            * `cbFun` (callable) - user-supplied callable that is invoked
+              on every poll completion. Default is `None`.
+            * `cbCtx` (object) - user-supplied object passing additional
+              parameters to/from `cbFun`. Default is `None`.
+
+    Notes
+    -----
+    User-supplied `cbFun` callable must have the following call
+    signature:
+
+    * snmpEngine (:py:class:`~pysnmp.hlapi.SnmpEngine`):
+      Class instance representing SNMP engine.
+    * jobId (int): Unique polling job identifier.
+    * errorIndication (str): True value indicates SNMP engine error.
+    * errorStatus (str): True value indicates SNMP PDU error.
+    * errorIndex (int): Non-zero value refers to `varBinds[errorIndex-1]`
+    * varBinds (tuple): A sequence of
+      :py:class:`~pysnmp.smi.rfc1902.ObjectType` class instances
+      representing MIB variables returned in SNMP response in exactly
+      the same order as `varBinds` in request.
+    * `cbCtx` : Original user-supplied object.
+
+    Returns
+    -------
+    jobId : int
+        Unique polling job identifier. Polling stops once it is passed
+        to `removeJob()` method of SNMP engine's poll scheduler.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from pysnmp.hlapi.asyncio import *
+    >>>
+    >>> def cbFun(snmpEngine, jobId, errorIndication, errorStatus,
+    ...           errorIndex, varBinds, cbCtx):
+    ...     print(errorIndication, errorStatus, errorIndex, varBinds)
+    >>>
+    >>> snmpEngine = SnmpEngine()
+    >>> pollCmd(snmpEngine,
+    ...         CommunityData('public'),
+    ...         UdpTransportTarget(('demo.snmplabs.com', 161)),
+    ...         ContextData(),
+    ...         ObjectType(ObjectIdentity('SNMPv2-MIB', 'sysUpTime', 0)),
+    ...         interval=10, cbFun=cbFun)
+    1
+    >>> asyncio.get_event_loop().run_forever()
+    None 0 0 [ObjectType(ObjectIdentity(ObjectName('1.3.6.1.2.1.1.3.0')), TimeTicks(3524813))]
+    ...
+    >>>
+
+    """
+
+    def __cbFun(snmpEngine, jobId, errorIndication, errorStatus, errorIndex,
+                varBinds, cbCtx):
+        lookupMib, cbFun, cbCtx = cbCtx
+
+        if cbFun:
+            cbFun(snmpEngine, jobId, errorIndication, errorStatus, errorIndex,
+                  VB_PROCESSOR.unmakeVarBinds(
+                      snmpEngine.cache, varBinds, lookupMib), cbCtx)
+
+    addrName, paramsName = LCD.configure(
+        snmpEngine, authData, transportTarget, contextData.contextName)
+
+    scheduler = poller.getPollScheduler(snmpEngine)
+
+    if scheduler is None:
+        scheduler = poller.configurePollScheduler(snmpEngine)
+
+    return scheduler.addJob(
+        addrName, contextData.contextEngineId, contextData.contextName,
+        VB_PROCESSOR.makeVarBinds(snmpEngine.cache, varBinds),
+        options.get('interval', 60), __cbFun,
+        (options.get('lookupMib', True), options.get('cbFun'),
+         options.get('cbCtx')))
@@ -10,16 +10,23 @@ from pysnmp.hlapi.v3arch.context import *
 from pysnmp.hlapi.v3arch.lcd import *
 from pysnmp.hlapi.v3arch.asyncore.transport import *
 from pysnmp.entity.rfc3413 import cmdgen
+from pysnmp.entity.rfc3413 import discovery
+from pysnmp.entity.rfc3413 import tablewalk
 from pysnmp.proto.api import v2c
 from pysnmp.smi.rfc1902 import *
 
-__all__ = ['getCmd', 'nextCmd', 'setCmd', 'bulkCmd', 'isEndOfMib']
+__all__ = ['getCmd', 'PreparedGetCmd', 'nextCmd', 'setCmd', 'bulkCmd', 'tableCmd',
+           'isEndOfMib', 'discoverEngines', 'exportEngineInfo',
+           'importEngineInfo']
 
 VB_PROCESSOR = CommandGeneratorVarBinds()
 LCD = CommandGeneratorLcdConfigurator()
 
 isEndOfMib = lambda varBinds: not v2c.apiPDU.getNextVarBinds(varBinds)[1]
 
+exportEngineInfo = discovery.exportEngineInfo
+importEngineInfo = discovery.importEngineInfo
+
 
 def getCmd(snmpEngine, authData, transportTarget, contextData,
            *varBinds, **options):
@@ -135,6 +142,90 @@ def getCmd(snmpEngine, authData, transportTarget, contextData,
          options.get('cbFun'), options.get('cbCtx')))
 
 
+class PreparedGetCmd(object):
+    """SNMP GET query prepared for repeated sending.
+
+    SNMP engine configuration and MIB variables resolution are done
+    once, when the query is created. Each
+    :py:meth:`~pysnmp.hlapi.v3arch.asyncore.PreparedGetCmd.send` call
+    schedules transmission of SNMP GET packet (:RFC:`1905#section-4.2.1`)
+    built of already resolved MIB variables. MIB variables of SNMP
+    response are resolved through the SNMP engine's MIB resolution cache,
+    those requested are found there with no MIB look up.
+
+    Parameters and `**options` are the same as for
+    :py:func:`~pysnmp.hlapi.v3arch.asyncore.getCmd`.
+
+    Examples
+    --------
+    >>> from pysnmp.hlapi.asyncore import *
+    >>> def cbFun(snmpEngine, sendRequestHandle, errorIndication, errorStatus, errorIndex, varBinds, cbCtx):
+    ...     print(errorIndication, errorStatus, errorIndex, varBinds)
+    >>>
+    >>> snmpEngine = SnmpEngine()
+    >>> getSysDescr = PreparedGetCmd(snmpEngine,
+    ...                              CommunityData('public'),
+    ...                              UdpTransportTarget(('demo.snmplabs.com', 161)),
+    ...                              ContextData(),
+    ...                              ObjectType(ObjectIdentity('SNMPv2-MIB', 'sysDescr', 0)),
+    ...                              cbFun=cbFun)
+    >>> getSysDescr.send()
+    >>> snmpEngine.transportDispatcher.runDispatcher()
+    (None, 0, 0, [ObjectType(ObjectIdentity(ObjectName('1.3.6.1.2.1.1.1.0')), DisplayString('SunOS zeus.snmplabs.com 4.1.3_U1 1 sun4m'))])
+    >>>
+
+    """
+    def __init__(self, snmpEngine, authData, transportTarget, contextData,
+                 *varBinds, **options):
+        self._snmpEngine = snmpEngine
+
+        self._addrName, paramsName = LCD.configure(
+            snmpEngine, authData, transportTarget, contextData.contextName)
+
+        self._contextEngineId = contextData.contextEngineId
+        self._contextName = contextData.contextName
+
+        self._varBinds = VB_PROCESSOR.makeVarBinds(snmpEngine.cache, varBinds)
+
+        self._options = options
+
+        self._cmdGen = cmdgen.GetCommandGenerator()
+
+    def send(self, **options):
+        """Send SNMP GET query.
+
+        Other Parameters
+        ----------------
+        \*\*options :
+            `cbFun` and `cbCtx` overriding those the query was created with.
+
+        Returns
+        -------
+        sendRequestHandle : int
+            Unique request identifier. Can be used for matching received
+            responses with ongoing requests.
+        """
+        return self._cmdGen.sendVarBinds(
+            self._snmpEngine, self._addrName, self._contextEngineId,
+            self._contextName, self._varBinds, self._cbFun,
+            (options.get('cbFun', self._options.get('cbFun')),
+             options.get('cbCtx', self._options.get('cbCtx'))))
+
+    def _cbFun(self, snmpEngine, sendRequestHandle,
+               errorIndication, errorStatus, errorIndex,
+               varBinds, cbCtx):
+
+        cbFun, cbCtx = cbCtx
+
+        if cbFun:
+            varBinds = VB_PROCESSOR.unmakeVarBinds(
+                snmpEngine.cache, varBinds,
+                self._options.get('lookupMib', True))
+
+            return cbFun(snmpEngine, sendRequestHandle, errorIndication,
+                         errorStatus, errorIndex, varBinds, cbCtx)
+
+
 def setCmd(snmpEngine, authData, transportTarget, contextData,
            *varBinds, **options):
     """Performs SNMP SET query.
@@ -509,3 +600,222 @@ def bulkCmd(snmpEngine, authData, transportTarget, contextData,
         contextData.contextName, nonRepeaters, maxRepetitions,
         varBinds, __cbFun, (options.get('lookupMib', True),
                             options.get('cbFun'), options.get('cbCtx')))
+
+
+def tableCmd(snmpEngine, authData, transportTarget, contextData,
+             *varBinds, **options):
+    """Walks many MIB table columns at once.
+
+    Based on passed parameters, schedules concurrent series of SNMP
+    GETBULK requests (:RFC:`1905#section-4.2.3`) walking all the table
+    columns given in `varBinds`. Columns leaving their subtree are not
+    requested anymore. Column instances sharing the same index are
+    assembled into table rows.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    authData : :py:class:`~pysnmp.hlapi.CommunityData` or :py:class:`~pysnmp.hlapi.UsmUserData`
+        Class instance representing SNMP credentials.
+
+    transportTarget : :py:class:`~pysnmp.hlapi.asyncore.UdpTransportTarget` or :py:class:`~pysnmp.hlapi.asyncore.Udp6TransportTarget`
+        Class instance representing transport type along with SNMP peer
+        address.
+
+    contextData : :py:class:`~pysnmp.hlapi.ContextData`
+        Class instance representing SNMP ContextEngineId and ContextName
+        values.
+
+    \*varBinds : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+        One or more class instances representing MIB table columns
+        to walk. Columns of different tables sharing the same index
+        (e.g. `ifTable` and `ifXTable`) can be mixed.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+        Request options:
+
+            * `lookupMib` - load MIB and resolve response MIB variables at
+              the cost of slightly reduced performance. Default is `True`.
+            * `maxRepetitions` (int) - GETBULK max-repetitions value.
+              Default is 25.
+            * `maxColumns` (int) - at most that many columns are walked
+              by a single series of requests, the rest are walked
+              concurrently. Default is 16.
+            * `cbFun` (callable) - user-supplied callable that is invoked
+               to pass SNMP response data or error to user at a later point
+               of time. Default is `None`.
+            * `cbCtx` (object) - user-supplied object passing additional
+               parameters to/from `cbFun`. Default is `None`.
+
+    Notes
+    -----
+    User-supplied `cbFun` callable must have the following call
+    signature:
+
+    * snmpEngine (:py:class:`~pysnmp.hlapi.SnmpEngine`):
+      Class instance representing SNMP engine.
+    * sendRequestHandle (int): Unique request identifier. Can be used
+      for matching multiple ongoing requests with received responses.
+    * errorIndication (str): True value indicates SNMP engine error.
+    * errorStatus (str): True value indicates SNMP PDU error.
+    * errorIndex (int): Non-zero value refers to `varBinds[errorIndex-1]`
+    * varBindTable (tuple): A sequence of table rows in the order of
+      their indices. Each row is a sequence of
+      :py:class:`~pysnmp.smi.rfc1902.ObjectType` class instances, one
+      per table column in the order of `varBinds`. Missing column
+      instances are reported as
+      :py:class:`~pysnmp.proto.rfc1905.NoSuchInstance` values.
+    * `cbCtx` : Original user-supplied object.
+
+    User `cbFun` is called as table rows get complete. Once all the
+    columns are walked, `cbFun` is called with empty `varBindTable`.
+    Walk stops on error, reported by the last `cbFun` call, or once
+    `cbFun` returns false value.
+
+    Raises
+    ------
+    PySnmpError
+        Or its derivative indicating that an error occurred while
+        performing SNMP operation.
+
+    Examples
+    --------
+    >>> from pysnmp.hlapi.asyncore import *
+    >>> def cbFun(snmpEngine, sendRequestHandle, errorIndication, errorStatus, errorIndex, varBindTable, cbCtx):
+    ...     for varBindRow in varBindTable:
+    ...         print([x.prettyPrint() for x in varBindRow])
+    ...     return True
+    >>>
+    >>> snmpEngine = SnmpEngine()
+    >>> tableCmd(snmpEngine,
+    ...          CommunityData('public'),
+    ...          UdpTransportTarget(('demo.snmplabs.com', 161)),
+    ...          ContextData(),
+    ...          ObjectType(ObjectIdentity('IF-MIB', 'ifDescr')),
+    ...          ObjectType(ObjectIdentity('IF-MIB', 'ifName')),
+    ...          cbFun=cbFun)
+    >>> snmpEngine.transportDispatcher.runDispatcher()
+    ['IF-MIB::ifDescr.1 = lo', 'IF-MIB::ifName.1 = lo']
+    ['IF-MIB::ifDescr.2 = eth0', 'IF-MIB::ifName.2 = eth0']
+    >>>
+
+    """
+
+    def __cbFun(snmpEngine, sendRequestHandle, errorIndication,
+                errorStatus, errorIndex, varBindTable, cbCtx):
+
+        lookupMib, cbFun, cbCtx = cbCtx
+
+        varBindTable = [VB_PROCESSOR.unmakeVarBinds(snmpEngine.cache,
+                                                    varBindTableRow, lookupMib)
+                        for varBindTableRow in varBindTable]
+
+        return cbFun(snmpEngine, sendRequestHandle, errorIndication,
+                     errorStatus, errorIndex, varBindTable, cbCtx)
+
+    addrName, paramsName = LCD.configure(
+        snmpEngine, authData, transportTarget, contextData.contextName)
+
+    varBinds = VB_PROCESSOR.makeVarBinds(snmpEngine.cache, varBinds)
+
+    tablewalk.walkTables(
+        snmpEngine, addrName, contextData.contextEngineId,
+        contextData.contextName, [x[0] for x in varBinds], __cbFun,
+        (options.get('lookupMib', True), options.get('cbFun'),
+         options.get('cbCtx')),
+        options.get('maxRepetitions', tablewalk.DEFAULT_MAX_REPETITIONS),
+        options.get('maxColumns', tablewalk.DEFAULT_MAX_COLUMNS))
+
+
+def discoverEngines(snmpEngine, targets, **options):
+    """Discovers SNMP engines of many SNMP agents at once.
+
+    Based on passed parameters, schedules SNMP engine ID and time
+    discovery (:RFC:`3414#section-4`) towards each of the SNMP agents
+    while keeping a limited number of discovery requests in flight.
+    Discovered SNMP engines are kept in `snmpEngine` caches so that
+    the following SNMP queries to the same agents do not have to
+    repeat the discovery round trip.
+
+    Parameters
+    ----------
+    snmpEngine : :py:class:`~pysnmp.hlapi.SnmpEngine`
+        Class instance representing SNMP engine.
+
+    targets : iterable
+        Sequence of (`authData`, `transportTarget`) tuples, where
+        `authData` is :py:class:`~pysnmp.hlapi.UsmUserData` and
+        `transportTarget` is :py:class:`~pysnmp.hlapi.asyncore.UdpTransportTarget`
+        or :py:class:`~pysnmp.hlapi.asyncore.Udp6TransportTarget`.
+
+    Other Parameters
+    ----------------
+    \*\*options :
+
+        * `concurrency` (int) - maximum number of discovery requests
+           in flight. Default is 64.
+        * `cbFun` (callable) - user-supplied callable that is invoked
+           once per SNMP agent to report discovery result. Default
+           is `None`
+        * `cbCtx` (object) - user-supplied object passing additional
+           parameters to/from `cbFun`. Default is `None`.
+
+    Notes
+    -----
+    User-supplied `cbFun` callable must have the following call
+    signature:
+
+    * snmpEngine (:py:class:`~pysnmp.hlapi.SnmpEngine`):
+      Class instance representing SNMP engine.
+    * transportTarget: Original transport target instance.
+    * errorIndication (str): True value indicates SNMP engine error.
+    * securityEngineId (:py:class:`~pysnmp.proto.rfc1902.OctetString`):
+      Discovered SNMP engine ID or `None` on error.
+    * `cbCtx` : Original user-supplied object.
+
+    Discovered SNMP engines can be saved and restored with
+    `exportEngineInfo(snmpEngine, filename)` and
+    `importEngineInfo(snmpEngine, filename)` functions.
+
+    Examples
+    --------
+    >>> from pysnmp.hlapi.asyncore import *
+    >>> def cbFun(snmpEngine, transportTarget, errorIndication, securityEngineId, cbCtx):
+    ...     print(errorIndication, securityEngineId.prettyPrint())
+    >>>
+    >>> snmpEngine = SnmpEngine()
+    >>> discoverEngines(snmpEngine,
+    ...                 [(UsmUserData('usr-md5-none', 'authkey1'),
+    ...                   UdpTransportTarget(('demo.snmplabs.com', 161)))],
+    ...                 cbFun=cbFun)
+    >>> snmpEngine.transportDispatcher.runDispatcher()
+    None 0x80004fb805636c6f75644dab22cc
+    >>>
+
+    """
+
+    def __cbFun(snmpEngine, addrName, errorIndication,
+                securityEngineId, cbCtx):
+
+        cbFun, cbCtx = cbCtx
+
+        if cbFun:
+            return cbFun(snmpEngine, transportTargets[addrName],
+                         errorIndication, securityEngineId, cbCtx)
+
+    transportTargets = {}
+
+    for authData, transportTarget in targets:
+        addrName, paramsName = LCD.configure(
+            snmpEngine, authData, transportTarget, '')
+
+        transportTargets[addrName] = transportTarget
+
+    discovery.discoverEngines(
+        snmpEngine, list(transportTargets), __cbFun,
+        (options.get('cbFun'), options.get('cbCtx')),
+        options.get('concurrency', discovery.DEFAULT_CONCURRENCY))
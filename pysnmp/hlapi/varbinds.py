@@ -4,6 +4,7 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+from pysnmp import cache
 from pysnmp.smi import builder
 from pysnmp.smi import view
 from pysnmp.smi.rfc1902 import *
@@ -11,6 +12,127 @@ from pysnmp.smi.rfc1902 import *
 __all__ = ['CommandGeneratorVarBinds', 'NotificationOriginatorVarBinds']
 
 
+class ResolverCache(object):
+    """Bounded cache of MIB variables resolved against MIB view.
+
+    Forward entries hold resolved `ObjectType` objects of read requests,
+    equal `ObjectType` objects get their resolved state copied over with
+    no MIB look up. Reverse entries map OIDs of MIB variable instances
+    to resolved `ObjectIdentity` objects, OIDs falling under already seen
+    MIB scalar or table column objects are resolved with no MIB tree
+    search.
+
+    All entries are dropped once more MIB modules get loaded into
+    MIB view.
+    """
+    def __init__(self, maxSize=4096):
+        self._symbols = cache.Cache(maxSize)
+        self._instances = cache.Cache(maxSize)
+        self._prefixes = cache.Cache(maxSize)
+
+        # lengths of OID prefixes ever cached, longest first
+        self._prefixLengths = []
+
+        self._lastBuildId = None
+
+    def resolveObjectType(self, objectType, mibViewController,
+                          ignoreErrors=True):
+        key = objectType.getResolutionKey()
+
+        if key is None:
+            return objectType.resolveWithMib(
+                mibViewController, ignoreErrors=ignoreErrors)
+
+        self._sync(mibViewController)
+
+        resolvedObjectType = self._symbols.get(key)
+
+        if resolvedObjectType is not None:
+            return objectType.resolveLike(resolvedObjectType)
+
+        objectType.resolveWithMib(
+            mibViewController, ignoreErrors=ignoreErrors)
+
+        self._sync(mibViewController)
+
+        self._symbols[key] = objectType
+
+        self._cacheObjectIdentity(objectType[0], mibViewController)
+
+        return objectType
+
+    def resolveOid(self, oid, mibViewController):
+        self._sync(mibViewController)
+
+        objectIdentity = self._instances.get(oid)
+
+        if objectIdentity is not None:
+            return objectIdentity
+
+        subOids = tuple(oid)
+
+        for length in self._prefixLengths:
+            if length < len(subOids):
+                prefixIdentity = self._prefixes.get(subOids[:length])
+
+                if prefixIdentity is not None:
+                    objectIdentity = prefixIdentity.resolveInstance(
+                        oid, mibViewController)
+
+                    self._instances[subOids] = objectIdentity
+
+                    return objectIdentity
+
+        objectIdentity = ObjectIdentity(oid).resolveWithMib(mibViewController)
+
+        self._sync(mibViewController)
+
+        self._cacheObjectIdentity(objectIdentity, mibViewController)
+
+        return objectIdentity
+
+    def getStats(self):
+        """Return forward and reverse caches performance counters"""
+        return {
+            'symbols': self._symbols.getStats(),
+            'instances': self._instances.getStats(),
+            'prefixes': self._prefixes.getStats()
+        }
+
+    def _sync(self, mibViewController):
+        lastBuildId = mibViewController.mibBuilder.lastViewBuildId
+
+        if self._lastBuildId != lastBuildId:
+            self._symbols.clear()
+            self._instances.clear()
+            self._prefixes.clear()
+
+            self._prefixLengths = []
+
+            self._lastBuildId = lastBuildId
+
+    def _cacheObjectIdentity(self, objectIdentity, mibViewController):
+        MibScalar, MibTableColumn = mibViewController.mibBuilder.importSymbols(
+            'SNMPv2-SMI', 'MibScalar', 'MibTableColumn')
+
+        mibNode = objectIdentity.getMibNode()
+
+        # only leaf MIB objects own every OID under them
+        if not isinstance(mibNode, (MibScalar, MibTableColumn)):
+            return
+
+        self._instances[tuple(objectIdentity.getOid())] = objectIdentity
+
+        prefix = tuple(mibNode.name)
+
+        if prefix not in self._prefixes:
+            self._prefixes[prefix] = objectIdentity
+
+        if len(prefix) not in self._prefixLengths:
+            self._prefixLengths.append(len(prefix))
+            self._prefixLengths.sort(reverse=True)
+
+
 class MibViewControllerManager(object):
     @staticmethod
     def getMibViewController(userCache):
@@ -23,11 +145,24 @@ class MibViewControllerManager(object):
 
         return mibViewController
 
+    @staticmethod
+    def getResolverCache(userCache):
+        try:
+            resolverCache = userCache['resolverCache']
+
+        except KeyError:
+            resolverCache = ResolverCache()
+            userCache['resolverCache'] = resolverCache
+
+        return resolverCache
+
 
 class CommandGeneratorVarBinds(MibViewControllerManager):
     def makeVarBinds(self, userCache, varBinds):
         mibViewController = self.getMibViewController(userCache)
 
+        resolverCache = self.getResolverCache(userCache)
+
         resolvedVarBinds = []
 
         for varBind in varBinds:
@@ -46,15 +181,17 @@ class CommandGeneratorVarBinds(MibViewControllerManager):
                 varBind = ObjectType(ObjectIdentity(varBind[0]), varBind[1])
 
             resolvedVarBinds.append(
-                varBind.resolveWithMib(mibViewController, ignoreErrors=False))
+                resolverCache.resolveObjectType(
+                    varBind, mibViewController, ignoreErrors=False))
 
         return resolvedVarBinds
 
     def unmakeVarBinds(self, userCache, varBinds, lookupMib=True):
         if lookupMib:
             mibViewController = self.getMibViewController(userCache)
+            resolverCache = self.getResolverCache(userCache)
             varBinds = [
-                ObjectType(ObjectIdentity(x[0]),
+                ObjectType(resolverCache.resolveOid(x[0], mibViewController),
                            x[1]).resolveWithMib(mibViewController)
                 for x in varBinds]
 
@@ -94,8 +231,9 @@ class NotificationOriginatorVarBinds(MibViewControllerManager):
     def unmakeVarBinds(self, userCache, varBinds, lookupMib=False):
         if lookupMib:
             mibViewController = self.getMibViewController(userCache)
+            resolverCache = self.getResolverCache(userCache)
             varBinds = [
-                ObjectType(ObjectIdentity(x[0]),
+                ObjectType(resolverCache.resolveOid(x[0], mibViewController),
                            x[1]).resolveWithMib(mibViewController)
                 for x in varBinds]
 
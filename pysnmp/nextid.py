@@ -5,9 +5,25 @@
 # License: http://snmplabs.com/pysnmp/license.html
 #
 import random
+import weakref
 
 random.seed()
 
+# all sequences, to be re-randomized by reseed()
+_integers = weakref.WeakValueDictionary()
+
+
+def reseed():
+    """Start all sequences over from new random values.
+
+    Processes forked off the same parent inherit the same sequences,
+    each of them should call this to avoid producing the same IDs.
+    """
+    random.seed()
+
+    for integer in list(_integers.values()):
+        integer.reseed()
+
 
 class Integer(object):
     """Return a next value in a reasonably MT-safe manner"""
@@ -20,14 +36,20 @@ class Integer(object):
         self._increment = increment
         self._threshold = increment // 2
 
-        e = random.randrange(self._maximum - self._increment)
+        self.reseed()
 
-        self._bank = list(range(e, e + self._increment))
+        _integers[id(self)] = self
 
     def __repr__(self):
         return '%s(%d, %d)' % (
             self.__class__.__name__, self._maximum, self._increment)
 
+    def reseed(self):
+        """Start the sequence over from a new random value"""
+        e = random.randrange(self._maximum - self._increment)
+
+        self._bank = list(range(e, e + self._increment))
+
     def __call__(self):
         v = self._bank.pop(0)
 
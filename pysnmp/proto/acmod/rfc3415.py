@@ -4,12 +4,90 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+from pysnmp import cache
 from pysnmp import debug
 from pysnmp.proto import errind
 from pysnmp.proto import error
 from pysnmp.smi.error import NoSuchInstanceError
 
 
+class _ViewTree(object):
+    """View tree families of a MIB view compiled into a trie.
+
+    Each family is a path of sub-OIDs from the root of the trie, the
+    sub-OIDs masked out by family mask follow wildcard edges. The node
+    where family path ends holds family rating and type.
+    """
+    def __init__(self):
+        # [sub-OID -> node, wildcard node, (rating, included)]
+        self._root = [{}, None, None]
+
+        # the longest family subtree
+        self.depth = 0
+
+        # families added so far
+        self._count = 0
+
+    def addFamily(self, subtree, ignoredSubOids, included):
+        node = self._root
+
+        for idx, subOid in enumerate(subtree):
+            if idx in ignoredSubOids:
+                if node[1] is None:
+                    node[1] = [{}, None, None]
+
+                node = node[1]
+
+            else:
+                try:
+                    node = node[0][subOid]
+
+                except KeyError:
+                    node[0][subOid] = [{}, None, None]
+                    node = node[0][subOid]
+
+        self._count += 1
+
+        # 3.2.5b: the longest, then lexicographically greater subtree
+        # wins, the latest family is the last resort
+        rating = len(subtree), tuple(subtree), self._count
+
+        node[2] = rating, included
+
+        self.depth = max(self.depth, len(subtree))
+
+    def isIncluded(self, subOids):
+        """Return `True` if OID is included into MIB view"""
+        best = None
+
+        nodes = [self._root]
+
+        for subOid in subOids[:self.depth]:
+            nextNodes = []
+
+            for node in nodes:
+                try:
+                    nextNodes.append(node[0][subOid])
+
+                except KeyError:
+                    pass
+
+                if node[1] is not None:
+                    nextNodes.append(node[1])
+
+            if not nextNodes:
+                break
+
+            for node in nextNodes:
+                if node[2] is not None and (best is None or
+                                            node[2][0] > best[0]):
+                    best = node[2]
+
+            nodes = nextNodes
+
+        return best is not None and best[1]
+
+
 # 3.2
 class Vacm(object):
     """View-based Access Control Model"""
@@ -17,6 +95,9 @@ class Vacm(object):
 
     _powOfTwoSeq = (128, 64, 32, 16, 8, 4, 2, 1)
 
+    # (viewName, OID prefix) -> access decision
+    DECISION_CACHE_SIZE = 4096
+
     def __init__(self):
         self._contextBranchId = -1
         self._groupNameBranchId = -1
@@ -28,6 +109,20 @@ class Vacm(object):
         self._accessMap = {}
         self._viewTreeMap = {}
 
+        # instId -> table row the maps are built from
+        self._contextRows = {}
+        self._accessRows = {}
+        self._viewTreeRows = {}
+
+        # viewName -> {instId: family}
+        self._viewTreeFamilies = {}
+
+        # principal -> viewName
+        self._principalBranchIds = None
+        self._principalMap = {}
+
+        self._decisionCache = cache.Cache(self.DECISION_CACHE_SIZE)
+
     def _addAccessEntry(self, groupName, contextPrefix, securityModel,
                         securityLevel, prefixMatch, readView, writeView,
                         notifyView):
@@ -72,191 +167,178 @@ class Vacm(object):
 
             levels[securityLevel] = viewName
 
-    def _getFamilyViewName(self, groupName, contextName, securityModel, securityLevel, viewType):
-        groups = self._accessMap
-
-        try:
-            views = groups[groupName]
+    def _delAccessEntry(self, groupName, contextPrefix, securityModel,
+                        securityLevel, prefixMatch, readView, writeView,
+                        notifyView):
+        if not groupName:
+            return
 
-        except KeyError:
-            raise error.StatusInformation(errorIndication=errind.noGroupName)
+        views = self._accessMap[groupName]
 
-        try:
+        for viewType in ('read', 'write', 'notify'):
             matches = views[viewType]
+            contexts = matches[prefixMatch]
+            models = contexts[contextPrefix]
+            levels = models[securityModel]
 
-        except KeyError:
-            raise error.StatusInformation(errorIndication=errind.noAccessEntry)
-
-        try:
-            # vacmAccessTable #2: exact match shortcut
-            return matches[1][contextName][securityModel][securityLevel]
+            del levels[securityLevel]
 
-        except KeyError:
-            pass
+            if not levels:
+                del models[securityModel]
 
-        # vacmAccessTable #2: fuzzy look-up
+            if not models:
+                del contexts[contextPrefix]
 
-        candidates = []
-
-        for match, names in matches.items():
+            if not contexts:
+                del matches[prefixMatch]
 
-            for context, models in names.items():
-
-                if match == 1 and contextName != context:
-                    continue
+            if not matches:
+                del views[viewType]
 
-                if match == 2 and contextName[:len(context)] != context:
-                    continue
+        if not views:
+            del self._accessMap[groupName]
 
-                for model, levels in models.items():
-                    for level, viewName in levels.items():
+    @staticmethod
+    def _getChangedRows(mibNode, lastVersionId):
+        """Return instance IDs of table rows changed since `lastVersionId`.
 
-                        # priorities:
-                        # - matching securityModel
-                        # - exact context name match
-                        # - longer partial match
-                        # - highest securityLevel
-                        rating = securityModel == model, match == 1, len(context), level
+        Returns `None` if all rows should be re-read.
+        """
+        changes = mibNode.getInstancesChanges(lastVersionId)
 
-                        candidates.append((rating, viewName))
+        if changes is None:
+            debug.logger & debug.FLAG_ACL and debug.logger(
+                '_getChangedRows: changes of %s since version %s are '
+                'unknown' % (mibNode.name, lastVersionId))
+            return
 
-        if not candidates:
-            raise error.StatusInformation(errorIndication=errind.notInView)
+        return set(changes)
 
-        candidates.sort()
+    @staticmethod
+    def _getAllRows(mibNode):
+        instIds = []
 
-        rating, viewName = candidates[0]
-        return viewName
+        nextMibNode = mibNode
 
-    def isAccessAllowed(self,
-                        snmpEngine,
-                        securityModel,
-                        securityName,
-                        securityLevel,
-                        viewType,
-                        contextName,
-                        variableName):
+        while True:
+            try:
+                nextMibNode = mibNode.getNextNode(nextMibNode.name)
 
-        mibInstrumController = snmpEngine.msgAndPduDsp.mibInstrumController
-        mibBuilder = mibInstrumController.mibBuilder
+            except NoSuchInstanceError:
+                break
 
-        debug.logger & debug.FLAG_ACL and debug.logger(
-            'isAccessAllowed: securityModel %s, securityName %s, '
-            'securityLevel %s, viewType %s, contextName %s for '
-            'variableName %s' % (securityModel, securityName,
-                                 securityLevel, viewType, contextName,
-                                 variableName))
+            instIds.append(nextMibNode.name[len(mibNode.name):])
 
-        # Rebuild contextName map if changed
+        return instIds
 
-        vacmContextName, = mibInstrumController.mibBuilder.importSymbols(
+    def _updateContextMap(self, mibBuilder):
+        vacmContextName, = mibBuilder.importSymbols(
             'SNMP-VIEW-BASED-ACM-MIB', 'vacmContextName')
 
-        if self._contextBranchId != vacmContextName.branchVersionId:
+        if self._contextBranchId == vacmContextName.branchVersionId:
+            return
+
+        instIds = self._getChangedRows(vacmContextName, self._contextBranchId)
 
+        if instIds is None:
             self._contextMap.clear()
+            self._contextRows.clear()
 
-            nextMibNode = vacmContextName
+            instIds = self._getAllRows(vacmContextName)
 
-            while True:
-                try:
-                    nextMibNode = vacmContextName.getNextNode(nextMibNode.name)
+        for instId in instIds:
+            if instId in self._contextRows:
+                del self._contextMap[self._contextRows.pop(instId)]
 
-                except NoSuchInstanceError:
-                    break
+            try:
+                contextName = vacmContextName.getNode(
+                    vacmContextName.name + instId).syntax
 
-                self._contextMap[nextMibNode.syntax] = True
+            except NoSuchInstanceError:
+                continue
 
-            self._contextBranchId = vacmContextName.branchVersionId
+            self._contextMap[contextName] = True
+            self._contextRows[instId] = contextName
 
-        # 3.2.1
-        if contextName not in self._contextMap:
-            raise error.StatusInformation(errorIndication=errind.noSuchContext)
+        self._contextBranchId = vacmContextName.branchVersionId
 
-        # Rebuild groupName map if changed
-
-        vacmGroupName, = mibInstrumController.mibBuilder.importSymbols(
+    def _updateGroupNameMap(self, mibBuilder):
+        vacmGroupName, = mibBuilder.importSymbols(
             'SNMP-VIEW-BASED-ACM-MIB', 'vacmGroupName')
 
-        if self._groupNameBranchId != vacmGroupName.branchVersionId:
-
-            vacmSecurityToGroupEntry, = mibInstrumController.mibBuilder.importSymbols(
-                'SNMP-VIEW-BASED-ACM-MIB', 'vacmSecurityToGroupEntry')
-
-            self._groupNameMap.clear()
-
-            nextMibNode = vacmGroupName
-
-            while True:
-                try:
-                    nextMibNode = vacmGroupName.getNextNode(nextMibNode.name)
-
-                except NoSuchInstanceError:
-                    break
+        if self._groupNameBranchId == vacmGroupName.branchVersionId:
+            return
 
-                instId = nextMibNode.name[len(vacmGroupName.name):]
+        vacmSecurityToGroupEntry, = mibBuilder.importSymbols(
+            'SNMP-VIEW-BASED-ACM-MIB', 'vacmSecurityToGroupEntry')
 
-                indices = vacmSecurityToGroupEntry.getIndicesFromInstId(instId)
+        instIds = self._getChangedRows(vacmGroupName, self._groupNameBranchId)
 
-                self._groupNameMap[indices] = nextMibNode.syntax
+        if instIds is None:
+            self._groupNameMap.clear()
 
-            self._groupNameBranchId = vacmGroupName.branchVersionId
+            instIds = self._getAllRows(vacmGroupName)
 
-        # 3.2.2
-        indices = securityModel, securityName
+        for instId in instIds:
+            # securityModel and securityName index the row
+            indices = vacmSecurityToGroupEntry.getIndicesFromInstId(instId)
 
-        try:
-            groupName = self._groupNameMap[indices]
+            try:
+                self._groupNameMap[indices] = vacmGroupName.getNode(
+                    vacmGroupName.name + instId).syntax
 
-        except KeyError:
-            raise error.StatusInformation(errorIndication=errind.noGroupName)
+            except NoSuchInstanceError:
+                self._groupNameMap.pop(indices, None)
 
-        # Rebuild access map if changed
+        self._groupNameBranchId = vacmGroupName.branchVersionId
 
-        vacmAccessStatus, = mibInstrumController.mibBuilder.importSymbols(
+    def _updateAccessMap(self, mibBuilder):
+        vacmAccessStatus, = mibBuilder.importSymbols(
             'SNMP-VIEW-BASED-ACM-MIB', 'vacmAccessStatus')
 
-        if self._accessBranchId != vacmAccessStatus.branchVersionId:
-
-            (vacmAccessEntry,
-             vacmAccessContextPrefix,
-             vacmAccessSecurityModel,
-             vacmAccessSecurityLevel,
-             vacmAccessContextMatch,
-             vacmAccessReadViewName,
-             vacmAccessWriteViewName,
-             vacmAccessNotifyViewName) = mibInstrumController.mibBuilder.importSymbols(
-                'SNMP-VIEW-BASED-ACM-MIB',
-                'vacmAccessEntry',
-                'vacmAccessContextPrefix',
-                'vacmAccessSecurityModel',
-                'vacmAccessSecurityLevel',
-                'vacmAccessContextMatch',
-                'vacmAccessReadViewName',
-                'vacmAccessWriteViewName',
-                'vacmAccessNotifyViewName')
+        if self._accessBranchId == vacmAccessStatus.branchVersionId:
+            return
 
+        (vacmAccessEntry,
+         vacmAccessContextPrefix,
+         vacmAccessSecurityModel,
+         vacmAccessSecurityLevel,
+         vacmAccessContextMatch,
+         vacmAccessReadViewName,
+         vacmAccessWriteViewName,
+         vacmAccessNotifyViewName) = mibBuilder.importSymbols(
+            'SNMP-VIEW-BASED-ACM-MIB',
+            'vacmAccessEntry',
+            'vacmAccessContextPrefix',
+            'vacmAccessSecurityModel',
+            'vacmAccessSecurityLevel',
+            'vacmAccessContextMatch',
+            'vacmAccessReadViewName',
+            'vacmAccessWriteViewName',
+            'vacmAccessNotifyViewName')
+
+        instIds = self._getChangedRows(vacmAccessStatus, self._accessBranchId)
+
+        if instIds is None:
             self._accessMap.clear()
+            self._accessRows.clear()
 
-            nextMibNode = vacmAccessStatus
-
-            while True:
-                try:
-                    nextMibNode = vacmAccessStatus.getNextNode(nextMibNode.name)
+            instIds = self._getAllRows(vacmAccessStatus)
 
-                except NoSuchInstanceError:
-                    break
+        for instId in instIds:
+            if instId in self._accessRows:
+                self._delAccessEntry(*self._accessRows.pop(instId))
 
-                if nextMibNode.syntax != 1:  # active row
+            try:
+                if vacmAccessStatus.getNode(
+                        vacmAccessStatus.name + instId).syntax != 1:  # active row
                     continue
 
-                instId = nextMibNode.name[len(vacmAccessStatus.name):]
-
                 indices = vacmAccessEntry.getIndicesFromInstId(instId)
 
                 vacmGroupName = indices[0]
 
-                self._addAccessEntry(
+                accessEntry = (
                     vacmGroupName,
                     vacmAccessContextPrefix.getNode(
                         vacmAccessContextPrefix.name + instId).syntax,
@@ -274,44 +356,53 @@ class Vacm(object):
                         vacmAccessNotifyViewName.name + instId).syntax
                 )
 
-            self._accessBranchId = vacmAccessStatus.branchVersionId
+            except NoSuchInstanceError:
+                continue
 
-        viewName = self._getFamilyViewName(
-            groupName, contextName, securityModel, securityLevel, viewType)
+            self._addAccessEntry(*accessEntry)
+
+            self._accessRows[instId] = accessEntry
 
-        # Rebuild family subtree map if changed
+        self._accessBranchId = vacmAccessStatus.branchVersionId
 
-        vacmViewTreeFamilyViewName, = mibInstrumController.mibBuilder.importSymbols(
+    def _updateViewTreeMap(self, mibBuilder):
+        vacmViewTreeFamilyViewName, = mibBuilder.importSymbols(
             'SNMP-VIEW-BASED-ACM-MIB', 'vacmViewTreeFamilyViewName')
 
-        if self._viewTreeBranchId != vacmViewTreeFamilyViewName.branchVersionId:
+        if self._viewTreeBranchId == vacmViewTreeFamilyViewName.branchVersionId:
+            return
+
+        (vacmViewTreeFamilySubtree,
+         vacmViewTreeFamilyMask,
+         vacmViewTreeFamilyType) = mibBuilder.importSymbols(
+            'SNMP-VIEW-BASED-ACM-MIB',
+            'vacmViewTreeFamilySubtree',
+            'vacmViewTreeFamilyMask',
+            'vacmViewTreeFamilyType')
 
-            (vacmViewTreeFamilySubtree,
-             vacmViewTreeFamilyMask,
-             vacmViewTreeFamilyType) = mibInstrumController.mibBuilder.importSymbols(
-                'SNMP-VIEW-BASED-ACM-MIB',
-                'vacmViewTreeFamilySubtree',
-                'vacmViewTreeFamilyMask',
-                'vacmViewTreeFamilyType')
+        instIds = self._getChangedRows(
+            vacmViewTreeFamilyViewName, self._viewTreeBranchId)
 
+        if instIds is None:
             self._viewTreeMap.clear()
+            self._viewTreeRows.clear()
+            self._viewTreeFamilies.clear()
 
-            powerOfTwo = [2 ** exp for exp in range(7, -1, -1)]
+            instIds = self._getAllRows(vacmViewTreeFamilyViewName)
 
-            nextMibNode = vacmViewTreeFamilyViewName
+        viewNames = set()
 
-            while True:
-                try:
-                    nextMibNode = vacmViewTreeFamilyViewName.getNextNode(
-                        nextMibNode.name)
+        for instId in instIds:
+            if instId in self._viewTreeRows:
+                viewName = self._viewTreeRows.pop(instId)
 
-                except NoSuchInstanceError:
-                    break
+                del self._viewTreeFamilies[viewName][instId]
 
-                if nextMibNode.syntax not in self._viewTreeMap:
-                    self._viewTreeMap[nextMibNode.syntax] = []
+                viewNames.add(viewName)
 
-                instId = nextMibNode.name[len(vacmViewTreeFamilyViewName.name):]
+            try:
+                viewName = vacmViewTreeFamilyViewName.getNode(
+                    vacmViewTreeFamilyViewName.name + instId).syntax
 
                 subtree = vacmViewTreeFamilySubtree.getNode(
                     vacmViewTreeFamilySubtree.name + instId).syntax
@@ -322,59 +413,196 @@ class Vacm(object):
                 mode = vacmViewTreeFamilyType.getNode(
                     vacmViewTreeFamilyType.name + instId).syntax
 
-                mask = mask.asNumbers()
-                maskLength = min(len(mask) * 8, len(subtree))
+            except NoSuchInstanceError:
+                continue
 
-                ignoredSubOids = [
-                    i * 8 + j for i, octet in enumerate(mask)
-                    for j, bit in enumerate(powerOfTwo)
-                    if not (bit & octet) and i * 8 + j < maskLength
-                ]
+            mask = mask.asNumbers()
+            maskLength = min(len(mask) * 8, len(subtree))
 
-                if ignoredSubOids:
-                    pattern = list(subtree)
+            ignoredSubOids = [
+                i * 8 + j for i, octet in enumerate(mask)
+                for j, bit in enumerate(self._powOfTwoSeq)
+                if not (bit & octet) and i * 8 + j < maskLength
+            ]
 
-                    for ignoredSubOid in ignoredSubOids:
-                        pattern[ignoredSubOid] = 0
+            subtree = list(subtree)
 
-                    subtree = subtree.clone(pattern)
+            for ignoredSubOid in ignoredSubOids:
+                subtree[ignoredSubOid] = 0
 
-                entry = subtree, ignoredSubOids, mode == 1
+            if viewName not in self._viewTreeFamilies:
+                self._viewTreeFamilies[viewName] = {}
 
-                self._viewTreeMap[nextMibNode.syntax].append(entry)
+            self._viewTreeFamilies[viewName][instId] = (
+                subtree, ignoredSubOids, mode == 1)
 
-            for entries in self._viewTreeMap.values():
-                entries.sort(key=lambda x: (len(x[0]), x[0]))
+            self._viewTreeRows[instId] = viewName
 
-            self._viewTreeBranchId = vacmViewTreeFamilyViewName.branchVersionId
+            viewNames.add(viewName)
 
-        # 3.2.5a
-        indices = viewName
+        # re-compile changed views, families come in table order
+        for viewName in viewNames:
+            families = self._viewTreeFamilies.get(viewName)
+
+            if not families:
+                self._viewTreeFamilies.pop(viewName, None)
+                self._viewTreeMap.pop(viewName, None)
+                continue
+
+            viewTree = self._viewTreeMap[viewName] = _ViewTree()
+
+            for instId in sorted(families):
+                viewTree.addFamily(*families[instId])
+
+        self._decisionCache.clear()
+
+        self._viewTreeBranchId = vacmViewTreeFamilyViewName.branchVersionId
+
+    def _getFamilyViewName(self, groupName, contextName, securityModel, securityLevel, viewType):
+        groups = self._accessMap
 
         try:
-            entries = self._viewTreeMap[indices]
+            views = groups[groupName]
 
         except KeyError:
-            return error.StatusInformation(errorIndication=errind.notInView)
+            raise error.StatusInformation(errorIndication=errind.noGroupName)
 
-        accessAllowed = False
+        try:
+            matches = views[viewType]
 
-        for entry in entries:
-            subtree, ignoredSubOids, included = entry
+        except KeyError:
+            raise error.StatusInformation(errorIndication=errind.noAccessEntry)
 
-            if ignoredSubOids:
-                subOids = list(variableName)
+        try:
+            # vacmAccessTable #2: exact match shortcut
+            return matches[1][contextName][securityModel][securityLevel]
 
-                for ignoredSubOid in ignoredSubOids:
-                    subOids[ignoredSubOid] = 0
+        except KeyError:
+            pass
 
-                normalizedVariableName = subtree.clone(subOids)
+        # vacmAccessTable #2: fuzzy look-up
 
-            else:
-                normalizedVariableName = variableName
+        candidates = []
+
+        for match, names in matches.items():
+
+            for context, models in names.items():
+
+                if match == 1 and contextName != context:
+                    continue
+
+                if match == 2 and contextName[:len(context)] != context:
+                    continue
+
+                for model, levels in models.items():
+                    for level, viewName in levels.items():
+
+                        # priorities:
+                        # - matching securityModel
+                        # - exact context name match
+                        # - longer partial match
+                        # - highest securityLevel
+                        rating = securityModel == model, match == 1, len(context), level
+
+                        candidates.append((rating, viewName))
+
+        if not candidates:
+            raise error.StatusInformation(errorIndication=errind.notInView)
+
+        candidates.sort()
+
+        rating, viewName = candidates[0]
+        return viewName
+
+    def _getViewName(self, mibBuilder, securityModel, securityName,
+                     securityLevel, viewType, contextName):
+        self._updateContextMap(mibBuilder)
+
+        # 3.2.1
+        if contextName not in self._contextMap:
+            raise error.StatusInformation(errorIndication=errind.noSuchContext)
+
+        self._updateGroupNameMap(mibBuilder)
+
+        # 3.2.2
+        indices = securityModel, securityName
+
+        try:
+            groupName = self._groupNameMap[indices]
+
+        except KeyError:
+            raise error.StatusInformation(errorIndication=errind.noGroupName)
+
+        self._updateAccessMap(mibBuilder)
+
+        return self._getFamilyViewName(
+            groupName, contextName, securityModel, securityLevel, viewType)
+
+    def isAccessAllowed(self,
+                        snmpEngine,
+                        securityModel,
+                        securityName,
+                        securityLevel,
+                        viewType,
+                        contextName,
+                        variableName):
+
+        mibInstrumController = snmpEngine.msgAndPduDsp.mibInstrumController
+        mibBuilder = mibInstrumController.mibBuilder
+
+        debug.logger & debug.FLAG_ACL and debug.logger(
+            'isAccessAllowed: securityModel %s, securityName %s, '
+            'securityLevel %s, viewType %s, contextName %s for '
+            'variableName %s' % (securityModel, securityName,
+                                 securityLevel, viewType, contextName,
+                                 variableName))
+
+        vacmContextName, vacmGroupName, vacmAccessStatus = mibBuilder.importSymbols(
+            'SNMP-VIEW-BASED-ACM-MIB', 'vacmContextName', 'vacmGroupName',
+            'vacmAccessStatus')
+
+        branchIds = (vacmContextName.branchVersionId,
+                     vacmGroupName.branchVersionId,
+                     vacmAccessStatus.branchVersionId)
+
+        if self._principalBranchIds != branchIds:
+            self._principalMap.clear()
+            self._principalBranchIds = branchIds
+
+        principal = (securityModel, securityName, securityLevel, viewType,
+                     contextName)
+
+        try:
+            viewName = self._principalMap[principal]
+
+        except KeyError:
+            viewName = self._getViewName(
+                mibBuilder, securityModel, securityName, securityLevel,
+                viewType, contextName)
+
+            self._principalMap[principal] = viewName
+
+        self._updateViewTreeMap(mibBuilder)
+
+        # 3.2.5a
+        indices = viewName
+
+        try:
+            viewTree = self._viewTreeMap[indices]
+
+        except KeyError:
+            return error.StatusInformation(errorIndication=errind.notInView)
+
+        # view families can only tell apart OIDs this long
+        subOids = tuple(variableName)[:viewTree.depth]
+
+        key = viewName, subOids
+
+        accessAllowed = self._decisionCache.get(key)
 
-            if subtree.isPrefixOf(normalizedVariableName):
-                accessAllowed = included
+        if accessAllowed is None:
+            accessAllowed = self._decisionCache[key] = viewTree.isIncluded(
+                subOids)
 
         # 3.2.5c
         if not accessAllowed:
@@ -4,6 +4,7 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+from pysnmp.proto.api import fastcodec
 from pysnmp.proto.api import v1
 from pysnmp.proto.api import v2c
 from pysnmp.proto.api import verdec
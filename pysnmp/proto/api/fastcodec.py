@@ -0,0 +1,712 @@
+#
+# This file is part of pysnmp software.
+#
+# Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pysnmp/license.html
+#
+# Specialised BER codec for SNMP messages
+#
+# Handles the fixed layout of SNMP message envelopes, PDUs and
+# variable-bindings in straight Python code rather than going through
+# generic pyasn1 schema objects. Decoded messages are plain tuples:
+#
+#   SNMPv1/v2c message: (version, community, pdu)
+#   SNMPv3 message: (version, (msgID, msgMaxSize, msgFlags,
+#                              msgSecurityModel),
+#                    msgSecurityParameters, msgData)
+#
+# Where SNMPv3 `msgData` is either (contextEngineId, contextName, pdu)
+# tuple or encrypted PDU octets. The `pdu` is either
+#
+#   (pduType, requestId, errorStatus, errorIndex, varBinds)
+#
+# with `errorStatus` and `errorIndex` being non-repeaters and
+# max-repetitions for GETBULK PDU or, for SNMPv1 TRAP PDU,
+#
+#   (pduType, enterprise, agentAddr, genericTrap, specificTrap,
+#    timeStamp, varBinds)
+#
+# Variable-bindings are (oid, (tag, value)) tuples with `oid` being
+# a tuple of integers. Values are integers, octets, OID tuples or None
+# depending on their BER `tag`.
+#
+# Encodings the fast codec can not handle (e.g. indefinite length or
+# constructed OCTET STRING) are passed to pyasn1.
+#
+import sys
+
+from pyasn1.codec.ber import decoder
+from pyasn1.error import PyAsn1Error
+from pyasn1.type import univ
+
+from pysnmp.proto import rfc1157
+from pysnmp.proto import rfc1901
+from pysnmp.proto import rfc1902
+from pysnmp.proto import rfc1905
+from pysnmp.proto.error import ProtocolError
+
+__all__ = ['decodeMessageVersion', 'decodeMessage', 'encodeMessage',
+           'decodeScopedPdu', 'encodeScopedPdu', 'toAsn1Value',
+           'fromAsn1Value']
+
+# Universal and SNMP application tags
+TAG_INTEGER = 0x02
+TAG_OCTET_STRING = 0x04
+TAG_NULL = 0x05
+TAG_OBJECT_IDENTIFIER = 0x06
+TAG_SEQUENCE = 0x30
+TAG_IP_ADDRESS = 0x40
+TAG_COUNTER32 = 0x41
+TAG_GAUGE32 = 0x42
+TAG_TIME_TICKS = 0x43
+TAG_OPAQUE = 0x44
+TAG_COUNTER64 = 0x46
+TAG_NO_SUCH_OBJECT = 0x80
+TAG_NO_SUCH_INSTANCE = 0x81
+TAG_END_OF_MIB_VIEW = 0x82
+
+# PDU tags
+TAG_GET_REQUEST = 0xa0
+TAG_GET_NEXT_REQUEST = 0xa1
+TAG_RESPONSE = 0xa2
+TAG_SET_REQUEST = 0xa3
+TAG_V1_TRAP = 0xa4
+TAG_GET_BULK_REQUEST = 0xa5
+TAG_INFORM_REQUEST = 0xa6
+TAG_SNMPV2_TRAP = 0xa7
+TAG_REPORT = 0xa8
+
+_INTEGER_TAGS = frozenset(
+    (TAG_INTEGER, TAG_COUNTER32, TAG_GAUGE32, TAG_TIME_TICKS, TAG_COUNTER64))
+
+_OCTETS_TAGS = frozenset((TAG_OCTET_STRING, TAG_IP_ADDRESS, TAG_OPAQUE))
+
+_NULL_TAGS = frozenset(
+    (TAG_NULL, TAG_NO_SUCH_OBJECT, TAG_NO_SUCH_INSTANCE, TAG_END_OF_MIB_VIEW))
+
+# what SNMPv1 can not carry
+_V2_ONLY_TAGS = frozenset(
+    (TAG_COUNTER64, TAG_NO_SUCH_OBJECT, TAG_NO_SUCH_INSTANCE,
+     TAG_END_OF_MIB_VIEW))
+
+_V1_PDU_TAGS = frozenset(
+    (TAG_GET_REQUEST, TAG_GET_NEXT_REQUEST, TAG_RESPONSE, TAG_SET_REQUEST,
+     TAG_V1_TRAP))
+
+_V2_PDU_TAGS = frozenset(
+    (TAG_GET_REQUEST, TAG_GET_NEXT_REQUEST, TAG_RESPONSE, TAG_SET_REQUEST,
+     TAG_GET_BULK_REQUEST, TAG_INFORM_REQUEST, TAG_SNMPV2_TRAP, TAG_REPORT))
+
+_ASN1_TYPES = {
+    TAG_INTEGER: rfc1902.Integer32,
+    TAG_OCTET_STRING: rfc1902.OctetString,
+    TAG_NULL: rfc1902.Null,
+    TAG_OBJECT_IDENTIFIER: rfc1902.ObjectIdentifier,
+    TAG_IP_ADDRESS: rfc1902.IpAddress,
+    TAG_COUNTER32: rfc1902.Counter32,
+    TAG_GAUGE32: rfc1902.Gauge32,
+    TAG_TIME_TICKS: rfc1902.TimeTicks,
+    TAG_OPAQUE: rfc1902.Opaque,
+    TAG_COUNTER64: rfc1902.Counter64,
+    TAG_NO_SUCH_OBJECT: rfc1905.NoSuchObject,
+    TAG_NO_SUCH_INSTANCE: rfc1905.NoSuchInstance,
+    TAG_END_OF_MIB_VIEW: rfc1905.EndOfMibView
+}
+
+if sys.version_info[0] <= 2:
+    def _octets(substrate):
+        return bytearray(substrate)
+
+else:
+    def _octets(substrate):
+        if isinstance(substrate, bytes):
+            return substrate
+
+        return bytes(substrate)
+
+
+class _FallbackError(Exception):
+    """Encoding is unusual or broken, let pyasn1 have a go at it"""
+
+
+def _header(data, pos, end):
+    """Return tag, contents start and end offsets of TLV at `pos`"""
+    if pos + 2 > end:
+        raise _FallbackError()
+
+    tag = data[pos]
+
+    if tag & 0x1f == 0x1f:
+        raise _FallbackError()
+
+    length = data[pos + 1]
+
+    pos += 2
+
+    if length & 0x80:
+        size = length & 0x7f
+
+        # indefinite or insanely long
+        if not size or size > 4 or pos + size > end:
+            raise _FallbackError()
+
+        length = 0
+
+        for idx in range(pos, pos + size):
+            length = length << 8 | data[idx]
+
+        pos += size
+
+    if pos + length > end:
+        raise _FallbackError()
+
+    return tag, pos, pos + length
+
+
+def _decodeInteger(data, start, end):
+    if start == end:
+        raise _FallbackError()
+
+    value = data[start]
+
+    if value & 0x80:
+        value -= 0x100
+
+    for idx in range(start + 1, end):
+        value = value << 8 | data[idx]
+
+    return value
+
+
+def _decodeOid(data, start, end):
+    if start == end or data[end - 1] & 0x80:
+        raise _FallbackError()
+
+    arcs = []
+
+    arc = 0
+
+    for idx in range(start, end):
+        octet = data[idx]
+
+        # non-minimal sub-identifier encoding
+        if octet == 0x80 and not arc:
+            raise _FallbackError()
+
+        arc = arc << 7 | octet & 0x7f
+
+        if not octet & 0x80:
+            arcs.append(arc)
+            arc = 0
+
+    first = arcs[0]
+
+    if first < 40:
+        return (0, first) + tuple(arcs[1:])
+
+    elif first < 80:
+        return (1, first - 40) + tuple(arcs[1:])
+
+    else:
+        return (2, first - 80) + tuple(arcs[1:])
+
+
+def _decodeValue(data, tag, start, end):
+    if tag in _INTEGER_TAGS:
+        return _decodeInteger(data, start, end)
+
+    elif tag in _OCTETS_TAGS:
+        return bytes(data[start:end])
+
+    elif tag == TAG_OBJECT_IDENTIFIER:
+        return _decodeOid(data, start, end)
+
+    elif tag in _NULL_TAGS:
+        if start != end:
+            raise _FallbackError()
+
+        return None
+
+    raise _FallbackError()
+
+
+def _expect(data, pos, end, expectedTag):
+    tag, start, stop = _header(data, pos, end)
+
+    if tag != expectedTag:
+        raise _FallbackError()
+
+    return start, stop
+
+
+def _decodeVarBinds(data, pos, end, version):
+    varBinds = []
+
+    start, stop = _expect(data, pos, end, TAG_SEQUENCE)
+
+    if stop != end:
+        raise _FallbackError()
+
+    while start < end:
+        pos, stop = _expect(data, start, end, TAG_SEQUENCE)
+
+        oidStart, oidEnd = _expect(data, pos, stop, TAG_OBJECT_IDENTIFIER)
+
+        tag, valStart, valEnd = _header(data, oidEnd, stop)
+
+        if valEnd != stop or not version and tag in _V2_ONLY_TAGS:
+            raise _FallbackError()
+
+        varBinds.append(
+            (_decodeOid(data, oidStart, oidEnd),
+             (tag, _decodeValue(data, tag, valStart, valEnd))))
+
+        start = stop
+
+    return varBinds
+
+
+def _decodePdu(data, pos, end, version):
+    pduType, start, stop = _header(data, pos, end)
+
+    if stop != end:
+        raise _FallbackError()
+
+    if version:
+        if pduType not in _V2_PDU_TAGS:
+            raise _FallbackError()
+
+    elif pduType not in _V1_PDU_TAGS:
+        raise _FallbackError()
+
+    if pduType == TAG_V1_TRAP:
+        pos, end = _expect(data, start, stop, TAG_OBJECT_IDENTIFIER)
+        enterprise = _decodeOid(data, pos, end)
+
+        pos, end = _expect(data, end, stop, TAG_IP_ADDRESS)
+        agentAddr = bytes(data[pos:end])
+
+        pos, end = _expect(data, end, stop, TAG_INTEGER)
+        genericTrap = _decodeInteger(data, pos, end)
+
+        pos, end = _expect(data, end, stop, TAG_INTEGER)
+        specificTrap = _decodeInteger(data, pos, end)
+
+        pos, end = _expect(data, end, stop, TAG_TIME_TICKS)
+        timeStamp = _decodeInteger(data, pos, end)
+
+        return (pduType, enterprise, agentAddr, genericTrap, specificTrap,
+                timeStamp, _decodeVarBinds(data, end, stop, version))
+
+    pos, end = _expect(data, start, stop, TAG_INTEGER)
+    requestId = _decodeInteger(data, pos, end)
+
+    pos, end = _expect(data, end, stop, TAG_INTEGER)
+    errorStatus = _decodeInteger(data, pos, end)
+
+    pos, end = _expect(data, end, stop, TAG_INTEGER)
+    errorIndex = _decodeInteger(data, pos, end)
+
+    return (pduType, requestId, errorStatus, errorIndex,
+            _decodeVarBinds(data, end, stop, version))
+
+
+def _decodeScopedPdu(data, pos, end):
+    start, stop = _expect(data, pos, end, TAG_SEQUENCE)
+
+    if stop != end:
+        raise _FallbackError()
+
+    pos, end = _expect(data, start, stop, TAG_OCTET_STRING)
+    contextEngineId = bytes(data[pos:end])
+
+    pos, end = _expect(data, end, stop, TAG_OCTET_STRING)
+    contextName = bytes(data[pos:end])
+
+    return contextEngineId, contextName, _decodePdu(data, end, stop, 3)
+
+
+def _decodeMessage(data):
+    start, stop = _expect(data, 0, len(data), TAG_SEQUENCE)
+
+    pos, end = _expect(data, start, stop, TAG_INTEGER)
+    version = _decodeInteger(data, pos, end)
+
+    if version in (0, 1):
+        pos, end = _expect(data, end, stop, TAG_OCTET_STRING)
+        community = bytes(data[pos:end])
+
+        msg = version, community, _decodePdu(data, end, stop, version)
+
+    elif version == 3:
+        start, headerEnd = _expect(data, end, stop, TAG_SEQUENCE)
+
+        pos, end = _expect(data, start, headerEnd, TAG_INTEGER)
+        msgID = _decodeInteger(data, pos, end)
+
+        pos, end = _expect(data, end, headerEnd, TAG_INTEGER)
+        msgMaxSize = _decodeInteger(data, pos, end)
+
+        pos, end = _expect(data, end, headerEnd, TAG_OCTET_STRING)
+        msgFlags = bytes(data[pos:end])
+
+        pos, end = _expect(data, end, headerEnd, TAG_INTEGER)
+        msgSecurityModel = _decodeInteger(data, pos, end)
+
+        if end != headerEnd:
+            raise _FallbackError()
+
+        pos, end = _expect(data, headerEnd, stop, TAG_OCTET_STRING)
+        msgSecurityParameters = bytes(data[pos:end])
+
+        tag, pos, msgDataEnd = _header(data, end, stop)
+
+        if msgDataEnd != stop:
+            raise _FallbackError()
+
+        if tag == TAG_OCTET_STRING:
+            msgData = bytes(data[pos:msgDataEnd])
+
+        else:
+            msgData = _decodeScopedPdu(data, end, stop)
+
+        msg = (version, (msgID, msgMaxSize, msgFlags, msgSecurityModel),
+               msgSecurityParameters, msgData)
+
+    else:
+        raise _FallbackError()
+
+    return msg, bytes(data[stop:])
+
+
+def _getTag(value):
+    tag = value.tagSet[-1]
+    return tag.tagClass | tag.tagFormat | tag.tagId
+
+
+def fromAsn1Value(value):
+    """Turn pyasn1 SNMP value object into (tag, value) tuple"""
+    tag = _getTag(value)
+
+    if tag in _INTEGER_TAGS:
+        return tag, int(value)
+
+    elif tag in _OCTETS_TAGS:
+        return tag, value.asOctets()
+
+    elif tag == TAG_OBJECT_IDENTIFIER:
+        return tag, tuple(value)
+
+    return tag, None
+
+
+def toAsn1Value(value):
+    """Turn (tag, value) tuple into pyasn1 SNMP value object"""
+    tag, value = value
+
+    try:
+        asn1Type = _ASN1_TYPES[tag]
+
+    except KeyError:
+        raise ProtocolError('Unsupported SNMP value tag %s' % tag)
+
+    if value is None:
+        return asn1Type('')
+
+    return asn1Type(value)
+
+
+def _fromAsn1VarBinds(varBindList):
+    return [(tuple(varBind[0]), fromAsn1Value(varBind[1].getComponent(True)))
+            for varBind in varBindList]
+
+
+def _fromAsn1Pdu(pdu):
+    pduType = _getTag(pdu)
+
+    if pduType == TAG_V1_TRAP:
+        return (pduType, tuple(pdu[0]), pdu[1].getComponent().asOctets(),
+                int(pdu[2]), int(pdu[3]), int(pdu[4]),
+                _fromAsn1VarBinds(pdu[5]))
+
+    return (pduType, int(pdu[0]), int(pdu[1]), int(pdu[2]),
+            _fromAsn1VarBinds(pdu[3]))
+
+
+def _fromAsn1ScopedPdu(scopedPdu):
+    return (scopedPdu[0].asOctets(), scopedPdu[1].asOctets(),
+            _fromAsn1Pdu(scopedPdu[2].getComponent()))
+
+
+def _decodeWithPyasn1(wholeMsg):
+    from pysnmp.proto.api import verdec
+
+    version = int(verdec.decodeMessageVersion(wholeMsg))
+
+    if version == 0:
+        asn1Spec = rfc1157.Message()
+
+    elif version == 1:
+        asn1Spec = rfc1901.Message()
+
+    elif version == 3:
+        from pysnmp.proto.mpmod.rfc3412 import SNMPv3Message
+
+        asn1Spec = SNMPv3Message()
+
+    else:
+        raise ProtocolError('Unsupported SNMP version %s' % version)
+
+    msg, restOfWholeMsg = decoder.decode(wholeMsg, asn1Spec=asn1Spec)
+
+    if version == 3:
+        globalData = msg[1]
+        msgData = msg[3].getComponent()
+
+        if msgData.isSameTypeWith(univ.OctetString()):
+            msgData = msgData.asOctets()
+
+        else:
+            msgData = _fromAsn1ScopedPdu(msgData)
+
+        msg = (version,
+               (int(globalData[0]), int(globalData[1]),
+                globalData[2].asOctets(), int(globalData[3])),
+               msg[2].asOctets(), msgData)
+
+    else:
+        msg = (version, msg[1].asOctets(), _fromAsn1Pdu(msg[2].getComponent()))
+
+    return msg, restOfWholeMsg
+
+
+def decodeMessageVersion(wholeMsg):
+    """Return SNMP message version, None if encoding is unusual"""
+    try:
+        data = _octets(wholeMsg)
+
+        start, stop = _expect(data, 0, len(data), TAG_SEQUENCE)
+        pos, end = _expect(data, start, stop, TAG_INTEGER)
+
+        return _decodeInteger(data, pos, end)
+
+    except _FallbackError:
+        return None
+
+
+def decodeMessage(wholeMsg):
+    """Decode SNMP message into tuples.
+
+    Returns a tuple of decoded message and the rest of `wholeMsg`
+    following the message. Raises `ProtocolError` on broken or
+    unsupported message.
+    """
+    try:
+        return _decodeMessage(_octets(wholeMsg))
+
+    except _FallbackError:
+        pass
+
+    try:
+        return _decodeWithPyasn1(wholeMsg)
+
+    except ProtocolError:
+        raise
+
+    except PyAsn1Error as exc:
+        raise ProtocolError('Invalid BER at SNMP message: %s' % exc)
+
+
+def decodeScopedPdu(substrate):
+    """Decode (e.g. decrypted) SNMPv3 ScopedPDU into a tuple"""
+    data = _octets(substrate)
+
+    try:
+        return _decodeScopedPdu(data, 0, len(data))
+
+    except _FallbackError:
+        pass
+
+    from pysnmp.proto.mpmod.rfc3412 import ScopedPDU
+
+    try:
+        scopedPdu, _ = decoder.decode(substrate, asn1Spec=ScopedPDU())
+
+    except PyAsn1Error as exc:
+        raise ProtocolError('Invalid BER at SNMP scoped PDU: %s' % exc)
+
+    return _fromAsn1ScopedPdu(scopedPdu)
+
+
+def _encodeHeader(tag, length):
+    if length < 0x80:
+        return bytearray((tag, length))
+
+    elif length < 0x100:
+        return bytearray((tag, 0x81, length))
+
+    elif length < 0x10000:
+        return bytearray((tag, 0x82, length >> 8, length & 0xff))
+
+    elif length < 0x1000000:
+        return bytearray((tag, 0x83, length >> 16, length >> 8 & 0xff,
+                          length & 0xff))
+
+    return bytearray((tag, 0x84, length >> 24 & 0xff, length >> 16 & 0xff,
+                      length >> 8 & 0xff, length & 0xff))
+
+
+def _encodeTlv(tag, contents):
+    header = _encodeHeader(tag, len(contents))
+    header += contents
+    return header
+
+
+def _encodeInteger(tag, value):
+    octets = [value & 0xff]
+
+    value >>= 8
+
+    while value or octets[0] & 0x80:
+        if value == -1 and octets[0] & 0x80:
+            break
+
+        octets.insert(0, value & 0xff)
+        value >>= 8
+
+    header = _encodeHeader(tag, len(octets))
+    header.extend(octets)
+    return header
+
+
+def _encodeOid(tag, oid):
+    if len(oid) < 2 or oid[0] > 2 or oid[0] < 2 and oid[1] > 39:
+        raise ProtocolError('Malformed OID %s' % (oid,))
+
+    octets = bytearray()
+
+    for arc in (oid[0] * 40 + oid[1],) + tuple(oid[2:]):
+        if arc < 0x80:
+            if arc < 0:
+                raise ProtocolError('Negative OID arc at %s' % (oid,))
+
+            octets.append(arc)
+            continue
+
+        arcOctets = [arc & 0x7f]
+
+        arc >>= 7
+
+        while arc:
+            arcOctets.insert(0, 0x80 | arc & 0x7f)
+            arc >>= 7
+
+        octets.extend(arcOctets)
+
+    return _encodeTlv(tag, octets)
+
+
+def _encodeValue(value):
+    tag, value = value
+
+    if tag in _INTEGER_TAGS:
+        return _encodeInteger(tag, value)
+
+    elif tag in _OCTETS_TAGS:
+        return _encodeTlv(tag, value)
+
+    elif tag == TAG_OBJECT_IDENTIFIER:
+        return _encodeOid(tag, value)
+
+    elif tag in _NULL_TAGS:
+        return bytearray((tag, 0))
+
+    raise ProtocolError('Unsupported SNMP value tag %s' % tag)
+
+
+def _encodeVarBinds(varBinds):
+    octets = bytearray()
+
+    for oid, value in varBinds:
+        varBind = _encodeOid(TAG_OBJECT_IDENTIFIER, oid)
+        varBind += _encodeValue(value)
+        octets += _encodeTlv(TAG_SEQUENCE, varBind)
+
+    return _encodeTlv(TAG_SEQUENCE, octets)
+
+
+def _encodePdu(pdu):
+    pduType = pdu[0]
+
+    if pduType == TAG_V1_TRAP:
+        (pduType, enterprise, agentAddr, genericTrap, specificTrap,
+         timeStamp, varBinds) = pdu
+
+        octets = _encodeOid(TAG_OBJECT_IDENTIFIER, enterprise)
+        octets += _encodeTlv(TAG_IP_ADDRESS, agentAddr)
+        octets += _encodeInteger(TAG_INTEGER, genericTrap)
+        octets += _encodeInteger(TAG_INTEGER, specificTrap)
+        octets += _encodeInteger(TAG_TIME_TICKS, timeStamp)
+
+    else:
+        pduType, requestId, errorStatus, errorIndex, varBinds = pdu
+
+        octets = _encodeInteger(TAG_INTEGER, requestId)
+        octets += _encodeInteger(TAG_INTEGER, errorStatus)
+        octets += _encodeInteger(TAG_INTEGER, errorIndex)
+
+    octets += _encodeVarBinds(varBinds)
+
+    return _encodeTlv(pduType, octets)
+
+
+def _encodeScopedPdu(scopedPdu):
+    contextEngineId, contextName, pdu = scopedPdu
+
+    octets = _encodeTlv(TAG_OCTET_STRING, contextEngineId)
+    octets += _encodeTlv(TAG_OCTET_STRING, contextName)
+    octets += _encodePdu(pdu)
+
+    return _encodeTlv(TAG_SEQUENCE, octets)
+
+
+def encodeScopedPdu(scopedPdu):
+    """Encode (contextEngineId, contextName, pdu) tuple into octets"""
+    return bytes(_encodeScopedPdu(scopedPdu))
+
+
+def encodeMessage(msg):
+    """Encode SNMP message tuple (see `decodeMessage`) into octets"""
+    version = msg[0]
+
+    if version in (0, 1):
+        version, community, pdu = msg
+
+        octets = _encodeInteger(TAG_INTEGER, version)
+        octets += _encodeTlv(TAG_OCTET_STRING, community)
+        octets += _encodePdu(pdu)
+
+    elif version == 3:
+        version, globalData, msgSecurityParameters, msgData = msg
+
+        msgID, msgMaxSize, msgFlags, msgSecurityModel = globalData
+
+        header = _encodeInteger(TAG_INTEGER, msgID)
+        header += _encodeInteger(TAG_INTEGER, msgMaxSize)
+        header += _encodeTlv(TAG_OCTET_STRING, msgFlags)
+        header += _encodeInteger(TAG_INTEGER, msgSecurityModel)
+
+        octets = _encodeInteger(TAG_INTEGER, version)
+        octets += _encodeTlv(TAG_SEQUENCE, header)
+        octets += _encodeTlv(TAG_OCTET_STRING, msgSecurityParameters)
+
+        if isinstance(msgData, tuple):
+            octets += _encodeScopedPdu(msgData)
+
+        else:
+            octets += _encodeTlv(TAG_OCTET_STRING, msgData)
+
+    else:
+        raise ProtocolError('Unsupported SNMP version %s' % version)
+
+    return bytes(_encodeTlv(TAG_SEQUENCE, octets))
@@ -9,10 +9,15 @@ from pyasn1.codec.ber import eoo
 from pyasn1.error import PyAsn1Error
 from pyasn1.type import univ
 
+from pysnmp.proto.api import fastcodec
 from pysnmp.proto.error import ProtocolError
 
 
 def decodeMessageVersion(wholeMsg):
+    ver = fastcodec.decodeMessageVersion(wholeMsg)
+    if ver is not None:
+        return univ.Integer(ver)
+
     try:
         seq, wholeMsg = decoder.decode(
             wholeMsg, asn1Spec=univ.Sequence(),
@@ -4,18 +4,50 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import heapq
+
 from pysnmp.proto import error
 
 
 class Cache(object):
+    """Pending requests cache.
+
+    Cache entries carrying the `timeout` parameter are also queued
+    by their deadline so that expiring them takes time proportional
+    to the number of expired entries rather than to the number of
+    entries kept in the cache.
+    """
     def __init__(self):
         self._cacheRepository = {}
+        # Min-heap of (timeout, serial, index, cachedParams) entries
+        self._expirationQueue = []
+        self._serial = 0
+
+    def __len__(self):
+        return len(self._cacheRepository)
+
+    def __contains__(self, index):
+        return index in self._cacheRepository
+
+    def _schedule(self, index, cachedParams):
+        timeout = cachedParams.get('timeout')
+        if timeout is None:
+            return
+
+        self._serial += 1
+
+        heapq.heappush(
+            self._expirationQueue,
+            (timeout, self._serial, index, cachedParams))
 
     def add(self, index, **kwargs):
         self._cacheRepository[index] = kwargs
+        self._schedule(index, kwargs)
         return index
 
     def pop(self, index):
+        # n.b. the expiration queue entry is left behind and
+        # gets discarded once its deadline comes
         if index in self._cacheRepository:
             cachedParams = self._cacheRepository[index]
         else:
@@ -28,11 +60,55 @@ class Cache(object):
             raise error.ProtocolError(
                 'Cache miss on update for %s' % kwargs
             )
-        self._cacheRepository[index].update(kwargs)
-
-    def expire(self, cbFun, cbCtx):
-        for index, cachedParams in list(self._cacheRepository.items()):
-            if cbFun:
-                if cbFun(index, cachedParams, cbCtx):
-                    if index in self._cacheRepository:
-                        del self._cacheRepository[index]
+
+        cachedParams = self._cacheRepository[index]
+
+        timeout = cachedParams.get('timeout')
+
+        cachedParams.update(kwargs)
+
+        if cachedParams.get('timeout') != timeout:
+            self._schedule(index, cachedParams)
+
+    def expire(self, cbFun, cbCtx, timeNow=None):
+        """Offer cache entries to `cbFun` for expiration.
+
+        If `timeNow` is not given, every cache entry is offered
+        to `cbFun`. Otherwise just the entries whose `timeout` is
+        not in the future are offered. Either way, the entry is
+        removed from cache if `cbFun` returns `True`.
+        """
+        if timeNow is None:
+            for index, cachedParams in list(self._cacheRepository.items()):
+                if cbFun:
+                    if cbFun(index, cachedParams, cbCtx):
+                        if index in self._cacheRepository:
+                            del self._cacheRepository[index]
+
+            return
+
+        expirationQueue = self._expirationQueue
+
+        expired = []
+
+        while expirationQueue and expirationQueue[0][0] <= timeNow:
+            timeout, serial, index, cachedParams = heapq.heappop(
+                expirationQueue)
+
+            # skip entries that have been popped or re-scheduled
+            if (self._cacheRepository.get(index) is cachedParams and
+                    cachedParams.get('timeout') == timeout):
+                expired.append((index, cachedParams))
+
+        # callbacks may queue up new requests, those are not
+        # considered until the next call
+        for index, cachedParams in expired:
+            if self._cacheRepository.get(index) is not cachedParams:
+                continue
+
+            if cbFun and cbFun(index, cachedParams, cbCtx):
+                if self._cacheRepository.get(index) is cachedParams:
+                    del self._cacheRepository[index]
+
+            else:
+                self._schedule(index, cachedParams)
@@ -120,23 +120,24 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
                 transportDomain=transportDomain,
                 transportAddress=transportAddress)
 
-        communityName = msg.getComponentByPosition(1)  # for observer
-
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine, 'rfc2576.prepareOutgoingMessage',
-            dict(transportDomain=transportDomain,
-                 transportAddress=transportAddress,
-                 wholeMsg=wholeMsg,
-                 securityModel=securityModel,
-                 securityName=securityName,
-                 securityLevel=securityLevel,
-                 contextEngineId=contextEngineId,
-                 contextName=contextName,
-                 communityName=communityName,
-                 pdu=pdu))
-
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc2576.prepareOutgoingMessage')
+        if snmpEngine.observer.isObserved('rfc2576.prepareOutgoingMessage'):
+            communityName = msg.getComponentByPosition(1)
+
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine, 'rfc2576.prepareOutgoingMessage',
+                dict(transportDomain=transportDomain,
+                     transportAddress=transportAddress,
+                     wholeMsg=wholeMsg,
+                     securityModel=securityModel,
+                     securityName=securityName,
+                     securityLevel=securityLevel,
+                     contextEngineId=contextEngineId,
+                     contextName=contextName,
+                     communityName=communityName,
+                     pdu=pdu))
+
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc2576.prepareOutgoingMessage')
 
         return transportDomain, transportAddress, wholeMsg
 
@@ -232,21 +233,22 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
         # recover unique request-id right after PDU serialization
         pdu.setComponentByPosition(0, msgID)
 
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine, 'rfc2576.prepareResponseMessage',
-            dict(transportDomain=transportDomain,
-                 transportAddress=transportAddress,
-                 securityModel=securityModel,
-                 securityName=securityName,
-                 securityLevel=securityLevel,
-                 contextEngineId=contextEngineId,
-                 contextName=contextName,
-                 securityEngineId=snmpEngineId,
-                 communityName=msg.getComponentByPosition(1),
-                 pdu=pdu))
-
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc2576.prepareResponseMessage')
+        if snmpEngine.observer.isObserved('rfc2576.prepareResponseMessage'):
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine, 'rfc2576.prepareResponseMessage',
+                dict(transportDomain=transportDomain,
+                     transportAddress=transportAddress,
+                     securityModel=securityModel,
+                     securityName=securityName,
+                     securityLevel=securityLevel,
+                     contextEngineId=contextEngineId,
+                     contextName=contextName,
+                     securityEngineId=snmpEngineId,
+                     communityName=msg.getComponentByPosition(1),
+                     pdu=pdu))
+
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc2576.prepareResponseMessage')
 
         return transportDomain, transportAddress, wholeMsg
 
@@ -310,17 +312,19 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
         except error.StatusInformation as exc:
             statusInformation = exc
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:sm-failure',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityLevel=securityLevel,
-                     securityParameters=securityParameters,
-                     statusInformation=statusInformation))
+            if snmpEngine.observer.isObserved(
+                    'rfc2576.prepareDataElements:sm-failure'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:sm-failure',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityLevel=securityLevel,
+                         securityParameters=securityParameters,
+                         statusInformation=statusInformation))
 
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:sm-failure')
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:sm-failure')
 
             raise
 
@@ -383,21 +387,23 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
 
             stateReference = None
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:response',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     communityName=communityName,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:response')
+            if snmpEngine.observer.isObserved(
+                    'rfc2576.prepareDataElements:response'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:response',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         communityName=communityName,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:response')
 
             # rfc3412: 7.2.12c
             smHandler.releaseStateInformation(securityStateReference)
@@ -444,21 +450,23 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
                 transportAddress=transportAddress
             )
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:confirmed',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     communityName=communityName,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:confirmed')
+            if snmpEngine.observer.isObserved(
+                    'rfc2576.prepareDataElements:confirmed'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:confirmed',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         communityName=communityName,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:confirmed')
 
             debug.logger & debug.FLAG_MP and debug.logger(
                 'prepareDataElements: cached by new stateReference '
@@ -476,21 +484,23 @@ class SnmpV1MessageProcessingModel(AbstractMessageProcessingModel):
             # Pass new stateReference to let app browse request details
             stateReference = self._cache.newStateReference()
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:unconfirmed',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     communityName=communityName,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc2576.prepareDataElements:unconfirmed')
+            if snmpEngine.observer.isObserved(
+                    'rfc2576.prepareDataElements:unconfirmed'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:unconfirmed',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         communityName=communityName,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc2576.prepareDataElements:unconfirmed')
 
             # This is not specified explicitly in RFC
             smHandler.releaseStateInformation(securityStateReference)
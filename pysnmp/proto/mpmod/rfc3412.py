@@ -109,6 +109,43 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         else:
             return None, None, None
 
+    def setPeerEngineInfo(self, snmpEngine, transportDomain, transportAddress,
+                          securityEngineId, contextEngineId, contextName):
+        """Cache peer SNMP engine info as if it has been discovered"""
+        k = transportDomain, transportAddress
+
+        self._cachePeerEngineInfo(
+            snmpEngine, k, securityEngineId, contextEngineId, contextName)
+
+    def getPeerMaxMessageSize(self, transportDomain, transportAddress):
+        """Return max message size announced by SNMP peer or `None`"""
+        k = transportDomain, transportAddress
+        if k in self._engineIdCache:
+            return self._engineIdCache[k].get('msgMaxSize')
+
+    def getPeerEngines(self):
+        """Return (transportDomain, transportAddress) of known peers"""
+        return list(self._engineIdCache)
+
+    def _cachePeerEngineInfo(self, snmpEngine, k, securityEngineId,
+                             contextEngineId, contextName, msgMaxSize=None):
+        timerResolution = (snmpEngine.transportDispatcher is None and 1.0 or
+                           snmpEngine.transportDispatcher.getTimerResolution())
+        expireAt = int(self._expirationTimer + 300 / timerResolution)
+
+        self._engineIdCache[k] = {
+            'securityEngineId': securityEngineId,
+            'contextEngineId': contextEngineId,
+            'contextName': contextName,
+            'msgMaxSize': msgMaxSize,
+            'expireAt': expireAt
+        }
+
+        if expireAt not in self._engineIdCacheExpQueue:
+            self._engineIdCacheExpQueue[expireAt] = []
+
+        self._engineIdCacheExpQueue[expireAt].append(k)
+
     # 7.1.1a
     def prepareOutgoingMessage(self, snmpEngine, transportDomain,
                                transportAddress, messageProcessingModel,
@@ -272,21 +309,22 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
                 transportDomain=transportDomain,
                 transportAddress=transportAddress)
 
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine, 'rfc3412.prepareOutgoingMessage',
-            dict(transportDomain=transportDomain,
-                 transportAddress=transportAddress,
-                 wholeMsg=wholeMsg,
-                 securityModel=securityModel,
-                 securityName=securityName,
-                 securityLevel=securityLevel,
-                 contextEngineId=contextEngineId,
-                 contextName=contextName,
-                 pdu=pdu)
-        )
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc3412.prepareOutgoingMessage'
-        )
+        if snmpEngine.observer.isObserved('rfc3412.prepareOutgoingMessage'):
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine, 'rfc3412.prepareOutgoingMessage',
+                dict(transportDomain=transportDomain,
+                     transportAddress=transportAddress,
+                     wholeMsg=wholeMsg,
+                     securityModel=securityModel,
+                     securityName=securityName,
+                     securityLevel=securityLevel,
+                     contextEngineId=contextEngineId,
+                     contextName=contextName,
+                     pdu=pdu)
+            )
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc3412.prepareOutgoingMessage'
+            )
 
         return transportDomain, transportAddress, wholeMsg
 
@@ -482,21 +520,22 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         if len(wholeMsg) > min(snmpEngineMaxMessageSize.syntax, maxMessageSize):
             raise error.StatusInformation(errorIndication=errind.tooBig)
 
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine,
-            'rfc3412.prepareResponseMessage',
-            dict(transportDomain=transportDomain,
-                 transportAddress=transportAddress,
-                 securityModel=securityModel,
-                 securityName=securityName,
-                 securityLevel=securityLevel,
-                 contextEngineId=contextEngineId,
-                 contextName=contextName,
-                 securityEngineId=snmpEngineID,
-                 pdu=pdu))
-
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc3412.prepareResponseMessage')
+        if snmpEngine.observer.isObserved('rfc3412.prepareResponseMessage'):
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine,
+                'rfc3412.prepareResponseMessage',
+                dict(transportDomain=transportDomain,
+                     transportAddress=transportAddress,
+                     securityModel=securityModel,
+                     securityName=securityName,
+                     securityLevel=securityLevel,
+                     contextEngineId=contextEngineId,
+                     contextName=contextName,
+                     securityEngineId=snmpEngineID,
+                     pdu=pdu))
+
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc3412.prepareResponseMessage')
 
         return transportDomain, transportAddress, wholeMsg
 
@@ -580,17 +619,19 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
                 'prepareDataElements: SM failed, statusInformation '
                 '%s' % statusInformation)
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:sm-failure',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityLevel=securityLevel,
-                     securityParameters=securityParameters,
-                     statusInformation=statusInformation))
+            if snmpEngine.observer.isObserved(
+                    'rfc3412.prepareDataElements:sm-failure'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:sm-failure',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityLevel=securityLevel,
+                         securityParameters=securityParameters,
+                         statusInformation=statusInformation))
 
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:sm-failure')
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:sm-failure')
 
             if 'errorIndication' in statusInformation:
                 # 7.2.6a
@@ -666,19 +707,9 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
                 # Here we assume that authentic/default EngineIDs
                 # come only in the course of engine-to-engine communication.
                 if pdu.tagSet in rfc3411.INTERNAL_CLASS_PDUS:
-                    self._engineIdCache[k] = {
-                        'securityEngineId': securityEngineId,
-                        'contextEngineId': contextEngineId,
-                        'contextName': contextName
-                    }
-
-                    timerResolution = snmpEngine.transportDispatcher.getTimerResolution()
-                    expireAt = int(self._expirationTimer + 300 / timerResolution)
-
-                    if expireAt not in self._engineIdCacheExpQueue:
-                        self._engineIdCacheExpQueue[expireAt] = []
-
-                    self._engineIdCacheExpQueue[expireAt].append(k)
+                    self._cachePeerEngineInfo(
+                        snmpEngine, k, securityEngineId, contextEngineId,
+                        contextName, int(maxMessageSize))
 
                     debug.logger & debug.FLAG_MP and debug.logger(
                         'prepareDataElements: cache securityEngineId %r for %r %r' % (
@@ -742,20 +773,22 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
 
             # 7.2.11b (incomplete implementation)
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:internal',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:internal')
+            if snmpEngine.observer.isObserved(
+                    'rfc3412.prepareDataElements:internal'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:internal',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:internal')
 
             # 7.2.11c
             smHandler.releaseStateInformation(securityStateReference)
@@ -784,20 +817,22 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
 
                 raise error.StatusInformation(errorIndication=errind.dataMismatch)
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:response',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:response')
+            if snmpEngine.observer.isObserved(
+                    'rfc3412.prepareDataElements:response'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:response',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:response')
 
             # 7.2.12c
             smHandler.releaseStateInformation(securityStateReference)
@@ -835,20 +870,22 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             debug.logger & debug.FLAG_MP and debug.logger(
                 'prepareDataElements: new stateReference %s' % stateReference)
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:confirmed',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:confirmed')
+            if snmpEngine.observer.isObserved(
+                    'rfc3412.prepareDataElements:confirmed'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:confirmed',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:confirmed')
 
             # 7.2.13c
             return (messageProcessingModel, securityModel, securityName,
@@ -863,20 +900,22 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
             # Pass new stateReference to let app browse request details
             stateReference = self._cache.newStateReference()
 
-            snmpEngine.observer.storeExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:unconfirmed',
-                dict(transportDomain=transportDomain,
-                     transportAddress=transportAddress,
-                     securityModel=securityModel,
-                     securityName=securityName,
-                     securityLevel=securityLevel,
-                     contextEngineId=contextEngineId,
-                     contextName=contextName,
-                     securityEngineId=securityEngineId,
-                     pdu=pdu))
-
-            snmpEngine.observer.clearExecutionContext(
-                snmpEngine, 'rfc3412.prepareDataElements:unconfirmed')
+            if snmpEngine.observer.isObserved(
+                    'rfc3412.prepareDataElements:unconfirmed'):
+                snmpEngine.observer.storeExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:unconfirmed',
+                    dict(transportDomain=transportDomain,
+                         transportAddress=transportAddress,
+                         securityModel=securityModel,
+                         securityName=securityName,
+                         securityLevel=securityLevel,
+                         contextEngineId=contextEngineId,
+                         contextName=contextName,
+                         securityEngineId=securityEngineId,
+                         pdu=pdu))
+
+                snmpEngine.observer.clearExecutionContext(
+                    snmpEngine, 'rfc3412.prepareDataElements:unconfirmed')
 
             # This is not specified explicitly in RFC
             smHandler.releaseStateInformation(securityStateReference)
@@ -895,6 +934,12 @@ class SnmpV3MessageProcessingModel(AbstractMessageProcessingModel):
         if self._expirationTimer in self._engineIdCacheExpQueue:
 
             for engineKey in self._engineIdCacheExpQueue[self._expirationTimer]:
+                # entry may have been re-cached with a later deadline
+                peerSnmpEngineData = self._engineIdCache.get(engineKey)
+                if (peerSnmpEngineData is None or
+                        peerSnmpEngineData['expireAt'] != self._expirationTimer):
+                    continue
+
                 del self._engineIdCache[engineKey]
 
                 debug.logger & debug.FLAG_MP and debug.logger(
@@ -583,4 +583,6 @@ class MsgAndPduDispatcher(object):
 
     # noinspection PyUnusedLocal
     def receiveTimerTick(self, snmpEngine, timeNow):
-        self._cache.expire(self.__expireRequest, snmpEngine)
+        self._cache.expire(
+            self.__expireRequest, snmpEngine,
+            snmpEngine.transportDispatcher.getTimerTicks())
@@ -16,6 +16,28 @@ from pyasn1.codec.ber import encoder
 from pyasn1.error import PyAsn1Error
 
 
+def _addRef(refMap, key, value):
+    try:
+        values = refMap[key]
+
+    except KeyError:
+        values = refMap[key] = {}
+
+    values[value] = values.get(value, 0) + 1
+
+
+def _delRef(refMap, key, value):
+    values = refMap[key]
+
+    values[value] -= 1
+
+    if not values[value]:
+        del values[value]
+
+        if not values:
+            del refMap[key]
+
+
 class SnmpV1SecurityModel(base.AbstractSecurityModel):
     SECURITY_MODEL_ID = 1
 
@@ -29,257 +51,249 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         self._transportBranchId = -1
         self._paramsBranchId = -1
         self._communityBranchId = -1
-        self._securityBranchId = -1
 
-        base.AbstractSecurityModel.__init__(self)
+        # securityName -> {securityModel: references}
+        self._nameToModelMap = {}
+        # instId -> (securityName, securityModel)
+        self._paramsRows = {}
+
+        # transport address -> {tag: references}
+        self._transportToTagMap = {}
+        # instId -> (transport address, tags)
+        self._transportRows = {}
+
+        # (securityName, contextEngineId, contextName) -> communityName
+        self._securityMap = {}
+        # (securityName, contextEngineId, contextName) -> {instId: communityName}
+        self._securityRows = {}
+        # communityName -> {tag: references}
+        self._communityToTagMap = {}
+        # (tag, communityName) -> {instId: (securityName, contextEngineId, contextName)}
+        self._tagAndCommunityToSecurityMap = {}
+        # instId -> (communityName, tag, (securityName, contextEngineId, contextName))
+        self._communityRows = {}
 
-    def _sec2com(self, snmpEngine, securityName, contextEngineId, contextName):
-        mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
-
-        snmpTargetParamsSecurityName, = mibBuilder.importSymbols(
-            'SNMP-TARGET-MIB', 'snmpTargetParamsSecurityName')
-
-        if self._paramsBranchId != snmpTargetParamsSecurityName.branchVersionId:
-            snmpTargetParamsSecurityModel, = mibBuilder.importSymbols(
-                'SNMP-TARGET-MIB', 'snmpTargetParamsSecurityModel')
-
-            self._nameToModelMap = {}
+        base.AbstractSecurityModel.__init__(self)
 
-            nextMibNode = snmpTargetParamsSecurityName
+    @staticmethod
+    def _getChangedRows(mibNode, lastVersionId):
+        """Return instance IDs of table rows changed since `lastVersionId`.
 
-            while True:
-                try:
-                    nextMibNode = snmpTargetParamsSecurityName.getNextNode(
-                        nextMibNode.name)
+        Returns `None` if all rows should be re-read.
+        """
+        changes = mibNode.getInstancesChanges(lastVersionId)
 
-                except NoSuchInstanceError:
-                    break
+        if changes is None:
+            debug.logger & debug.FLAG_SM and debug.logger(
+                '_getChangedRows: changes of %s since version %s are '
+                'unknown' % (mibNode.name, lastVersionId))
+            return
 
-                instId = nextMibNode.name[len(snmpTargetParamsSecurityName.name):]
+        return set(changes)
 
-                mibNode = snmpTargetParamsSecurityModel.getNode(
-                    snmpTargetParamsSecurityModel.name + instId)
+    @staticmethod
+    def _getAllRows(mibNode):
+        instIds = []
 
-                try:
-                    if mibNode.syntax not in self._nameToModelMap:
-                        self._nameToModelMap[nextMibNode.syntax] = set()
+        nextMibNode = mibNode
 
-                    self._nameToModelMap[nextMibNode.syntax].add(mibNode.syntax)
+        while True:
+            try:
+                nextMibNode = mibNode.getNextNode(nextMibNode.name)
 
-                except PyAsn1Error:
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        '_sec2com: table entries %r/%r hashing '
-                        'failed' % (nextMibNode.syntax, mibNode.syntax))
-                    continue
+            except NoSuchInstanceError:
+                break
 
-            self._paramsBranchId = snmpTargetParamsSecurityName.branchVersionId
+            instIds.append(nextMibNode.name[len(mibNode.name):])
 
-            # invalidate next map as it include this one
-            self._securityBranchId = -1
+        return instIds
 
-        snmpCommunityName, = mibBuilder.importSymbols(
-            'SNMP-COMMUNITY-MIB', 'snmpCommunityName')
+    def _updateParamsMap(self, mibBuilder):
+        snmpTargetParamsSecurityName, = mibBuilder.importSymbols(
+            'SNMP-TARGET-MIB', 'snmpTargetParamsSecurityName')
 
-        if self._securityBranchId != snmpCommunityName.branchVersionId:
-            (snmpCommunitySecurityName,
-             snmpCommunityContextEngineId,
-             snmpCommunityContextName) = mibBuilder.importSymbols(
-                'SNMP-COMMUNITY-MIB', 'snmpCommunitySecurityName',
-                'snmpCommunityContextEngineID', 'snmpCommunityContextName'
-            )
+        if self._paramsBranchId == snmpTargetParamsSecurityName.branchVersionId:
+            return
 
-            self._securityMap = {}
+        snmpTargetParamsSecurityModel, = mibBuilder.importSymbols(
+            'SNMP-TARGET-MIB', 'snmpTargetParamsSecurityModel')
 
-            nextMibNode = snmpCommunityName
+        instIds = self._getChangedRows(
+            snmpTargetParamsSecurityName, self._paramsBranchId)
 
-            while True:
-                try:
-                    nextMibNode = snmpCommunityName.getNextNode(nextMibNode.name)
+        if instIds is None:
+            self._nameToModelMap.clear()
+            self._paramsRows.clear()
 
-                except NoSuchInstanceError:
-                    break
+            instIds = self._getAllRows(snmpTargetParamsSecurityName)
 
-                instId = nextMibNode.name[len(snmpCommunityName.name):]
+        for instId in instIds:
+            if instId in self._paramsRows:
+                _delRef(self._nameToModelMap, *self._paramsRows.pop(instId))
 
-                _securityName = snmpCommunitySecurityName.getNode(
-                    snmpCommunitySecurityName.name + instId).syntax
+            try:
+                securityName = snmpTargetParamsSecurityName.getNode(
+                    snmpTargetParamsSecurityName.name + instId).syntax
 
-                _contextEngineId = snmpCommunityContextEngineId.getNode(
-                    snmpCommunityContextEngineId.name + instId).syntax
+                securityModel = snmpTargetParamsSecurityModel.getNode(
+                    snmpTargetParamsSecurityModel.name + instId).syntax
 
-                _contextName = snmpCommunityContextName.getNode(
-                    snmpCommunityContextName.name + instId).syntax
+            except NoSuchInstanceError:
+                continue
 
-                key = _securityName, _contextEngineId, _contextName
+            try:
+                hash((securityName, securityModel))
 
-                try:
-                    self._securityMap[key] = nextMibNode.syntax
-
-                except PyAsn1Error:
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        '_sec2com: table entries %r/%r/%r hashing failed' % key)
-                    continue
+            except PyAsn1Error:
+                debug.logger & debug.FLAG_SM and debug.logger(
+                    '_updateParamsMap: table entries %r/%r hashing '
+                    'failed' % (securityName, securityModel))
+                continue
 
-            self._securityBranchId = snmpCommunityName.branchVersionId
+            _addRef(self._nameToModelMap, securityName, securityModel)
 
-            debug.logger & debug.FLAG_SM and debug.logger(
-                '_sec2com: built securityName to communityName map, version '
-                '%s: %s' % (self._securityBranchId, self._securityMap))
+            self._paramsRows[instId] = securityName, securityModel
 
-        key = securityName, contextEngineId, contextName
-
-        try:
-            return self._securityMap[key]
+        self._paramsBranchId = snmpTargetParamsSecurityName.branchVersionId
 
-        except KeyError:
-            raise error.StatusInformation(
-                errorIndication=errind.unknownCommunityName)
-
-    def _com2sec(self, snmpEngine, communityName, transportInformation):
-        mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+        debug.logger & debug.FLAG_SM and debug.logger(
+            '_updateParamsMap: updated securityName to securityModel map, '
+            'version %s: %s' % (self._paramsBranchId, self._nameToModelMap))
 
+    def _updateTransportMap(self, mibBuilder):
         snmpTargetAddrTAddress, = mibBuilder.importSymbols(
             'SNMP-TARGET-MIB', 'snmpTargetAddrTAddress')
 
-        if self._transportBranchId != snmpTargetAddrTAddress.branchVersionId:
-            (SnmpTagValue, snmpTargetAddrTDomain,
-             snmpTargetAddrTagList) = mibBuilder.importSymbols(
-                'SNMP-TARGET-MIB', 'SnmpTagValue', 'snmpTargetAddrTDomain',
-                'snmpTargetAddrTagList')
+        if self._transportBranchId == snmpTargetAddrTAddress.branchVersionId:
+            return
+
+        (SnmpTagValue, snmpTargetAddrTDomain,
+         snmpTargetAddrTagList) = mibBuilder.importSymbols(
+            'SNMP-TARGET-MIB', 'SnmpTagValue', 'snmpTargetAddrTDomain',
+            'snmpTargetAddrTagList')
 
-            self._emptyTag = SnmpTagValue('')
+        self._emptyTag = SnmpTagValue('')
 
-            self._transportToTagMap = {}
+        instIds = self._getChangedRows(
+            snmpTargetAddrTAddress, self._transportBranchId)
 
-            nextMibNode = snmpTargetAddrTagList
+        if instIds is None:
+            self._transportToTagMap.clear()
+            self._transportRows.clear()
 
-            while True:
-                try:
-                    nextMibNode = snmpTargetAddrTagList.getNextNode(nextMibNode.name)
+            instIds = self._getAllRows(snmpTargetAddrTAddress)
 
-                except NoSuchInstanceError:
-                    break
+        for instId in instIds:
+            if instId in self._transportRows:
+                targetAddr, tags = self._transportRows.pop(instId)
 
-                instId = nextMibNode.name[len(snmpTargetAddrTagList.name):]
+                for tag in tags:
+                    _delRef(self._transportToTagMap, targetAddr, tag)
 
+            try:
                 targetAddrTDomain = snmpTargetAddrTDomain.getNode(
                     snmpTargetAddrTDomain.name + instId).syntax
                 targetAddrTAddress = snmpTargetAddrTAddress.getNode(
                     snmpTargetAddrTAddress.name + instId).syntax
-
-                targetAddrTDomain = tuple(targetAddrTDomain)
-
-                if (targetAddrTDomain[:len(udp.SNMP_UDP_DOMAIN)] ==
-                        udp.SNMP_UDP_DOMAIN):
-                    SnmpUDPAddress, = mibBuilder.importSymbols(
-                        'SNMPv2-TM', 'SnmpUDPAddress')
-                    targetAddrTAddress = tuple(SnmpUDPAddress(targetAddrTAddress))
-
-                elif (targetAddrTDomain[:len(udp6.SNMP_UDP6_DOMAIN)] ==
-                        udp6.SNMP_UDP6_DOMAIN):
-                    TransportAddressIPv6, = mibBuilder.importSymbols(
-                        'TRANSPORT-ADDRESS-MIB', 'TransportAddressIPv6')
-
-                    targetAddrTAddress = tuple(TransportAddressIPv6(targetAddrTAddress))
-
-                targetAddr = targetAddrTDomain, targetAddrTAddress
-
                 targetAddrTagList = snmpTargetAddrTagList.getNode(
                     snmpTargetAddrTagList.name + instId).syntax
 
-                if targetAddr not in self._transportToTagMap:
-                    self._transportToTagMap[targetAddr] = set()
+            except NoSuchInstanceError:
+                continue
 
-                try:
-                    if targetAddrTagList:
-                        self._transportToTagMap[targetAddr].update(
-                            [SnmpTagValue(x)
-                             for x in targetAddrTagList.asOctets().split()])
+            targetAddrTDomain = tuple(targetAddrTDomain)
 
-                    else:
-                        self._transportToTagMap[targetAddr].add(self._emptyTag)
+            if (targetAddrTDomain[:len(udp.SNMP_UDP_DOMAIN)] ==
+                    udp.SNMP_UDP_DOMAIN):
+                SnmpUDPAddress, = mibBuilder.importSymbols(
+                    'SNMPv2-TM', 'SnmpUDPAddress')
+                targetAddrTAddress = tuple(SnmpUDPAddress(targetAddrTAddress))
 
-                except PyAsn1Error:
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        '_com2sec: table entries %r/%r hashing failed' % (
-                            targetAddr, targetAddrTagList))
-                    continue
+            elif (targetAddrTDomain[:len(udp6.SNMP_UDP6_DOMAIN)] ==
+                    udp6.SNMP_UDP6_DOMAIN):
+                TransportAddressIPv6, = mibBuilder.importSymbols(
+                    'TRANSPORT-ADDRESS-MIB', 'TransportAddressIPv6')
 
-            self._transportBranchId = snmpTargetAddrTAddress.branchVersionId
+                targetAddrTAddress = tuple(TransportAddressIPv6(targetAddrTAddress))
 
-            debug.logger & debug.FLAG_SM and debug.logger(
-                '_com2sec: built transport-to-tag map version %s: '
-                '%s' % (self._transportBranchId, self._transportToTagMap))
+            targetAddr = targetAddrTDomain, targetAddrTAddress
 
-        snmpTargetParamsSecurityName, = mibBuilder.importSymbols(
-            'SNMP-TARGET-MIB', 'snmpTargetParamsSecurityName')
+            try:
+                if targetAddrTagList:
+                    tags = [SnmpTagValue(x)
+                            for x in targetAddrTagList.asOctets().split()]
+
+                else:
+                    tags = [self._emptyTag]
+
+                hash((targetAddr, tuple(tags)))
 
-        if self._paramsBranchId != snmpTargetParamsSecurityName.branchVersionId:
-            snmpTargetParamsSecurityModel, = mibBuilder.importSymbols(
-                'SNMP-TARGET-MIB', 'snmpTargetParamsSecurityModel')
+            except PyAsn1Error:
+                debug.logger & debug.FLAG_SM and debug.logger(
+                    '_updateTransportMap: table entries %r/%r hashing '
+                    'failed' % (targetAddr, targetAddrTagList))
+                continue
 
-            self._nameToModelMap = {}
+            for tag in tags:
+                _addRef(self._transportToTagMap, targetAddr, tag)
 
-            nextMibNode = snmpTargetParamsSecurityName
+            self._transportRows[instId] = targetAddr, tags
 
-            while True:
-                try:
-                    nextMibNode = snmpTargetParamsSecurityName.getNextNode(nextMibNode.name)
+        self._transportBranchId = snmpTargetAddrTAddress.branchVersionId
 
-                except NoSuchInstanceError:
-                    break
+        debug.logger & debug.FLAG_SM and debug.logger(
+            '_updateTransportMap: updated transport-to-tag map version %s: '
+            '%s' % (self._transportBranchId, self._transportToTagMap))
 
-                instId = nextMibNode.name[len(snmpTargetParamsSecurityName.name):]
+    def _updateCommunityMaps(self, mibBuilder):
+        snmpCommunityName, = mibBuilder.importSymbols(
+            'SNMP-COMMUNITY-MIB', 'snmpCommunityName')
 
-                mibNode = snmpTargetParamsSecurityModel.getNode(
-                    snmpTargetParamsSecurityModel.name + instId)
+        if self._communityBranchId == snmpCommunityName.branchVersionId:
+            return
 
-                try:
-                    if nextMibNode.syntax not in self._nameToModelMap:
-                        self._nameToModelMap[nextMibNode.syntax] = set()
+        (snmpCommunitySecurityName, snmpCommunityContextEngineId,
+         snmpCommunityContextName,
+         snmpCommunityTransportTag) = mibBuilder.importSymbols(
+            'SNMP-COMMUNITY-MIB', 'snmpCommunitySecurityName',
+            'snmpCommunityContextEngineID', 'snmpCommunityContextName',
+            'snmpCommunityTransportTag'
+        )
 
-                    self._nameToModelMap[nextMibNode.syntax].add(mibNode.syntax)
+        instIds = self._getChangedRows(
+            snmpCommunityName, self._communityBranchId)
 
-                except PyAsn1Error:
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        '_com2sec: table entries %r/%r hashing '
-                        'failed' % (nextMibNode.syntax, mibNode.syntax))
-                    continue
+        if instIds is None:
+            self._securityMap.clear()
+            self._securityRows.clear()
+            self._communityToTagMap.clear()
+            self._tagAndCommunityToSecurityMap.clear()
+            self._communityRows.clear()
 
-            self._paramsBranchId = snmpTargetParamsSecurityName.branchVersionId
+            instIds = self._getAllRows(snmpCommunityName)
 
-            # invalidate next map as it include this one
-            self._communityBranchId = -1
+        securityKeys = set()
 
-            debug.logger & debug.FLAG_SM and debug.logger(
-                '_com2sec: built securityName to securityModel map, version '
-                '%s: %s' % (self._paramsBranchId, self._nameToModelMap))
+        for instId in instIds:
+            if instId in self._communityRows:
+                communityName, transportTag, securityKey = self._communityRows.pop(instId)
 
-        snmpCommunityName, = mibBuilder.importSymbols(
-            'SNMP-COMMUNITY-MIB', 'snmpCommunityName')
+                tagAndCommunity = transportTag, communityName
 
-        if self._communityBranchId != snmpCommunityName.branchVersionId:
-            (snmpCommunitySecurityName, snmpCommunityContextEngineId,
-             snmpCommunityContextName,
-             snmpCommunityTransportTag) = mibBuilder.importSymbols(
-                'SNMP-COMMUNITY-MIB', 'snmpCommunitySecurityName',
-                'snmpCommunityContextEngineID', 'snmpCommunityContextName',
-                'snmpCommunityTransportTag'
-            )
+                del self._tagAndCommunityToSecurityMap[tagAndCommunity][instId]
 
-            self._communityToTagMap = {}
-            self._tagAndCommunityToSecurityMap = {}
+                if not self._tagAndCommunityToSecurityMap[tagAndCommunity]:
+                    del self._tagAndCommunityToSecurityMap[tagAndCommunity]
 
-            nextMibNode = snmpCommunityName
+                _delRef(self._communityToTagMap, communityName, transportTag)
 
-            while True:
-                try:
-                    nextMibNode = snmpCommunityName.getNextNode(nextMibNode.name)
+                del self._securityRows[securityKey][instId]
 
-                except NoSuchInstanceError:
-                    break
+                securityKeys.add(securityKey)
 
-                instId = nextMibNode.name[len(snmpCommunityName.name):]
+            try:
+                communityName = snmpCommunityName.getNode(
+                    snmpCommunityName.name + instId).syntax
 
                 securityName = snmpCommunitySecurityName.getNode(
                     snmpCommunitySecurityName.name + instId).syntax
@@ -293,44 +307,94 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
                 transportTag = snmpCommunityTransportTag.getNode(
                     snmpCommunityTransportTag.name + instId).syntax
 
-                _tagAndCommunity = transportTag, nextMibNode.syntax
+            except NoSuchInstanceError:
+                continue
 
-                try:
-                    if _tagAndCommunity not in self._tagAndCommunityToSecurityMap:
-                        self._tagAndCommunityToSecurityMap[_tagAndCommunity] = set()
+            securityKey = securityName, contextEngineId, contextName
 
-                    self._tagAndCommunityToSecurityMap[_tagAndCommunity].add(
-                        (securityName, contextEngineId, contextName))
+            try:
+                hash((transportTag, communityName, securityKey))
 
-                    if nextMibNode.syntax not in self._communityToTagMap:
-                        self._communityToTagMap[nextMibNode.syntax] = set()
+            except PyAsn1Error:
+                debug.logger & debug.FLAG_SM and debug.logger(
+                    '_updateCommunityMaps: table entries %r/%r/%r hashing '
+                    'failed' % (transportTag, communityName, securityKey))
+                continue
 
-                    self._communityToTagMap[nextMibNode.syntax].add(transportTag)
+            tagAndCommunity = transportTag, communityName
 
-                except PyAsn1Error:
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        '_com2sec: table entries %r/%r hashing '
-                        'failed' % (_tagAndCommunity, nextMibNode.syntax))
-                    continue
+            if tagAndCommunity not in self._tagAndCommunityToSecurityMap:
+                self._tagAndCommunityToSecurityMap[tagAndCommunity] = {}
 
-            self._communityBranchId = snmpCommunityName.branchVersionId
+            self._tagAndCommunityToSecurityMap[tagAndCommunity][instId] = securityKey
 
-            debug.logger & debug.FLAG_SM and debug.logger(
-                '_com2sec: built communityName to tag map '
-                '(securityModel %s), version %s: '
-                '%s' % (self.SECURITY_MODEL_ID, self._communityBranchId,
-                        self._communityToTagMap))
+            _addRef(self._communityToTagMap, communityName, transportTag)
 
-            debug.logger & debug.FLAG_SM and debug.logger(
-                '_com2sec: built tag & community to securityName map '
-                '(securityModel %s), version %s: '
-                '%s' % (self.SECURITY_MODEL_ID, self._communityBranchId,
-                        self._tagAndCommunityToSecurityMap))
+            if securityKey not in self._securityRows:
+                self._securityRows[securityKey] = {}
+
+            self._securityRows[securityKey][instId] = communityName
+
+            securityKeys.add(securityKey)
+
+            self._communityRows[instId] = communityName, transportTag, securityKey
+
+        # the last of the rows with the same securityName & context wins
+        for securityKey in securityKeys:
+            rows = self._securityRows.get(securityKey)
+
+            if rows:
+                self._securityMap[securityKey] = rows[max(rows)]
+
+            else:
+                self._securityRows.pop(securityKey, None)
+                self._securityMap.pop(securityKey, None)
+
+        self._communityBranchId = snmpCommunityName.branchVersionId
+
+        debug.logger & debug.FLAG_SM and debug.logger(
+            '_updateCommunityMaps: updated securityName to communityName map, '
+            'version %s: %s' % (self._communityBranchId, self._securityMap))
+
+        debug.logger & debug.FLAG_SM and debug.logger(
+            '_updateCommunityMaps: updated communityName to tag map '
+            '(securityModel %s), version %s: '
+            '%s' % (self.SECURITY_MODEL_ID, self._communityBranchId,
+                    self._communityToTagMap))
+
+        debug.logger & debug.FLAG_SM and debug.logger(
+            '_updateCommunityMaps: updated tag & community to securityName map '
+            '(securityModel %s), version %s: '
+            '%s' % (self.SECURITY_MODEL_ID, self._communityBranchId,
+                    self._tagAndCommunityToSecurityMap))
+
+    def _sec2com(self, snmpEngine, securityName, contextEngineId, contextName):
+        mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+        self._updateCommunityMaps(mibBuilder)
+
+        key = securityName, contextEngineId, contextName
+
+        try:
+            return self._securityMap[key]
+
+        except KeyError:
+            raise error.StatusInformation(
+                errorIndication=errind.unknownCommunityName)
+
+    def _com2sec(self, snmpEngine, communityName, transportInformation):
+        mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
+
+        self._updateTransportMap(mibBuilder)
+        self._updateParamsMap(mibBuilder)
+        self._updateCommunityMaps(mibBuilder)
 
         if communityName in self._communityToTagMap:
             if transportInformation in self._transportToTagMap:
-                tags = self._transportToTagMap[transportInformation].intersection(
-                    self._communityToTagMap[communityName])
+                transportTags = self._transportToTagMap[transportInformation]
+
+                tags = [t for t in self._communityToTagMap[communityName]
+                        if t in transportTags]
 
             elif self._emptyTag in self._communityToTagMap[communityName]:
                 tags = [self._emptyTag]
@@ -339,15 +403,13 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
                 raise error.StatusInformation(
                     errorIndication=errind.unknownCommunityName)
 
-            candidateSecurityNames = []
+            rows = {}
 
-            securityNamesSets = [
-                self._tagAndCommunityToSecurityMap[(t, communityName)]
-                for t in tags
-            ]
+            for t in tags:
+                rows.update(self._tagAndCommunityToSecurityMap[(t, communityName)])
 
-            for x in securityNamesSets:
-                candidateSecurityNames.extend(list(x))
+            # ties are resolved in favor of the first row in the table
+            candidateSecurityNames = [rows[instId] for instId in sorted(rows)]
 
             if candidateSecurityNames:
                 candidateSecurityNames.sort(key=self._orderSecurityNames)
@@ -455,16 +517,21 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
         # rfc2576: 5.2.1
         communityName, transportInformation = securityParameters
 
-        scope = dict(communityName=communityName,
-                     transportInformation=transportInformation)
+        if snmpEngine.observer.isObserved(
+                'rfc2576.processIncomingMsg:writable'):
+            scope = dict(communityName=communityName,
+                         transportInformation=transportInformation)
 
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine, 'rfc2576.processIncomingMsg:writable', scope
-        )
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine, 'rfc2576.processIncomingMsg:writable', scope
+            )
 
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc2576.processIncomingMsg:writable'
-        )
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc2576.processIncomingMsg:writable'
+            )
+
+        else:
+            scope = {}
 
         try:
             securityName, contextEngineId, contextName = self._com2sec(
@@ -487,19 +554,20 @@ class SnmpV1SecurityModel(base.AbstractSecurityModel):
 
         securityEngineID = snmpEngineID.syntax
 
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine, 'rfc2576.processIncomingMsg',
-            dict(transportInformation=transportInformation,
-                 securityEngineId=securityEngineID,
-                 securityName=securityName,
-                 communityName=communityName,
-                 contextEngineId=contextEngineId,
-                 contextName=contextName)
-        )
+        if snmpEngine.observer.isObserved('rfc2576.processIncomingMsg'):
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine, 'rfc2576.processIncomingMsg',
+                dict(transportInformation=transportInformation,
+                     securityEngineId=securityEngineID,
+                     securityName=securityName,
+                     communityName=communityName,
+                     contextEngineId=contextEngineId,
+                     contextName=contextName)
+            )
 
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc2576.processIncomingMsg'
-        )
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc2576.processIncomingMsg'
+            )
 
         debug.logger & debug.FLAG_SM and debug.logger(
             'processIncomingMsg: looked up securityName %r securityModel %r '
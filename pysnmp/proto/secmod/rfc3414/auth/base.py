@@ -4,6 +4,9 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import hmac
+
+from pysnmp import cache
 from pysnmp.proto import errind
 from pysnmp.proto import error
 
@@ -11,6 +14,12 @@ from pysnmp.proto import error
 class AbstractAuthenticationService(object):
     SERVICE_ID = None
 
+    # max number of localized keys to keep HMAC state for
+    HMAC_CACHE_SIZE = 1024
+
+    def __init__(self):
+        self._hmacCache = cache.Cache(self.HMAC_CACHE_SIZE)
+
     def hashPassphrase(self, authKey):
         raise error.ProtocolError(errind.noAuthentication)
 
@@ -28,3 +37,23 @@ class AbstractAuthenticationService(object):
     # 7.2.4.2
     def authenticateIncomingMsg(self, authKey, authParameters, wholeMsg):
         raise error.ProtocolError(errind.noAuthentication)
+
+    def _hmacDigest(self, authKey, wholeMsg, hashFunc):
+        """Compute HMAC digest of `wholeMsg`.
+
+        The HMAC object keyed by the inner and outer pads is built
+        once per localized key, then just copied per message.
+        """
+        authKey = authKey.asOctets()
+
+        try:
+            mac = self._hmacCache[authKey]
+
+        except KeyError:
+            mac = self._hmacCache[authKey] = hmac.new(
+                authKey, None, hashFunc)
+
+        mac = mac.copy()
+        mac.update(wholeMsg)
+
+        return mac.digest()
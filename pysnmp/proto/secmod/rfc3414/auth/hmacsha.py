@@ -14,7 +14,6 @@ from pysnmp.proto.secmod.rfc3414 import localkey
 from pysnmp.proto.secmod.rfc3414.auth import base
 
 TWELVE_ZEROS = univ.OctetString((0,) * 12).asOctets()
-FORTY_FOUR_ZEROS = (0,) * 44
 
 
 # 7.2.4
@@ -22,9 +21,6 @@ FORTY_FOUR_ZEROS = (0,) * 44
 class HmacSha(base.AbstractAuthenticationService):
     SERVICE_ID = (1, 3, 6, 1, 6, 3, 10, 1, 1, 3)  # usmHMACSHAAuthProtocol
 
-    IPAD = [0x36] * 64
-    OPAD = [0x5C] * 64
-
     def hashPassphrase(self, authKey):
         return localkey.hashPassphraseSHA(authKey)
 
@@ -49,27 +45,10 @@ class HmacSha(base.AbstractAuthenticationService):
         wholeHead = wholeMsg[:ln]
         wholeTail = wholeMsg[ln + 12:]
 
-        # 7.3.1.2a
-        extendedAuthKey = authKey.asNumbers() + FORTY_FOUR_ZEROS
-
-        # 7.3.1.2b -- no-op
-
-        # 7.3.1.2c
-        k1 = univ.OctetString(
-            map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
-
-        # 7.3.1.2d -- no-op
-
-        # 7.3.1.2e
-        k2 = univ.OctetString(
-            map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
-
-        # 7.3.1.3
-        d1 = sha1(k1.asOctets() + wholeMsg).digest()
+        # 7.3.1.2 -- HMAC pads are precomputed per key
 
-        # 7.3.1.4
-        d2 = sha1(k2.asOctets() + d1).digest()
-        mac = d2[:12]
+        # 7.3.1.3 & 4
+        mac = self._hmacDigest(authKey, wholeMsg, sha1)[:12]
 
         # 7.3.1.5 & 6
         return wholeHead + mac + wholeTail
@@ -91,29 +70,10 @@ class HmacSha(base.AbstractAuthenticationService):
 
         authenticatedWholeMsg = wholeHead + TWELVE_ZEROS + wholeTail
 
-        # 7.3.2.4a
-        extendedAuthKey = authKey.asNumbers() + FORTY_FOUR_ZEROS
-
-        # 7.3.2.4b --> no-op
-
-        # 7.3.2.4c
-        k1 = univ.OctetString(
-            map(lambda x, y: x ^ y, extendedAuthKey, self.IPAD))
-
-        # 7.3.2.4d --> no-op
-
-        # 7.3.2.4e
-        k2 = univ.OctetString(
-            map(lambda x, y: x ^ y, extendedAuthKey, self.OPAD))
-
-        # 7.3.2.5a
-        d1 = sha1(k1.asOctets() + authenticatedWholeMsg).digest()
-
-        # 7.3.2.5b
-        d2 = sha1(k2.asOctets() + d1).digest()
+        # 7.3.2.4 -- HMAC pads are precomputed per key
 
-        # 7.3.2.5c
-        mac = d2[:12]
+        # 7.3.2.5
+        mac = self._hmacDigest(authKey, authenticatedWholeMsg, sha1)[:12]
 
         # 7.3.2.6
         if mac != authParameters:
@@ -4,15 +4,108 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import binascii
+import os
+import shutil
+import tempfile
 from hashlib import md5
 from hashlib import sha1
+from hashlib import sha256
 
 from pyasn1.type import univ
 
+from pysnmp import debug
+
+
+class KeyCache(object):
+    """Passphrase to master key cache.
+
+    Turning a passphrase into a master key (RFC3414 A.2) takes a
+    megabyte of hashing. This cache remembers master keys by hash
+    algorithm and passphrase digest so that the same passphrase is
+    never hashed twice. Localized keys are not cached as localizing
+    a master key takes just one hash operation.
+
+    If `path` is given, cached keys are read from and can be
+    :py:meth:`save`'d into that file. Keep in mind that the file
+    contents are just as sensitive as the passphrases themselves.
+    """
+    def __init__(self, path=None):
+        self._path = path
+        self._keys = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        return len(self._keys)
+
+    @staticmethod
+    def _getCacheKey(passphrase, hashFunc):
+        return hashFunc().name, sha256(passphrase).hexdigest()
+
+    def get(self, passphrase, hashFunc):
+        return self._keys.get(self._getCacheKey(passphrase, hashFunc))
+
+    def set(self, passphrase, hashFunc, masterKey):
+        self._keys[self._getCacheKey(passphrase, hashFunc)] = masterKey
+
+    def items(self):
+        return list(self._keys.items())
+
+    def update(self, items):
+        self._keys.update(items)
+
+    def load(self):
+        with open(self._path) as f:
+            for line in f:
+                try:
+                    hashName, digest, masterKey = line.split()
+
+                    self._keys[(hashName, digest)] = binascii.unhexlify(
+                        masterKey)
+
+                except (ValueError, TypeError):
+                    debug.logger & debug.FLAG_SM and debug.logger(
+                        'KeyCache: skipping malformed line in %s' % self._path)
+
+    def save(self):
+        dirName = os.path.dirname(os.path.abspath(self._path))
+
+        fd, fn = tempfile.mkstemp(dir=dirName)
+
+        try:
+            for (hashName, digest), masterKey in self._keys.items():
+                os.write(fd, ('%s %s %s\n' % (
+                    hashName, digest,
+                    binascii.hexlify(masterKey).decode())).encode())
+
+        finally:
+            os.close(fd)
+
+        shutil.move(fn, self._path)
+
+
+_keyCache = KeyCache()
+
+
+def getKeyCache():
+    return _keyCache
+
+
+def setKeyCache(keyCache):
+    """Replace master keys cache e.g. with a persistent one"""
+    global _keyCache
+    _keyCache = keyCache
+
 
 def hashPassphrase(passphrase, hashFunc):
     passphrase = univ.OctetString(passphrase).asOctets()
 
+    masterKey = _keyCache.get(passphrase, hashFunc)
+    if masterKey is not None:
+        return univ.OctetString(masterKey)
+
     hasher = hashFunc()
 
     ringBuffer = passphrase * (64 // len(passphrase) + 1)
@@ -37,6 +130,9 @@ def hashPassphrase(passphrase, hashFunc):
 
         count += 1
     digest = hasher.digest()
+
+    _keyCache.set(passphrase, hashFunc, digest)
+
     return univ.OctetString(digest)
 
 
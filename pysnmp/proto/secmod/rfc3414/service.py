@@ -106,6 +106,13 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         self._expirationTimer = 0
         self._paramsBranchId = -1
 
+        # (snmpEngineId, securityName) -> userName
+        self._securityToUserMap = {}
+        # (snmpEngineId, securityName) -> {instId: userName}
+        self._securityToUserRows = {}
+        # instId -> (snmpEngineId, securityName)
+        self._userRows = {}
+
     def _sec2usr(self, snmpEngine, securityName, securityEngineID=None):
         mibBuilder = snmpEngine.msgAndPduDsp.mibInstrumController.mibBuilder
 
@@ -116,37 +123,78 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
             usmUserName, usmUserSecurityName = mibBuilder.importSymbols(
                 'SNMP-USER-BASED-SM-MIB', 'usmUserName', 'usmUserSecurityName')
 
-            self._securityToUserMap = {}
+            changes = usmUserEngineID.getInstancesChanges(self._paramsBranchId)
+
+            if changes is None:
+                self._securityToUserMap.clear()
+                self._securityToUserRows.clear()
+                self._userRows.clear()
+
+                instIds = []
+
+                nextMibNode = usmUserEngineID
+
+                while True:
+                    try:
+                        nextMibNode = usmUserEngineID.getNextNode(nextMibNode.name)
+
+                    except NoSuchInstanceError:
+                        break
+
+                    instIds.append(nextMibNode.name[len(usmUserEngineID.name):])
+
+            else:
+                instIds = set(changes)
+
+            keys = set()
+
+            for instId in instIds:
+                if instId in self._userRows:
+                    k = self._userRows.pop(instId)
 
-            nextMibNode = usmUserEngineID
+                    del self._securityToUserRows[k][instId]
+
+                    keys.add(k)
 
-            while True:
                 try:
-                    nextMibNode = usmUserEngineID.getNextNode(nextMibNode.name)
+                    _engineID = usmUserEngineID.getNode(
+                        usmUserEngineID.name + instId).syntax
+                    _userName = usmUserName.getNode(
+                        usmUserName.name + instId).syntax
+                    _securityName = usmUserSecurityName.getNode(
+                        usmUserSecurityName.name + instId).syntax
 
                 except NoSuchInstanceError:
-                    self._paramsBranchId = usmUserEngineID.branchVersionId
+                    continue
 
-                    debug.logger & debug.FLAG_SM and debug.logger(
-                        '_sec2usr: built snmpEngineId + securityName to '
-                        'userName map, version %s: %r' % (
-                            self._paramsBranchId, self._securityToUserMap))
-                    break
+                k = _engineID, _securityName
 
-                instId = nextMibNode.name[len(usmUserSecurityName.name):]
+                if k not in self._securityToUserRows:
+                    self._securityToUserRows[k] = {}
 
-                _engineID = usmUserEngineID.getNode(
-                    usmUserEngineID.name + instId).syntax
-                _userName = usmUserName.getNode(
-                    usmUserName.name + instId).syntax
-                _securityName = usmUserSecurityName.getNode(
-                    usmUserSecurityName.name + instId).syntax
+                self._securityToUserRows[k][instId] = _userName
 
-                k = _engineID, _securityName
+                keys.add(k)
+
+                self._userRows[instId] = k
+
+            # first (lesser) securityName wins
+            for k in keys:
+                rows = self._securityToUserRows.get(k)
 
-                # first (lesser) securityName wins
-                if k not in self._securityToUserMap:
-                    self._securityToUserMap[k] = _userName
+                if rows:
+                    self._securityToUserMap[k] = rows[min(rows)]
+
+                else:
+                    self._securityToUserRows.pop(k, None)
+                    self._securityToUserMap.pop(k, None)
+
+            self._paramsBranchId = usmUserEngineID.branchVersionId
+
+            debug.logger & debug.FLAG_SM and debug.logger(
+                '_sec2usr: updated snmpEngineId + securityName to '
+                'userName map, version %s: %r' % (
+                    self._paramsBranchId, self._securityToUserMap))
 
         if securityEngineID is None:
             snmpEngineID, = mibBuilder.importSymbols(
@@ -978,20 +1026,21 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         msgAuthoritativeEngineBoots = securityParameters.getComponentByPosition(1)
         msgAuthoritativeEngineTime = securityParameters.getComponentByPosition(2)
 
-        snmpEngine.observer.storeExecutionContext(
-            snmpEngine, 'rfc3414.processIncomingMsg',
-            dict(securityEngineId=msgAuthoritativeEngineId,
-                 snmpEngineBoots=msgAuthoritativeEngineBoots,
-                 snmpEngineTime=msgAuthoritativeEngineTime,
-                 userName=usmUserName,
-                 securityName=usmUserSecurityName,
-                 authProtocol=usmUserAuthProtocol,
-                 authKey=usmUserAuthKeyLocalized,
-                 privProtocol=usmUserPrivProtocol,
-                 privKey=usmUserPrivKeyLocalized)
-        )
-        snmpEngine.observer.clearExecutionContext(
-            snmpEngine, 'rfc3414.processIncomingMsg')
+        if snmpEngine.observer.isObserved('rfc3414.processIncomingMsg'):
+            snmpEngine.observer.storeExecutionContext(
+                snmpEngine, 'rfc3414.processIncomingMsg',
+                dict(securityEngineId=msgAuthoritativeEngineId,
+                     snmpEngineBoots=msgAuthoritativeEngineBoots,
+                     snmpEngineTime=msgAuthoritativeEngineTime,
+                     userName=usmUserName,
+                     securityName=usmUserSecurityName,
+                     authProtocol=usmUserAuthProtocol,
+                     authKey=usmUserAuthKeyLocalized,
+                     privProtocol=usmUserPrivProtocol,
+                     privKey=usmUserPrivKeyLocalized)
+            )
+            snmpEngine.observer.clearExecutionContext(
+                snmpEngine, 'rfc3414.processIncomingMsg')
 
         # 3.2.5
         if msgAuthoritativeEngineId == snmpEngineID:
@@ -1080,22 +1129,10 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 'processIncomingMsg: incoming msg authenticated')
 
             # synchronize time with authed peer
-            self._timeline[msgAuthoritativeEngineId] = (
+            self._storeTimelineInfo(
+                snmpEngine, msgAuthoritativeEngineId,
                 securityParameters.getComponentByPosition(1),
-                securityParameters.getComponentByPosition(2),
-                securityParameters.getComponentByPosition(2),
-                int(time.time())
-            )
-
-            timerResolution = (snmpEngine.transportDispatcher is None and 1.0 or
-                               snmpEngine.transportDispatcher.getTimerResolution())
-
-            expireAt = int(self._expirationTimer + 300 / timerResolution)
-
-            if expireAt not in self._timelineExpQueue:
-                self._timelineExpQueue[expireAt] = []
-
-            self._timelineExpQueue[expireAt].append(msgAuthoritativeEngineId)
+                securityParameters.getComponentByPosition(2))
 
             debug.logger & debug.FLAG_SM and debug.logger(
                 'processIncomingMsg: store timeline for securityEngineID '
@@ -1170,23 +1207,10 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
                 if (msgAuthoritativeEngineBoots > snmpEngineBoots or
                         msgAuthoritativeEngineBoots == snmpEngineBoots and
                         msgAuthoritativeEngineTime > latestReceivedEngineTime):
-                    self._timeline[msgAuthoritativeEngineId] = (
+                    self._storeTimelineInfo(
+                        snmpEngine, msgAuthoritativeEngineId,
                         msgAuthoritativeEngineBoots,
-                        msgAuthoritativeEngineTime,
-                        msgAuthoritativeEngineTime,
-                        int(time.time())
-                    )
-
-                    timerResolution = (
-                            snmpEngine.transportDispatcher is None and 1.0 or
-                           snmpEngine.transportDispatcher.getTimerResolution())
-
-                    expireAt = int(self._expirationTimer + 300 / timerResolution)
-
-                    if expireAt not in self._timelineExpQueue:
-                        self._timelineExpQueue[expireAt] = []
-
-                    self._timelineExpQueue[expireAt].append(msgAuthoritativeEngineId)
+                        msgAuthoritativeEngineTime)
 
                     debug.logger & debug.FLAG_SM and debug.logger(
                         'processIncomingMsg: stored timeline '
@@ -1315,6 +1339,47 @@ class SnmpUSMSecurityModel(AbstractSecurityModel):
         return (msgAuthoritativeEngineId, securityName, scopedPDU,
                 maxSizeResponseScopedPDU, securityStateReference)
 
+    def getTimelineInfo(self, securityEngineId):
+        """Return estimated (snmpEngineBoots, snmpEngineTime) of peer SNMP engine
+
+        Returns `None` if peer SNMP engine timeline is not known.
+        """
+        if securityEngineId not in self._timeline:
+            return
+
+        (snmpEngineBoots, snmpEngineTime,
+         latestReceivedEngineTime,
+         latestUpdateTimestamp) = self._timeline[securityEngineId]
+
+        idleTime = int(time.time()) - latestUpdateTimestamp
+
+        return int(snmpEngineBoots), int(snmpEngineTime) + idleTime
+
+    def setTimelineInfo(self, snmpEngine, securityEngineId,
+                        snmpEngineBoots, snmpEngineTime):
+        """Store peer SNMP engine timeline as if it has been synchronized"""
+        self._storeTimelineInfo(
+            snmpEngine, securityEngineId, snmpEngineBoots, snmpEngineTime)
+
+    def _storeTimelineInfo(self, snmpEngine, securityEngineId,
+                           snmpEngineBoots, snmpEngineTime):
+        self._timeline[securityEngineId] = (
+            snmpEngineBoots,
+            snmpEngineTime,
+            snmpEngineTime,
+            int(time.time())
+        )
+
+        timerResolution = (snmpEngine.transportDispatcher is None and 1.0 or
+                           snmpEngine.transportDispatcher.getTimerResolution())
+
+        expireAt = int(self._expirationTimer + 300 / timerResolution)
+
+        if expireAt not in self._timelineExpQueue:
+            self._timelineExpQueue[expireAt] = []
+
+        self._timelineExpQueue[expireAt].append(securityEngineId)
+
     def _expireTimelineInfo(self):
         if self._expirationTimer in self._timelineExpQueue:
 
@@ -4,7 +4,6 @@
 # Copyright (c) 2005-2018, Olivier Verriest <verri@x25.pm>
 # License: http://snmplabs.com/pysnmp/license.html
 #
-import hmac
 try:
     from hashlib import sha224
     from hashlib import sha256
@@ -60,11 +59,10 @@ class HmacSha2(base.AbstractAuthenticationService):
         SHA384_SERVICE_ID: sha384,
         SHA512_SERVICE_ID: sha512
     }
-    
-    IPAD = [0x36] * 64
-    OPAD = [0x5C] * 64
-    
+
     def __init__(self, oid):
+        base.AbstractAuthenticationService.__init__(self)
+
         if oid not in self.HASH_ALGORITHM:
             raise error.ProtocolError(
                 'No SHA-2 authentication algorithm %s available' % (oid,))
@@ -96,13 +94,13 @@ class HmacSha2(base.AbstractAuthenticationService):
 
         # 7.3.1.2, 7.3.1.3
         try:
-            mac = hmac.new(authKey.asOctets(), wholeMsg, self._hashAlgo)
+            mac = self._hmacDigest(authKey, wholeMsg, self._hashAlgo)
 
         except errind.ErrorIndication as exc:
             raise error.StatusInformation(errorIndication=exc)
 
         # 7.3.1.4
-        mac = mac.digest()[:self._digestLength]
+        mac = mac[:self._digestLength]
 
         # 7.3.1.5 & 6
         return wholeHead + mac + wholeTail
@@ -125,13 +123,14 @@ class HmacSha2(base.AbstractAuthenticationService):
 
         # 7.3.2.4
         try:
-            mac = hmac.new(authKey.asOctets(), authenticatedWholeMsg, self._hashAlgo)
+            mac = self._hmacDigest(
+                authKey, authenticatedWholeMsg, self._hashAlgo)
 
         except errind.ErrorIndication as exc:
             raise error.StatusInformation(errorIndication=exc)
 
         # 7.3.2.5
-        mac = mac.digest()[:self._digestLength]
+        mac = mac[:self._digestLength]
 
         # 7.3.2.6
         if mac != authParameters:
@@ -4,12 +4,16 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import ast
+import bisect
 import marshal
+import mmap
 import os
 import struct
 import sys
 import time
 import traceback
+import zlib
 
 try:
     import importlib
@@ -107,7 +111,7 @@ class __AbstractMibSource(object):
                 pycData, pycPath = self._getData(pycFile, 'rb')
 
             except IOError as exc:
-                if ENOENT == -1 or why.errno in (ENOENT, EACCES):
+                if ENOENT == -1 or exc.errno in (ENOENT, EACCES):
                     debug.logger & debug.FLAG_BLD and debug.logger(
                         'file %s access error: %s' % (pycFile, exc))
 
@@ -160,6 +164,25 @@ class __AbstractMibSource(object):
 
         raise IOError(ENOENT, 'No suitable module found', f)
 
+    def readSource(self, f):
+        for pySfx in SOURCE_SUFFIXES:
+
+            pyFile = f + pySfx
+
+            try:
+                return self._getData(pyFile, 'r')
+
+            except IOError as exc:
+                if ENOENT == -1 or exc.errno in (ENOENT, EACCES):
+                    debug.logger & debug.FLAG_BLD and debug.logger(
+                        'file %s access error: %s' % (pyFile, exc))
+
+                else:
+                    raise error.MibLoadError(
+                        'MIB file %s access error: %s' % (pyFile, exc))
+
+        raise IOError(ENOENT, 'No module source found', f)
+
     # Interfaces for subclasses
     def _init(self):
         raise NotImplementedError()
@@ -288,6 +311,866 @@ class DirMibSource(__AbstractMibSource):
         raise IOError(ENOENT, msg)
 
 
+class BundleMibSource(__AbstractMibSource):
+    """MIB bundle file as a source of MIB modules.
+
+    MIB bundle holds compiled code of many MIB modules in a single file
+    (see :py:meth:`MibBuilder.bundleModules`). The file is memory-mapped
+    and just its index is read up front, modules code is unmarshalled
+    once per process as the modules are being loaded.
+
+    Bundles made by other Python or pysnmp versions are ignored.
+    """
+    BUNDLE_MAGIC = 'PYSNMPMB'.encode()
+
+    # magic, Python bytecode magic, index offset, index size
+    HEADER = struct.Struct('<8s4sLL')
+
+    # bundle path -> (file ID, mmap, modules index, code objects)
+    _bundles = {}
+
+    def _init(self):
+        self._srcName = os.path.normpath(self._srcName)
+
+        try:
+            st = os.stat(self._srcName)
+
+        except OSError as exc:
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                'stat() failed for %s: %s' % (self._srcName, exc))
+            self._bundle = None
+            return self
+
+        fileId = st.st_ino, st.st_size, st.st_mtime
+
+        bundle = self._bundles.get(self._srcName)
+
+        if bundle is None or bundle[0] != fileId:
+            bundle = self._bundles[self._srcName] = self._openBundle(fileId)
+
+        self._bundle = bundle
+
+        return self
+
+    def _openBundle(self, fileId):
+        try:
+            fp = open(self._srcName, 'rb')
+
+            try:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+            finally:
+                fp.close()
+
+            (magic, pyMagic, indexOffset,
+             indexSize) = self.HEADER.unpack(data[:self.HEADER.size])
+
+        except (IOError, OSError, ValueError, struct.error) as exc:
+            raise error.MibLoadError(
+                'MIB bundle %s access error: %s' % (self._srcName, exc))
+
+        if magic != self.BUNDLE_MAGIC:
+            raise error.MibLoadError(
+                'Not a MIB bundle file %s' % self._srcName)
+
+        try:
+            version, modules = marshal.loads(
+                data[indexOffset:indexOffset + indexSize])
+
+        except (EOFError, ValueError, TypeError) as exc:
+            raise error.MibLoadError(
+                'Broken MIB bundle %s: %s' % (self._srcName, exc))
+
+        if pyMagic != PY_MAGIC_NUMBER or version != pysnmp_version:
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                'MIB bundle %s is made by other Python or pysnmp '
+                'version, ignored' % self._srcName)
+            modules = {}
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            'MIB bundle %s has %d modules' % (self._srcName, len(modules)))
+
+        return fileId, data, modules, {}
+
+    def _listdir(self):
+        if self._bundle is None:
+            return ()
+
+        return tuple(self._bundle[2])
+
+    def read(self, f):
+        if self._bundle is None or f not in self._bundle[2]:
+            raise IOError(ENOENT, 'No such module in MIB bundle', f)
+
+        fileId, data, modules, codeObjs = self._bundle
+
+        if f not in codeObjs:
+            offset, size = modules[f]
+
+            codeObjs[f] = marshal.loads(data[offset:offset + size])
+
+        return codeObjs[f], ''
+
+    def readSource(self, f):
+        raise IOError(ENOENT, 'No module source in MIB bundle', f)
+
+    @classmethod
+    def writeBundle(cls, fileName, codeObjs):
+        """Write MIB bundle file from a dict of MIB modules code"""
+        tmpFileName = fileName + '.tmp'
+
+        modules = {}
+
+        fp = open(tmpFileName, 'wb')
+
+        try:
+            fp.write(cls.HEADER.pack(cls.BUNDLE_MAGIC, PY_MAGIC_NUMBER, 0, 0))
+
+            for modName, codeObj in codeObjs.items():
+                codeData = marshal.dumps(codeObj)
+
+                modules[modName] = fp.tell(), len(codeData)
+
+                fp.write(codeData)
+
+            indexData = marshal.dumps((pysnmp_version, modules))
+
+            indexOffset = fp.tell()
+
+            fp.write(indexData)
+
+            fp.seek(0)
+
+            fp.write(cls.HEADER.pack(cls.BUNDLE_MAGIC, PY_MAGIC_NUMBER,
+                                     indexOffset, len(indexData)))
+
+        finally:
+            fp.close()
+
+        # readers may still have the old file mapped
+        if sys.platform == 'win32' and os.path.exists(fileName):
+            os.remove(fileName)
+
+        os.rename(tmpFileName, fileName)
+
+
+class MibModuleManifest(object):
+    """Symbols manifest of MIB module source code.
+
+    Top-level statements of MIB module are analyzed for the module-scope
+    names they define and refer to. Each symbol the module exports is
+    tied to the statements its object depends on so that MIB objects can
+    be materialized one by one (see :py:attr:`MibBuilder.lazyLoad`).
+
+    The `symbols` attribute maps exported symbol names onto
+    `(typeName, oid)` tuples, `typeName` being MIB object class name
+    (e.g. `MibScalar`) or `None` for SMI types. Symbols whose nature
+    can not be figured out from the source are listed in `eagerExports`
+    to be exported as soon as MIB module loads.
+
+    Raises :py:class:`~pysnmp.smi.error.SmiError` on MIB modules it can
+    not analyze.
+    """
+    # manifest cache files suffix
+    CACHE_SUFFIX = '.manifest'
+
+    # attributes stored in manifest cache file
+    CACHED_ATTRS = ('items', 'lineNos', 'deps', 'mutators', 'eagerItems',
+                    'exports', 'eagerExports', 'symbols', 'oids')
+
+    # MIB module path -> manifest
+    _manifests = {}
+
+    # MIB objects taking object identifier for the first parameter
+    MIB_NODE_TYPES = {
+        'SNMPv2-SMI': ('MibIdentifier', 'MibScalar', 'MibTable',
+                       'MibTableRow', 'MibTableColumn', 'ObjectIdentity',
+                       'ModuleIdentity', 'NotificationType'),
+        'SNMPv2-CONF': ('ObjectGroup', 'NotificationGroup',
+                        'ModuleCompliance', 'AgentCapabilities')
+    }
+
+    # AST nodes introducing new names scope
+    SCOPE_NODES = tuple(
+        [getattr(ast, x) for x in ('FunctionDef', 'AsyncFunctionDef',
+                                   'ClassDef', 'Lambda', 'GeneratorExp',
+                                   'SetComp', 'DictComp')
+         if hasattr(ast, x)])
+
+    if sys.version_info[0] > 2:
+        SCOPE_NODES += (ast.ListComp,)
+
+    # AST nodes not referring to any names
+    if hasattr(ast, 'Constant'):
+        LEAF_NODES = (ast.Constant, ast.expr_context)
+
+    else:
+        LEAF_NODES = (ast.Str, ast.Num, ast.expr_context)
+
+    def __init__(self, modName, modData, modPath, moduleID='PYSNMP_MODULE_ID'):
+        self.modName = modName
+        self.modPath = modPath
+        self.modData = modData
+        self.moduleID = moduleID
+
+        # statements as slices of module source and
+        # (modName, symName, varName) imports
+        self.items = []
+
+        # item index -> first line of statement
+        self.lineNos = []
+
+        # item index -> items it depends on
+        self.deps = []
+
+        # item index -> items modifying objects it defines
+        self.mutators = []
+
+        # items to execute on module load
+        self.eagerItems = []
+
+        # symName -> (varName, item index)
+        self.exports = {}
+        self.eagerExports = {}
+
+        self.symbols = {}
+
+        # oid -> symName
+        self.oids = {}
+
+        try:
+            tree = ast.parse(modData, modPath)
+
+        except SyntaxError as exc:
+            raise error.SmiError(
+                'MIB module %s parse error: %s' % (modPath, exc))
+
+        self._analyze(tree, moduleID)
+
+        self._sliceSource(tree)
+
+        self._mergeItems()
+
+    @classmethod
+    def getManifest(cls, modName, modData, modPath,
+                    moduleID='PYSNMP_MODULE_ID', cacheDir=None):
+        """Return manifest of MIB module source.
+
+        Manifests are cached in memory and, if `cacheDir` is given, in
+        files in that directory. Cached manifest is used for as long as
+        MIB module source stays the same.
+
+        Raises :py:class:`~pysnmp.smi.error.MibLoadError` if manifest
+        can not be written into `cacheDir`.
+        """
+        manifest = cls._manifests.get(modPath)
+
+        if (manifest is None or manifest.modData != modData or
+                manifest.moduleID != moduleID):
+            manifest = None
+
+            if cacheDir:
+                cachePath = cls._getCachePath(modName, modPath, cacheDir)
+
+                manifest = cls._readCache(
+                    modName, modData, modPath, moduleID, cachePath)
+
+            if manifest is None:
+                manifest = cls(modName, modData, modPath, moduleID)
+
+                if cacheDir:
+                    manifest._writeCache(cachePath)
+
+            cls._manifests[modPath] = manifest
+
+        return manifest
+
+    @classmethod
+    def _getCachePath(cls, modName, modPath, cacheDir):
+        # same named modules may come from different MIB sources
+        pathId = os.path.abspath(modPath)
+
+        if not isinstance(pathId, bytes):
+            pathId = pathId.encode('utf-8')
+
+        return os.path.join(cacheDir, '%s-%08x%s' % (
+            modName, zlib.crc32(pathId) & 0xffffffff, cls.CACHE_SUFFIX))
+
+    @staticmethod
+    def _getSourceId(modData, moduleID):
+        if not isinstance(modData, bytes):
+            modData = modData.encode('utf-8')
+
+        return (pysnmp_version, moduleID, len(modData),
+                zlib.crc32(modData) & 0xffffffff)
+
+    @classmethod
+    def _readCache(cls, modName, modData, modPath, moduleID, cachePath):
+        try:
+            fp = open(cachePath, 'rb')
+
+            try:
+                sourceId, attrs = marshal.loads(fp.read())
+
+            finally:
+                fp.close()
+
+        except (IOError, OSError, EOFError, ValueError, TypeError) as exc:
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                'manifest cache %s not used: %s' % (cachePath, exc))
+            return
+
+        if sourceId != cls._getSourceId(modData, moduleID):
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                'manifest cache %s is stale' % cachePath)
+            return
+
+        manifest = cls.__new__(cls)
+
+        manifest.modName = modName
+        manifest.modPath = modPath
+        manifest.modData = modData
+        manifest.moduleID = moduleID
+
+        for attr in cls.CACHED_ATTRS:
+            setattr(manifest, attr, attrs[attr])
+
+        manifest.items = [len(x) == 2 and slice(*x) or x
+                          for x in manifest.items]
+
+        return manifest
+
+    def _writeCache(self, cachePath):
+        attrs = dict([(x, getattr(self, x)) for x in self.CACHED_ATTRS])
+
+        attrs['items'] = [isinstance(x, slice) and (x.start, x.stop) or x
+                          for x in self.items]
+
+        tmpFileName = '%s.%d' % (cachePath, os.getpid())
+
+        try:
+            cacheDir = os.path.dirname(cachePath)
+
+            if not os.path.isdir(cacheDir):
+                os.makedirs(cacheDir)
+
+            fp = open(tmpFileName, 'wb')
+
+            try:
+                fp.write(marshal.dumps(
+                    (self._getSourceId(self.modData, self.moduleID), attrs)))
+
+            finally:
+                fp.close()
+
+            if sys.platform == 'win32' and os.path.exists(cachePath):
+                os.remove(cachePath)
+
+            os.rename(tmpFileName, cachePath)
+
+        except (IOError, OSError) as exc:
+            raise error.MibLoadError(
+                'MIB manifest cache %s not written: %s' % (cachePath, exc))
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            'manifest cache %s written' % cachePath)
+
+    def _analyze(self, tree, moduleID):
+        items = self.items
+
+        uses = []
+        defines = []
+        labeled = []
+        exports = []
+
+        # varName -> defining items indices
+        varDefs = {}
+
+        for stmt in tree.body:
+            imports = self._parseImport(stmt)
+
+            if imports:
+                for item in imports:
+                    varDefs.setdefault(item[2], []).append(len(items))
+                    items.append(item)
+                    self.lineNos.append(stmt.lineno)
+                    uses.append(())
+                    defines.append(True)
+
+                continue
+
+            namedSyms = self._parseExport(stmt)
+
+            if namedSyms is not None:
+                exports.append((len(items), namedSyms))
+                continue
+
+            defined, used, eager, label = self._scanNames(stmt)
+
+            for varName in defined:
+                varDefs.setdefault(varName, []).append(len(items))
+
+            if eager:
+                self.eagerItems.append(len(items))
+
+            if label:
+                labeled.append(len(items))
+
+            items.append(stmt)
+            self.lineNos.append(self._getFirstLine(stmt))
+            uses.append(used)
+            defines.append(bool(defined))
+
+        localNames = set(
+            [x for x in varDefs
+             if [y for y in varDefs[x] if not isinstance(items[y], tuple)]])
+
+        self.mutators = [[] for x in items]
+
+        for idx, used in enumerate(uses):
+            deps = set()
+
+            for varName in used:
+                defIdx = self._findDef(varDefs, varName, idx, True)
+
+                if defIdx is not None and defIdx != idx:
+                    deps.add(defIdx)
+
+            self.deps.append(tuple(sorted(deps)))
+
+            if defines[idx] or idx in self.eagerItems:
+                continue
+
+            # statement just changing objects defined elsewhere
+            mutated = False
+
+            for varName in used:
+                if varName not in localNames:
+                    continue
+
+                defIdx = self._findDef(varDefs, varName, idx, True)
+
+                if defIdx is not None and not isinstance(items[defIdx], tuple):
+                    self.mutators[defIdx].append(idx)
+                    mutated = True
+
+            if not mutated:
+                self.eagerItems.append(idx)
+
+        self.mutators = [tuple(x) for x in self.mutators]
+
+        # MIB objects labels must be known before they get exported
+        for idx in labeled:
+            symType = self._getSymbolType(items[idx], varDefs)
+
+            if not symType or symType[2] is None:
+                raise error.SmiError(
+                    'MIB object label is not known at %s line '
+                    '%s' % (self.modPath, self.lineNos[idx]))
+
+        for exportIdx, namedSyms in exports:
+            for symName, varName in namedSyms.items():
+                defIdx = self._findDef(varDefs, varName, exportIdx)
+
+                symType = None
+
+                if (defIdx is not None and
+                        not isinstance(items[defIdx], tuple) and
+                        len(varDefs[varName]) == 1):
+                    symType = self._getSymbolType(items[defIdx], varDefs)
+
+                if symType is not None:
+                    typeName, oid, label = symType
+
+                    if symName != moduleID and label:
+                        symName = label
+
+                    if symName not in self.symbols:
+                        self.symbols[symName] = typeName, oid
+                        self.exports[symName] = varName, defIdx
+
+                        if oid is not None:
+                            self.oids[oid] = symName
+
+                        continue
+
+                self.eagerExports[symName] = varName, defIdx
+
+    def _sliceSource(self, tree):
+        """Replace AST statements with their pieces of module source"""
+        modData = self.modData
+
+        newLine = isinstance(modData, bytes) and b'\n' or '\n'
+
+        # line number -> source offset
+        offsets = [0, 0]
+
+        for line in modData.split(newLine):
+            offsets.append(offsets[-1] + len(line) + 1)
+
+        # statement ends where the next one begins
+        firstLines = [self._getFirstLine(x) for x in tree.body]
+        lastLines = dict(zip(firstLines, firstLines[1:] + [len(offsets) - 1]))
+
+        if len(lastLines) != len(firstLines):
+            raise error.SmiError(
+                'Many statements per line at %s' % self.modPath)
+
+        for idx, item in enumerate(self.items):
+            if not isinstance(item, tuple):
+                firstLine = self.lineNos[idx]
+                self.items[idx] = slice(
+                    offsets[firstLine], offsets[lastLines[firstLine]])
+
+    def _mergeItems(self):
+        """Join adjacent statements always executed together"""
+        items = self.items
+
+        entries = self.eagerItems + [
+            x[1] for x in list(self.exports.values()) +
+            list(self.eagerExports.values()) if x[1] is not None]
+
+        # item index -> entry items it is executed for
+        entriesMap = [[] for x in items]
+
+        for entry in sorted(set(entries)):
+            for idx in self.getItems([entry]):
+                entriesMap[idx].append(entry)
+
+        # old item index -> new item index
+        idxMap = []
+
+        newItems = []
+        newLineNos = []
+
+        for idx, item in enumerate(items):
+            if (newItems and isinstance(item, slice) and
+                    isinstance(newItems[-1], slice) and
+                    newItems[-1].stop == item.start and
+                    entriesMap[idx] == entriesMap[idx - 1]):
+                newItems[-1] = slice(newItems[-1].start, item.stop)
+
+            else:
+                newItems.append(item)
+                newLineNos.append(self.lineNos[idx])
+
+            idxMap.append(len(newItems) - 1)
+
+        if len(newItems) == len(items):
+            return
+
+        deps = [set() for x in newItems]
+        mutators = [set() for x in newItems]
+
+        for idx, newIdx in enumerate(idxMap):
+            deps[newIdx].update([idxMap[x] for x in self.deps[idx]])
+            mutators[newIdx].update([idxMap[x] for x in self.mutators[idx]])
+
+        self.deps = [tuple(sorted(x.difference([idx])))
+                     for idx, x in enumerate(deps)]
+        self.mutators = [tuple(sorted(x.difference([idx])))
+                         for idx, x in enumerate(mutators)]
+
+        self.eagerItems = sorted(set([idxMap[x] for x in self.eagerItems]))
+
+        for exports in self.exports, self.eagerExports:
+            for symName, (varName, idx) in exports.items():
+                if idx is not None:
+                    exports[symName] = varName, idxMap[idx]
+
+        self.items = newItems
+        self.lineNos = newLineNos
+
+    @staticmethod
+    def _getFirstLine(stmt):
+        return min([stmt.lineno] + [
+            x.lineno for x in getattr(stmt, 'decorator_list', ())])
+
+    def getCode(self, idxs):
+        """Return AST module of statement items `idxs`"""
+        body = []
+
+        for idx in idxs:
+            tree = ast.parse(self.modData[self.items[idx]], self.modPath)
+
+            ast.increment_lineno(tree, self.lineNos[idx] - 1)
+
+            body.extend(tree.body)
+
+        tree = ast.Module(body=body)
+        tree.type_ignores = []
+
+        return tree
+
+    @staticmethod
+    def _findDef(varDefs, varName, idx, forward=False):
+        if varName not in varDefs:
+            return
+
+        defs = varDefs[varName]
+
+        pos = bisect.bisect_left(defs, idx)
+
+        if pos:
+            return defs[pos - 1]
+
+        # functions may refer to names defined later on
+        if forward:
+            return defs[-1]
+
+    @staticmethod
+    def _isBuilderCall(node, method):
+        return (isinstance(node, ast.Call) and
+                isinstance(node.func, ast.Attribute) and
+                node.func.attr == method and
+                isinstance(node.func.value, ast.Name) and
+                node.func.value.id == 'mibBuilder' and
+                not getattr(node, 'starargs', None))
+
+    def _parseImport(self, stmt):
+        if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
+            return
+
+        target = stmt.targets[0]
+
+        if (not isinstance(target, (ast.Tuple, ast.List)) or
+                not self._isBuilderCall(stmt.value, 'importSymbols') or
+                stmt.value.keywords or getattr(stmt.value, 'kwargs', None)):
+            return
+
+        try:
+            names = [ast.literal_eval(x) for x in stmt.value.args]
+
+        except (ValueError, TypeError):
+            return
+
+        varNames = [x.id for x in target.elts if isinstance(x, ast.Name)]
+
+        if (len(varNames) != len(target.elts) or
+                len(names) != len(varNames) + 1 or
+                [x for x in names if not isinstance(x, str)]):
+            return
+
+        return [(names[0], symName, varName)
+                for symName, varName in zip(names[1:], varNames)]
+
+    def _parseExport(self, stmt):
+        if (not isinstance(stmt, ast.Expr) or
+                not self._isBuilderCall(stmt.value, 'exportSymbols') or
+                len(stmt.value.args) != 1):
+            return
+
+        call = stmt.value
+
+        try:
+            if ast.literal_eval(call.args[0]) != self.modName:
+                return
+
+        except (ValueError, TypeError):
+            return
+
+        namedSyms = [(x.arg, x.value) for x in call.keywords if x.arg]
+
+        kwargs = [x.value for x in call.keywords if not x.arg]
+
+        if getattr(call, 'kwargs', None):
+            kwargs.append(call.kwargs)
+
+        for node in kwargs:
+            if not isinstance(node, ast.Dict) or None in node.keys:
+                return
+
+            try:
+                namedSyms.extend(
+                    zip([ast.literal_eval(x) for x in node.keys], node.values))
+
+            except (ValueError, TypeError):
+                return
+
+        exports = {}
+
+        for symName, node in namedSyms:
+            if not isinstance(symName, str) or not isinstance(node, ast.Name):
+                return
+
+            exports[symName] = node.id
+
+        return exports
+
+    def _scanNames(self, stmt):
+        defined = set()
+        used = set()
+        eager = labeled = False
+
+        nodes = [(stmt, False)]
+
+        while nodes:
+            node, nested = nodes.pop()
+
+            if isinstance(node, self.LEAF_NODES):
+                continue
+
+            elif isinstance(node, ast.Name):
+                if isinstance(node.ctx, ast.Load):
+                    used.add(node.id)
+
+                    # module reads MIB builder context
+                    if node.id == 'userCtx':
+                        eager = True
+
+                elif not nested:
+                    defined.add(node.id)
+
+            elif isinstance(node, ast.Attribute):
+                if node.attr == 'setLabel':
+                    labeled = True
+
+                # calls into MIB builder take effect on load
+                if (isinstance(node.value, ast.Name) and
+                        node.value.id == 'mibBuilder' and
+                        node.attr != 'loadTexts'):
+                    eager = True
+
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.name == '*':
+                        raise error.SmiError(
+                            'Wildcard import at %s line '
+                            '%s' % (self.modPath, node.lineno))
+
+                    if not nested:
+                        defined.add((alias.asname or alias.name).split('.')[0])
+
+            elif isinstance(node, ast.Global):
+                raise error.SmiError(
+                    'Global statement at %s line '
+                    '%s' % (self.modPath, node.lineno))
+
+            elif isinstance(node, self.SCOPE_NODES):
+                if not nested and hasattr(node, 'name'):
+                    defined.add(node.name)
+
+                nested = True
+
+            elif isinstance(node, ast.AugAssign):
+                if isinstance(node.target, ast.Name):
+                    used.add(node.target.id)
+
+            elif isinstance(node, ast.ExceptHandler):
+                if isinstance(node.name, str) and not nested:
+                    defined.add(node.name)
+
+            for field in node._fields:
+                value = getattr(node, field, None)
+
+                if isinstance(value, ast.AST):
+                    nodes.append((value, nested))
+
+                elif isinstance(value, list):
+                    nodes.extend([(x, nested) for x in value])
+
+        return defined, used, eager, labeled
+
+    def _getSymbolType(self, stmt, varDefs):
+        """Return `(typeName, oid, label)` of object or `None` if not known"""
+        if isinstance(stmt, ast.ClassDef):
+            return None, None, None
+
+        if (not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1 or
+                not isinstance(stmt.targets[0], ast.Name)):
+            return
+
+        node = stmt.value
+
+        label = None
+
+        # setters return MIB object itself
+        while isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            method = node.func.attr
+
+            if not method.startswith('set') or method == 'setValue':
+                return
+
+            if method == 'setLabel':
+                try:
+                    label, = [ast.literal_eval(x) for x in node.args]
+
+                except (ValueError, TypeError):
+                    return
+
+                if not isinstance(label, str):
+                    return
+
+            node = node.func.value
+
+        if (not isinstance(node, ast.Call) or
+                not isinstance(node.func, ast.Name) or not node.args):
+            return
+
+        typeName = self._resolveType(node.func.id, varDefs)
+
+        if typeName is None:
+            return
+
+        try:
+            oid = ast.literal_eval(node.args[0])
+
+            if not isinstance(oid, tuple) or not oid or oid != tuple(
+                    [int(x) for x in oid]):
+                return
+
+        except (ValueError, TypeError):
+            return
+
+        return typeName, oid, label
+
+    def _resolveType(self, varName, varDefs):
+        seen = set()
+
+        while varName not in seen:
+            seen.add(varName)
+
+            defs = varDefs.get(varName, ())
+
+            if len(defs) != 1:
+                return
+
+            item = self.items[defs[0]]
+
+            if isinstance(item, tuple):
+                if item[1] in self.MIB_NODE_TYPES.get(item[0], ()):
+                    return item[1]
+
+                return
+
+            # type alias
+            if (isinstance(item, ast.Assign) and len(item.targets) == 1 and
+                    isinstance(item.value, ast.Name)):
+                varName = item.value.id
+                continue
+
+            return
+
+    def getItems(self, idxs, skip=()):
+        """Return sorted indices of items `idxs` depend on, except `skip`"""
+        idxs = list(idxs)
+
+        seen = set()
+
+        while idxs:
+            idx = idxs.pop()
+
+            if idx in seen or idx in skip:
+                continue
+
+            seen.add(idx)
+
+            idxs.extend(self.deps[idx])
+            idxs.extend(self.mutators[idx])
+
+        return sorted(seen)
+
+
 class MibBuilder(object):
     DEFAULT_CORE_MIBS = os.pathsep.join(
         ('pysnmp.smi.mibs.instances', 'pysnmp.smi.mibs')
@@ -295,16 +1178,38 @@ class MibBuilder(object):
 
     DEFAULT_MISC_MIBS = 'pysnmp_mibs'
 
+    # MIB bundle files to look up MIB modules at first
+    DEFAULT_MIB_BUNDLES = ''
+
+    # Directory to cache lazily loaded MIB modules manifests in
+    DEFAULT_MIB_MANIFESTS = ''
+
     moduleID = 'PYSNMP_MODULE_ID'
 
     loadTexts = False
 
+    # Materialize objects of other than pysnmp own MIB modules on demand
+    lazyLoad = False
+
     # MIB modules can use this to select the features they can use
     version = tuple([int(x) for x in pysnmp_version.split('.')])
 
+    # How many exported/unexported symbols to remember
+    MAX_SYMBOLS_CHANGES = 65536
+
     def __init__(self):
         self.lastBuildId = self._autoName = 0
 
+        # last build changing the set of MIB symbols, materialization
+        # of lazily loaded symbols does not count
+        self.lastViewBuildId = 0
+
+        # (modName, symObj, exported) tuples and their build IDs
+        self._symbolsChanges = []
+        self._symbolsChangesIds = []
+        # all changes made after this build ID are remembered
+        self._symbolsChangesBuildId = 0
+
         sources = []
 
         for ev in 'PYSNMP_MIB_PKGS', 'PYSNMP_MIB_DIRS', 'PYSNMP_MIB_DIR':
@@ -316,10 +1221,29 @@ class MibBuilder(object):
             for m in self.DEFAULT_MISC_MIBS.split(os.pathsep):
                 sources.append(ZipMibSource(m))
 
+        coreSources = []
+
         for m in self.DEFAULT_CORE_MIBS.split(os.pathsep):
-            sources.insert(0, ZipMibSource(m))
+            coreSources.insert(0, ZipMibSource(m))
+
+        sources[:0] = coreSources
+
+        bundles = os.environ.get('PYSNMP_MIB_BUNDLES', self.DEFAULT_MIB_BUNDLES)
+
+        if bundles:
+            sources[:0] = [BundleMibSource(m) for m in bundles.split(os.pathsep)]
+
+        self._manifestsDir = os.environ.get(
+            'PYSNMP_MIB_MANIFESTS', self.DEFAULT_MIB_MANIFESTS)
 
         self.mibSymbols = {}
+
+        # symbols of lazily loaded MIB modules yet to be materialized
+        self.lazySymbols = {}
+
+        # modName -> (manifest, module globals, executed items)
+        self._lazyModules = {}
+
         self._mibSources = []
         self._modSeen = {}
         self._modPathsSeen = set()
@@ -327,6 +1251,8 @@ class MibBuilder(object):
 
         self.setMibSources(*sources)
 
+        self._coreMibSources = [s.init() for s in coreSources]
+
     # MIB compiler management
 
     def getMibCompiler(self):
@@ -360,8 +1286,17 @@ class MibBuilder(object):
             debug.logger & debug.FLAG_BLD and debug.logger(
                 'loadModule: trying %s at %s' % (modName, mibSource))
 
+            manifest = None
+
             try:
-                codeObj, sfx = mibSource.read(modName)
+                if self.lazyLoad and mibSource not in self._coreMibSources:
+                    manifest = self._readManifest(mibSource, modName)
+
+                if manifest is None:
+                    codeObj, sfx = mibSource.read(modName)
+
+                else:
+                    sfx = manifest.modPath
 
             except IOError as exc:
                 debug.logger & debug.FLAG_BLD and debug.logger(
@@ -386,10 +1321,16 @@ class MibBuilder(object):
                  'userCtx': userCtx}
 
             try:
-                exec(codeObj, g)
+                if manifest is None:
+                    exec(codeObj, g)
+
+                else:
+                    self._loadLazily(modName, manifest, g)
 
             except Exception:
                 self._modPathsSeen.remove(modPath)
+                self._lazyModules.pop(modName, None)
+                self.lazySymbols.pop(modName, None)
                 raise error.MibLoadError(
                     'MIB module "%s" load error: '
                     '%s' % (modPath, traceback.format_exception(*sys.exc_info())))
@@ -409,6 +1350,170 @@ class MibBuilder(object):
 
         return self
 
+    def _readManifest(self, mibSource, modName):
+        try:
+            modData, pyPath = mibSource.readSource(modName)
+
+        except IOError as exc:
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                '_readManifest: read %s source from %s failed: '
+                '%s' % (modName, mibSource, exc))
+            return
+
+        try:
+            return MibModuleManifest.getManifest(
+                modName, modData, pyPath, self.moduleID, self._manifestsDir)
+
+        except error.MibLoadError:
+            raise
+
+        except error.SmiError as exc:
+            debug.logger & debug.FLAG_BLD and debug.logger(
+                '_readManifest: %s will load eagerly: %s' % (modName, exc))
+
+    def _loadLazily(self, modName, manifest, g):
+        self._lazyModules[modName] = manifest, g, set()
+
+        # modules imported from are loaded anyway
+        for item in manifest.items:
+            if isinstance(item, tuple) and item[0] not in self.mibSymbols:
+                self.loadModules(item[0])
+
+        self.mibSymbols.setdefault(modName, {})
+        self.lazySymbols[modName] = dict(manifest.symbols)
+
+        self._execLazyItems(modName, manifest.eagerItems + [
+            x[1] for x in manifest.eagerExports.values() if x[1] is not None])
+
+        namedSyms = {}
+
+        for symName, (varName, idx) in manifest.eagerExports.items():
+            if varName not in g:
+                raise error.MibLoadError(
+                    'Exported name %s not defined at %s' % (varName, modName))
+
+            namedSyms[symName] = g[varName]
+
+        self.exportSymbols(modName, **namedSyms)
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            '_loadLazily: %s has %d symbols exported, %d to be '
+            'materialized' % (modName, len(namedSyms), len(manifest.symbols)))
+
+    def _execLazyItems(self, modName, idxs):
+        manifest, g, executed = self._lazyModules[modName]
+
+        idxs = manifest.getItems(idxs, executed)
+
+        executed.update(idxs)
+
+        stmts = []
+
+        for idx in idxs + [None]:
+            item = idx is not None and manifest.items[idx]
+
+            if item and not isinstance(item, tuple):
+                stmts.append(idx)
+                continue
+
+            if stmts:
+                exec(compile(manifest.getCode(stmts),
+                             manifest.modPath, 'exec'), g)
+
+                stmts = []
+
+            if item:
+                fromModName, symName, varName = item
+                g[varName], = self.importSymbols(fromModName, symName)
+
+    def _materializeSymbols(self, modName, *symNames):
+        manifest, g, executed = self._lazyModules[modName]
+
+        lazySymbols = self.lazySymbols[modName]
+
+        symNames = [x for x in symNames if x in lazySymbols]
+
+        # table columns are not managed without their table row
+        for symName in list(symNames):
+            typeName, oid = lazySymbols[symName]
+
+            if typeName == 'MibTableColumn':
+                rowName = manifest.oids.get(oid[:-1])
+
+                if rowName in lazySymbols and rowName not in symNames:
+                    symNames.append(rowName)
+
+        try:
+            self._execLazyItems(
+                modName, [manifest.exports[x][1] for x in symNames])
+
+        except Exception:
+            raise error.MibLoadError(
+                'MIB module "%s" load error: '
+                '%s' % (manifest.modPath,
+                        traceback.format_exception(*sys.exc_info())))
+
+        namedSyms = {}
+
+        for symName in symNames:
+            del lazySymbols[symName]
+
+            namedSyms[symName] = g[manifest.exports[symName][0]]
+
+        # these symbols are known to MIB view since module load
+        lastViewBuildId = self.lastViewBuildId
+
+        self.exportSymbols(modName, **namedSyms)
+
+        self.lastViewBuildId = lastViewBuildId
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            '_materializeSymbols: %s::%s' % (modName, ', '.join(symNames)))
+
+    def bundleModules(self, fileName, *modNames):
+        """Write compiled MIB modules into a MIB bundle file.
+
+        MIB modules are looked up at MIB sources the same way as
+        :py:meth:`loadModules` does, but not loaded. Modules loaded so
+        far are bundled unless `modNames` are given.
+
+        Bundle file is used by :py:class:`BundleMibSource` or, for all
+        new :py:class:`MibBuilder` objects, by listing it in the
+        `PYSNMP_MIB_BUNDLES` environment variable or the
+        `DEFAULT_MIB_BUNDLES` class attribute. That saves locating and
+        compiling modules every time they get loaded.
+        """
+        if not modNames:
+            modNames = list(self._modSeen)
+
+        codeObjs = {}
+
+        for modName in modNames:
+            for mibSource in self._mibSources:
+                try:
+                    codeObjs[modName], sfx = mibSource.read(modName)
+
+                except IOError as exc:
+                    debug.logger & debug.FLAG_BLD and debug.logger(
+                        'bundleModules: read %s from %s failed: '
+                        '%s' % (modName, mibSource, exc))
+                    continue
+
+                break
+
+            else:
+                raise error.MibNotFoundError(
+                    'MIB file "%s" not found in search path '
+                    '(%s)' % (modName, ', '.join(
+                        [str(x) for x in self._mibSources])))
+
+        BundleMibSource.writeBundle(fileName, codeObjs)
+
+        debug.logger & debug.FLAG_BLD and debug.logger(
+            'bundleModules: %d modules written to %s' % (len(codeObjs), fileName))
+
+        return self
+
     def loadModules(self, *modNames, **userCtx):
         """Load (optionally, compiling) pysnmp MIB modules"""
         # Build a list of available modules
@@ -488,19 +1593,55 @@ class MibBuilder(object):
                     'No module %s loaded at %s' % (modName, self))
 
             if symName not in self.mibSymbols[modName]:
-                raise error.SmiError(
-                    'No symbol %s::%s at %s' % (modName, symName, self))
+                if symName not in self.lazySymbols.get(modName, ()):
+                    raise error.SmiError(
+                        'No symbol %s::%s at %s' % (modName, symName, self))
+
+                self._materializeSymbols(modName, symName)
 
             symbols.append(self.mibSymbols[modName][symName])
 
         return symbols
 
+    def getSymbolsChanges(self, lastBuildId):
+        """Return symbols exported or unexported after `lastBuildId`.
+
+        Returns a list of (modName, symObj, exported) tuples in the order
+        of change or `None` if changes are not known that far back.
+        """
+        if lastBuildId < self._symbolsChangesBuildId:
+            return
+
+        idx = bisect.bisect_right(self._symbolsChangesIds, lastBuildId)
+
+        return self._symbolsChanges[idx:]
+
+    def _recordSymbolsChanges(self, modName, symObjs, exported):
+        self._symbolsChanges.extend(
+            [(modName, symObj, exported) for symObj in symObjs])
+        self._symbolsChangesIds.extend([self.lastBuildId] * len(symObjs))
+
+        if len(self._symbolsChanges) <= self.MAX_SYMBOLS_CHANGES:
+            return
+
+        # forget older half of the changes keeping builds intact
+        idx = bisect.bisect_right(
+            self._symbolsChangesIds,
+            self._symbolsChangesIds[len(self._symbolsChanges) // 2])
+
+        self._symbolsChangesBuildId = self._symbolsChangesIds[idx - 1]
+
+        del self._symbolsChanges[:idx]
+        del self._symbolsChangesIds[:idx]
+
     def exportSymbols(self, modName, *anonymousSyms, **namedSyms):
         if modName not in self.mibSymbols:
             self.mibSymbols[modName] = {}
 
         mibSymbols = self.mibSymbols[modName]
 
+        symObjs = list(anonymousSyms)
+
         for symObj in anonymousSyms:
             debug.logger & debug.FLAG_BLD and debug.logger(
                 'exportSymbols: anonymous symbol %s::'
@@ -528,10 +1669,15 @@ class MibBuilder(object):
 
             mibSymbols[symName] = symObj
 
+            symObjs.append(symObj)
+
             debug.logger & debug.FLAG_BLD and debug.logger(
                 'exportSymbols: symbol %s::%s' % (modName, symName))
 
         self.lastBuildId += 1
+        self.lastViewBuildId = self.lastBuildId
+
+        self._recordSymbolsChanges(modName, symObjs, True)
 
     def unexportSymbols(self, modName, *symNames):
         if modName not in self.mibSymbols:
@@ -539,20 +1685,37 @@ class MibBuilder(object):
 
         mibSymbols = self.mibSymbols[modName]
 
+        lazySymbols = self.lazySymbols.get(modName, {})
+
         if not symNames:
-            symNames = list(mibSymbols.keys())
+            symNames = list(mibSymbols.keys()) + list(lazySymbols)
+
+        symObjs = []
 
         for symName in symNames:
+            if symName in lazySymbols:
+                del lazySymbols[symName]
+
+                debug.logger & debug.FLAG_BLD and debug.logger(
+                    'unexportSymbols: lazy symbol %s::%s' % (modName, symName))
+                continue
+
             if symName not in mibSymbols:
                 raise error.SmiError(
                     'No symbol %s::%s at %s' % (modName, symName, self))
 
-            del mibSymbols[symName]
+            symObjs.append(mibSymbols.pop(symName))
 
             debug.logger & debug.FLAG_BLD and debug.logger(
                 'unexportSymbols: symbol %s::%s' % (modName, symName))
 
-        if not self.mibSymbols[modName]:
+        if not mibSymbols and not lazySymbols:
             del self.mibSymbols[modName]
 
+            self.lazySymbols.pop(modName, None)
+            self._lazyModules.pop(modName, None)
+
         self.lastBuildId += 1
+        self.lastViewBuildId = self.lastBuildId
+
+        self._recordSymbolsChanges(modName, symObjs, False)
@@ -4,18 +4,23 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
-from bisect import bisect
+from bisect import bisect_left
+from bisect import bisect_right
 
 
 class OrderedDict(dict):
-    """Ordered dictionary used for indices"""
+    """Ordered dictionary used for indices.
+
+    Keys are kept sorted as they come in. The sorted sequence is split
+    into blocks of at most `BLOCK_SIZE` keys so that insertion, removal
+    and the next key lookup never move more than a block worth of keys.
+    """
+    BLOCK_SIZE = 1024
 
     def __init__(self, *args, **kwargs):
         super(OrderedDict, self).__init__()
 
-        self._keys = []
-        self._dirty = True
-        self._keysLens = []
+        self._initKeys()
 
         if args:
             self.update(*args)
@@ -23,38 +28,142 @@ class OrderedDict(dict):
         if kwargs:
             self.update(**kwargs)
 
+    def _initKeys(self):
+        # blocks of sorted keys, their sorting keys and the greatest
+        # sorting key of each block
+        self._keys = []
+        self._sortKeys = []
+        self._maxSortKeys = []
+
+        # key length -> number of such keys
+        self._keysLensCount = {}
+        self._keysLens = []
+        self._dirty = False
+
     def __setitem__(self, key, value):
+        if key not in self:
+            self._addKey(key)
+
         super(OrderedDict, self).__setitem__(key, value)
-        if key not in self._keys:
-            self._keys.append(key)
-            self._dirty = True
 
     def __delitem__(self, key):
         super(OrderedDict, self).__delitem__(key)
-        if key in self._keys:
-            self._keys.remove(key)
+
+        self._removeKey(key)
+
+    def _addKey(self, key):
+        sortKey = self.sortingKey(key)
+
+        maxSortKeys = self._maxSortKeys
+
+        blockIdx = bisect_left(maxSortKeys, sortKey)
+
+        if blockIdx == len(maxSortKeys):
+            if blockIdx:
+                blockIdx -= 1
+                maxSortKeys[blockIdx] = sortKey
+
+            else:
+                self._keys.append([])
+                self._sortKeys.append([])
+                maxSortKeys.append(sortKey)
+
+        keys = self._keys[blockIdx]
+        sortKeys = self._sortKeys[blockIdx]
+
+        idx = bisect_left(sortKeys, sortKey)
+
+        keys.insert(idx, key)
+        sortKeys.insert(idx, sortKey)
+
+        if len(keys) > self.BLOCK_SIZE:
+            half = len(keys) // 2
+
+            self._keys.insert(blockIdx + 1, keys[half:])
+            self._sortKeys.insert(blockIdx + 1, sortKeys[half:])
+            maxSortKeys.insert(blockIdx, sortKeys[half - 1])
+
+            del keys[half:]
+            del sortKeys[half:]
+
+        keyLen = len(key)
+
+        if keyLen in self._keysLensCount:
+            self._keysLensCount[keyLen] += 1
+
+        else:
+            self._keysLensCount[keyLen] = 1
+            self._dirty = True
+
+    def _removeKey(self, key):
+        sortKey = self.sortingKey(key)
+
+        blockIdx = bisect_left(self._maxSortKeys, sortKey)
+
+        keys = self._keys[blockIdx]
+        sortKeys = self._sortKeys[blockIdx]
+
+        idx = bisect_left(sortKeys, sortKey)
+
+        # distinct keys may share sorting key, e.g. '1.3' and (1, 3)
+        while keys[idx] != key:
+            idx += 1
+
+            if idx == len(keys):
+                blockIdx += 1
+                keys = self._keys[blockIdx]
+                sortKeys = self._sortKeys[blockIdx]
+                idx = 0
+
+        del keys[idx]
+        del sortKeys[idx]
+
+        if not keys:
+            del self._keys[blockIdx]
+            del self._sortKeys[blockIdx]
+            del self._maxSortKeys[blockIdx]
+
+        elif idx == len(keys):
+            self._maxSortKeys[blockIdx] = sortKeys[-1]
+
+        keyLen = len(key)
+
+        self._keysLensCount[keyLen] -= 1
+
+        if not self._keysLensCount[keyLen]:
+            del self._keysLensCount[keyLen]
             self._dirty = True
 
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+
+        return super(OrderedDict, self).pop(key, *default)
+
+    def setdefault(self, key, value=None):
+        if key not in self:
+            self[key] = value
+
+        return self[key]
+
     def clear(self):
         super(OrderedDict, self).clear()
-        self._keys = []
-        self._dirty = True
+        self._initKeys()
 
     def keys(self):
-        if self._dirty:
-            self._order()
-        return list(self._keys)
+        keys = []
+        for block in self._keys:
+            keys.extend(block)
+
+        return keys
 
     def values(self):
-        if self._dirty:
-            self._order()
-        return [self[k] for k in self._keys]
+        return [self[k] for k in self.keys()]
 
     def items(self):
-        if self._dirty:
-            self._order()
-
-        return [(k, self[k]) for k in self._keys]
+        return [(k, self[k]) for k in self.keys()]
 
     def update(self, *args, **kwargs):
         if args:
@@ -71,38 +180,26 @@ class OrderedDict(dict):
             for k in kwargs:
                 self[k] = kwargs[k]
 
-    def sortingFun(self, keys):
-        keys.sort()
-
-    def _order(self):
-        self.sortingFun(self._keys)
-
-        self._keysLens = sorted(
-            set(len(k) for k in self._keys), reverse=True)
-
-        self._dirty = False
+    def sortingKey(self, key):
+        return key
 
     def nextKey(self, key):
-        if self._dirty:
-            self._order()
-
-        keys = self._keys
+        sortKey = self.sortingKey(key)
 
-        if key in keys:
-            nextIdx = keys.index(key) + 1
+        blockIdx = bisect_right(self._maxSortKeys, sortKey)
 
-        else:
-            nextIdx = bisect(keys, key)
+        if blockIdx < len(self._maxSortKeys):
+            sortKeys = self._sortKeys[blockIdx]
 
-        if nextIdx < len(keys):
-            return keys[nextIdx]
+            return self._keys[blockIdx][bisect_right(sortKeys, sortKey)]
 
         else:
             raise KeyError(key)
 
     def getKeysLens(self):
         if self._dirty:
-            self._order()
+            self._keysLens = sorted(self._keysLensCount, reverse=True)
+            self._dirty = False
 
         return self._keysLens
 
@@ -110,26 +207,12 @@ class OrderedDict(dict):
 class OidOrderedDict(OrderedDict):
     """OID-ordered dictionary used for indices"""
 
-    def __init__(self, *args, **kwargs):
-        OrderedDict.__init__(self, *args, **kwargs)
-
-        self._keysCache = {}
-
-    def __setitem__(self, key, value):
-        OrderedDict.__setitem__(self, key, value)
-
-        if key not in self._keysCache:
-            if isinstance(key, tuple):
-                self._keysCache[key] = key
-
-            else:
-                self._keysCache[key] = [int(x) for x in key.split('.') if x]
-
-    def __delitem__(self, key):
-        OrderedDict.__delitem__(self, key)
+    def sortingKey(self, key):
+        if isinstance(key, tuple):
+            return key
 
-        if key in self._keysCache:
-            del self._keysCache[key]
+        if isinstance(key, str):
+            return tuple([int(x) for x in key.split('.') if x])
 
-    def sortingFun(self, keys):
-        keys.sort(key=lambda k, d=self._keysCache: d[k])
+        # e.g. ObjectName
+        return tuple(key)
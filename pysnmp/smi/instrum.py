@@ -4,8 +4,11 @@
 # Copyright (c) 2005-2019, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pysnmp/license.html
 #
+import bisect
+
 from pysnmp import debug
 from pysnmp.smi import error
+from pysnmp.smi import exval
 
 __all__ = ['AbstractMibInstrumController', 'MibInstrumController']
 
@@ -71,20 +74,147 @@ class MibInstrumController(AbstractMibInstrumController):
         (STATE_ANY, STATUS_ERROR): STATE_STOP
     }
 
+    # methods objects may override to serve subtrees of their own
+    NEXT_HOOKS = ('getNextNode', 'getNextBranch',
+                  STATE_READ_TEST_NEXT, STATE_READ_GET_NEXT)
+
     def __init__(self, mibBuilder):
         self.mibBuilder = mibBuilder
         self.lastBuildId = -1
         self.lastBuildSyms = {}
+        # name -> MibScalar or MibTableColumn the instances attach to
+        self._instanceParents = {}
+        # name -> [(modName, MibScalarInstance), ...] in precedence order
+        self._instanceCandidates = {}
+        # sorted names of scalars and columns along with the objects,
+        # valid while MIB tree branchVersionId stays the same
+        self._nextIndexNames = []
+        self._nextIndexParents = []
+        self._nextIndexVersionId = -1
+        # names of objects serving GETNEXT by their own means
+        self._customNextNames = set()
+        # class -> whether it overrides any of NEXT_HOOKS
+        self._customNextClasses = {}
 
     def getMibBuilder(self):
         return self.mibBuilder
 
+    def indexMib(self):
+        """Bring a tree of MIB objects up to date with currently loaded modules.
+
+        MIB objects get attached to each other (e.g. table columns to table
+        rows) as the tree is built. Read and write operations do this on
+        their own, but objects may need to be indexed ahead of being
+        changed directly.
+        """
+        self._indexMib()
+
     def _indexMib(self):
+        """Bring a tree of MIB objects up to date with currently loaded modules.
+
+        If currently existing tree is out of date, attach and detach just
+        the Managed Objects Instances exported or unexported since the last
+        time the tree has been built. Other changes call for full tree rebuild
+        (see :py:meth:`_rebuildMib`).
+        """
+        if self.lastBuildId == self.mibBuilder.lastBuildId:
+            return
+
+        if self.lastBuildId < 0 or not self._updateMib(
+                self.mibBuilder.getSymbolsChanges(self.lastBuildId)):
+            self._rebuildMib()
+
+        self.lastBuildId = self.mibBuilder.lastBuildId
+
+    def _updateMib(self, changes):
+        """Apply symbols changes to the tree of MIB objects.
+
+        Returns `False` if the changes can not be applied incrementally.
+        """
+        if changes is None:
+            return False
+
+        (MibScalarInstance, MibScalar,
+         MibTableRow, MibTable, MibTree) = self.mibBuilder.importSymbols(
+            'SNMPv2-SMI', 'MibScalarInstance', 'MibScalar',
+            'MibTableRow', 'MibTable', 'MibTree'
+        )
+
+        instanceChanges = []
+
+        for modName, symObj, exported in changes:
+            if isinstance(symObj, MibScalarInstance):
+                instanceChanges.append((modName, symObj, exported))
+
+            elif isinstance(symObj, (MibScalar, MibTableRow, MibTable, MibTree)):
+                return False
+
+        for modName, inst, exported in instanceChanges:
+            if exported and inst.typeName not in self._instanceParents:
+                raise error.SmiError(
+                    'Orphan MIB scalar instance %r at '
+                    '%r' % (inst, self))
+
+        candidates = self._instanceCandidates
+
+        winners = {}
+
+        for modName, inst, exported in instanceChanges:
+            name = inst.name
+
+            if name not in winners:
+                winners[name] = name in candidates and candidates[name][-1][1] or None
+
+            if exported:
+                if self._hasNextHooks(inst):
+                    self._customNextNames.add(name)
+
+                instances = candidates.setdefault(name, [])
+
+                # same order as full rebuild would produce
+                idx = len(instances)
+                while idx and instances[idx - 1][0] < modName:
+                    idx -= 1
+
+                instances.insert(idx, (modName, inst))
+
+            elif name in candidates:
+                instances = candidates[name]
+
+                for idx, (_, candidate) in enumerate(instances):
+                    if candidate is inst:
+                        del instances[idx]
+                        break
+
+                if not instances:
+                    del candidates[name]
+
+                    self._customNextNames.discard(name)
+
+        for name, oldInst in winners.items():
+            newInst = name in candidates and candidates[name][-1][1] or None
+
+            if newInst is oldInst:
+                continue
+
+            if oldInst is not None:
+                self._instanceParents[
+                    self.lastBuildSyms.pop(name)].unregisterSubtrees(name)
+
+            if newInst is not None:
+                self._instanceParents[newInst.typeName].registerSubtrees(newInst)
+                self.lastBuildSyms[name] = newInst.typeName
+
+        debug.logger & debug.FLAG_INS and debug.logger(
+            '_updateMib: %d instances changed' % len(winners))
+
+        return True
+
+    def _rebuildMib(self):
         """Rebuild a tree from MIB objects found at currently loaded modules.
 
-        If currently existing tree is out of date, walk over all Managed Objects
-        and Instances to structure Management Instrumentation objects into a tree
-        of the following layout:
+        Walk over all Managed Objects and Instances to structure Management
+        Instrumentation objects into a tree of the following layout:
 
         MibTree
           |
@@ -105,9 +235,6 @@ class MibInstrumController(AbstractMibInstrumController):
         Only Managed Objects (i.e. `OBJECT-TYPE`) get indexed here, various MIB
         definitions and constants can't be SNMP managed so we drop them.
         """
-        if self.lastBuildId == self.mibBuilder.lastBuildId:
-            return
-
         (MibScalarInstance, MibScalar,
          MibTableColumn, MibTableRow,
          MibTable) = self.mibBuilder.importSymbols(
@@ -123,6 +250,8 @@ class MibInstrumController(AbstractMibInstrumController):
         rows = {}
         cols = {}
 
+        candidates = {}
+
         # Sort by module name to give user a chance to slip-in
         # custom MIB modules (that would be sorted out first)
         mibSymbols = list(self.mibBuilder.mibSymbols.items())
@@ -143,6 +272,8 @@ class MibInstrumController(AbstractMibInstrumController):
 
                 elif isinstance(symObj, MibScalarInstance):
                     instances[symObj.name] = symObj
+                    candidates.setdefault(symObj.name, []).append(
+                        (modName, symObj))
 
                 elif isinstance(symObj, MibScalar):
                     scalars[symObj.name] = symObj
@@ -210,9 +341,92 @@ class MibInstrumController(AbstractMibInstrumController):
 
         self.lastBuildSyms = lastBuildSyms
 
-        self.lastBuildId = self.mibBuilder.lastBuildId
+        self._instanceParents = dict(scalars)
+        self._instanceParents.update(cols)
 
-        debug.logger & debug.FLAG_INS and debug.logger('_indexMib: rebuilt')
+        self._instanceCandidates = candidates
+
+        self._customNextNames = set()
+
+        for objs in (instances, scalars, cols, rows, tables):
+            for name, obj in objs.items():
+                if self._hasNextHooks(obj):
+                    self._customNextNames.add(name)
+
+        if self._hasNextHooks(mibTree):
+            self._customNextNames.add(mibTree.name)
+
+        debug.logger & debug.FLAG_INS and debug.logger(
+            '_rebuildMib: rebuilt, %d objects serve GETNEXT on their '
+            'own' % len(self._customNextNames))
+
+    def _hasNextHooks(self, obj):
+        """Tell if MIB object overrides any of the GETNEXT hooks"""
+        objType = obj.__class__
+
+        if objType not in self._customNextClasses:
+            baseTypes = set()
+
+            for baseType in self.mibBuilder.importSymbols(
+                    'SNMPv2-SMI', 'MibTree', 'MibScalar', 'MibScalarInstance',
+                    'MibTableColumn', 'MibTableRow', 'MibTable'):
+                baseTypes.update(baseType.__mro__)
+
+            custom = False
+
+            for hook in self.NEXT_HOOKS:
+                for mroType in objType.__mro__:
+                    if hook in mroType.__dict__:
+                        custom = mroType not in baseTypes
+                        break
+
+                if custom:
+                    break
+
+            self._customNextClasses[objType] = custom
+
+        return self._customNextClasses[objType]
+
+    def _getNextInstance(self, name):
+        """Return Managed Object Instance next to `name` or `None`.
+
+        Looks up the scalar or column `name` belongs to or precedes, then
+        takes the next instance from its index. Both lookups take
+        O(log n) time.
+        """
+        mibTree, = self.mibBuilder.importSymbols('SNMPv2-SMI', 'iso')
+
+        if self._nextIndexVersionId != mibTree.branchVersionId:
+            parents = sorted(self._instanceParents.items())
+
+            self._nextIndexNames = [x[0] for x in parents]
+            self._nextIndexParents = [x[1] for x in parents]
+            self._nextIndexVersionId = mibTree.branchVersionId
+
+            debug.logger & debug.FLAG_INS and debug.logger(
+                '_getNextInstance: indexed %d objects' % len(parents))
+
+        name = tuple(name)
+
+        names = self._nextIndexNames
+        parents = self._nextIndexParents
+
+        idx = bisect.bisect_right(names, name)
+
+        # name falls into the subtree of the preceding object
+        if idx and name[:len(names[idx - 1])] == names[idx - 1]:
+            try:
+                return parents[idx - 1].getNextBranch(name)
+
+            except (error.NoSuchInstanceError, error.NoSuchObjectError):
+                pass
+
+        while idx < len(parents):
+            try:
+                return parents[idx].getNextBranch(names[idx])
+
+            except (error.NoSuchInstanceError, error.NoSuchObjectError):
+                idx += 1
 
     def flipFlopFsm(self, fsmTable, *varBinds, **context):
         """Read, modify, create or remove Managed Objects Instances.
@@ -477,22 +691,133 @@ class MibInstrumController(AbstractMibInstrumController):
         In case of errors, the `errors` key in the `context` dict will contain
         a sequence of `dict` objects describing one or more errors that occur.
 
-        If a non-existing Managed Object is referenced, no error will be
-        reported, but the values returned in the `varBinds` would be one of:
-        :py:class:`NoSuchObject` (indicating non-existent Managed Object) or
-        :py:class:`NoSuchInstance` (if Managed Object exists, but is not
-        instantiated) or :py:class:`EndOfMibView` (when the last Managed Object
-        Instance has been read).
-
-        When :py:class:`NoSuchObject` or :py:class:`NoSuchInstance` values are
-        returned, the caller is expected to repeat the same call with some
-        or all `varBinds` returned to progress towards the end of the
-        implemented MIB.
+        The next Managed Object Instance is looked up in the index of all
+        instantiated Managed Objects. Instances that can not be read (e.g.
+        have no value or are not authorized by `acFun`) are skipped. Once
+        the last Managed Object Instance has been read, the value returned
+        in the `varBinds` would be :py:class:`EndOfMibView`.
         """
         if 'cbFun' not in context:
             context['cbFun'] = self._defaultErrorHandler
 
-        self.flipFlopFsm(self.FSM_READ_NEXT_VAR, *varBinds, **context)
+        self._indexMib()
+
+        # leftovers of the previous operations
+        for key in ('state', 'status', 'instances', 'varBinds', 'errors'):
+            context.pop(key, None)
+
+        # objects serving their own subtrees are walked the old way,
+        # the caller retries on intermediate NoSuchInstance/NoSuchObject
+        if self._customNextNames:
+            self.flipFlopFsm(self.FSM_READ_NEXT_VAR, *varBinds, **context)
+            return
+
+        cbFun = context['cbFun']
+
+        if not varBinds:
+            cbFun((), **dict(context, errors=[]))
+            return
+
+        rspVarBinds = list(varBinds)
+        errors = []
+        count = [0]
+
+        def _complete(idx, varBind, errs):
+            rspVarBinds[idx] = varBind
+
+            for err in errs:
+                if isinstance(err['error'], error.MibOperationError):
+                    err['error'].update({'idx': idx})
+
+                errors.append(dict(err, idx=idx))
+
+            count[0] += 1
+
+            if count[0] < len(varBinds):
+                return
+
+            debug.logger & debug.FLAG_INS and debug.logger(
+                'readNextMibObjects: output var-binds %r' % (rspVarBinds,))
+
+            cbFun(rspVarBinds, **dict(context, errors=errors))
+
+        def _readNext(idx, name):
+            nextName = name
+
+            while True:
+                node = self._getNextInstance(nextName)
+
+                if node is None:
+                    _complete(idx, (varBinds[idx][0], exval.endOfMibView), ())
+                    return
+
+                result = self._readInstance(idx, node, _readNext, _complete, context)
+
+                # instance is being read asynchronously
+                if not result:
+                    return
+
+                varBind, errs = result
+
+                if not self._isSkipped(varBind, errs):
+                    _complete(idx, varBind, errs)
+                    return
+
+                nextName = node.name
+
+        for idx, varBind in enumerate(varBinds):
+            _readNext(idx, varBind[0])
+
+    def _readInstance(self, idx, node, readNextFun, completeFun, context):
+        """Read Managed Object Instance found next to the requested one.
+
+        Returns (varBind, errors) tuple if instance has been read right
+        away or `None` if its reading has been deferred. In the latter
+        case, one of the callables is invoked later.
+        """
+        result = []
+        deferred = [False]
+
+        def _cbFun(varBinds, **context):
+            varBind, errs = varBinds[0], context.get('errors') or ()
+
+            if not deferred[0]:
+                result.append((varBind, errs))
+
+            elif self._isSkipped(varBind, errs):
+                readNextFun(idx, node.name)
+
+            else:
+                completeFun(idx, varBind, errs)
+
+        try:
+            self.readMibObjects(
+                (node.name, None), **dict(context, cbFun=_cbFun))
+
+        except error.NoAccessError:
+            # skip silently (e.g. RFC 2576 section 4.1.2.1)
+            result.append(((node.name, exval.noSuchInstance), ()))
+
+        if result:
+            return result[0]
+
+        deferred[0] = True
+
+    @staticmethod
+    def _isSkipped(varBind, errors):
+        """Tell if read instance should be skipped while reading next"""
+        if errors:
+            for err in errors:
+                if not isinstance(err['error'], (error.NoSuchInstanceError,
+                                                 error.NoSuchObjectError)):
+                    return False
+
+            return True
+
+        name, val = varBind
+
+        return (exval.noSuchInstance.isSameTypeWith(val) or
+                exval.noSuchObject.isSameTypeWith(val))
 
     def writeMibObjects(self, *varBinds, **context):
         """Create, destroy or modify Managed Objects Instances.
@@ -9,6 +9,7 @@
 #
 # Parts of otherwise autogenerated MIB has been updated manually.
 #
+import bisect
 import sys
 import traceback
 
@@ -462,18 +463,11 @@ class ManagedMibObject(ObjectType):
         raise error.NoSuchObjectError(name=name, idx=context.get('idx'))
 
     def getNextBranch(self, name, **context):
-        # Start from the beginning
-        if self._vars:
-            first = list(self._vars.keys())[0]
-        else:
-            first = ()
-        if self._vars and name < first:
-            return self._vars[first]
-        else:
-            try:
-                return self._vars[self._vars.nextKey(name)]
-            except KeyError:
-                raise error.NoSuchObjectError(name=name, idx=context.get('idx'))
+        # Names preceding the first key yield the first key
+        try:
+            return self._vars[self._vars.nextKey(name)]
+        except KeyError:
+            raise error.NoSuchObjectError(name=name, idx=context.get('idx'))
 
     def getNode(self, name, **context):
         """Return tree node found by name"""
@@ -2165,6 +2159,62 @@ class MibTableColumn(MibScalar, ObjectType):
                                    ...
     """
 
+    # How many changed instances to remember
+    MAX_INSTANCES_CHANGES = 65536
+
+    def __init__(self, name, syntax=None):
+        MibScalar.__init__(self, name, syntax)
+
+        # changed instance IDs and branch versions they changed at
+        self._instancesChanges = []
+        self._instancesChangesIds = []
+        # all changes made at or after this branch version are remembered
+        self._instancesChangesVersionId = self.branchVersionId
+
+    def getInstancesChanges(self, lastVersionId):
+        """Return IDs of instances changed since `lastVersionId`.
+
+        Instances created, destroyed or modified since this column's
+        `branchVersionId` was `lastVersionId` are reported by their
+        instance IDs (the OID suffix past column's name) in the order of
+        change, possibly repeating.
+
+        Returns a list of instance IDs or `None` if changes are not known
+        that far back.
+        """
+        if lastVersionId < self._instancesChangesVersionId:
+            return
+
+        idx = bisect.bisect_left(self._instancesChangesIds, lastVersionId)
+
+        return self._instancesChanges[idx:]
+
+    def _recordInstancesChanges(self, *names):
+        # recorded ahead of version bump, so that the change is never missed
+        self._instancesChanges.extend([name[len(self.name):] for name in names])
+        self._instancesChangesIds.extend([self.branchVersionId] * len(names))
+
+        if len(self._instancesChanges) <= self.MAX_INSTANCES_CHANGES:
+            return
+
+        # forget older half of the changes keeping versions intact
+        idx = bisect.bisect_right(
+            self._instancesChangesIds,
+            self._instancesChangesIds[len(self._instancesChanges) // 2])
+
+        # the latest batch is kept whole, however large, so that a bulk
+        # change can still be caught up with
+        idx = min(idx, bisect.bisect_left(
+            self._instancesChangesIds, self.branchVersionId))
+
+        if not idx:
+            return
+
+        self._instancesChangesVersionId = self._instancesChangesIds[idx - 1] + 1
+
+        del self._instancesChanges[:idx]
+        del self._instancesChangesIds[:idx]
+
     #
     # Subtree traversal
     #
@@ -2176,6 +2226,26 @@ class MibTableColumn(MibScalar, ObjectType):
             return self._vars[name]
         raise error.NoSuchInstanceError(name=name, idx=context.get('idx'))
 
+    # Subtrees registration
+
+    def registerSubtrees(self, *subTrees):
+        self._recordInstancesChanges(*[subTree.name for subTree in subTrees])
+        MibScalar.registerSubtrees(self, *subTrees)
+
+    def unregisterSubtrees(self, *names):
+        self._recordInstancesChanges(*names)
+        MibScalar.unregisterSubtrees(self, *names)
+
+    # Instances modification
+
+    def writeCleanup(self, varBind, **context):
+        self._recordInstancesChanges(varBind[0])
+        MibScalar.writeCleanup(self, varBind, **context)
+
+    def createCleanup(self, varBind, **context):
+        self._recordInstancesChanges(varBind[0])
+        MibScalar.createCleanup(self, varBind, **context)
+
     # Column creation (this should probably be converted into some state
     # machine for clarity). Also, it might be a good idea to indicate
     # defaulted cols creation in a clearer way than just a val == None.
@@ -2371,6 +2441,8 @@ class MibTableColumn(MibScalar, ObjectType):
         (debug.logger & debug.FLAG_INS and
          debug.logger('%s: destroyCleanup(%s, %r)' % (self, name, val)))
 
+        self._recordInstancesChanges(name)
+
         self.branchVersionId += 1
 
         instances = context['instances'].setdefault(self.name, {self.ST_CREATE: {}, self.ST_DESTROY: {}})
@@ -3268,6 +3340,177 @@ class MibTableRow(ManagedMibObject):
 
     # Table row management
 
+    def createRows(self, rows):
+        """Put many table rows in place at once.
+
+        Unlike SNMP SET-driven row creation, rows are created directly,
+        bypassing multi-phase SET processing, access control and row
+        consistency checks. Columns not given a value are set to their
+        defaults, index columns not given a value are set from the
+        instance identifier. Already existing rows are replaced, rows of
+        augmenting tables are (re)created with default values.
+
+        Each column is changed only once whatever the number of rows.
+
+        Parameters
+        ----------
+        rows: iterable of (`instId`, `values`) tuples, where `instId` is
+            :py:class:`tuple` instance identifier (OID suffix past column
+            name) and `values` is :py:class:`dict` mapping column sub-OID
+            (e.g. last sub-OID of column name) to column value.
+
+        Raises
+        ------
+        :py:class:`WrongValueError` if any of the values does not fit its
+        column. No rows are created then.
+        """
+        self.commitRows(self.prepareRows(rows))
+
+    def prepareRows(self, rows):
+        """Build table rows to be put in place by :py:meth:`commitRows`.
+
+        Takes the same `rows` as :py:meth:`createRows` does and builds
+        Managed Objects Instances for them and for the rows of augmenting
+        tables, leaving the table intact. Rows of many tables can be
+        prepared first and committed once all of them have been found fine.
+
+        Returns an object to pass to :py:meth:`commitRows`.
+
+        Raises
+        ------
+        :py:class:`WrongValueError` if any of the values does not fit its
+        column.
+        """
+        newRows = {}
+
+        for instId, values in rows:
+            newRows[tuple(instId)] = values
+
+        if not newRows:
+            return self, (), {}, ()
+
+        colLen = len(self.name) + 1
+
+        indexObjs = []
+
+        for impliedFlag, modName, symName in self._indexNames:
+            mibObj, = mibBuilder.importSymbols(modName, symName)
+            indexObjs.append((impliedFlag, mibObj))
+
+        # sub-OIDs of index columns belonging to this table
+        indexColIds = [mibObj.name[-1] for impliedFlag, mibObj in indexObjs
+                       if mibObj.name in self._vars]
+
+        newInstances = {}
+
+        # bulk loaded rows tend to share values
+        clonedValues = {}
+
+        for instId, values in newRows.items():
+            indexVals = {}
+
+            # index values are only needed for index columns not given
+            if [colId for colId in indexColIds if values.get(colId) is None]:
+                indices = []
+
+                suffix = instId
+
+                for impliedFlag, mibObj in indexObjs:
+                    try:
+                        syntax, suffix = self.oidToValue(
+                            mibObj.syntax, suffix, impliedFlag, indices)
+
+                    except PyAsn1Error as exc:
+                        raise error.WrongValueError(
+                            name=self.name + (0,) + instId, msg=exc)
+
+                    indexVals[mibObj.name] = syntax
+                    indices.append(syntax)
+
+                if suffix:
+                    raise error.SmiError(
+                        'Excessive instance identifier sub-OIDs left at %s: '
+                        '%s' % (self, suffix))
+
+            for colName, colObj in self._vars.items():
+                value = values.get(colName[colLen - 1])
+
+                if value is None:
+                    if colName in indexVals:
+                        value = indexVals[colName]
+
+                    else:
+                        value = colObj.syntax.clone()
+
+                else:
+                    key = colName, value.__class__, value
+
+                    try:
+                        cloned = key in clonedValues
+
+                    except TypeError:  # unhashable value
+                        key = cloned = None
+
+                    if cloned:
+                        value = clonedValues[key]
+
+                    else:
+                        try:
+                            value = colObj.syntax.clone(value)
+
+                        except PyAsn1Error as exc:
+                            raise error.WrongValueError(
+                                name=colName + instId, msg=exc)
+
+                        if key is not None:
+                            clonedValues[key] = value
+
+                newInstances.setdefault(colName, []).append(
+                    MibScalarInstance(colName, instId, value))
+
+        augmentingRows = []
+
+        for modName, symName in self._augmentingRows:
+            mibObj, = mibBuilder.importSymbols(modName, symName)
+            augmentingRows.append(
+                mibObj.prepareRows([(instId, {}) for instId in newRows]))
+
+        return self, tuple(newRows), newInstances, augmentingRows
+
+    def commitRows(self, preparedRows):
+        """Put table rows built by :py:meth:`prepareRows` in place.
+
+        Parameters
+        ----------
+        preparedRows:
+            object returned by :py:meth:`prepareRows` of this table row
+        """
+        mibObj, instIds, newInstances, augmentingRows = preparedRows
+
+        if mibObj is not self:
+            raise error.SmiError(
+                'Rows prepared by %s can not be committed at %s' % (mibObj, self))
+
+        if not instIds:
+            return
+
+        for colName, colObj in self._vars.items():
+            oldNames = [colName + instId for instId in instIds
+                        if colName + instId in colObj._vars]
+
+            if oldNames:
+                colObj.unregisterSubtrees(*oldNames)
+
+            colObj.registerSubtrees(*newInstances[colName])
+
+        self.branchVersionId += 1
+
+        debug.logger & debug.FLAG_INS and debug.logger(
+            '%s: commitRows: %d rows created' % (self, len(instIds)))
+
+        for preparedAugmentingRows in augmentingRows:
+            preparedAugmentingRows[0].commitRows(preparedAugmentingRows)
+
     # Table row access by instance name
 
     def getInstName(self, colId, instId):
@@ -3280,6 +3523,8 @@ class MibTableRow(ManagedMibObject):
         if instId in self._idToIdxCache:
             return self._idToIdxCache[instId]
 
+        cacheKey = instId
+
         indices = []
         for impliedFlag, modName, symName in self._indexNames:
             mibObj, = mibBuilder.importSymbols(modName, symName)
@@ -3301,7 +3546,7 @@ class MibTableRow(ManagedMibObject):
             )
 
         indices = tuple(indices)
-        self._idToIdxCache[instId] = indices
+        self._idToIdxCache[cacheKey] = indices
 
         return indices
 
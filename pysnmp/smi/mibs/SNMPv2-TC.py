@@ -97,6 +97,35 @@ class TextualConvention(object):
     __timeticks = TimeTicks()
     __octetString = OctetString()
 
+    # (class, tagSet) -> base SNMP type and its kind
+    __baseTypes = {}
+
+    def __getBaseType(self):
+        """Return base SNMP type along with integer, unsigned and octets flags"""
+        key = self.__class__, self.tagSet
+
+        try:
+            return self.__baseTypes[key]
+
+        except KeyError:
+            pass
+
+        for base in inspect.getmro(self.__class__):
+            if not issubclass(base, TextualConvention) and issubclass(base, Asn1Item):
+                break
+        else:
+            base = None
+
+        baseType = self.__baseTypes[key] = (
+            base,
+            self.__integer.isSuperTypeOf(self, matchConstraints=False),
+            (self.__unsigned32.isSuperTypeOf(self, matchConstraints=False) or
+             self.__timeticks.isSuperTypeOf(self, matchConstraints=False)),
+            self.__octetString.isSuperTypeOf(self, matchConstraints=False)
+        )
+
+        return baseType
+
     def getDisplayHint(self):
         return self.displayHint
 
@@ -119,9 +148,9 @@ class TextualConvention(object):
 
     def prettyOut(self, value):  # override asn1 type method
         """Implements DISPLAY-HINT evaluation"""
-        if self.displayHint and (self.__integer.isSuperTypeOf(self, matchConstraints=False) and not self.getNamedValues() or
-                                 self.__unsigned32.isSuperTypeOf(self, matchConstraints=False) or
-                                 self.__timeticks.isSuperTypeOf(self, matchConstraints=False)):
+        base, isInteger, isUnsigned, isOctetString = self.__getBaseType()
+
+        if self.displayHint and (isInteger and not self.getNamedValues() or isUnsigned):
             _ = lambda t, f=0: (t, f)
             displayHintType, decimalPrecision = _(*self.displayHint.split('-'))
             if displayHintType == 'x':
@@ -146,7 +175,7 @@ class TextualConvention(object):
                 raise SmiError(
                     'Unsupported numeric type spec "%s" at %s' % (displayHintType, self.__class__.__name__)
                 )
-        elif self.displayHint and self.__octetString.isSuperTypeOf(self, matchConstraints=False):
+        elif self.displayHint and isOctetString:
             outputValue = ''
             runningValue = OctetString(value).asOctets()
             displayHint = self.displayHint
@@ -241,11 +270,10 @@ class TextualConvention(object):
 
             return outputValue
 
-        for base in inspect.getmro(self.__class__):
-            if not issubclass(base, TextualConvention) and issubclass(base, Asn1Item):
-                return base.prettyOut(self, value)
+        if base is None:
+            raise SmiError('TEXTUAL-CONVENTION has no underlying SNMP base type')
 
-        raise SmiError('TEXTUAL-CONVENTION has no underlying SNMP base type')
+        return base.prettyOut(self, value)
 
     def prettyIn(self, value):  # override asn1 type method
         """Implements DISPLAY-HINT parsing into base SNMP value
@@ -257,16 +285,12 @@ class TextualConvention(object):
         Keep in mind that this parser only works with "text"
         input meaning `unicode` (Py2) or `str` (Py3).
         """
-        for base in inspect.getmro(self.__class__):
-            if not issubclass(base, TextualConvention) and issubclass(base, Asn1Item):
-                break
-        else:
+        base, isInteger, isUnsigned, isOctetString = self.__getBaseType()
+
+        if base is None:
             raise SmiError('TEXTUAL-CONVENTION has no underlying SNMP base type')
 
-        if self.displayHint and (self.__integer.isSuperTypeOf(self, matchConstraints=False) and
-                                 self.getNamedValues() or
-                                 self.__unsigned32.isSuperTypeOf(self, matchConstraints=False) or
-                                 self.__timeticks.isSuperTypeOf(self, matchConstraints=False)):
+        if self.displayHint and (isInteger and self.getNamedValues() or isUnsigned):
             value = str(value)
 
             _ = lambda t, f=0: (t, f)
@@ -312,7 +336,7 @@ class TextualConvention(object):
                     'Unsupported numeric type spec "%s" at %s' % (displayHintType, self.__class__.__name__)
                 )
 
-        elif self.displayHint and self.__octetString.isSuperTypeOf(self, matchConstraints=False):
+        elif self.displayHint and isOctetString:
             numBase = {
                 'x': 16,
                 'd': 10,
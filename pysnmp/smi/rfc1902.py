@@ -203,6 +203,127 @@ class ObjectIdentity(object):
     def isFullyResolved(self):
         return self._state & self.ST_CLEAN
 
+    def getResolutionKey(self):
+        """Returns hashable key of MIB variable reference.
+
+        Objects having equal keys resolve into the same MIB variable
+        against the same MIB view.
+
+        Returns
+        -------
+        : :py:class:`tuple` or :py:obj:`None`
+            key or :py:obj:`None` if this object is already resolved or
+            MIB sources or modules are yet to be added to MIB view.
+        """
+        if (self._state & self.ST_CLEAN or
+                self._mibSourcesToAdd is not None or
+                self._asn1SourcesToAdd is not None or
+                self._modNamesToLoad is not None or
+                self._args and isinstance(self._args[0], ObjectIdentity)):
+            return
+
+        key = self._args, bool(self._kwargs.get('last'))
+
+        try:
+            hash(key)
+
+        except (TypeError, PyAsn1Error):
+            return
+
+        return key
+
+    def resolveInstance(self, oid, mibViewController):
+        """Create resolved object for an instance of this MIB variable.
+
+        Unlike :py:meth:`~pysnmp.smi.rfc1902.ObjectIdentity.resolveWithMib`,
+        MIB tree is not searched for the MIB variable.
+
+        Parameters
+        ----------
+        oid : :py:class:`~pysnmp.proto.rfc1902.ObjectName`
+            OID of MIB variable instance falling under MIB scalar or
+            table column object this object is resolved into.
+
+        mibViewController : :py:class:`~pysnmp.smi.view.MibViewController`
+            class instance representing MIB browsing functionality.
+
+        Returns
+        -------
+        : :py:class:`~pysnmp.smi.rfc1902.ObjectIdentity`
+            new, resolved object
+        """
+        if not self._state & self.ST_CLEAN:
+            raise SmiError(
+                '%s object not fully initialized' % self.__class__.__name__)
+
+        MibTableColumn, = mibViewController.mibBuilder.importSymbols(
+            'SNMPv2-SMI', 'MibTableColumn')
+
+        mibNode = self._mibNode
+
+        if not isinstance(oid, rfc1902.ObjectName):
+            oid = rfc1902.ObjectName(oid)
+
+        suffix = oid.asTuple()[len(mibNode.name):]
+
+        objectIdentity = self.__class__(oid)
+
+        objectIdentity._oid = oid
+        objectIdentity._modName = self._modName
+        objectIdentity._symName = self._symName
+        objectIdentity._label = self._label
+        objectIdentity._mibNode = mibNode
+
+        if suffix:
+            if isinstance(mibNode, MibTableColumn):
+                rowModName, rowSymName, _ = mibViewController.getNodeLocation(
+                    mibNode.name[:-1]
+                )
+
+                rowNode, = mibViewController.mibBuilder.importSymbols(
+                    rowModName, rowSymName
+                )
+
+                objectIdentity._indices = rowNode.getIndicesFromInstId(suffix)
+
+            else:
+                objectIdentity._indices = (rfc1902.ObjectName(suffix),)
+
+        objectIdentity._state |= self.ST_CLEAN
+
+        return objectIdentity
+
+    def resolveLike(self, objectIdentity):
+        """Resolve this object the same way as given resolved one.
+
+        Unlike :py:meth:`~pysnmp.smi.rfc1902.ObjectIdentity.resolveWithMib`,
+        MIB is not consulted, resolved state is copied over instead.
+
+        Parameters
+        ----------
+        objectIdentity : :py:class:`~pysnmp.smi.rfc1902.ObjectIdentity`
+            resolved object having equal resolution key
+
+        Returns
+        -------
+        : :py:class:`~pysnmp.smi.rfc1902.ObjectIdentity`
+            reference to itself
+        """
+        if not objectIdentity._state & self.ST_CLEAN:
+            raise SmiError(
+                '%s object not fully initialized' % self.__class__.__name__)
+
+        self._oid = objectIdentity._oid
+        self._modName = objectIdentity._modName
+        self._symName = objectIdentity._symName
+        self._label = objectIdentity._label
+        self._mibNode = objectIdentity._mibNode
+        self._indices = objectIdentity._indices
+
+        self._state |= self.ST_CLEAN
+
+        return self
+
     #
     # A gateway to MIBs manipulation routines
     #
@@ -819,6 +940,28 @@ class ObjectType(object):
     def isFullyResolved(self):
         return self._state & self.ST_CLEAM
 
+    def getResolutionKey(self):
+        """Returns hashable key of MIB variable read request.
+
+        Objects having equal keys resolve into the same MIB variable and
+        value against the same MIB view.
+
+        Returns
+        -------
+        : :py:class:`tuple` or :py:obj:`None`
+            key or :py:obj:`None` if this object is already resolved,
+            carries a value other than unspecified one or its MIB variable
+            reference can not be keyed
+        """
+        if (self._state & self.ST_CLEAM or
+                not isinstance(self._args[1], rfc1905.UnSpecified)):
+            return
+
+        key = self._args[0].getResolutionKey()
+
+        if key is not None:
+            return key, self._args[1].__class__
+
     def addAsn1MibSource(self, *asn1Sources, **kwargs):
         """Adds path to a repository to search ASN.1 MIB files.
 
@@ -1007,6 +1150,33 @@ class ObjectType(object):
 
         return self
 
+    def resolveLike(self, objectType):
+        """Resolve this object the same way as given resolved one.
+
+        Unlike :py:meth:`~pysnmp.smi.rfc1902.ObjectType.resolveWithMib`,
+        MIB is not consulted, resolved state is copied over instead.
+
+        Parameters
+        ----------
+        objectType : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+            resolved object having equal resolution key
+
+        Returns
+        -------
+        : :py:class:`~pysnmp.smi.rfc1902.ObjectType`
+            reference to itself
+        """
+        if not objectType._state & self.ST_CLEAM:
+            raise SmiError(
+                '%s object not fully initialized' % self.__class__.__name__)
+
+        self._args[0].resolveLike(objectType._args[0])
+        self._args[1] = objectType._args[1]
+
+        self._state |= self.ST_CLEAM
+
+        return self
+
     def prettyPrint(self):
         if self._state & self.ST_CLEAM:
             return '%s = %s' % (self._args[0].prettyPrint(),
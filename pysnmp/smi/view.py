@@ -36,8 +36,9 @@ class MibViewController(object):
         # ascending age for resolution
         mb = self.mibBuilder
 
-        if mb.moduleID in mb.mibSymbols[name]:
-            mib = mb.mibSymbols[name][mb.moduleID]
+        if (mb.moduleID in mb.mibSymbols[name] or
+                mb.moduleID in mb.lazySymbols.get(name, ())):
+            mib, = mb.importSymbols(name, mb.moduleID)
             revs = mib.getRevisions()
             if revs:
                 return revs[0]
@@ -45,7 +46,7 @@ class MibViewController(object):
         return '1970-01-01 00:00'
 
     def indexMib(self):
-        if self.lastBuildId == self.mibBuilder.lastBuildId:
+        if self.lastBuildId == self.mibBuilder.lastViewBuildId:
             return
 
         debug.logger & debug.FLAG_MIB and debug.logger(
@@ -123,6 +124,26 @@ class MibViewController(object):
                     raise error.SmiError(
                         'Unexpected object %s::%s' % (modName, n))
 
+            # Lazily loaded symbols yet to be materialized
+            lazySymbols = self.mibBuilder.lazySymbols.get(modName, {})
+
+            for n, (typeName, oid) in lazySymbols.items():
+                if n == self.mibBuilder.moduleID:
+                    continue
+
+                if oid is None:
+                    globMibMod['typeToModIdx'][n] = modName
+                    mibMod['typeToModIdx'][n] = modName
+                    continue
+
+                globMibMod['varToNameIdx'][n] = oid
+                mibMod['varToNameIdx'][n] = oid
+
+                globMibMod['oidToModIdx'][oid] = modName
+                mibMod['oidToModIdx'][oid] = modName
+                globMibMod['oidToLabelIdx'][oid] = (n,)
+                mibMod['oidToLabelIdx'][oid] = (n,)
+
         # Build oid->long-label index
         oidToLabelIdx = self._mibSymbolsIdx['']['oidToLabelIdx']
         labelToOidIdx = self._mibSymbolsIdx['']['labelToOidIdx']
@@ -130,7 +151,8 @@ class MibViewController(object):
         prevOid = ()
         baseLabel = ()
 
-        for key in oidToLabelIdx:
+        # parent OIDs must come first, whatever the symbols export order
+        for key in oidToLabelIdx.keys():
             keydiff = len(key) - len(prevOid)
 
             if keydiff > 0:
@@ -175,7 +197,7 @@ class MibViewController(object):
                 mibMod['oidToLabelIdx'][oid] = oidToLabelIdx[oid]
                 mibMod['labelToOidIdx'][oidToLabelIdx[oid]] = oid
 
-        self.lastBuildId = self.mibBuilder.lastBuildId
+        self.lastBuildId = self.mibBuilder.lastViewBuildId
 
     # Module management
 